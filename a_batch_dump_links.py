@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+Headless batch dump of links, TOC entries and named destinations
+Runs the a_dump_all_links / a_dump_toc / a_debug_named_destinations extraction
+over whole PDF corpora and streams structured JSONL instead of printing text.
+
+Usage:
+    python a_batch_dump_links.py incoming/ "archive/**/*.pdf" -o dump.jsonl [--workers 8] [--resume]
+
+Every PDF is processed in a separate worker process (each opens its own
+fitz.Document). Only a bounded number of files is in flight at once, and each
+file's records are written in one block as soon as it finishes, so memory does
+not grow with the size of the corpus.
+
+Record types (one JSON object per line, all carry "file"):
+    link         page, index, kind, rect, target_page, to, uri / target_file / name
+    toc          index, level, title, page (0-based), valid
+    destination  name, page, to
+    file         status, error, pages, links, toc_entries, destinations, timing (seconds)
+
+The "file" record is always the last record of a file. --resume skips every
+file that already has one in the output, so an interrupted run continues where
+it stopped. A worker that crashes (e.g. MuPDF on a corrupt PDF) only costs an
+error "file" record for that PDF; the pool is restarted and the batch goes on.
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# Try to import PyMuPDF (main() reports it missing)
+try:
+    import fitz
+except ImportError:
+    fitz = None
+
+SECTIONS = ('links', 'toc', 'destinations')
+
+# PyMuPDF link kinds
+LINK_KIND_NAMES = {
+    fitz.LINK_NONE: 'none',
+    fitz.LINK_GOTO: 'goto',
+    fitz.LINK_URI: 'uri',
+    fitz.LINK_LAUNCH: 'launch',
+    fitz.LINK_NAMED: 'named',
+    fitz.LINK_GOTOR: 'gotor'
+} if fitz is not None else {}
+
+
+# ========================================
+# WORKER SIDE (runs in the pool processes)
+# ========================================
+
+def _point(to) -> Optional[List[float]]:
+    """[x, y] of a fitz.Point or sequence, None when absent"""
+    if to is not None and hasattr(to, 'x'):
+        return [round(to.x, 2), round(to.y, 2)]
+    if isinstance(to, (list, tuple)) and len(to) >= 2 and to[0] is not None and to[1] is not None:
+        return [round(to[0], 2), round(to[1], 2)]
+    return None
+
+
+def _link_records(doc, file_path: str) -> List[Dict[str, Any]]:
+    records = []
+    for page_num in range(len(doc)):
+        for i, raw_link in enumerate(doc[page_num].get_links()):
+            rect = raw_link.get('from')
+            record = {
+                'type': 'link',
+                'file': file_path,
+                'page': page_num,
+                'index': i,
+                'kind': LINK_KIND_NAMES.get(raw_link.get('kind', 0), 'unknown'),
+                'rect': [round(rect.x0, 2), round(rect.y0, 2), round(rect.x1, 2), round(rect.y1, 2)] if rect else None
+            }
+            target_page = raw_link.get('page')
+            if isinstance(target_page, int) and target_page >= 0:
+                record['target_page'] = target_page
+            to = _point(raw_link.get('to'))
+            if to is not None:
+                record['to'] = to
+            if raw_link.get('uri'):
+                record['uri'] = raw_link['uri']
+            if raw_link.get('file'):
+                record['target_file'] = raw_link['file']  # 'file' is the source PDF
+            name = raw_link.get('nameddest') or raw_link.get('name') or raw_link.get('named')
+            if name:
+                record['name'] = name
+            records.append(record)
+    return records
+
+
+def _toc_records(doc, file_path: str) -> List[Dict[str, Any]]:
+    records = []
+    total_pages = len(doc)
+    for i, entry in enumerate(doc.get_toc(simple=True)):
+        level, title, page = entry[0], entry[1], entry[2] - 1  # get_toc pages are 1-based
+        records.append({
+            'type': 'toc',
+            'file': file_path,
+            'index': i,
+            'level': level,
+            'title': title,
+            'page': page,
+            'valid': 0 <= page < total_pages
+        })
+    return records
+
+
+def _destination_records(doc, file_path: str) -> List[Dict[str, Any]]:
+    if not hasattr(doc, 'resolve_names'):
+        return []  # PyMuPDF too old to walk the name tree in bulk
+    records = []
+    for name, dest in (doc.resolve_names() or {}).items():
+        record = {
+            'type': 'destination',
+            'file': file_path,
+            'name': str(name),
+            'page': dest.get('page', -1) if isinstance(dest, dict) else -1
+        }
+        to = _point(dest.get('to')) if isinstance(dest, dict) else None
+        if to is not None:
+            record['to'] = to
+        records.append(record)
+    return records
+
+
+def dump_file(file_path: str, sections: Iterable[str] = SECTIONS) -> Tuple[str, bool]:
+    """
+    All records of one PDF as a JSONL block ("file" record last), and whether it succeeded
+
+    Errors are reported in the "file" record instead of raised, so one broken
+    PDF does not stop the batch.
+    """
+    extractors = {'links': _link_records, 'toc': _toc_records, 'destinations': _destination_records}
+    counts = {'links': 0, 'toc': 0, 'destinations': 0}
+    timing = {}
+    lines = []
+    summary = {'type': 'file', 'file': file_path, 'status': 'ok'}
+
+    start_time = time.perf_counter()
+    doc = None
+    try:
+        doc = fitz.open(file_path)
+        summary['pages'] = len(doc)
+        timing['open'] = time.perf_counter() - start_time
+
+        for section in sections:
+            section_start = time.perf_counter()
+            records = extractors[section](doc, file_path)
+            timing[section] = time.perf_counter() - section_start
+            counts[section] = len(records)
+            lines.extend(json.dumps(record, ensure_ascii=False) for record in records)
+    except Exception as e:
+        summary['status'] = 'error'
+        summary['error'] = f"{type(e).__name__}: {e}"
+    finally:
+        if doc is not None:
+            doc.close()
+
+    timing['total'] = time.perf_counter() - start_time
+    summary.update({
+        'links': counts['links'],
+        'toc_entries': counts['toc'],
+        'destinations': counts['destinations'],
+        'timing': {key: round(value, 6) for key, value in timing.items()}
+    })
+    lines.append(json.dumps(summary, ensure_ascii=False))
+    return '\n'.join(lines) + '\n', summary['status'] == 'ok'
+
+
+def crashed_file_block(file_path: str) -> Tuple[str, bool]:
+    """Error "file" record for a PDF whose worker process died"""
+    summary = {
+        'type': 'file',
+        'file': file_path,
+        'status': 'error',
+        'error': 'BrokenProcessPool: worker process crashed',
+        'links': 0,
+        'toc_entries': 0,
+        'destinations': 0,
+        'timing': {}
+    }
+    return json.dumps(summary, ensure_ascii=False) + '\n', False
+
+
+# ========================================
+# DRIVER SIDE
+# ========================================
+
+def find_pdfs(inputs: Iterable[str], recursive: bool = False) -> List[str]:
+    """PDF paths from files, directories and glob patterns (sorted, de-duplicated)"""
+    found = set()
+    for item in inputs:
+        if os.path.isdir(item):
+            pattern = os.path.join(item, '**', '*.pdf') if recursive else os.path.join(item, '*.pdf')
+            matches = glob.glob(pattern, recursive=recursive)
+            matches += glob.glob(pattern[:-4] + '.PDF', recursive=recursive)
+        elif glob.has_magic(item):
+            matches = glob.glob(item, recursive=True)
+        else:
+            matches = [item] if os.path.isfile(item) else []
+            if not matches:
+                print(f"⚠️ Not found: {item}", file=sys.stderr)
+        found.update(os.path.abspath(path) for path in matches if os.path.isfile(path))
+    return sorted(found)
+
+
+def completed_files(output_path: str) -> Set[str]:
+    """
+    Files with a "file" record in an existing output
+
+    The output is cut back to the end of the last "file" record. Records of a
+    file whose block was only partly written (run killed mid-write) are
+    dropped with it, so the file is dumped again without duplicates.
+    """
+    done = set()
+    if not os.path.exists(output_path):
+        return done
+
+    with open(output_path, 'rb+') as f:
+        position = 0
+        valid_end = 0
+        for line in iter(f.readline, b''):
+            position += len(line)
+            if not line.endswith(b'\n') or b'"type": "file"' not in line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record.get('type') == 'file':
+                done.add(record['file'])
+                valid_end = position
+        f.truncate(valid_end)
+    return done
+
+
+def run_batch(pdf_paths: List[str], output_path: str, workers: int, sections: Iterable[str],
+              resume: bool = False) -> Dict[str, Any]:
+    """Dump all files over a process pool, streaming blocks to output_path as they finish"""
+    sections = tuple(sections)
+    skipped = 0
+    if resume:
+        done = completed_files(output_path)
+        remaining = [path for path in pdf_paths if path not in done]
+        skipped = len(pdf_paths) - len(remaining)
+        pdf_paths = remaining
+        if skipped:
+            print(f"⏭️ Resuming: {skipped} files already dumped", file=sys.stderr)
+
+    stats = {'files': 0, 'errors': 0, 'skipped': skipped, 'seconds': 0.0}
+    if not pdf_paths:
+        return stats
+
+    max_in_flight = workers * 2  # Keeps every worker busy without queueing the whole corpus
+    start_time = time.perf_counter()
+    pending_paths = iter(pdf_paths)
+    in_flight = {}  # future -> path
+    executor = ProcessPoolExecutor(max_workers=workers)
+
+    try:
+        with open(output_path, 'a' if resume else 'w', encoding='utf-8') as out:
+
+            def write_block(block: str, ok: bool):
+                out.write(block)  # One write per file - "file" record last
+                out.flush()
+
+                stats['files'] += 1
+                if not ok:
+                    stats['errors'] += 1
+                if stats['files'] % 100 == 0:
+                    print(f"📄 {stats['files']}/{len(pdf_paths)} files dumped", file=sys.stderr)
+
+            def fill():
+                while len(in_flight) < max_in_flight:
+                    path = next(pending_paths, None)
+                    if path is None:
+                        return
+                    in_flight[executor.submit(dump_file, path, sections)] = path
+
+            fill()
+            while in_flight:
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                crashed = []
+                for future in finished:
+                    path = in_flight.pop(future)
+                    try:
+                        block, ok = future.result()
+                    except BrokenProcessPool:
+                        crashed.append(path)
+                        continue
+                    write_block(block, ok)
+
+                if crashed:
+                    # A dead worker breaks the whole pool - every file still in flight failed with it
+                    crashed.extend(in_flight.values())
+                    in_flight.clear()
+                    executor.shutdown(wait=False)
+                    executor = ProcessPoolExecutor(max_workers=workers)
+                    if len(crashed) > 1:
+                        print(f"💥 Worker crashed with {len(crashed)} files in flight - retrying them one by one",
+                              file=sys.stderr)
+
+                    # Re-run each file on its own, so only the file that crashes gets an error record
+                    for path in sorted(crashed):
+                        if len(crashed) > 1:  # A single file in flight is known to be the culprit
+                            try:
+                                write_block(*executor.submit(dump_file, path, sections).result())
+                                continue
+                            except BrokenProcessPool:
+                                executor.shutdown(wait=False)
+                                executor = ProcessPoolExecutor(max_workers=workers)
+                        print(f"💥 Worker crashed on {path}", file=sys.stderr)
+                        write_block(*crashed_file_block(path))
+
+                fill()
+    finally:
+        executor.shutdown()
+
+    stats['seconds'] = time.perf_counter() - start_time
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dump links, TOC entries and named destinations of many PDFs as JSONL")
+    parser.add_argument("inputs", nargs="+", help="PDF files, directories or glob patterns")
+    parser.add_argument("-o", "--output", required=True, help="JSONL output file")
+    parser.add_argument("-r", "--recursive", action="store_true", help="Search directories recursively")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("--only", action="append", choices=SECTIONS,
+                        help="Dump only these record types (repeatable; default: all)")
+    parser.add_argument("--resume", action="store_true", help="Skip files already completed in the output")
+    args = parser.parse_args()
+
+    if fitz is None:
+        print("✗ Missing dependency: PyMuPDF (fitz)", file=sys.stderr)
+        return 1
+
+    pdf_paths = find_pdfs(args.inputs, args.recursive)
+    if not pdf_paths:
+        print("❌ No PDF files found", file=sys.stderr)
+        return 1
+
+    print(f"🔗 Dumping {len(pdf_paths)} PDFs with {args.workers} workers → {args.output}", file=sys.stderr)
+    stats = run_batch(pdf_paths, args.output, max(1, args.workers), args.only or SECTIONS, args.resume)
+
+    rate = stats['files'] / stats['seconds'] if stats['seconds'] else 0.0
+    print(f"✅ {stats['files']} files dumped ({stats['errors']} errors, {stats['skipped']} skipped) "
+          f"in {stats['seconds']:.1f}s ({rate:.1f} files/s)", file=sys.stderr)
+    return 0 if stats['errors'] == 0 else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+"""
+Micro-benchmark: FormField memory per large template
+
+Loads a synthetic template (JSON, so every string is a separate object like a
+real project file) into the old __dict__-based dataclass layout and into the
+slotted FormField with interned strings and shared appearances. A second run
+gives every field a fresh appearance dict with QColor values, the way the
+appearance property widgets build them.
+
+Usage:
+    python scripts/benchmark_field_memory.py [--fields 100000] [--styles 8]
+"""
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Dict
+
+# Add src to path so we can import our modules
+sys.path.append('src')
+
+
+@dataclass
+class LegacyFormField:
+    """FormField layout before slots/interning (per-instance __dict__, private appearance dicts)"""
+    id: str
+    type: Any
+    name: str
+    x: int
+    y: int
+    width: int
+    height: int
+    page_number: int = 0
+    required: bool = False
+    read_only: bool = False
+    tooltip: str = ""
+    locked: bool = False
+    visibility: str = "Visible"
+    orientation: str = "0"
+    value: Any = ""
+    properties: Dict[str, Any] = field(default_factory=dict)
+    format_category: str = "None"
+    format_settings: str = "{}"
+    input_type: str = "text"
+    map_to: str = "Auto"
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], field_type) -> 'LegacyFormField':
+        return cls(**dict(data, type=field_type(data['type'])))
+
+
+def build_template_json(field_count: int, style_count: int) -> str:
+    """Serialized template with a handful of appearance styles reused across fields"""
+    styles = [{
+        'font': {'family': 'Arial', 'size': 9 + i, 'bold': i % 2 == 0, 'italic': False},
+        'border': {'style': 'solid', 'width': 1, 'color': '#000000'},
+        'background': {'color': f'#FFFF{i:02X}', 'transparent': False},
+        'text_color': '#000000'
+    } for i in range(style_count)]
+
+    fields = [{
+        'id': f'text_{i}',
+        'type': 'text',
+        'name': f'text_{i}',
+        'x': 50 + (i % 10) * 55,
+        'y': 50 + (i // 10 % 30) * 25,
+        'width': 150,
+        'height': 25,
+        'page_number': i // 300,
+        'required': False,
+        'read_only': False,
+        'locked': False,
+        'tooltip': '',
+        'visibility': 'Visible',
+        'orientation': '0',
+        'value': '',
+        'properties': {'appearance': styles[i % style_count]},
+        'format_category': 'None',
+        'format_settings': '{}',
+        'input_type': 'text',
+        'map_to': 'Auto',
+    } for i in range(field_count)]
+    return json.dumps(fields)
+
+
+def ui_appearance(style: int) -> Dict[str, Any]:
+    """Appearance as the property widgets build it (QColor values, a new dict per field)"""
+    from PyQt6.QtGui import QColor
+    return {
+        'font': {'family': 'Arial', 'size': 9 + style, 'bold': style % 2 == 0, 'italic': False,
+                 'underline': False, 'color': QColor(0, 0, 0)},
+        'border': {'color': QColor(100, 100, 100), 'width': 'thin', 'style': 'solid'},
+        'background': {'color': QColor(255, 255, style), 'opacity': 100}
+    }
+
+
+def with_ui_appearances(records, style_count: int):
+    """Template records with their JSON appearances replaced by QColor ones"""
+    for i, record in enumerate(records):
+        record['properties'] = {'appearance': ui_appearance(i % style_count)}
+    return records
+
+
+def measure(load) -> int:
+    """Bytes still allocated after load() (the loaded objects are kept alive)"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    loaded = load()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del loaded
+    gc.collect()
+    return after - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark FormField memory usage")
+    parser.add_argument("--fields", type=int, default=100_000, help="Fields to load (default 100000)")
+    parser.add_argument("--styles", type=int, default=8, help="Distinct appearance styles (default 8)")
+    args = parser.parse_args()
+
+    try:
+        from models.field_model import FieldType, FormField
+    except ImportError as e:
+        print(f"✗ Missing dependency: {e}")
+        return 1
+
+    template = build_template_json(args.fields, args.styles)
+
+    runs = [
+        ("JSON appearances", lambda: json.loads(template)),
+        ("QColor appearances", lambda: with_ui_appearances(json.loads(template), args.styles)),
+    ]
+
+    print("=== FormField memory benchmark ===")
+    print(f"{args.fields} fields, {args.styles} appearance styles")
+    for run_name, records in runs:
+        results = [
+            ("dict dataclass (before)", measure(
+                lambda: [LegacyFormField.from_dict(d, FieldType) for d in records()])),
+            ("slotted + interned (after)", measure(
+                lambda: [FormField.from_dict(d) for d in records()])),
+        ]
+
+        print(f"-- {run_name}")
+        baseline = results[0][1]
+        for name, total in results:
+            per_100k_mb = total / args.fields * 100_000 / (1024 * 1024)
+            print(f"{name}: {per_100k_mb:8.1f} MB per 100k fields  "
+                  f"({total / args.fields:6.0f} B/field, {baseline / total:4.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""
+Micro-benchmark: EnhancedFieldRenderer overlay pass
+
+Renders a page of identically styled text fields onto an image, repeatedly,
+with the renderer's caches switched on and off:
+
+    no caches          - new QFont/QPen per field, every field re-rendered (old behaviour)
+    paint object cache - shared fonts/pens/brushes
+    + pixmap cache     - pre-rendered field pixmaps blitted on later passes
+
+Usage:
+    python scripts/benchmark_field_rendering.py [--fields 2000] [--passes 10]
+"""
+import argparse
+import sys
+import time
+
+# Add src to path so we can import our modules
+sys.path.append('src')
+
+
+class UncachedPaintObjects:
+    """Stand-in for PaintObjectCache that builds a new object per call"""
+
+    def font(self, family, size, bold=False, italic=False):
+        from PyQt6.QtGui import QFont
+        font = QFont(family, size)
+        font.setBold(bold)
+        font.setItalic(italic)
+        return font
+
+    def pen(self, color, width=1, style=None):
+        from PyQt6.QtCore import Qt
+        from PyQt6.QtGui import QPen
+        return QPen(color, width, style if style is not None else Qt.PenStyle.SolidLine)
+
+    def brush(self, color):
+        from PyQt6.QtGui import QBrush
+        return QBrush(color)
+
+    def get_stats(self):
+        return {}
+
+
+def build_fields(FormField, count: int):
+    """Text fields on page 0 sharing one appearance"""
+    appearance = {'font': {'family': 'Arial', 'size': 10, 'bold': False, 'italic': False},
+                  'border': {'style': 'solid', 'width': 'thin'}}
+    fields = []
+    for i in range(count):
+        field = FormField.create('text', 20 + (i % 8) * 160, 20 + (i // 8) * 30, field_id=f'text_{i}')
+        field.set_appearance(appearance)
+        fields.append(field)
+    return fields
+
+
+def time_passes(renderer, fields, image, passes: int) -> float:
+    """Seconds per overlay pass (average)"""
+    from PyQt6.QtGui import QPainter
+
+    start = time.perf_counter()
+    for _ in range(passes):
+        painter = QPainter(image)
+        renderer.render_fields(painter, fields, None, 0, 1.0, lambda page, x, y: (x, y))
+        painter.end()
+    return (time.perf_counter() - start) / passes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark field overlay rendering")
+    parser.add_argument("--fields", type=int, default=2000, help="Fields on the page (default 2000)")
+    parser.add_argument("--passes", type=int, default=10, help="Overlay passes to time (default 10)")
+    args = parser.parse_args()
+
+    try:
+        from PyQt6.QtGui import QGuiApplication, QImage
+        from models.field_model import FormField
+        from ui.enhanced_field_renderer import EnhancedFieldRenderer
+    except ImportError as e:
+        print(f"✗ Missing dependency: {e}")
+        return 1
+
+    _app = QGuiApplication(sys.argv)  # Fonts need a GUI application (kept alive for the run)
+
+    fields = build_fields(FormField, args.fields)
+    rows = (args.fields + 7) // 8
+    image = QImage(20 + 8 * 160, 40 + rows * 30, QImage.Format.Format_ARGB32_Premultiplied)
+
+    uncached = EnhancedFieldRenderer()
+    uncached.paint_cache = UncachedPaintObjects()
+    uncached.pixmap_cache_enabled = False
+
+    paint_cached = EnhancedFieldRenderer()
+    paint_cached.pixmap_cache_enabled = False
+
+    fully_cached = EnhancedFieldRenderer()
+
+    results = [
+        ("no caches (before)", time_passes(uncached, fields, image, args.passes)),
+        ("paint object cache", time_passes(paint_cached, fields, image, args.passes)),
+        ("+ pixmap cache", time_passes(fully_cached, fields, image, args.passes)),
+    ]
+
+    print("=== Field overlay rendering benchmark ===")
+    print(f"{args.fields} text fields, {args.passes} passes")
+    baseline = results[0][1]
+    for name, seconds in results:
+        print(f"{name}: {seconds * 1000:8.2f} ms/pass  ({baseline / seconds:4.1f}x)")
+
+    stats = fully_cached.get_cache_stats()
+    print(f"Font hit rate: {stats['paint_objects']['fonts']['hit_rate']:.1%}, "
+          f"pen hit rate: {stats['paint_objects']['pens']['hit_rate']:.1%}, "
+          f"pixmap hit rate: {stats['hit_rate']:.1%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
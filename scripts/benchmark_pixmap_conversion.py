@@ -0,0 +1,86 @@
+"""
+Micro-benchmark: fitz.Pixmap -> Qt conversion
+
+Compares the old PPM round-trip (pix.tobytes("ppm") + QPixmap.loadFromData)
+with the zero-copy samples wrapper in utils.pixmap_utils.
+
+Usage:
+    python scripts/benchmark_pixmap_conversion.py [file.pdf] [--zoom 2.0] [--pages 10] [--repeat 5]
+"""
+import argparse
+import sys
+import time
+
+# Add src to path so we can import our modules
+sys.path.append('src')
+
+
+def build_sample_document(fitz, page_count: int):
+    """In-memory document with some text so pages are not blank"""
+    doc = fitz.open()
+    for i in range(page_count):
+        page = doc.new_page()
+        for line in range(40):
+            page.insert_text((50, 60 + line * 17), f"Benchmark page {i + 1} line {line + 1} " * 3, fontsize=10)
+    return doc
+
+
+def time_conversion(pixmaps, convert, repeat: int) -> float:
+    """Best-of-repeat seconds to convert all pixmaps"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for pix in pixmaps:
+            convert(pix)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark fitz.Pixmap to QPixmap/QImage conversion")
+    parser.add_argument("pdf", nargs="?", help="PDF to render (default: generated sample)")
+    parser.add_argument("--zoom", type=float, default=2.0, help="Render zoom (default 2.0)")
+    parser.add_argument("--pages", type=int, default=10, help="Pages to convert (default 10)")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions, best is reported (default 5)")
+    args = parser.parse_args()
+
+    try:
+        import fitz
+        from PyQt6.QtGui import QGuiApplication, QPixmap
+        from utils.pixmap_utils import fitz_pixmap_to_qimage, fitz_pixmap_to_qpixmap
+    except ImportError as e:
+        print(f"✗ Missing dependency: {e}")
+        return 1
+
+    app = QGuiApplication(sys.argv)  # QPixmap needs a GUI application
+
+    doc = fitz.open(args.pdf) if args.pdf else build_sample_document(fitz, args.pages)
+    page_count = min(args.pages, doc.page_count)
+    matrix = fitz.Matrix(args.zoom, args.zoom)
+    pixmaps = [doc[i].get_pixmap(matrix=matrix) for i in range(page_count)]
+
+    def ppm_round_trip(pix):
+        qpix = QPixmap()
+        qpix.loadFromData(pix.tobytes("ppm"))
+        return qpix
+
+    results = [
+        ("PPM round-trip -> QPixmap", time_conversion(pixmaps, ppm_round_trip, args.repeat)),
+        ("samples wrap   -> QPixmap", time_conversion(pixmaps, fitz_pixmap_to_qpixmap, args.repeat)),
+        ("samples wrap   -> QImage ", time_conversion(pixmaps, fitz_pixmap_to_qimage, args.repeat)),
+    ]
+
+    first = pixmaps[0]
+    print("=== Pixmap conversion benchmark ===")
+    print(f"{page_count} pages, {first.width}x{first.height} px at zoom {args.zoom}, best of {args.repeat}")
+    baseline = results[0][1]
+    for name, seconds in results:
+        per_page_ms = seconds / page_count * 1000
+        print(f"{name}: {per_page_ms:8.3f} ms/page  ({baseline / seconds:5.1f}x)")
+
+    del app
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,128 +1,250 @@
 """
 Business logic for TOC extraction and management - FIXED VERSION
+
+Extraction is a generator of top-level entries (each with its complete
+subtree), so the tree widget can populate while the rest is still converted.
+Results are cached next to the PDF as <file>.toc.json, keyed by file size and
+mtime with the SHA-256 of the content as fallback, so reopening a document
+costs one small file read instead of a TOC walk. The extractor runs on the GUI
+thread, so it never hashes the PDF itself: it uses a hash the link indexer
+already computed, and otherwise a background thread adds the hash to the cache.
 """
 
-from typing import List, Dict, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Any, Iterator
+import json
+import os
 import time
 from ..models.a_toc_entry import TOCEntry
+from utils.file_handler import file_content_hash, file_signature, known_content_hash
 import fitz  # PyMuPDF
 
+TOC_CACHE_SUFFIX = ".toc.json"
+TOC_CACHE_VERSION = 1
+
+# Cached row: [level (0-based), title, page (0-based), x, y]
+TOCRow = list
+
+
+def toc_cache_path(file_path: str) -> str:
+    return file_path + TOC_CACHE_SUFFIX
+
+
+def _file_signature(file_path: str) -> list:
+    return list(file_signature(file_path))  # JSON form
+
+
+class TOCCache:
+    """Compact on-disk TOC rows per document"""
+
+    # Hashes PDFs whose content hash is not known yet, off the GUI thread
+    _hash_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="toc-hash")
+
+    @staticmethod
+    def load(file_path: str) -> Optional[List[TOCRow]]:
+        """Cached rows, or None if missing or stale"""
+        path = toc_cache_path(file_path)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get('version') != TOC_CACHE_VERSION:
+                return None
+
+            signature = _file_signature(file_path)
+            if data.get('signature') != signature:
+                # Touched or copied - still valid if the content is unchanged. Only a hash that is
+                # already known is compared; hashing here would block the GUI thread.
+                content_hash = known_content_hash(file_path)
+                if content_hash is None or data.get('sha256') != content_hash:
+                    return None
+                data['signature'] = signature
+                TOCCache._write(path, data)
+            return data['rows']
+        except (OSError, ValueError, KeyError) as e:
+            print(f"⚠️ Ignoring unreadable TOC cache {path}: {e}")
+            return None
+
+    @staticmethod
+    def save(file_path: str, rows: List[TOCRow]):
+        """Write the rows; the content hash is added in the background when not known yet"""
+        try:
+            data = {
+                'version': TOC_CACHE_VERSION,
+                'signature': _file_signature(file_path),
+                'sha256': known_content_hash(file_path),
+                'rows': rows
+            }
+            TOCCache._write(toc_cache_path(file_path), data)
+        except OSError as e:
+            print(f"⚠️ Could not save TOC cache next to {file_path}: {e}")
+            return
+
+        if data['sha256'] is None:
+            TOCCache._hash_executor.submit(TOCCache._add_content_hash, file_path, data['signature'])
+
+    @staticmethod
+    def _add_content_hash(file_path: str, signature: list):
+        """Hash the PDF (worker thread) and store it in a cache still written for that signature"""
+        path = toc_cache_path(file_path)
+        try:
+            content_hash = file_content_hash(file_path)
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get('signature') != signature or data.get('sha256') is not None:
+                return
+            data['sha256'] = content_hash
+            TOCCache._write(path, data)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not hash {file_path} for its TOC cache: {e}")
+
+    @staticmethod
+    def wait_for_hashing():
+        """Block until background hashing submitted so far has finished"""
+        TOCCache._hash_executor.submit(lambda: None).result()
+
+    @staticmethod
+    def _write(path: str, data: dict):
+        # Replace atomically - the GUI thread and the hashing thread both write caches
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temp_path, path)
+
 
 class TOCExtractor:
     """
     FIXED TOC Extractor with proper page number validation and timing
     """
 
-    def __init__(self, pdf_document):
+    def __init__(self, pdf_document, use_cache: bool = True):
         self.pdf_document = pdf_document
+        self.use_cache = use_cache
         self.last_extraction_time = 0.0
+        self.last_entry_count = 0
+        self.last_source = ""  # "cache" or "pdf"
 
     def extract_toc(self) -> List[TOCEntry]:
-        """Extract TOC with page number validation and timing"""
+        """Extract the whole TOC at once (see iter_toc for progressive loading)"""
+        return list(self.iter_toc())
+
+    def iter_toc(self, use_cache: Optional[bool] = None) -> Iterator[TOCEntry]:
+        """
+        Yield top-level entries in order, each as soon as its subtree is complete
+
+        Served from the on-disk cache when it matches the file; otherwise read
+        from the PDF, validated, and cached once the last entry has been yielded.
+        use_cache=False re-reads the PDF (the cache is still rewritten).
+        """
+        if use_cache is None:
+            use_cache = self.use_cache
 
         start_time = time.time()
+        self.last_entry_count = 0
 
         if not self.pdf_document or not hasattr(self.pdf_document, 'doc'):
             self.last_extraction_time = time.time() - start_time
-            return []
-
-        try:
-            # Get raw TOC data
-            pdf_read_start = time.time()
-            toc_data = self.pdf_document.doc.get_toc(simple=True)  # Use simple=True for speed
-            pdf_read_time = time.time() - pdf_read_start
+            return
 
-            print(f"🚀 PDF TOC read time: {pdf_read_time:.3f}s")
+        file_path = getattr(self.pdf_document, 'file_path', '') or ''
+        cacheable = bool(file_path) and os.path.isfile(file_path)
 
-            if not toc_data:
+        try:
+            rows = TOCCache.load(file_path) if cacheable and use_cache else None
+            if rows is not None:
+                self.last_source = "cache"
+                yield from self._assemble(rows)
                 self.last_extraction_time = time.time() - start_time
-                print(f"🕒 Total extraction time (no TOC): {self.last_extraction_time:.3f}s")
-                return []
-
-            # CRITICAL FIX: Get actual page count for validation
-            total_pages = len(self.pdf_document.doc)
-            print(f"📊 PDF has {total_pages} pages total (0-based: 0-{total_pages-1})")
-
-            conversion_start = time.time()
-            entries = []
-            entry_stack = []
-            invalid_pages = 0
-            processed_count = 0
-
-            for i, toc_item in enumerate(toc_data):
-                # Progress for large TOCs
-                if i > 0 and i % 100 == 0:
-                    print(f"📊 Processed {i}/{len(toc_data)} TOC entries...")
-
-                level = toc_item[0] - 1  # Convert to 0-based
-                title = toc_item[1].strip()
-                raw_page_info = toc_item[2]
-
-                # CRITICAL FIX: Validate and correct page numbers
-                raw_page_num, dest_type, coords = self._parse_destination_safe(raw_page_info)
-
-                # PyMuPDF sometimes returns incorrect page numbers - validate against actual PDF
-                if raw_page_num >= total_pages:
-                    print(f"⚠️  TOC entry '{title}' points to page {raw_page_num + 1}, but PDF only has {total_pages} pages")
-                    corrected_page = min(raw_page_num, total_pages - 1)
-                    print(f"    → Correcting to page {corrected_page + 1}")
-                    invalid_pages += 1
-                else:
-                    corrected_page = raw_page_num
-
-                # Ensure page is never negative
-                final_page = max(0, corrected_page)
-
-                # Debug output for first few entries
-                if i < 5:
-                    print(f"📖 TOC Entry {i+1}: '{title}' → Page {final_page + 1} (0-based: {final_page})")
-
-                entry = TOCEntry(
-                    title=title,
-                    page=final_page,  # Always 0-based internally
-                    level=level,
-                    dest_type=dest_type,
-                    coordinates=coords
-                )
-
-                # Handle nesting efficiently
-                if level == 0:
-                    entries.append(entry)
-                    entry_stack = [entry]
-                else:
-                    # Trim stack efficiently
-                    if len(entry_stack) > level:
-                        entry_stack = entry_stack[:level]
-
-                    if entry_stack:
-                        entry_stack[-1].add_child(entry)
-                        entry_stack.append(entry)
-                    else:
-                        # Fallback - treat as top level
-                        entries.append(entry)
-                        entry_stack = [entry]
-
-                processed_count += 1
-
-            conversion_time = time.time() - conversion_start
+                print(f"🚀 TOC loaded from cache: {self.last_entry_count} entries "
+                      f"in {self.last_extraction_time:.3f}s")
+                return
+
+            self.last_source = "pdf"
+            rows = []
+            yield from self._assemble(self._read_rows(rows))
             self.last_extraction_time = time.time() - start_time
 
-            # Summary output
-            if invalid_pages > 0:
-                print(f"⚠️  FIXED {invalid_pages} invalid page references in TOC")
+            if rows and cacheable:
+                TOCCache.save(file_path, rows)
 
-            print(f"🚀 TOC conversion time: {conversion_time:.3f}s")
             print(f"🚀 Total extraction time: {self.last_extraction_time:.3f}s")
-            print(f"✅ TOC extraction complete: {len(entries)} top-level entries, {processed_count} total entries")
-            print(f"🚀 Performance: {processed_count / self.last_extraction_time:.0f} entries/second")
-
-            return entries
+            if self.last_entry_count:
+                print(f"✅ TOC extraction complete: {self.last_entry_count} total entries")
 
         except Exception as e:
             self.last_extraction_time = time.time() - start_time
             print(f"❌ Error extracting TOC: {e}")
             print(f"🕒 Failed extraction time: {self.last_extraction_time:.3f}s")
-            return []
+
+    def _read_rows(self, collected: List[TOCRow]) -> Iterator[TOCRow]:
+        """Validated rows from the PDF (also appended to collected for the cache)"""
+        # Get raw TOC data
+        pdf_read_start = time.time()
+        toc_data = self.pdf_document.doc.get_toc(simple=True)  # Use simple=True for speed
+        print(f"🚀 PDF TOC read time: {time.time() - pdf_read_start:.3f}s")
+
+        if not toc_data:
+            return
+
+        # CRITICAL FIX: Get actual page count for validation
+        total_pages = len(self.pdf_document.doc)
+        invalid_pages = 0
+
+        for toc_item in toc_data:
+            level = toc_item[0] - 1  # Convert to 0-based
+            title = toc_item[1].strip()
+
+            # CRITICAL FIX: Validate and correct page numbers
+            raw_page_num, dest_type, coords = self._parse_destination_safe(toc_item[2])
+
+            # PyMuPDF sometimes returns incorrect page numbers - validate against actual PDF
+            if raw_page_num >= total_pages:
+                corrected_page = min(raw_page_num, total_pages - 1)
+                invalid_pages += 1
+            else:
+                corrected_page = raw_page_num
+
+            # Ensure page is never negative
+            row = [level, title, max(0, corrected_page), coords[0], coords[1]]
+            collected.append(row)
+            yield row
+
+        if invalid_pages > 0:
+            print(f"⚠️  FIXED {invalid_pages} invalid page references in TOC (PDF has {total_pages} pages)")
+
+    def _assemble(self, rows: Iterator[TOCRow]) -> Iterator[TOCEntry]:
+        """Nest rows into entries; a top-level entry is yielded when the next one starts"""
+        current_top = None
+        entry_stack = []
+
+        for level, title, page, x, y in rows:
+            entry = TOCEntry(
+                title=title,
+                page=page,  # Always 0-based internally
+                level=level,
+                dest_type='page',
+                coordinates=(x, y)
+            )
+            self.last_entry_count += 1
+
+            # Handle nesting efficiently
+            if level > 0 and entry_stack:
+                # Trim stack efficiently
+                if len(entry_stack) > level:
+                    entry_stack = entry_stack[:level]
+                entry_stack[-1].add_child(entry)
+                entry_stack.append(entry)
+                continue
+
+            # Top level (or orphaned child - treated as top level)
+            if current_top is not None:
+                yield current_top
+            current_top = entry
+            entry_stack = [entry]
+
+        if current_top is not None:
+            yield current_top
 
     def _parse_destination_safe(self, dest_info) -> tuple:
         """CORRECTED - Convert PyMuPDF's 1-based pages to 0-based"""
@@ -163,7 +285,9 @@ class TOCExtractor:
         """Get performance statistics"""
         return {
             'last_time': self.last_extraction_time,
-            'entries_per_second': 0 if self.last_extraction_time == 0 else len(self.toc_entries) / self.last_extraction_time
+            'entries': self.last_entry_count,
+            'source': self.last_source,
+            'entries_per_second': 0 if self.last_extraction_time == 0 else self.last_entry_count / self.last_extraction_time
         }
 
     # Optional: Debug method to test specific PDF
@@ -0,0 +1,129 @@
+"""
+Field Edge Index
+Sorted per-page edge positions for alignment guides
+
+Every field contributes three vertical edges (left, center-x, right) and three
+horizontal edges (top, center-y, bottom). Each page keeps them in two sorted
+lists, so "nearest edge within N px" is a bisection instead of a scan of every
+field. The index is a snapshot: it is built when a drag starts (without the
+fields being dragged) and thrown away when the drag ends. Pages are indexed
+lazily, the first time they are queried.
+"""
+
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+Bounds = Tuple[float, float, float, float]  # x0, y0, x1, y1
+
+X_EDGES = ('left', 'center_x', 'right')
+Y_EDGES = ('top', 'center_y', 'bottom')
+
+
+class EdgeMatch(NamedTuple):
+    """A dragged edge lined up with another field's edge"""
+    axis: str  # 'x' (vertical guide) or 'y' (horizontal guide)
+    edge: str  # Edge of the dragged bounds, e.g. 'left'
+    target: str  # Edge of the other field, e.g. 'center_x'
+    position: float  # Document coordinate of the guide
+    delta: float  # Move that puts the dragged edge on the guide
+    field: object  # Field owning the target edge
+
+
+def edge_positions(bounds: Bounds, axis: str) -> Tuple[float, float, float]:
+    """(start, center, end) of bounds along an axis"""
+    x0, y0, x1, y1 = bounds
+    if axis == 'x':
+        return x0, (x0 + x1) / 2, x1
+    return y0, (y0 + y1) / 2, y1
+
+
+class _AxisEdges:
+    """Sorted edge positions of one page along one axis"""
+
+    __slots__ = ('positions', 'owners')
+
+    def __init__(self, edges: List[Tuple[float, str, object]]):
+        edges.sort(key=lambda edge: edge[0])
+        self.positions = [edge[0] for edge in edges]
+        self.owners = [(edge[1], edge[2]) for edge in edges]
+
+    def nearest(self, value: float) -> Optional[int]:
+        """Index of the closest position (None when empty)"""
+        if not self.positions:
+            return None
+        index = bisect_left(self.positions, value)
+        if index == 0:
+            return 0
+        if index == len(self.positions):
+            return index - 1
+        return index - 1 if value - self.positions[index - 1] <= self.positions[index] - value else index
+
+
+class FieldEdgeIndex:
+    """Per-page sorted x and y edges of a set of fields"""
+
+    def __init__(self, fields_on_page: Callable[[int], Iterable[object]], exclude: Iterable[object] = ()):
+        """
+        Args:
+            fields_on_page: Returns the fields of a page (e.g. FieldManager.get_fields_on_page)
+            exclude: Fields left out of the index (the ones being dragged)
+        """
+        self._fields_on_page = fields_on_page
+        self._excluded = {id(field) for field in exclude}
+        self._pages: Dict[int, Tuple[_AxisEdges, _AxisEdges]] = {}
+
+        # Statistics
+        self.queries = 0
+        self.matches = 0
+
+    def _page(self, page_num: int) -> Tuple[_AxisEdges, _AxisEdges]:
+        axes = self._pages.get(page_num)
+        if axes is None:
+            x_edges, y_edges = [], []
+            for field in self._fields_on_page(page_num):
+                if id(field) in self._excluded:
+                    continue
+                bounds = (field.x, field.y, field.x + field.width, field.y + field.height)
+                x_edges.extend(zip(edge_positions(bounds, 'x'), X_EDGES, (field,) * 3))
+                y_edges.extend(zip(edge_positions(bounds, 'y'), Y_EDGES, (field,) * 3))
+            axes = self._pages[page_num] = (_AxisEdges(x_edges), _AxisEdges(y_edges))
+        return axes
+
+    def nearest_edge(self, page_num: int, axis: str, value: float,
+                     tolerance: float) -> Optional[Tuple[float, str, object]]:
+        """Closest (position, edge name, field) within tolerance of value, or None"""
+        edges = self._page(page_num)[0 if axis == 'x' else 1]
+        index = edges.nearest(value)
+        if index is None or abs(edges.positions[index] - value) > tolerance:
+            return None
+        return (edges.positions[index],) + edges.owners[index]
+
+    def match(self, page_num: int, bounds: Bounds, tolerance: float) -> Tuple[Optional[EdgeMatch], Optional[EdgeMatch]]:
+        """
+        Best x and y alignment for dragged bounds
+
+        Each of the bounds' three edges per axis is matched against the page's
+        edges; the closest match within tolerance wins.
+        """
+        self.queries += 1
+        result = []
+        for axis, names in (('x', X_EDGES), ('y', Y_EDGES)):
+            best = None
+            for name, value in zip(names, edge_positions(bounds, axis)):
+                hit = self.nearest_edge(page_num, axis, value, tolerance)
+                if hit is not None and (best is None or abs(hit[0] - value) < abs(best.delta)):
+                    best = EdgeMatch(axis, name, hit[1], hit[0], hit[0] - value, hit[2])
+            result.append(best)
+
+        if result[0] is not None or result[1] is not None:
+            self.matches += 1
+        return result[0], result[1]
+
+    def get_stats(self) -> dict:
+        """Index statistics"""
+        return {
+            'pages_indexed': len(self._pages),
+            'edges': sum(len(x.positions) + len(y.positions) for x, y in self._pages.values()),
+            'queries': self.queries,
+            'matches': self.matches
+        }
@@ -0,0 +1,123 @@
+"""
+Field Interning
+Shared storage for values that repeat across thousands of form fields
+
+Enum-like strings ("Visible", "Auto", "None", "{}") are interned so every field
+points at one string object, and identical appearance dicts are pooled into a
+single read-only SharedAppearance. Appearance edits replace the field's
+reference with another pooled object (copy-on-write) instead of mutating it.
+"""
+
+import sys
+import weakref
+from typing import Any, Dict, Mapping, Optional
+
+from PyQt6.QtGui import QColor
+
+
+def intern_str(value):
+    """Intern plain strings, pass anything else through"""
+    return sys.intern(value) if type(value) is str else value
+
+
+class SharedAppearance(dict):
+    """Read-only appearance mapping shared between fields - copy() returns a mutable dict"""
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("SharedAppearance is shared between fields; "
+                        "use FormField.update_appearance() / set_appearance() instead")
+
+    __setitem__ = __delitem__ = _read_only
+    update = setdefault = pop = popitem = clear = _read_only
+
+    def copy(self) -> Dict[str, Any]:
+        """Private, mutable (deep) copy"""
+        return thaw(self)
+
+    def __reduce__(self):
+        # copy/deepcopy/pickle produce a plain dict, never another shared instance
+        return dict, (thaw(self),)
+
+
+class SharedList(tuple):
+    """Immutable stand-in for a list inside a SharedAppearance (thawed back into a list)"""
+
+    __slots__ = ()
+
+
+# Pooled appearances; entries disappear once no field references them
+_appearance_pool: "weakref.WeakValueDictionary[Any, SharedAppearance]" = weakref.WeakValueDictionary()
+
+
+def _freeze(value):
+    """Hashable pool key for an appearance value"""
+    if isinstance(value, Mapping):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return ('__list__',) + tuple(_freeze(v) for v in value)
+    if isinstance(value, tuple):
+        return ('__tuple__',) + tuple(_freeze(v) for v in value)
+    if isinstance(value, QColor):
+        return 'QColor', value.isValid(), value.rgba()  # QColor is unhashable
+    hash(value)  # Unhashable leaves make the appearance unpoolable
+    return type(value).__name__, value
+
+
+def _build_shared(value):
+    if isinstance(value, Mapping):
+        shared = SharedAppearance()
+        for key, item in value.items():
+            dict.__setitem__(shared, intern_str(key), _build_shared(item))
+        return shared
+    if isinstance(value, list):
+        return SharedList(_build_shared(v) for v in value)
+    if isinstance(value, tuple):
+        return tuple(_build_shared(v) for v in value)
+    if isinstance(value, QColor):
+        return QColor(value)  # Own copy - the caller may keep mutating theirs
+    return intern_str(value)
+
+
+def share_appearance(appearance: Optional[Mapping]) -> Optional[Mapping]:
+    """Pooled read-only copy of an appearance dict (identical appearances share one object)"""
+    if appearance is None or isinstance(appearance, SharedAppearance):
+        return appearance
+    if not isinstance(appearance, Mapping):
+        return appearance
+
+    try:
+        key = _freeze(appearance)
+    except TypeError:
+        return _build_shared(appearance)
+
+    shared = _appearance_pool.get(key)
+    if shared is None:
+        shared = _build_shared(appearance)
+        _appearance_pool[key] = shared
+    return shared
+
+
+def thaw(value):
+    """Plain, mutable deep copy of a (possibly shared) appearance value"""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, SharedList):
+        return [thaw(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(thaw(v) for v in value)
+    if isinstance(value, QColor):
+        return QColor(value)
+    return value
+
+
+def thaw_properties(properties: Mapping) -> Dict[str, Any]:
+    """Shallow copy of a field's properties with the shared appearance made mutable"""
+    copied = dict(properties)
+    if isinstance(copied.get('appearance'), SharedAppearance):
+        copied['appearance'] = thaw(copied['appearance'])
+    return copied
+
+
+def get_pool_stats() -> dict:
+    """Appearance pool statistics"""
+    return {'shared_appearances': len(_appearance_pool)}
@@ -0,0 +1,117 @@
+"""
+Field Lookup Index
+Hash indexes from field id and (case-insensitive) field name to fields
+
+Replaces linear scans of FieldManager.all_fields for id lookups and name
+uniqueness checks. Fields report their own id/name changes (FormField notifies
+its index on id/name writes), so renames from the properties panel stay indexed.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+
+def name_key(name) -> str:
+    """Case-insensitive key for a field name"""
+    return str(name).lower() if name is not None else ""
+
+
+class FieldLookupIndex:
+    """id -> fields and lower-cased name -> fields, in insertion order"""
+
+    def __init__(self):
+        # Ids and names are expected to be unique, but duplicates are tolerated;
+        # the first indexed field wins, like the list scan it replaces.
+        self._by_id: Dict[str, List[object]] = {}
+        self._by_name: Dict[str, List[object]] = {}
+
+    # ========================================
+    # MAINTENANCE
+    # ========================================
+
+    def insert(self, field):
+        """Index a field under its current id and name"""
+        self._by_id.setdefault(getattr(field, 'id', None), []).append(field)
+        self._by_name.setdefault(name_key(getattr(field, 'name', None)), []).append(field)
+        field._lookup_index = self
+
+    def remove(self, field):
+        """Drop a field from both indexes"""
+        self._discard(self._by_id, getattr(field, 'id', None), field)
+        self._discard(self._by_name, name_key(getattr(field, 'name', None)), field)
+        if getattr(field, '_lookup_index', None) is self:
+            field._lookup_index = None
+
+    def rekey(self, field, attr: str, old_value, new_value):
+        """Move a field after its id or name was reassigned"""
+        if attr == 'id':
+            if self._discard(self._by_id, old_value, field):
+                self._by_id.setdefault(new_value, []).append(field)
+        elif attr == 'name':
+            if self._discard(self._by_name, name_key(old_value), field):
+                self._by_name.setdefault(name_key(new_value), []).append(field)
+
+    def clear(self):
+        """Drop every field"""
+        for fields in self._by_id.values():
+            for field in fields:
+                if getattr(field, '_lookup_index', None) is self:
+                    field._lookup_index = None
+        self._by_id.clear()
+        self._by_name.clear()
+
+    def rebuild(self, fields: Iterable[object]):
+        """Re-index a complete field list (keeps the list's order)"""
+        self.clear()
+        for field in fields:
+            self.insert(field)
+
+    @staticmethod
+    def _discard(table: Dict[str, List[object]], key, field) -> bool:
+        """Remove one field (by identity) from a bucket; True if it was there"""
+        bucket = table.get(key)
+        if not bucket:
+            return False
+        for i, candidate in enumerate(bucket):
+            if candidate is field:
+                del bucket[i]
+                if not bucket:
+                    del table[key]
+                return True
+        return False
+
+    # ========================================
+    # QUERIES
+    # ========================================
+
+    def get(self, field_id: str) -> Optional[object]:
+        """Field with this id (first indexed on duplicates)"""
+        bucket = self._by_id.get(field_id)
+        return bucket[0] if bucket else None
+
+    def get_many(self, field_ids: Iterable[str]) -> List[object]:
+        """Fields for several ids, in the order given; unknown ids are skipped"""
+        by_id = self._by_id
+        return [by_id[field_id][0] for field_id in field_ids if field_id in by_id]
+
+    def contains_id(self, field_id: str) -> bool:
+        return field_id in self._by_id
+
+    def has_name(self, name: str, exclude_field_id: str = None) -> bool:
+        """Case-insensitive name check, optionally ignoring the field with exclude_field_id"""
+        bucket = self._by_name.get(name_key(name))
+        if not bucket:
+            return False
+        if not exclude_field_id:
+            return True
+        return any(getattr(field, 'id', None) != exclude_field_id for field in bucket)
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self._by_id.values())
+
+    def get_stats(self) -> dict:
+        """Index statistics"""
+        return {
+            'ids': len(self._by_id),
+            'names': len(self._by_name),
+            'fields': len(self)
+        }
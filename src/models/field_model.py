@@ -4,13 +4,17 @@ Defines the structure and operations for form fields
 """
 
 from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields as dataclass_fields
 from enum import Enum
 
 from PyQt6.QtCore import QRect
 from click import clear
 
 from models.page_manager import PageManager
+from models.field_interning import intern_str, share_appearance, thaw_properties
+from models.field_lookup_index import FieldLookupIndex
+from models.field_spatial_index import FieldSpatialIndex
+from models.field_edge_index import FieldEdgeIndex
 
 
 class FieldType(Enum):
@@ -32,9 +36,27 @@ class FieldType(Enum):
     TEXTAREA = "textarea"           # FIXED: removed comma
     #PASSWORD = "password"
 
+class _IndexedField:
+    """Slots for the FieldManager indexes a field is registered in and its change version"""
+    __slots__ = ('_spatial_index', '_lookup_index', '_version')
+
+
+def _slotted(cls):
+    """Recreate a dataclass with __slots__ for its fields (dataclass(slots=True) needs Python 3.10)"""
+    field_names = tuple(f.name for f in dataclass_fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in field_names:
+        namespace.pop(name, None)  # Defaults live in __init__; class attributes would clash with the slots
+    namespace.pop('__dict__', None)
+    namespace.pop('__weakref__', None)
+    namespace['__slots__'] = field_names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+@_slotted
 @dataclass
-class FormField:
-    """Data model for a form field"""
+class FormField(_IndexedField):
+    """Data model for a form field (slotted - no per-instance __dict__)"""
     id: str
     type: FieldType
     name: str
@@ -58,6 +80,39 @@ class FormField:
     input_type: str = "text"
     map_to: str = "Auto"
 
+    # Attributes that decide where a field sits in FieldManager's spatial index
+    _GEOMETRY_ATTRS = frozenset(('x', 'y', 'width', 'height', 'page_number'))
+    # Attributes FieldManager's id/name lookup index is keyed on
+    _KEY_ATTRS = frozenset(('id', 'name'))
+    # Enum-like string attributes repeated across fields - stored interned
+    _INTERNED_ATTRS = frozenset(('visibility', 'orientation', 'format_category', 'format_settings',
+                                 'input_type', 'map_to'))
+
+    def __setattr__(self, name, value):
+        """Keep the owning indexes in sync with direct writes (field.x = ..., field.name = ...)"""
+        if name[0] != '_':
+            object.__setattr__(self, '_version', getattr(self, '_version', 0) + 1)
+
+        if name in FormField._INTERNED_ATTRS:
+            object.__setattr__(self, name, intern_str(value))
+            return
+
+        if name in FormField._KEY_ATTRS:
+            lookup_index = getattr(self, '_lookup_index', None)
+            old_value = getattr(self, name, None)
+            object.__setattr__(self, name, value)
+            if lookup_index is not None and old_value != value:
+                lookup_index.rekey(self, name, old_value, value)
+            return
+
+        object.__setattr__(self, name, value)
+        if name in FormField._GEOMETRY_ATTRS:
+            self._notify_geometry_changed()
+
+    def __post_init__(self):
+        """Share identical appearance dicts between fields"""
+        if 'appearance' in self.properties:
+            self.properties['appearance'] = share_appearance(self.properties['appearance'])
 
     @classmethod
     def create(cls, field_type: str, x: int, y: int, field_id: Optional[str] = None, page_number:int = 0) -> 'FormField':
@@ -118,7 +173,7 @@ class FormField:
             'visibility': self.visibility,  # ← ADD THIS
             'orientation': self.orientation,  # ← ADD THIS
             'value': self.value,
-            'properties': self.properties.copy(),
+            'properties': thaw_properties(self.properties),
             'format_category': self.format_category,
             'format_settings': self.format_settings,
             'input_type': self.input_type,
@@ -144,7 +199,7 @@ class FormField:
             visibility=data.get('visibility', 'Visible'), # ← ADD THIS
             orientation=data.get('orientation', '0'),     # ← ADD THIS
             value=data.get('value', ''),
-            properties=data.get('properties', {}),
+            properties=dict(data.get('properties', {})),
             format_category=data.get('format_category', 'None'),
             format_settings=data.get('format_settings', '{}'),
             input_type=data.get('input_type', 'text'),
@@ -158,13 +213,43 @@ class FormField:
 
     def move_to(self, x: int, y: int):
         """Move field to new position"""
-        self.x = x
-        self.y = y
+        object.__setattr__(self, 'x', x)
+        object.__setattr__(self, 'y', y)
+        self.touch()
+        self._notify_geometry_changed()
 
     def resize_to(self, width: int, height: int):
         """Resize field to new dimensions"""
-        self.width = max(10, width)  # Minimum width
-        self.height = max(10, height)  # Minimum height
+        object.__setattr__(self, 'width', max(10, width))  # Minimum width
+        object.__setattr__(self, 'height', max(10, height))  # Minimum height
+        self.touch()
+        self._notify_geometry_changed()
+
+    @property
+    def version(self) -> int:
+        """Change counter - bumped on every attribute write and touch()"""
+        return getattr(self, '_version', 0)
+
+    def touch(self):
+        """Mark the field changed after in-place edits (e.g. field.properties[key] = value)"""
+        object.__setattr__(self, '_version', getattr(self, '_version', 0) + 1)
+
+    def _notify_geometry_changed(self):
+        """Re-bucket this field in its manager's spatial index (one update per move/resize)"""
+        spatial_index = getattr(self, '_spatial_index', None)
+        if spatial_index is not None:
+            spatial_index.update(self)
+
+    def set_appearance(self, appearance: Optional[Dict[str, Any]]):
+        """Replace the appearance (stored as a shared, read-only object)"""
+        self.properties['appearance'] = share_appearance(appearance if appearance is not None else {})
+        self.touch()
+
+    def update_appearance(self, changes: Dict[str, Any]):
+        """Copy-on-write appearance update - other fields sharing the old appearance are untouched"""
+        appearance = dict(self.properties.get('appearance') or {})
+        appearance.update(changes)
+        self.set_appearance(appearance)
 
     def duplicate(self, offset_x: int = 20, offset_y: int = 20) -> 'FormField':
         """Create a duplicate of this field with offset"""
@@ -207,7 +292,10 @@ Enhanced FieldManager class with centralized field management using lists
 Handles all field creation, deletion, and selection operations
 """
 
-from typing import List, Optional, Dict, Any
+from contextlib import contextmanager
+from typing import Callable, List, Optional, Dict, Any, Tuple
+
+import numpy as np
 from PyQt6.QtCore import QObject, pyqtSignal
 
 
@@ -220,6 +308,8 @@ class FieldManager(QObject):
     fields_cleared = pyqtSignal()
     selection_changed = pyqtSignal(list)  # list of selected fields
     field_list_changed = pyqtSignal()
+    field_damaged = pyqtSignal(object, object, object)  # FormField, old (page, x0, y0, x1, y1), new (...)
+    fields_geometry_changed = pyqtSignal(list, list)  # moved/resized fields, affected pages (one per transaction)
 
     def __init__(self):
         super().__init__()
@@ -229,6 +319,16 @@ class FieldManager(QObject):
         # List of currently selected fields (supports multi-selection)
         self.selected_fields: List[FormField] = []
 
+        # Per-page grid over field bounds for hit testing (kept in sync by the fields themselves)
+        self.spatial_index = FieldSpatialIndex()
+        self.spatial_index.listener = self._on_field_geometry_changed
+
+        # id -> field and name -> field hash indexes (kept in sync by the fields themselves)
+        self.lookup_index = FieldLookupIndex()
+
+        # Nesting depth of geometry_transaction()
+        self._transaction_depth = 0
+
         # Field counter for generating unique IDs
         self._field_counter = 0
         self.duplicate_offset_count = 0  # Tracks how many times duplicate was called
@@ -345,6 +445,8 @@ class FieldManager(QObject):
 
             # Add to master list
             self.all_fields.append(field)
+            self.spatial_index.insert(field)
+            self.lookup_index.insert(field)
 
             # Emit signal
             self.field_added.emit(field)
@@ -369,8 +471,10 @@ class FieldManager(QObject):
             True if successful, False otherwise
         """
         try:
-            if field not in self.all_fields:
+            if not self.lookup_index.contains_id(field.id):
                 self.all_fields.append(field)
+                self.spatial_index.insert(field)
+                self.lookup_index.insert(field)
                 self.field_added.emit(field)
                 self.field_list_changed.emit()
                 print(f"✅ Added existing field: {field.id}")
@@ -411,6 +515,8 @@ class FieldManager(QObject):
             # Remove from all fields list
             if field_to_remove in self.all_fields:
                 self.all_fields.remove(field_to_remove)
+                self.spatial_index.remove(field_to_remove)
+                self.lookup_index.remove(field_to_remove)
                 print(f"✅ Removed field from all_fields: {field_id}")
 
             # Remove from selected fields list if present
@@ -435,6 +541,8 @@ class FieldManager(QObject):
         try:
             self.all_fields.clear()
             self.selected_fields.clear()
+            self.spatial_index.clear()
+            self.lookup_index.clear()
             self._field_counter = 0
 
             self.fields_cleared.emit()
@@ -570,11 +678,7 @@ class FieldManager(QObject):
     def select_fields_by_ids(self, field_ids: List[str]):
         """Select multiple fields by their IDs"""
         try:
-            fields_to_select = []
-            for field_id in field_ids:
-                field = self.get_field_by_id(field_id)
-                if field:
-                    fields_to_select.append(field)
+            fields_to_select = self.get_fields_by_ids(field_ids)
 
             self.selected_fields = fields_to_select
             self.selection_changed.emit(self.selected_fields.copy())
@@ -628,6 +732,149 @@ class FieldManager(QObject):
         """Clear all selected fields"""
         self.select_field(None)
 
+    # ==========================================
+    # DAMAGE REPORTING
+    # ==========================================
+
+    def _on_field_geometry_changed(self, field: FormField, old_page: int, old_bounds: tuple,
+                                   new_page: int, new_bounds: tuple):
+        """Spatial index saw a move/resize - report the old and new document rects"""
+        self.field_damaged.emit(field, (old_page,) + tuple(old_bounds), (new_page,) + tuple(new_bounds))
+
+    def notify_field_changed(self, field: FormField):
+        """A non-geometry property changed - report the field's current rect as damaged"""
+        field.touch()
+        page = getattr(field, 'page_number', 0)
+        bounds = (page, field.x, field.y, field.x + field.width, field.y + field.height)
+        self.field_damaged.emit(field, bounds, bounds)
+
+    # ==========================================
+    # BATCH GEOMETRY
+    # ==========================================
+
+    @contextmanager
+    def geometry_transaction(self):
+        """
+        Batch geometry edits: the spatial index is updated once per field and
+        a single fields_geometry_changed signal replaces per-field field_damaged
+        signals. Transactions nest; the outermost one commits.
+        """
+        self._transaction_depth += 1
+        if self._transaction_depth == 1:
+            self.spatial_index.defer_updates()
+        try:
+            yield self
+        finally:
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0:
+                self._commit_geometry_transaction()
+
+    def _commit_geometry_transaction(self):
+        changes = self.spatial_index.apply_deferred()
+        if not changes:
+            return
+        pages = sorted({page for change in changes for page in (change[1], change[3])})
+        self.fields_geometry_changed.emit([change[0] for change in changes], pages)
+
+    @staticmethod
+    def _geometry_arrays(fields: List[FormField]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """x, y, width, height of fields as arrays"""
+        geometry = np.array([(f.x, f.y, f.width, f.height) for f in fields], dtype=np.float64).reshape(-1, 4)
+        return geometry[:, 0], geometry[:, 1], geometry[:, 2], geometry[:, 3]
+
+    def _apply_positions(self, fields: List[FormField], xs: np.ndarray, ys: np.ndarray) -> int:
+        """Move fields to new positions inside one transaction; returns how many moved"""
+        moved = 0
+        with self.geometry_transaction():
+            for field, x, y in zip(fields, xs.tolist(), ys.tolist()):
+                x = int(x) if float(x).is_integer() else x
+                y = int(y) if float(y).is_integer() else y
+                if x != field.x or y != field.y:
+                    field.move_to(x, y)
+                    moved += 1
+        return moved
+
+    def move_fields(self, fields: List[FormField], dx: float, dy: float) -> int:
+        """Offset fields by (dx, dy) in one transaction"""
+        if not fields or (dx == 0 and dy == 0):
+            return 0
+        xs, ys, _, _ = self._geometry_arrays(fields)
+        return self._apply_positions(fields, xs + dx, ys + dy)
+
+    def align_fields(self, fields: List[FormField], mode: str, reference: Optional[FormField] = None) -> int:
+        """
+        Align fields to a reference field (the first field by default)
+
+        Args:
+            mode: left, right, top, bottom, center_horizontal or center_vertical
+        """
+        if len(fields) < 2:
+            return 0
+        reference = reference if reference is not None else fields[0]
+        others = [f for f in fields if f is not reference]
+        xs, ys, widths, heights = self._geometry_arrays(others)
+
+        if mode == "left":
+            xs = np.full_like(xs, reference.x)
+        elif mode == "right":
+            xs = (reference.x + reference.width) - widths
+        elif mode == "center_horizontal":
+            xs = (reference.x + reference.width // 2) - widths // 2
+        elif mode == "top":
+            ys = np.full_like(ys, reference.y)
+        elif mode == "bottom":
+            ys = (reference.y + reference.height) - heights
+        elif mode == "center_vertical":
+            ys = (reference.y + reference.height // 2) - heights // 2
+        else:
+            print(f"⚠️ Unknown alignment mode: {mode}")
+            return 0
+
+        return self._apply_positions(others, xs, ys)
+
+    def distribute_fields(self, fields: List[FormField], axis: str, spacing: Optional[float] = None) -> int:
+        """
+        Distribute fields along an axis ("horizontal" or "vertical")
+
+        Without spacing the outermost fields stay put and the gaps between fields
+        are equalized (needs 3+ fields); with spacing the fields are packed from
+        the first one with that gap.
+        """
+        if len(fields) < (3 if spacing is None else 2):
+            return 0
+
+        xs, ys, widths, heights = self._geometry_arrays(fields)
+        horizontal = axis == "horizontal"
+        starts, sizes = (xs, widths) if horizontal else (ys, heights)
+
+        order = np.argsort(starts, kind='stable')
+        sorted_starts, sorted_sizes = starts[order], sizes[order]
+        keep_last = spacing is None
+        if keep_last:
+            span = (sorted_starts[-1] + sorted_sizes[-1]) - sorted_starts[0]
+            spacing = (span - sorted_sizes.sum()) / (len(fields) - 1)
+
+        # Each field starts after the sizes and gaps of the fields before it
+        offsets = np.concatenate(([0.0], np.cumsum(sorted_sizes[:-1] + spacing)))
+        new_starts = np.empty_like(starts)
+        new_starts[order] = np.rint(sorted_starts[0] + offsets)
+        if keep_last:
+            new_starts[order[-1]] = sorted_starts[-1]
+
+        if horizontal:
+            return self._apply_positions(fields, new_starts, ys)
+        return self._apply_positions(fields, xs, new_starts)
+
+    def snap_fields(self, fields: List[FormField],
+                    snap_points: Callable[[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]]) -> int:
+        """Snap field positions with a vectorized snap function (xs, ys) -> (xs, ys)"""
+        if not fields:
+            return 0
+        xs, ys, _, _ = self._geometry_arrays(fields)
+        snapped_xs, snapped_ys = snap_points(xs, ys)
+        return self._apply_positions(fields, np.asarray(snapped_xs, dtype=np.float64),
+                                     np.asarray(snapped_ys, dtype=np.float64))
+
     # ==========================================
     # FIELD RETRIEVAL AND QUERIES
     # ==========================================
@@ -646,16 +893,11 @@ class FieldManager(QObject):
 
     def get_field_by_id(self, field_id: str) -> Optional[FormField]:
         """Find field by ID"""
-        try:
-            print(f"📋 Looking for: {field_id}")
-            for field in self.all_fields:
-                print(f"📋 Field: {field.id}")
-                if getattr(field, 'id', None) == field_id:
-                    return field
-            return None
-        except Exception as e:
-            print(f"❌ Error finding field by ID: {e}")
-            return None
+        return self.lookup_index.get(field_id)
+
+    def get_fields_by_ids(self, field_ids: List[str]) -> List[FormField]:
+        """Find several fields by ID (in the order given; unknown IDs are skipped)"""
+        return self.lookup_index.get_many(field_ids)
 
     def get_field_at_position(self, x: int, y: int, page_num: int = 0, tolerance: int = 5, zoom_level: float = 1.0,
                               coordinate_type: str = "document") -> Optional[FormField]:
@@ -684,24 +926,8 @@ class FieldManager(QObject):
                 doc_y = y
                 doc_tolerance = tolerance
 
-            for field in self.all_fields:
-                # Check if field is on the right page
-                field_page = getattr(field, 'page_num', getattr(field, 'page_number', 0))
-                if field_page != page_num:
-                    continue
-
-                # Get field bounds in document coordinates
-                field_x = getattr(field, 'x', 0)
-                field_y = getattr(field, 'y', 0)
-                field_width = getattr(field, 'width', 100)
-                field_height = getattr(field, 'height', 30)
-
-                # Check if position is within field bounds (with zoom-aware tolerance)
-                if (field_x - doc_tolerance <= doc_x <= field_x + field_width + doc_tolerance and
-                        field_y - doc_tolerance <= doc_y <= field_y + field_height + doc_tolerance):
-                    return field
-
-            return None
+            # Only fields sharing a grid cell with the point are tested (first in list order wins)
+            return self.spatial_index.query_point(page_num, doc_x, doc_y, doc_tolerance)
 
         except Exception as e:
             print(f"❌ Error finding field at position: {e}")
@@ -740,25 +966,8 @@ class FieldManager(QObject):
             doc_width = screen_rect.width() / zoom_level
             doc_height = screen_rect.height() / zoom_level
 
-            matching_fields = []
-            for field in self.all_fields:
-                # Check if field is on the right page
-                field_page = getattr(field, 'page_num', getattr(field, 'page_number', 0))
-                if field_page != page_num:
-                    continue
-
-                # Get field bounds in document coordinates
-                field_x = getattr(field, 'x', 0)
-                field_y = getattr(field, 'y', 0)
-                field_width = getattr(field, 'width', 100)
-                field_height = getattr(field, 'height', 30)
-
-                # Check if field intersects with the area
-                if (field_x < doc_x + doc_width and field_x + field_width > doc_x and
-                        field_y < doc_y + doc_height and field_y + field_height > doc_y):
-                    matching_fields.append(field)
-
-            return matching_fields
+            # Fields intersecting the area, from the grid cells it covers
+            return self.spatial_index.query_rect(page_num, (doc_x, doc_y, doc_x + doc_width, doc_y + doc_height))
 
         except Exception as e:
             print(f"❌ Error getting fields in screen area: {e}")
@@ -767,17 +976,16 @@ class FieldManager(QObject):
     def get_fields_on_page(self, page_num: int) -> List[FormField]:
         """Get all fields on a specific page"""
         try:
-            page_fields = []
-            for field in self.all_fields:
-                field_page = getattr(field, 'page_num', getattr(field, 'page_number', 0))
-                if field_page == page_num:
-                    page_fields.append(field)
-            return page_fields
+            return self.spatial_index.fields_on_page(page_num)
 
         except Exception as e:
             print(f"❌ Error getting fields on page: {e}")
             return []
 
+    def build_edge_index(self, exclude: List[FormField] = ()) -> FieldEdgeIndex:
+        """Edge index for alignment guides over every field except exclude (pages indexed on first use)"""
+        return FieldEdgeIndex(self.get_fields_on_page, exclude)
+
     def convert_field_to_screen_bounds(self, field: FormField, zoom_level: float = 1.0) -> dict:
         """
         Convert field document coordinates to screen bounds (zoom-aware)
@@ -948,6 +1156,8 @@ class FieldManager(QObject):
 
             # Add to manager
             self.all_fields.append(duplicate)
+            self.spatial_index.insert(duplicate)
+            self.lookup_index.insert(duplicate)
             self.field_added.emit(duplicate)
             self.field_list_changed.emit()
 
@@ -1008,12 +1218,7 @@ class FieldManager(QObject):
 
     def is_name_duplicate(self, name: str, exclude_field_id: str = None) -> bool:
         """Check if name already exists (case-insensitive)"""
-        for field in self.all_fields:
-            if exclude_field_id and field.id == exclude_field_id:
-                continue
-            if field.name.lower() == name.lower():
-                return True
-        return False
+        return self.lookup_index.has_name(name, exclude_field_id)
 
     def duplicate_selected_fields(self) -> List[FormField]:
         """
@@ -1080,6 +1285,8 @@ class FieldManager(QObject):
                         # Remove the invalid duplicate from all_fields (it was already added by _create_duplicate_field)
                         if duplicate in self.all_fields:
                             self.all_fields.remove(duplicate)
+                            self.spatial_index.remove(duplicate)
+                            self.lookup_index.remove(duplicate)
                             self.field_removed.emit(duplicate.id)
 
                         # Return empty list - duplication failed
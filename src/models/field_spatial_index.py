@@ -0,0 +1,226 @@
+"""
+Field Spatial Index
+Per-page uniform grid over field bounds (document coordinates)
+
+Point and rectangle hit tests only look at the grid cells they touch instead
+of every field in the document. Fields report their own geometry changes
+(FormField notifies its index on x/y/width/height/page_number writes); an
+optional listener is told the old and new bounds of every move/resize.
+Updates can be deferred so a batch of geometry edits re-buckets each field once.
+"""
+
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+Bounds = Tuple[float, float, float, float]  # x0, y0, x1, y1
+Cell = Tuple[int, int]
+Change = Tuple[object, int, Bounds, int, Bounds]  # field, old page, old bounds, new page, new bounds
+
+
+def field_page(field) -> int:
+    """Page a field lives on (FieldManager's historical lookup order)"""
+    return getattr(field, 'page_num', getattr(field, 'page_number', 0))
+
+
+def field_bounds(field) -> Bounds:
+    """Field rectangle in document coordinates"""
+    x = getattr(field, 'x', 0)
+    y = getattr(field, 'y', 0)
+    return x, y, x + getattr(field, 'width', 100), y + getattr(field, 'height', 30)
+
+
+class FieldSpatialIndex:
+    """Uniform-grid spatial index of form fields, one grid per page"""
+
+    DEFAULT_CELL_SIZE = 64  # Points per grid cell
+
+    def __init__(self, cell_size: int = DEFAULT_CELL_SIZE):
+        self.cell_size = cell_size
+
+        # page -> cell -> {object id}
+        self._grid: Dict[int, Dict[Cell, Set[int]]] = {}
+        # page -> {object id}
+        self._pages: Dict[int, Set[int]] = {}
+        # object id -> (field, page, cells, insertion order, bounds)
+        self._entries: Dict[int, Tuple[object, int, Tuple[Cell, ...], int, Bounds]] = {}
+        self._sequence = 0
+
+        # Called as listener(field, old_page, old_bounds, new_page, new_bounds) after a move/resize
+        self.listener: Optional[Callable[[object, int, Bounds, int, Bounds], None]] = None
+
+        # object id -> field while updates are deferred (see defer_updates)
+        self._deferred: Optional[Dict[int, object]] = None
+
+    # ========================================
+    # MAINTENANCE
+    # ========================================
+
+    def insert(self, field):
+        """Index a field (appended after every existing field in iteration order)"""
+        key = id(field)
+        if key in self._entries:
+            self._unlink(key)
+
+        self._sequence += 1
+        self._link(field, self._sequence)
+        field._spatial_index = self
+
+    def remove(self, field):
+        """Drop a field from the index"""
+        key = id(field)
+        if key in self._entries:
+            self._unlink(key)
+            del self._entries[key]
+        if getattr(field, '_spatial_index', None) is self:
+            field._spatial_index = None
+
+    def update(self, field):
+        """Re-bucket a field after its position, size or page changed"""
+        if self._deferred is not None:
+            self._deferred[id(field)] = field
+            return
+
+        change = self._rebucket(field)
+        if change is not None and self.listener is not None:
+            self.listener(*change)
+
+    def defer_updates(self):
+        """Collect updates instead of applying them (until apply_deferred)"""
+        if self._deferred is None:
+            self._deferred = {}
+
+    def is_deferring(self) -> bool:
+        return self._deferred is not None
+
+    def apply_deferred(self) -> List[Change]:
+        """Re-bucket every field updated since defer_updates, once each (the listener is not called)"""
+        pending, self._deferred = self._deferred, None
+        if not pending:
+            return []
+        changes = [self._rebucket(field) for field in pending.values()]
+        return [change for change in changes if change is not None]
+
+    def _rebucket(self, field) -> Optional[Change]:
+        entry = self._entries.get(id(field))
+        if entry is None:
+            return None
+
+        page = field_page(field)
+        bounds = field_bounds(field)
+        old_page, old_bounds = entry[1], entry[4]
+        if page == old_page and bounds == old_bounds:
+            return None
+
+        cells = self._cells_for(bounds)
+        if page == old_page and cells == entry[2]:
+            self._entries[id(field)] = entry[:4] + (bounds,)  # Still in the same cells
+        else:
+            self._unlink(id(field))
+            self._link(field, entry[3])
+
+        return field, old_page, old_bounds, page, bounds
+
+    def clear(self):
+        """Drop every field"""
+        for field, _, _, _, _ in self._entries.values():
+            if getattr(field, '_spatial_index', None) is self:
+                field._spatial_index = None
+        self._grid.clear()
+        self._pages.clear()
+        self._entries.clear()
+
+    def rebuild(self, fields):
+        """Re-index a complete field list (keeps the list's order)"""
+        self.clear()
+        for field in fields:
+            self.insert(field)
+
+    def _cells_for(self, bounds: Bounds) -> Tuple[Cell, ...]:
+        """Grid cells overlapped by a rectangle"""
+        size = self.cell_size
+        x0, y0, x1, y1 = bounds
+        return tuple((col, row)
+                     for row in range(int(y0 // size), int(y1 // size) + 1)
+                     for col in range(int(x0 // size), int(x1 // size) + 1))
+
+    def _link(self, field, order: int):
+        key = id(field)
+        page = field_page(field)
+        bounds = field_bounds(field)
+        cells = self._cells_for(bounds)
+
+        page_grid = self._grid.setdefault(page, {})
+        for cell in cells:
+            page_grid.setdefault(cell, set()).add(key)
+        self._pages.setdefault(page, set()).add(key)
+        self._entries[key] = (field, page, cells, order, bounds)
+
+    def _unlink(self, key: int):
+        _, page, cells, _, _ = self._entries[key]
+        page_grid = self._grid.get(page, {})
+        for cell in cells:
+            bucket = page_grid.get(cell)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del page_grid[cell]
+        self._pages.get(page, set()).discard(key)
+
+    # ========================================
+    # QUERIES
+    # ========================================
+
+    def _candidates(self, page: int, bounds: Bounds) -> Set[int]:
+        """Object ids of fields sharing a grid cell with the rectangle"""
+        page_grid = self._grid.get(page)
+        if not page_grid:
+            return set()
+
+        candidates = set()
+        for cell in self._cells_for(bounds):
+            bucket = page_grid.get(cell)
+            if bucket:
+                candidates |= bucket
+        return candidates
+
+    def _ordered(self, keys) -> List[object]:
+        """Fields for object ids, in insertion order"""
+        entries = sorted((self._entries[key] for key in keys), key=lambda entry: entry[3])
+        return [entry[0] for entry in entries]
+
+    def query_point(self, page: int, x: float, y: float, tolerance: float = 0) -> Optional[object]:
+        """First field (insertion order) whose bounds grown by tolerance contain the point"""
+        best = None
+        for key in self._candidates(page, (x - tolerance, y - tolerance, x + tolerance, y + tolerance)):
+            field, _, _, order, _ = self._entries[key]
+            x0, y0, x1, y1 = field_bounds(field)
+            if (x0 - tolerance <= x <= x1 + tolerance and
+                    y0 - tolerance <= y <= y1 + tolerance):
+                if best is None or order < best[1]:
+                    best = (field, order)
+        return best[0] if best else None
+
+    def query_rect(self, page: int, bounds: Bounds) -> List[object]:
+        """Fields strictly overlapping a rectangle, in insertion order"""
+        rx0, ry0, rx1, ry1 = bounds
+        hits = []
+        for key in self._candidates(page, bounds):
+            x0, y0, x1, y1 = field_bounds(self._entries[key][0])
+            if x0 < rx1 and x1 > rx0 and y0 < ry1 and y1 > ry0:
+                hits.append(key)
+        return self._ordered(hits)
+
+    def fields_on_page(self, page: int) -> List[object]:
+        """Every field on a page, in insertion order"""
+        return self._ordered(self._pages.get(page, ()))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> dict:
+        """Index statistics"""
+        return {
+            'fields': len(self._entries),
+            'pages': len(self._grid),
+            'cells': sum(len(page_grid) for page_grid in self._grid.values()),
+            'cell_size': self.cell_size
+        }
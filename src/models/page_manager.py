@@ -1,6 +1,8 @@
 from typing import Dict, List, Tuple, Optional
 from PyQt6.QtCore import QObject, pyqtSignal
 
+from utils.layout_index import PageLayoutIndex
+
 
 class PageInfo:
     """Information about a single PDF page"""
@@ -37,6 +39,10 @@ class PageManager(QObject):
         self.page_spacing = 20  # Default spacing between pages
         self.page_margins = {'top': 15, 'bottom': 15, 'left': 15, 'right': 15}
 
+        # Prefix sums of page tops - rebuilt on load, zoom-only changes reuse page sizes
+        self.layout_index = PageLayoutIndex(zoom=self.zoom_level, top_margin=self.page_margins['top'],
+                                            spacing=self.page_spacing)
+
         print("✅ PageManager initialized")
 
     # ==========================================
@@ -73,6 +79,7 @@ class PageManager(QObject):
                 print(f"  {page_info}")
 
             self.page_count = len(self.pages)
+            self._rebuild_layout_index()
             self.pages_loaded.emit(self.page_count)
 
             print(f"✅ Successfully loaded {self.page_count} pages")
@@ -86,8 +93,15 @@ class PageManager(QObject):
         """Clear all cached page information"""
         self.pages.clear()
         self.page_count = 0
+        self._rebuild_layout_index()
         print("🧹 Cleared all page information")
 
+    def _rebuild_layout_index(self):
+        """Re-index page heights after pages were (re)loaded"""
+        sizes = [(self.pages[i].width, self.pages[i].height) if i in self.pages else (612, 792)
+                 for i in range(self.page_count)]
+        self.layout_index.set_page_sizes(sizes)
+
     # ==========================================
     # PAGE DIMENSION QUERIES
     # ==========================================
@@ -143,6 +157,7 @@ class PageManager(QObject):
     def set_zoom_level(self, zoom_level: float):
         """Update zoom level for coordinate conversions"""
         self.zoom_level = zoom_level
+        self.layout_index.set_zoom(zoom_level)
         print(f"🔍 PageManager zoom updated to {zoom_level:.2f}x")
 
     def document_to_screen_coords(self, page_num: int, doc_x: float, doc_y: float) -> Tuple[int, int]:
@@ -204,22 +219,25 @@ class PageManager(QObject):
             return float(screen_x), float(screen_y)
 
     def get_page_offset_y(self, page_num: int) -> int:
-        """Calculate Y offset for a page in multi-page layout"""
+        """Calculate Y offset for a page in multi-page layout (O(1) prefix-sum lookup)"""
         try:
-            if page_num == 0:
-                return self.page_margins['top']
+            index = self.layout_index
+            if index.top_margin != self.page_margins['top'] or index.spacing != self.page_spacing:
+                index.set_spacing(self.page_margins['top'], self.page_spacing)
+            if index.zoom != self.zoom_level:
+                index.set_zoom(self.zoom_level)
 
-            total_offset = self.page_margins['top']
+            if page_num <= 0:
+                return self.page_margins['top']
 
-            # Add heights of all previous pages plus spacing
-            for i in range(page_num):
-                if i in self.pages:
-                    page_height = int(self.pages[i].height * self.zoom_level)
-                    total_offset += page_height + self.page_spacing
-                else:
-                    # Fallback for missing page info
-                    total_offset += int(792 * self.zoom_level) + self.page_spacing
+            page_top = index.get_page_top(page_num)
+            if page_top is not None:
+                return page_top
 
+            # Beyond the loaded pages - extend with letter-size fallback pages
+            total_offset = index.get_total_height() + self.page_spacing if len(index) else self.page_margins['top']
+            missing_pages = page_num - len(index)
+            total_offset += missing_pages * (int(792 * self.zoom_level) + self.page_spacing)
             return total_offset
 
         except Exception as e:
@@ -9,9 +9,13 @@ import time
 from collections import deque
 from PyQt6.QtWidgets import QWidget
 from PyQt6.QtCore import Qt, QTimer, QRectF, pyqtSignal, pyqtSlot
-from PyQt6.QtGui import QPainter, QPixmap, QPen, QBrush
+from PyQt6.QtGui import QPainter, QPixmap, QPen, QBrush, QImage
 from typing import Optional, List, Tuple, Set
 
+from ui.a_page_cache import PageCache
+from ui.a_render_service import PageRenderService, FITZ_AVAILABLE as RENDER_SERVICE_AVAILABLE
+from ui.a_scroll_prefetcher import ScrollPrefetcher
+
 
 class CanvasWidget(QWidget):
     """Canvas widget for rendering PDF pages - based on working reference"""
@@ -36,7 +40,7 @@ class CanvasWidget(QWidget):
         # ========================================
         # RENDERING STATE
         # ========================================
-        self.rendered_pages = {}  # Cache for rendered page pixmaps
+        self.page_cache = PageCache(budget_mb=256)  # Rendered page pixmaps keyed by (page, zoom, dpi)
         self.visible_pages = []  # Currently visible page indices
         self.viewport_rect = QRectF()
 
@@ -50,6 +54,18 @@ class CanvasWidget(QWidget):
         self.render_timer.setSingleShot(True)
         self.needs_render = False
 
+        # Background rasterization (created per document)
+        self.render_service = None
+        self.use_background_rendering = RENDER_SERVICE_AVAILABLE
+        self.render_workers = 2
+
+        # Progressive zoom: scaled cached renders or a quick low-DPI render first
+        self.progressive_zoom = True
+        self._preview_dpi = 36
+
+        # Direction/velocity-aware prefetch while scrolling
+        self.scroll_prefetcher = ScrollPrefetcher(self)
+
         # Paint loop prevention
         self.is_painting = False
         self.paint_count = 0
@@ -62,9 +78,8 @@ class CanvasWidget(QWidget):
         self._cache_cleanup_timer.timeout.connect(self._periodic_cache_cleanup)
         self._cache_cleanup_timer.start(10000)  # Cleanup every 10 seconds
 
-        # Cache size limits
-        self._max_cached_pages = 10  # Maximum pages to keep in cache
-        self._cache_adjacent_pages = 2  # Number of adjacent pages to cache
+        # Cache limits
+        self._cache_adjacent_pages = 2  # Pages either side of the viewport pinned in cache
 
         # ========================================
         # UI SETTINGS AND STYLING
@@ -123,6 +138,7 @@ class CanvasWidget(QWidget):
                 print(f"📏 Canvas size calculated: {width}x{height}")
 
                 self._update_canvas_size()
+                self._start_render_service()
                 self.current_page = 0
                 self.pageChanged.emit(0)
 
@@ -147,9 +163,11 @@ class CanvasWidget(QWidget):
     def _clear_document(self):
         """Internal method to clear document from canvas"""
         print("🧹 Clearing document from canvas...")
+        self._stop_render_service()
         self.document = None
         self.layout_manager = None
-        self.rendered_pages.clear()
+        self.page_cache.clear()
+        self.scroll_prefetcher.reset()
         self.visible_pages.clear()
         self.current_page = 0
         self.update()
@@ -194,8 +212,10 @@ class CanvasWidget(QWidget):
     def set_document(self, document):
         """Set the PDF document"""
         self.document = document
-        self.rendered_pages.clear()  # Clear cache when document changes
+        self.page_cache.clear()  # Clear cache when document changes
+        self.scroll_prefetcher.reset()
         self.current_page = 0
+        self._start_render_service()
         print(f"📄 Document set: {document.get_page_count()} pages" if document else "📄 Document cleared")
 
     def set_layout_manager(self, layout_manager):
@@ -241,8 +261,11 @@ class CanvasWidget(QWidget):
         pages_to_render = []
         cached_pages = []
 
+        # Hit-rate accounting: were pages scrolling into view already rendered?
+        self.scroll_prefetcher.record_visible_pages(page_indices)
+
         for page_idx in page_indices:
-            if page_idx not in self.rendered_pages:
+            if not self.is_page_cached(page_idx):
                 pages_to_render.append(page_idx)
             else:
                 cached_pages.append(page_idx)
@@ -250,6 +273,7 @@ class CanvasWidget(QWidget):
         # Update state immediately
         self.visible_pages = page_indices
         self.viewport_rect = viewport_rect
+        self.page_cache.set_pinned_pages(self._get_pinned_pages(), self._get_render_dpi())
 
         # Log smart optimization results
         if pages_to_render and cached_pages:
@@ -304,10 +328,15 @@ class CanvasWidget(QWidget):
 
         print(f"🎨 Processing render queue: {pages_to_render}")
 
+        # Hand work to the background pool: visible pages first, then neighbours as prefetch
+        if self.render_service:
+            self._submit_background_renders(pages_to_render)
+            return
+
         # Render pages that still need rendering
         rendered_count = 0
         for page_idx in pages_to_render:
-            if page_idx not in self.rendered_pages:
+            if not self.is_page_cached(page_idx):
                 self._render_page(page_idx)
                 rendered_count += 1
 
@@ -319,6 +348,132 @@ class CanvasWidget(QWidget):
         # Trigger repaint to show newly rendered content
         self.update()
 
+    # ========================================
+    # BACKGROUND RENDERING
+    # ========================================
+
+    def _start_render_service(self):
+        """Create the background render pool for the current document"""
+        self._stop_render_service()
+
+        if not self.use_background_rendering or not self.document:
+            return
+
+        file_path = getattr(self.document, 'file_path', None)
+        if not file_path:
+            return
+
+        try:
+            self.render_service = PageRenderService(file_path, max_workers=self.render_workers)
+            self.render_service.pageRendered.connect(self._on_background_page_rendered)
+            self.render_service.renderFailed.connect(self._on_background_render_failed)
+        except Exception as e:
+            print(f"⚠️ Background rendering unavailable, rendering on GUI thread: {e}")
+            self.render_service = None
+
+    def _stop_render_service(self):
+        """Shut down the background render pool"""
+        if self.render_service:
+            self.render_service.shutdown()
+            self.render_service.deleteLater()
+            self.render_service = None
+
+    def _get_render_dpi(self) -> int:
+        """Render DPI for the current zoom"""
+        base_dpi = 72  # PDF native DPI
+        return int(base_dpi * self.zoom_level)
+
+    def _submit_background_renders(self, pages_to_render: List[int]):
+        """Queue visible pages at high priority and adjacent pages as prefetch"""
+        render_dpi = self._get_render_dpi()
+        page_count = self.document.get_page_count() if self.document else 0
+        visible = set(self.visible_pages)
+
+        queued = 0
+        for page_idx in sorted(pages_to_render, key=lambda p: (p not in visible, p)):
+            if not self.is_page_cached(page_idx):
+                priority = (PageRenderService.PRIORITY_VISIBLE if page_idx in visible
+                            else PageRenderService.PRIORITY_PREFETCH)
+                self.render_service.request_page(page_idx, render_dpi, priority)
+                queued += 1
+
+        # Prefetch neighbours of the visible range
+        for page_idx in self.visible_pages:
+            for offset in range(1, self._cache_adjacent_pages + 1):
+                for neighbour in (page_idx + offset, page_idx - offset):
+                    if 0 <= neighbour < page_count and not self.is_page_cached(neighbour):
+                        self.render_service.request_page(neighbour, render_dpi,
+                                                         PageRenderService.PRIORITY_PREFETCH)
+
+        print(f"🧵 Submitted {queued} page renders to background pool")
+
+    # ========================================
+    # SCROLL PREFETCH
+    # ========================================
+
+    def track_scroll(self, viewport_rect: QRectF):
+        """Feed a raw (undebounced) scroll position to the prefetcher"""
+        self.scroll_prefetcher.on_scroll(viewport_rect)
+
+    def prefetch_pages(self, page_indices: List[int]) -> List[int]:
+        """Queue pages ahead of the viewport at prefetch priority; returns the pages queued"""
+        queued = []
+        render_dpi = self._get_render_dpi()
+
+        for page_idx in page_indices:
+            if self.is_page_cached(page_idx):
+                continue
+            if self.render_service:
+                if self.render_service.is_pending(page_idx):
+                    continue
+                self.render_service.request_page(page_idx, render_dpi, PageRenderService.PRIORITY_PREFETCH)
+            elif page_idx in self.pending_render_pages:
+                continue
+            queued.append(page_idx)
+
+        if queued and not self.render_service:
+            self._queue_render_pages(queued)
+
+        return queued
+
+    def cancel_prefetch(self, page_indices) -> int:
+        """Drop queued (not yet running) prefetch renders outside the pinned range"""
+        pinned = self._get_pinned_pages()
+        to_cancel = set(page_indices) - pinned
+
+        if self.render_service:
+            return self.render_service.cancel_pages(to_cancel)
+
+        cancelled = self.pending_render_pages & to_cancel
+        self.pending_render_pages -= cancelled
+        return len(cancelled)
+
+    def get_prefetch_stats(self) -> dict:
+        """Scroll prefetch statistics (hit rate, lookahead, cancellations)"""
+        return self.scroll_prefetcher.get_stats()
+
+    @pyqtSlot(int, int, int, QImage)
+    def _on_background_page_rendered(self, page_index: int, render_dpi: int, generation: int, image: QImage):
+        """Receive a finished page from the render pool (GUI thread)"""
+        if render_dpi != self._get_render_dpi():
+            return  # Zoom changed while rendering
+
+        self.page_cache.put(page_index, self.zoom_level, render_dpi, QPixmap.fromImage(image))
+        print(f"✅ Page {page_index} rendered in background: {image.width()}x{image.height()}")
+
+        self._periodic_cache_cleanup()
+
+        if page_index in self.visible_pages:
+            self.update()
+
+    @pyqtSlot(int, str)
+    def _on_background_render_failed(self, page_index: int, message: str):
+        """Fall back to a GUI-thread render if the pool could not rasterize a page"""
+        print(f"⚠️ Falling back to synchronous render for page {page_index}: {message}")
+        self._render_page(page_index)
+        if page_index in self.visible_pages:
+            self.update()
+
     # ========================================
     # BACKWARD COMPATIBILITY (FROM REFERENCE)
     # ========================================
@@ -353,8 +508,7 @@ class CanvasWidget(QWidget):
             print(f"🖼️ Rendering page {page_index} at zoom {self.zoom_level:.2f}")
 
             # Calculate render DPI based on zoom (from reference)
-            base_dpi = 72  # PDF native DPI
-            render_dpi = int(base_dpi * self.zoom_level)
+            render_dpi = self._get_render_dpi()
 
             print(f"📐 Using render DPI: {render_dpi} (zoom: {self.zoom_level:.2f})")
 
@@ -362,7 +516,7 @@ class CanvasWidget(QWidget):
             pixmap = self.document.render_page(page_index, 1.0, render_dpi)  # Use zoom=1.0, control via DPI
 
             if not pixmap.isNull():
-                self.rendered_pages[page_index] = pixmap
+                self.page_cache.put(page_index, self.zoom_level, render_dpi, pixmap)
                 print(f"✅ Page {page_index} rendered: {pixmap.width()}x{pixmap.height()}")
             else:
                 print(f"❌ Failed to render page {page_index}")
@@ -372,39 +526,50 @@ class CanvasWidget(QWidget):
             import traceback
             traceback.print_exc()
 
-    def _periodic_cache_cleanup(self):
-        """Periodic cache cleanup to prevent memory bloat - from reference"""
-        try:
-            if not hasattr(self, 'rendered_pages'):
-                return
-
-            initial_cache_size = len(self.rendered_pages)
-
-            if initial_cache_size > self._max_cached_pages:
-                # Keep only the most recently used pages
-                pages_to_keep = set(self.visible_pages)
-
-                # Add adjacent pages
-                for page_idx in self.visible_pages:
-                    for offset in range(-self._cache_adjacent_pages, self._cache_adjacent_pages + 1):
-                        adjacent_page = page_idx + offset
-                        if adjacent_page >= 0:  # Will check upper bound when we have document
-                            pages_to_keep.add(adjacent_page)
-
-                # Remove excess pages
-                pages_to_remove = []
-                for page_idx in self.rendered_pages.keys():
-                    if page_idx not in pages_to_keep:
-                        pages_to_remove.append(page_idx)
+    def is_page_cached(self, page_index: int) -> bool:
+        """True if the page is cached at the current zoom and DPI"""
+        return self.page_cache.contains(page_index, self.zoom_level, self._get_render_dpi())
+
+    def _get_pinned_pages(self) -> Set[int]:
+        """Visible pages plus adjacent pages - never evicted from the cache"""
+        page_count = self.document.get_page_count() if self.document else 0
+        pinned = set()
+        for page_idx in self.visible_pages:
+            for offset in range(-self._cache_adjacent_pages, self._cache_adjacent_pages + 1):
+                adjacent_page = page_idx + offset
+                if 0 <= adjacent_page < page_count:
+                    pinned.add(adjacent_page)
+        return pinned
+
+    def set_cache_budget(self, budget_mb: float):
+        """Set the page cache memory budget in megabytes"""
+        self.page_cache.set_budget_mb(budget_mb)
+        print(f"💾 Page cache budget: {budget_mb:.0f} MB")
+
+    def get_cache_stats(self) -> dict:
+        """Page cache statistics (hits, misses, evictions, memory)"""
+        return self.page_cache.get_stats()
+
+    def _render_zoom_previews(self):
+        """Quick low-DPI render of visible pages that have no cached render at any zoom"""
+        if not self.document or self._preview_dpi >= self._get_render_dpi():
+            return
 
-                # Remove oldest pages first (simple LRU)
-                pages_to_remove.sort()
-                excess_count = initial_cache_size - self._max_cached_pages
-                for page_idx in pages_to_remove[:excess_count]:
-                    del self.rendered_pages[page_idx]
+        for page_index in self.visible_pages:
+            if self.page_cache.has_page(page_index):
+                continue  # An old-zoom render will be scaled instead
+            try:
+                pixmap = self.document.render_page(page_index, 1.0, self._preview_dpi)
+                self.page_cache.put(page_index, self.zoom_level, self._preview_dpi, pixmap)
+                print(f"🔎 Preview render of page {page_index} at {self._preview_dpi} DPI")
+            except Exception as e:
+                print(f"⚠️ Preview render failed for page {page_index}: {e}")
 
-                if pages_to_remove:
-                    print(f"🧹 Periodic cache cleanup: Removed {len(pages_to_remove[:excess_count])} pages")
+    def _periodic_cache_cleanup(self):
+        """Periodic cache cleanup - evicts least-recently-used pages over the memory budget"""
+        try:
+            self.page_cache.set_pinned_pages(self._get_pinned_pages(), self._get_render_dpi())
+            self.page_cache.evict_to_budget()
 
         except Exception as e:
             print(f"❌ Cache cleanup error: {e}")
@@ -472,13 +637,22 @@ class CanvasWidget(QWidget):
         painter.drawRect(page_rect)
 
         # Draw rendered content if available
-        if page_index in self.rendered_pages:
-            pixmap = self.rendered_pages[page_index]
+        render_dpi = self._get_render_dpi()
+        pixmap = self.page_cache.get(page_index, self.zoom_level, render_dpi)
+        if pixmap is not None:
             print(f"🖼️ Drawing pixmap for page {page_index}: {pixmap.width()}x{pixmap.height()}")
 
             # Scale pixmap to fit page rect exactly (from reference)
             painter.drawPixmap(page_rect.toRect(), pixmap)
             print(f"✅ Pixmap scaled and drawn for page {page_index}")
+            return True
+
+        # Stretch a render from another zoom until the sharp one arrives
+        placeholder = self.page_cache.get_placeholder(page_index, render_dpi)
+        if placeholder is not None:
+            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+            painter.drawPixmap(page_rect.toRect(), placeholder)
+            print(f"🔎 Placeholder drawn for page {page_index}: {placeholder.width()}x{placeholder.height()}")
         else:
             # Draw loading indicator
             painter.setPen(QPen(Qt.GlobalColor.gray))
@@ -499,19 +673,29 @@ class CanvasWidget(QWidget):
         if abs(self.zoom_level - zoom_level) > 0.01:
             print(f"🔍 Setting zoom to {zoom_level:.2f}")
 
-            # Clear old cache when zoom changes (different DPI needed)
-            self.rendered_pages.clear()
+            # Old-zoom renders stay cached: they are drawn scaled as placeholders
+            # until the sharp pages arrive, then age out in plain LRU order (drawing
+            # one as a placeholder counts as a use)
 
             # Update zoom
             old_zoom = self.zoom_level
             self.zoom_level = zoom_level
 
+            # Anything still rendering at the old zoom is now stale
+            if self.render_service:
+                self.render_service.next_generation()
+            self.scroll_prefetcher.reset()
+
             # Update layout manager
             if self.layout_manager:
                 self.layout_manager.set_zoom(zoom_level)
                 self._update_canvas_size()
 
-            # Re-queue visible pages for rendering at new zoom
+            # Phase 1: make sure every visible page has something to stretch
+            if self.progressive_zoom:
+                self._render_zoom_previews()
+
+            # Phase 2: re-queue visible pages for full-resolution rendering at new zoom
             if self.visible_pages:
                 self._queue_render_pages(self.visible_pages)
 
@@ -1,6 +1,8 @@
 from typing import List, Tuple, Optional
 from PyQt6.QtCore import QSizeF, QRectF, QPointF
 
+from utils.layout_index import PageLayoutIndex
+
 
 class LayoutManager:
     """Manages page positioning and coordinate transformations with configurable spacing"""
@@ -17,55 +19,65 @@ class LayoutManager:
         self.page_positions = []  # List of QRectF for each page in canvas coordinates
         self.total_width = 0
         self.total_height = 0
+        self.layout_index = PageLayoutIndex(integer_heights=False)  # Bisectable page tops/bottoms
+        self._page_sizes = self._read_page_sizes()
+        self._calculate_layout()
+
+    def _read_page_sizes(self) -> List[Tuple[float, float]]:
+        """Page sizes in points - read from the document once, reused for every zoom"""
+        if not self.document:
+            return []
+        sizes = []
+        for i in range(self.document.get_page_count()):
+            page_size = self.document.get_page_size(i)
+            sizes.append((page_size.width(), page_size.height()))
+        return sizes
+
+    def set_document(self, document):
+        """Switch document and rebuild the layout"""
+        self.document = document
+        self._page_sizes = self._read_page_sizes()
         self._calculate_layout()
 
     def _calculate_layout(self):
         """Calculate positions for all pages with proper spacing and different page sizes"""
         self.page_positions.clear()
 
-        if not self.document or self.document.get_page_count() == 0:
+        # Vertical positions come from the prefix-sum index (zoom-only changes reuse page sizes)
+        index = self.layout_index
+        index.page_sizes = self._page_sizes
+        index.zoom = self.zoom
+        index.top_margin = self.PAGE_MARGIN_TOP
+        index.spacing = self.PAGE_SPACING_VERTICAL
+        index.rebuild()
+
+        if not self._page_sizes:
             self.total_width = 0
             self.total_height = 0
             return
 
-        current_y = self.PAGE_MARGIN_TOP  # Start with top margin
-        max_page_width = 0
-
-        # First pass: find the maximum page width to center all pages
-        for i in range(self.document.get_page_count()):
-            page_size = self.document.get_page_size(i)
-            canvas_width = page_size.width() * self.zoom
-            max_page_width = max(max_page_width, canvas_width)
-
-        # Second pass: position pages with centering
-        for i in range(self.document.get_page_count()):
-            page_size = self.document.get_page_size(i)
+        # Find the maximum page width to center all pages
+        max_page_width = max(width for width, _ in self._page_sizes) * self.zoom
 
+        # Position pages with centering
+        for i, (width, height) in enumerate(self._page_sizes):
             # Convert from document points to canvas pixels
-            canvas_width = page_size.width() * self.zoom
-            canvas_height = page_size.height() * self.zoom
+            canvas_width = width * self.zoom
+            canvas_height = self.layout_index.heights[i]
 
             # Center this page horizontally within the maximum page width
             x_offset = (max_page_width - canvas_width) / 2
             x = self.PAGE_SPACING_HORIZONTAL + x_offset
 
             # Create page rectangle
-            page_rect = QRectF(x, current_y, canvas_width, canvas_height)
-            self.page_positions.append(page_rect)
-
-            # Move to next page position
-            current_y += canvas_height + self.PAGE_SPACING_VERTICAL
+            self.page_positions.append(QRectF(x, self.layout_index.tops[i], canvas_width, canvas_height))
 
         # Calculate total canvas size
         # Width: max page width + horizontal margins on both sides
         self.total_width = max_page_width + (2 * self.PAGE_SPACING_HORIZONTAL)
 
         # Height: last page bottom + bottom margin
-        if self.page_positions:
-            last_page_bottom = self.page_positions[-1].bottom()
-            self.total_height = last_page_bottom + self.PAGE_MARGIN_BOTTOM
-        else:
-            self.total_height = self.PAGE_MARGIN_TOP + self.PAGE_MARGIN_BOTTOM
+        self.total_height = self.page_positions[-1].bottom() + self.PAGE_MARGIN_BOTTOM
 
     def set_zoom(self, zoom: float):
         """Update zoom level and recalculate layout"""
@@ -93,13 +105,10 @@ class LayoutManager:
 
     def get_visible_pages(self, viewport_rect: QRectF) -> List[int]:
         """Get list of page indices visible in viewport"""
-        visible_pages = []
-
-        for i, page_rect in enumerate(self.page_positions):
-            if viewport_rect.intersects(page_rect):
-                visible_pages.append(i)
-
-        return visible_pages
+        # Bisect to the pages overlapping the viewport band, then check horizontal overlap
+        candidates = self.layout_index.pages_in_range(viewport_rect.top(), viewport_rect.bottom(),
+                                                      inclusive=False)
+        return [i for i in candidates if viewport_rect.intersects(self.page_positions[i])]
 
     def get_page_at_position(self, y_position: float) -> int:
         """Get page index at given Y position"""
@@ -111,33 +120,14 @@ class LayoutManager:
         if y_position > self.total_height - self.PAGE_MARGIN_BOTTOM:
             return max(0, len(self.page_positions) - 1)
 
-        # Find page that contains this Y position
-        for i, page_rect in enumerate(self.page_positions):
-            if page_rect.top() <= y_position <= page_rect.bottom():
-                return i
-
-        # If between pages, find the closest page
-        min_distance = float('inf')
-        closest_page = 0
-
-        for i, page_rect in enumerate(self.page_positions):
-            # Distance to top edge
-            dist_to_top = abs(y_position - page_rect.top())
-            # Distance to bottom edge
-            dist_to_bottom = abs(y_position - page_rect.bottom())
-            distance = min(dist_to_top, dist_to_bottom)
-
-            if distance < min_distance:
-                min_distance = distance
-                closest_page = i
-
-        return closest_page
+        # Page containing this Y position, or the closest page if between pages
+        return self.layout_index.nearest_page(y_position)
 
     def get_page_at_canvas_position(self, x: float, y: float) -> Optional[int]:
         """Get page index at canvas position (x, y)"""
-        for i, page_rect in enumerate(self.page_positions):
-            if page_rect.contains(x, y):
-                return i
+        page_index = self.layout_index.page_at(y)
+        if page_index is not None and self.page_positions[page_index].contains(x, y):
+            return page_index
         return None
 
     def document_to_canvas(self, page_index: int, doc_point: QPointF) -> QPointF:
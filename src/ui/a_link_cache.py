@@ -0,0 +1,242 @@
+"""
+Link Cache - Bounded LRU cache and latency histograms for the link managers
+File: src/ui/a_link_cache.py
+
+LinkCache replaces the plain dicts the link managers used to trim by dropping
+arbitrary keys: entries are evicted least-recently-used first once an entry
+budget (and optionally a byte budget) is exceeded, and every lookup is counted.
+
+LatencyHistogram replaces the ever-growing lists of timings: samples land in
+fixed log-linear buckets (HDR-style, 8 sub-buckets per power of two, ~12.5%
+worst-case error), so memory stays constant no matter how many are recorded.
+"""
+
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Iterator, List, Optional
+
+_MISSING = object()
+
+
+class LinkCache:
+    """True-LRU cache with an entry budget, an optional byte budget and hit/miss counters"""
+
+    def __init__(self, name: str, max_entries: int = 100, max_bytes: int = 0,
+                 sizeof: Optional[Callable[[object], int]] = None):
+        """
+        Args:
+            name: Shown in statistics
+            max_entries: Entry budget (0 = unlimited)
+            max_bytes: Byte budget (0 = unlimited), measured with sizeof
+            sizeof: Approximate size of a value in bytes (required for a byte budget)
+        """
+        self.name = name
+        self._max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+
+        self._entries: "OrderedDict[Hashable, object]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self.current_bytes = 0
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ========================================
+    # LOOKUP
+    # ========================================
+
+    def get(self, key: Hashable, default=None):
+        """Counted lookup; marks the entry most recently used"""
+        value = self._entries.get(key, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Membership test (does not touch LRU order or stats)"""
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._entries)
+
+    def values(self):
+        return self._entries.values()
+
+    # ========================================
+    # INSERTION / EVICTION
+    # ========================================
+
+    def put(self, key: Hashable, value):
+        """Store a value as most recently used and evict over budget"""
+        if key in self._entries:
+            self.current_bytes -= self._sizes.pop(key, 0)
+
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if self.sizeof is not None:
+            size = self.sizeof(value)
+            self._sizes[key] = size
+            self.current_bytes += size
+
+        self._evict_to_budget()
+
+    def __delitem__(self, key: Hashable):
+        del self._entries[key]
+        self.current_bytes -= self._sizes.pop(key, 0)
+
+    def pop(self, key: Hashable, default=None):
+        if key not in self._entries:
+            return default
+        value = self._entries[key]
+        del self[key]
+        return value
+
+    @property
+    def max_entries(self) -> int:
+        return self._max_entries
+
+    @max_entries.setter
+    def max_entries(self, max_entries: int):
+        self._max_entries = max_entries
+        self._evict_to_budget()
+
+    def _over_budget(self) -> bool:
+        return ((self._max_entries and len(self._entries) > self._max_entries) or
+                (self.max_bytes and self.current_bytes > self.max_bytes))
+
+    def _evict_to_budget(self):
+        # Never evict the entry just stored, even if it alone exceeds the byte budget
+        while len(self._entries) > 1 and self._over_budget():
+            oldest = next(iter(self._entries))
+            del self[oldest]
+            self.evictions += 1
+
+    def clear(self):
+        """Drop all entries (statistics are kept)"""
+        self._entries.clear()
+        self._sizes.clear()
+        self.current_bytes = 0
+
+    # ========================================
+    # STATISTICS
+    # ========================================
+
+    def get_stats(self) -> dict:
+        """Cache statistics"""
+        lookups = self.hits + self.misses
+        return {
+            'name': self.name,
+            'entries': len(self._entries),
+            'max_entries': self._max_entries,
+            'bytes': self.current_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits / lookups * 100) if lookups else 0.0,
+            'evictions': self.evictions
+        }
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (microsecond resolution, log-linear buckets)"""
+
+    SUB_BUCKET_BITS = 3  # 8 linear sub-buckets per power of two
+    MAX_EXPONENT = 32  # Top bucket starts at ~9.5 hours
+
+    def __init__(self, name: str):
+        self.name = name
+        sub_buckets = 1 << self.SUB_BUCKET_BITS
+        self.counts: List[int] = [0] * (sub_buckets * (self.MAX_EXPONENT + 2))
+
+        self.count = 0
+        self.total = 0.0  # Seconds
+        self.min = 0.0
+        self.max = 0.0
+
+    # ========================================
+    # BUCKETS
+    # ========================================
+
+    @classmethod
+    def bucket_index(cls, microseconds: int) -> int:
+        sub_buckets = 1 << cls.SUB_BUCKET_BITS
+        if microseconds < sub_buckets:
+            return max(0, microseconds)
+        exponent = min(microseconds.bit_length() - cls.SUB_BUCKET_BITS - 1, cls.MAX_EXPONENT)
+        sub_bucket = min((microseconds >> exponent) - sub_buckets, sub_buckets - 1)
+        return sub_buckets + exponent * sub_buckets + sub_bucket
+
+    @classmethod
+    def bucket_bounds(cls, index: int) -> tuple:
+        """[low, high) microseconds covered by a bucket"""
+        sub_buckets = 1 << cls.SUB_BUCKET_BITS
+        if index < sub_buckets:
+            return index, index + 1
+        exponent, sub_bucket = divmod(index - sub_buckets, sub_buckets)
+        low = (sub_buckets + sub_bucket) << exponent
+        return low, low + (1 << exponent)
+
+    # ========================================
+    # RECORDING
+    # ========================================
+
+    def record(self, seconds: float):
+        """Add one sample"""
+        self.counts[self.bucket_index(int(seconds * 1_000_000))] += 1
+        if self.count == 0 or seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.count += 1
+        self.total += seconds
+
+    def reset(self):
+        self.counts = [0] * len(self.counts)
+        self.count = 0
+        self.total = 0.0
+        self.min = 0.0
+        self.max = 0.0
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """Approximate percentile in seconds (bucket midpoint, clamped to the observed range)"""
+        if not self.count:
+            return 0.0
+
+        rank = max(1, int(round(percent / 100.0 * self.count)))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                low, high = self.bucket_bounds(index)
+                return min(max((low + high) / 2 / 1_000_000, self.min), self.max)
+        return self.max
+
+    def get_stats(self) -> dict:
+        """Count, total and summary latencies in seconds"""
+        return {
+            'name': self.name,
+            'count': self.count,
+            'total': self.total,
+            'mean': self.mean,
+            'min': self.min,
+            'max': self.max,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99)
+        }
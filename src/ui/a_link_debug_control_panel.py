@@ -437,21 +437,37 @@ class LinkDebugControlPanel(QWidget):
 
         # Get metrics from link manager
         if self.link_integration and self.link_integration.link_manager:
-            cache_info = self.link_integration.link_manager.get_cache_info()
+            link_manager = self.link_integration.link_manager
+            cache_info = link_manager.get_cache_info()
             metrics.extend([
                 ("Cached Pages", str(cache_info.get('cached_pages', 0))),
                 ("Total Cached Links", str(cache_info.get('total_cached_links', 0))),
                 ("Named Destinations", str(cache_info.get('named_destinations', 0))),
-                ("Max Cache Size", str(cache_info.get('max_cache_size', 0)))
+                ("Max Cache Size", str(cache_info.get('max_cache_size', 0))),
+                ("Cache Hits / Misses",
+                 f"{cache_info.get('cache_hits', 0)} / {cache_info.get('cache_misses', 0)}"),
+                ("Cache Hit Rate", f"{cache_info.get('cache_hit_rate', 0.0):.1f}%"),
+                ("Cache Evictions", str(cache_info.get('cache_evictions', 0)))
             ])
 
+            # Latency histograms (p50 / p90 / p99)
+            if hasattr(link_manager, 'get_latency_stats'):
+                for name, latency in link_manager.get_latency_stats().items():
+                    if not latency['count']:
+                        continue
+                    metrics.append((
+                        f"{name.replace('_', ' ').title()} Latency",
+                        f"p50 {latency['p50'] * 1000:.2f} / p90 {latency['p90'] * 1000:.2f} / "
+                        f"p99 {latency['p99'] * 1000:.2f} ms (n={latency['count']})"
+                    ))
+
         # Get metrics from overlay manager
         if self.link_integration and self.link_integration.overlay_manager:
             overlay_stats = self.link_integration.overlay_manager.get_overlay_stats()
             metrics.extend([
                 ("Active Overlay Pages", str(overlay_stats.get('active_pages', 0))),
                 ("Total Overlays", str(overlay_stats.get('total_overlays', 0))),
-                ("Pooled Overlays", str(overlay_stats.get('pooled_overlays', 0))),
+                ("Hotspot Hit Tests", str(overlay_stats.get('hit_tests', 0))),
                 ("Current Page", str(overlay_stats.get('current_page', 0) + 1))
             ])
 
@@ -497,7 +513,7 @@ class LinkDebugControlPanel(QWidget):
             stats_text = []
             stats_text.append(f"Active Pages: {stats.get('active_pages', 0)}")
             stats_text.append(f"Total Overlays: {stats.get('total_overlays', 0)}")
-            stats_text.append(f"Pooled Overlays: {stats.get('pooled_overlays', 0)}")
+            stats_text.append(f"Hotspot Hit Tests: {stats.get('hit_tests', 0)}")
             stats_text.append(f"Current Page: {stats.get('current_page', 0) + 1}")
             stats_text.append(f"Visible Pages: {stats.get('visible_pages_count', 0)}")
 
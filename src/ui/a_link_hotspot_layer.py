@@ -0,0 +1,294 @@
+"""
+Link Hotspot Layer
+One painted layer for all link rectangles on the canvas
+
+Link overlays used to be one QLabel (with its own stylesheet) per link on every
+visible page; index pages with thousands of links meant thousands of widgets.
+This layer is a single transparent child widget of the canvas that paints every
+link rect in one pass, and resolves hover and click through a grid hit-test
+index instead of per-widget enter/press events.
+
+Mouse input is taken from an event filter on the canvas, so the layer itself
+never blocks canvas events; only clicks that hit a link are consumed.
+"""
+
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+from PyQt6.QtCore import QEvent, QObject, QPoint, QRect, Qt, pyqtSignal
+from PyQt6.QtGui import QBrush, QColor, QCursor, QPainter, QPen
+from PyQt6.QtWidgets import QToolTip, QWidget
+
+Cell = Tuple[int, int]
+
+
+class LinkHotspot:
+    """One clickable link rect in canvas coordinates"""
+
+    __slots__ = ('rect', 'page_index', 'style', 'key', 'payload', 'tooltip')
+
+    def __init__(self, rect: QRect, page_index: int, style: Hashable, key: Hashable, payload,
+                 tooltip: str = ""):
+        self.rect = rect
+        self.page_index = page_index
+        self.style = style  # Key into the layer's style table
+        self.key = key  # Identity used for highlighting (e.g. the link id)
+        self.payload = payload  # Emitted on hover/click
+        self.tooltip = tooltip
+
+
+class LinkHitIndex:
+    """Uniform grid over hotspot rects; point queries only look at one cell"""
+
+    DEFAULT_CELL_SIZE = 64  # Canvas pixels
+
+    def __init__(self, cell_size: int = DEFAULT_CELL_SIZE):
+        self.cell_size = cell_size
+        self._pages: Dict[int, List[LinkHotspot]] = {}
+        self._cells: Dict[Cell, List[LinkHotspot]] = {}
+        self._dirty = False
+
+    def set_page(self, page_index: int, hotspots: List[LinkHotspot]):
+        self._pages[page_index] = hotspots
+        self._dirty = True
+
+    def remove_page(self, page_index: int):
+        if self._pages.pop(page_index, None) is not None:
+            self._dirty = True
+
+    def clear(self):
+        self._pages.clear()
+        self._cells.clear()
+        self._dirty = False
+
+    def pages(self) -> List[int]:
+        return list(self._pages)
+
+    def page_hotspots(self, page_index: int) -> List[LinkHotspot]:
+        return self._pages.get(page_index, [])
+
+    def all_hotspots(self) -> Iterable[LinkHotspot]:
+        for page_index in sorted(self._pages):
+            yield from self._pages[page_index]
+
+    def __len__(self) -> int:
+        return sum(len(hotspots) for hotspots in self._pages.values())
+
+    def _cell_range(self, rect: QRect) -> Tuple[range, range]:
+        size = self.cell_size
+        return (range(rect.left() // size, rect.right() // size + 1),
+                range(rect.top() // size, rect.bottom() // size + 1))
+
+    def _rebuild(self):
+        """Re-bucket every hotspot (pages are replaced as a whole, so this runs once per update)"""
+        self._cells.clear()
+        for hotspot in self.all_hotspots():
+            columns, rows = self._cell_range(hotspot.rect)
+            for cy in rows:
+                for cx in columns:
+                    self._cells.setdefault((cx, cy), []).append(hotspot)
+        self._dirty = False
+
+    def at(self, point: QPoint) -> List[LinkHotspot]:
+        """Hotspots containing a point, in page/link order"""
+        if self._dirty:
+            self._rebuild()
+        cell = (point.x() // self.cell_size, point.y() // self.cell_size)
+        return [h for h in self._cells.get(cell, ()) if h.rect.contains(point)]
+
+    def in_rect(self, rect: QRect) -> List[LinkHotspot]:
+        """Hotspots intersecting a rect, each once"""
+        if self._dirty:
+            self._rebuild()
+        found = {}
+        columns, rows = self._cell_range(rect)
+        for cy in rows:
+            for cx in columns:
+                for hotspot in self._cells.get((cx, cy), ()):
+                    if id(hotspot) not in found and hotspot.rect.intersects(rect):
+                        found[id(hotspot)] = hotspot
+        return list(found.values())
+
+
+class LinkHotspotLayer(QWidget):
+    """Transparent canvas child that paints and hit-tests all link hotspots"""
+
+    hotspotClicked = pyqtSignal(object)  # payload
+    hotspotHovered = pyqtSignal(object)  # payload
+
+    HIGHLIGHT_COLOR = QColor(255, 102, 0)
+    BORDER_WIDTH = 2
+    HIGHLIGHT_WIDTH = 3
+
+    def __init__(self, canvas_widget: QWidget, styles: Dict[Hashable, QColor],
+                 draw_hotspots: bool = True):
+        """
+        Args:
+            canvas_widget: Canvas the layer covers (and whose mouse events it filters)
+            styles: style key -> border color (fill is the same color, translucent)
+            draw_hotspots: False keeps links invisible (cursor and clicks only)
+        """
+        super().__init__(canvas_widget)
+        self.canvas_widget = canvas_widget
+        self.styles = styles
+        self.draw_hotspots = draw_hotspots
+        self.opacity = 1.0
+
+        self.index = LinkHitIndex()
+        self.hovered: Optional[LinkHotspot] = None
+        self.highlighted_key: Optional[Hashable] = None
+
+        # Painting only - mouse input comes through the canvas event filter
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
+        self.setGeometry(canvas_widget.rect())
+        canvas_widget.installEventFilter(self)
+        canvas_widget.setMouseTracking(True)
+        self.show()
+        self.raise_()
+
+        # Statistics
+        self.paint_passes = 0
+        self.hit_tests = 0
+
+    # ========================================
+    # HOTSPOTS
+    # ========================================
+
+    def set_page_hotspots(self, page_index: int, hotspots: List[LinkHotspot]):
+        """Replace the hotspots of one page"""
+        old_bounds = self._page_bounds(page_index)
+        self.index.set_page(page_index, hotspots)
+        if self.hovered is not None and self.hovered.page_index == page_index:
+            self._set_hovered(None)
+        self.update(old_bounds.united(self._page_bounds(page_index)))
+
+    def clear(self):
+        """Drop every hotspot"""
+        self.index.clear()
+        self._set_hovered(None)
+        self.update()
+
+    def hotspots_at(self, point: QPoint) -> List[LinkHotspot]:
+        self.hit_tests += 1
+        return self.index.at(point)
+
+    def set_highlighted(self, key: Optional[Hashable]):
+        """Outline the hotspot(s) with this key (None clears the highlight)"""
+        if key != self.highlighted_key:
+            self.highlighted_key = key
+            self.update()
+
+    def detach(self):
+        """Stop filtering the canvas' events and delete the layer (canvas replaced)"""
+        self.canvas_widget.removeEventFilter(self)
+        self.canvas_widget.unsetCursor()
+        self.hide()
+        self.deleteLater()
+
+    def set_opacity(self, opacity: float):
+        self.opacity = max(0.0, min(1.0, opacity))
+        self.update()
+
+    def _page_bounds(self, page_index: int) -> QRect:
+        bounds = QRect()
+        for hotspot in self.index.page_hotspots(page_index):
+            bounds = bounds.united(hotspot.rect)
+        if bounds.isEmpty():
+            return bounds
+        return bounds.adjusted(-self.HIGHLIGHT_WIDTH, -self.HIGHLIGHT_WIDTH,
+                               self.HIGHLIGHT_WIDTH, self.HIGHLIGHT_WIDTH)
+
+    # ========================================
+    # MOUSE (canvas event filter)
+    # ========================================
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if watched is not self.canvas_widget:
+            return False
+
+        event_type = event.type()
+        if event_type == QEvent.Type.Resize:
+            self.setGeometry(self.canvas_widget.rect())
+        elif event_type == QEvent.Type.MouseMove:
+            hits = self.hotspots_at(event.position().toPoint())
+            self._set_hovered(hits[-1] if hits else None, event.globalPosition().toPoint())
+        elif event_type == QEvent.Type.MouseButtonPress and event.button() == Qt.MouseButton.LeftButton:
+            hits = self.hotspots_at(event.position().toPoint())
+            if hits:
+                self.hotspotClicked.emit(hits[-1].payload)  # Topmost (last painted) link wins
+                return True
+        elif event_type == QEvent.Type.Leave:
+            self._set_hovered(None)
+        return False
+
+    def _set_hovered(self, hotspot: Optional[LinkHotspot], global_pos: QPoint = None):
+        if hotspot is self.hovered:
+            return
+
+        previous, self.hovered = self.hovered, hotspot
+        for changed in (previous, hotspot):
+            if changed is not None:
+                self.update(changed.rect.adjusted(-self.HIGHLIGHT_WIDTH, -self.HIGHLIGHT_WIDTH,
+                                                  self.HIGHLIGHT_WIDTH, self.HIGHLIGHT_WIDTH))
+
+        if hotspot is None:
+            self.canvas_widget.unsetCursor()
+            QToolTip.hideText()
+            return
+
+        self.canvas_widget.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        if hotspot.tooltip and global_pos is not None:
+            QToolTip.showText(global_pos, hotspot.tooltip, self.canvas_widget)
+        self.hotspotHovered.emit(hotspot.payload)
+
+    # ========================================
+    # PAINTING
+    # ========================================
+
+    def paintEvent(self, event):
+        """Paint the hotspots in the exposed area - one drawRects call per style"""
+        exposed = event.rect()
+        hotspots = self.index.in_rect(exposed)
+        if not hotspots:
+            return
+
+        painter = QPainter(self)
+        try:
+            painter.setOpacity(self.opacity)
+            self.paint_passes += 1
+
+            if self.draw_hotspots:
+                by_style: Dict[Hashable, List[QRect]] = {}
+                for hotspot in hotspots:
+                    if hotspot is not self.hovered:
+                        by_style.setdefault(hotspot.style, []).append(hotspot.rect)
+                for style, rects in by_style.items():
+                    color = self.styles.get(style, QColor(102, 102, 102))
+                    painter.setPen(QPen(color, self.BORDER_WIDTH, Qt.PenStyle.DashLine))
+                    painter.setBrush(QBrush(QColor(color.red(), color.green(), color.blue(), 20)))
+                    painter.drawRects(rects)
+
+                if self.hovered is not None and self.hovered.rect.intersects(exposed):
+                    color = self.styles.get(self.hovered.style, QColor(102, 102, 102))
+                    painter.setPen(QPen(color, self.BORDER_WIDTH))
+                    painter.setBrush(QBrush(QColor(color.red(), color.green(), color.blue(), 40)))
+                    painter.drawRect(self.hovered.rect)
+
+            if self.highlighted_key is not None:
+                highlighted = [h.rect for h in hotspots if h.key == self.highlighted_key]
+                if highlighted:
+                    color = self.HIGHLIGHT_COLOR
+                    painter.setPen(QPen(color, self.HIGHLIGHT_WIDTH))
+                    painter.setBrush(QBrush(QColor(color.red(), color.green(), color.blue(), 60)))
+                    painter.drawRects(highlighted)
+        finally:
+            painter.end()
+
+    def get_stats(self) -> dict:
+        """Layer statistics"""
+        return {
+            'pages': len(self.index.pages()),
+            'hotspots': len(self.index),
+            'paint_passes': self.paint_passes,
+            'hit_tests': self.hit_tests
+        }
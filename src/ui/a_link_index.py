@@ -0,0 +1,446 @@
+"""
+Link Index - Whole-document link extraction in the background
+File: src/ui/a_link_index.py
+
+A background job opens its own fitz.Document, walks every page once and packs
+all links into a compact index (per-page slices of flat arrays for rects,
+kinds and each get_links() key). The index is saved next to the
+PDF as <file>.linkindex.npz, keyed by the SHA-256 of the file's content, so
+reopening an unchanged document loads it without any PyMuPDF calls.
+
+Every optional key of a PyMuPDF get_links() dict ('page', 'to', 'zoom', 'uri',
+'file', 'nameddest', ...) has its own column plus a presence bit per link, so
+raw links handed out by the index are equal to what page.get_links() returns
+and existing click parsing and overlay code works on them unchanged. String
+columns are one UTF-8 blob plus offsets, so a single long URI does not pad
+every other row.
+
+The same job resolves the document's named destinations (/Dests dictionary and
+/Names name tree) in bulk and stores them with the links, so named-link clicks
+are a single dict lookup instead of a resolve_dest() call per click.
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
+
+from utils.file_handler import file_content_hash
+
+# Try to import PyMuPDF
+try:
+    import fitz
+    FITZ_AVAILABLE = True
+except ImportError:
+    FITZ_AVAILABLE = False
+    fitz = None
+
+INDEX_SUFFIX = ".linkindex.npz"
+INDEX_FORMAT_VERSION = 4
+
+# Optional get_links() keys in presence-bit order (bit i set = key i present)
+LINK_KEYS = ('page', 'to', 'zoom', 'xref', 'uri', 'file', 'nameddest', 'name', 'id')
+_KEY_BITS = {key: 1 << bit for bit, key in enumerate(LINK_KEYS)}
+_STRING_KEYS = ('uri', 'file', 'nameddest', 'name', 'id')
+
+
+class LinkRect:
+    """Minimal stand-in for fitz.Rect as used by link consumers (when PyMuPDF is missing)"""
+
+    __slots__ = ('x0', 'y0', 'x1', 'y1')
+
+    def __init__(self, x0: float, y0: float, x1: float, y1: float):
+        self.x0, self.y0, self.x1, self.y1 = x0, y0, x1, y1
+
+    @property
+    def width(self) -> float:
+        return self.x1 - self.x0
+
+    @property
+    def height(self) -> float:
+        return self.y1 - self.y0
+
+    def __repr__(self):
+        return f"LinkRect({self.x0}, {self.y0}, {self.x1}, {self.y1})"
+
+
+class StringColumn:
+    """Variable-length strings as one UTF-8 byte blob and (n + 1) int64 offsets"""
+
+    __slots__ = ('data', 'offsets')
+
+    def __init__(self, data: np.ndarray, offsets: np.ndarray):
+        self.data = data  # (bytes,) uint8 - every string's UTF-8 encoding back to back
+        self.offsets = offsets  # (n + 1,) int64 - string i is data[offsets[i]:offsets[i + 1]]
+
+    @classmethod
+    def from_strings(cls, strings: Iterable[str]) -> 'StringColumn':
+        encoded = [str(string).encode('utf-8') for string in strings]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(value) for value in encoded], out=offsets[1:])
+        return cls(np.frombuffer(b''.join(encoded), dtype=np.uint8), offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, item):
+        """One string for an index, a list of strings for a slice"""
+        if isinstance(item, slice):
+            start, stop, _ = item.indices(len(self))
+            return self._decode(start, max(start, stop))
+        if item < 0:
+            item += len(self)
+        return self._decode(item, item + 1)[0]
+
+    def _decode(self, start: int, stop: int) -> List[str]:
+        offsets = self.offsets[start:stop + 1].tolist()
+        blob = self.data[offsets[0]:offsets[-1]].tobytes() if offsets else b''
+        base = offsets[0] if offsets else 0
+        return [blob[begin - base:end - base].decode('utf-8') for begin, end in zip(offsets, offsets[1:])]
+
+    def tolist(self) -> List[str]:
+        return self[:]
+
+    @property
+    def nbytes(self) -> int:
+        return self.data.nbytes + self.offsets.nbytes
+
+
+def index_path_for(file_path: str) -> str:
+    return file_path + INDEX_SUFFIX
+
+
+class LinkIndex:
+    """All links of a document as flat arrays, sliced per page by page_offsets"""
+
+    def __init__(self, content_hash: str, page_offsets: np.ndarray, rects: np.ndarray, kinds: np.ndarray,
+                 present: np.ndarray, target_pages: np.ndarray, target_points: np.ndarray, zooms: np.ndarray,
+                 xrefs: np.ndarray, uris: StringColumn, files: StringColumn, nameddests: StringColumn,
+                 names: StringColumn, ids: StringColumn,
+                 dest_names: StringColumn = None, dest_pages: np.ndarray = None, dest_points: np.ndarray = None):
+        self.content_hash = content_hash
+        self.page_offsets = page_offsets  # (pages + 1,) int64 - links of page p are [offsets[p], offsets[p + 1])
+        self.rects = rects  # (n, 4) float64 x0, y0, x1, y1 in PDF points
+        self.kinds = kinds  # (n,) int8 PyMuPDF link kind (fitz.LINK_*)
+        self.present = present  # (n,) uint16 presence bits of LINK_KEYS
+
+        # One column per optional get_links() key (only meaningful where its presence bit is set)
+        self.target_pages = target_pages  # (n,) int32 'page'
+        self.target_points = target_points  # (n, 2) float64 'to'
+        self.zooms = zooms  # (n,) float64 'zoom'
+        self.xrefs = xrefs  # (n,) int32 'xref'
+        self.uris = uris  # (n,) 'uri'
+        self.files = files  # (n,) 'file' (LINK_LAUNCH / LINK_GOTOR)
+        self.nameddests = nameddests  # (n,) 'nameddest' (LINK_NAMED)
+        self.names = names  # (n,) 'name' (older PyMuPDF versions)
+        self.ids = ids  # (n,) 'id'
+
+        # Named destinations: name -> page and point (NaN when the destination has no point)
+        self.dest_names = dest_names if dest_names is not None else StringColumn.from_strings([])
+        self.dest_pages = dest_pages if dest_pages is not None else np.array([], dtype=np.int32)
+        self.dest_points = dest_points if dest_points is not None else np.empty((0, 2), dtype=np.float64)
+
+        self._raw_cache: Dict[int, List[dict]] = {}
+        self._destinations: Optional[Dict[str, Tuple[int, float, float]]] = None
+
+    def _columns(self) -> Dict[str, Any]:
+        """Link column per optional get_links() key"""
+        return {'page': self.target_pages, 'to': self.target_points, 'zoom': self.zooms, 'xref': self.xrefs,
+                'uri': self.uris, 'file': self.files, 'nameddest': self.nameddests, 'name': self.names,
+                'id': self.ids}
+
+    @property
+    def page_count(self) -> int:
+        return len(self.page_offsets) - 1
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def page_slice(self, page_index: int) -> slice:
+        return slice(int(self.page_offsets[page_index]), int(self.page_offsets[page_index + 1]))
+
+    def page_link_count(self, page_index: int) -> int:
+        if not 0 <= page_index < self.page_count:
+            return 0
+        return int(self.page_offsets[page_index + 1] - self.page_offsets[page_index])
+
+    def raw_links(self, page_index: int) -> List[dict]:
+        """Links of a page, equal to page.get_links() (built once per page)"""
+        cached = self._raw_cache.get(page_index)
+        if cached is not None:
+            return cached
+        if not 0 <= page_index < self.page_count:
+            return []
+
+        page = self.page_slice(page_index)
+        columns = {key: column[page] if isinstance(column, StringColumn) else column[page].tolist()
+                   for key, column in self._columns().items()}
+        make_rect = fitz.Rect if FITZ_AVAILABLE else LinkRect
+        make_point = fitz.Point if FITZ_AVAILABLE else (lambda x, y: (x, y))
+
+        links = []
+        for i, (rect, kind, present) in enumerate(zip(
+                self.rects[page].tolist(), self.kinds[page].tolist(), self.present[page].tolist())):
+            link = {'kind': kind, 'from': make_rect(*rect)}
+            for key in LINK_KEYS:
+                if present & _KEY_BITS[key]:
+                    value = columns[key][i]
+                    link[key] = make_point(*value) if key == 'to' else value
+            links.append(link)
+
+        self._raw_cache[page_index] = links
+        return links
+
+    # ========================================
+    # NAMED DESTINATIONS
+    # ========================================
+
+    @property
+    def destinations(self) -> Dict[str, Tuple[int, float, float]]:
+        """Hash table name -> (page, x, y), built from the arrays on first use"""
+        if self._destinations is None:
+            self._destinations = {
+                name: (page, x, y) for name, page, (x, y) in zip(
+                    self.dest_names.tolist(), self.dest_pages.tolist(), self.dest_points.tolist())}
+        return self._destinations
+
+    def resolve_destination(self, name: str) -> Optional[Dict[str, Any]]:
+        """Named destination as {'page', 'x', 'y'} (link manager shape), or None if unknown"""
+        entry = self.destinations.get(name)
+        if entry is None:
+            return None
+        page, x, y = entry
+        if x != x or y != y:  # NaN - destination without a point, use the page's top-left defaults
+            x, y = 72.0, 720.0
+        return {'page': page, 'x': x, 'y': y}
+
+    # ========================================
+    # PERSISTENCE
+    # ========================================
+
+    def save(self, path: str):
+        arrays = {}
+        for key, column in self._columns().items():
+            if isinstance(column, StringColumn):
+                arrays[f"link_{key}_data"], arrays[f"link_{key}_offsets"] = column.data, column.offsets
+            else:
+                arrays[f"link_{key}"] = column
+        np.savez_compressed(
+            path, version=np.array(INDEX_FORMAT_VERSION), content_hash=np.array(self.content_hash),
+            page_offsets=self.page_offsets, rects=self.rects, kinds=self.kinds, present=self.present,
+            dest_names_data=self.dest_names.data, dest_names_offsets=self.dest_names.offsets,
+            dest_pages=self.dest_pages, dest_points=self.dest_points, **arrays)
+
+    @classmethod
+    def load(cls, path: str, content_hash: str) -> Optional['LinkIndex']:
+        """Index saved at path, or None if missing, unreadable or for different content"""
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if int(data['version']) != INDEX_FORMAT_VERSION or str(data['content_hash']) != content_hash:
+                    return None
+                return cls(content_hash, data['page_offsets'], data['rects'], data['kinds'], data['present'],
+                           *(data[f"link_{key}"] for key in ('page', 'to', 'zoom', 'xref')),
+                           *(StringColumn(data[f"link_{key}_data"], data[f"link_{key}_offsets"])
+                             for key in _STRING_KEYS),
+                           StringColumn(data['dest_names_data'], data['dest_names_offsets']),
+                           data['dest_pages'], data['dest_points'])
+        except Exception as e:
+            print(f"⚠️ Ignoring unreadable link index {path}: {e}")
+            return None
+
+    def get_stats(self) -> dict:
+        """Index size statistics"""
+        arrays = [self.page_offsets, self.rects, self.kinds, self.present, self.dest_names, self.dest_pages,
+                  self.dest_points] + list(self._columns().values())
+        return {
+            'pages': self.page_count,
+            'links': len(self),
+            'named_destinations': len(self.dest_names),
+            'bytes': sum(array.nbytes for array in arrays)
+        }
+
+
+# ========================================
+# WORKER SIDE (runs in the indexer's thread)
+# ========================================
+
+def _point(to) -> Tuple[float, float]:
+    """x, y of a link/destination 'to' value (fitz.Point or sequence), NaN when absent"""
+    if to is not None and hasattr(to, 'x'):
+        return to.x, to.y
+    if isinstance(to, (list, tuple)) and len(to) >= 2 and to[0] is not None and to[1] is not None:
+        return to[0], to[1]
+    return np.nan, np.nan
+
+
+def extract_named_destinations(doc, named_links: Iterable[Tuple[str, int, Tuple[float, float]]] = ()
+                               ) -> Tuple[StringColumn, np.ndarray, np.ndarray]:
+    """
+    All named destinations of a document as (names, pages, points) arrays
+
+    doc.resolve_names() walks the catalog's /Dests dictionary and the /Names
+    name tree once in MuPDF. Names that only named links resolve (PyMuPDF
+    already filled in their page and point) are added from named_links, so
+    documents or PyMuPDF versions without resolve_names still get every
+    destination their links use.
+    """
+    resolved = {}
+    if hasattr(doc, 'resolve_names'):
+        try:
+            resolved = doc.resolve_names() or {}
+        except Exception as e:
+            print(f"⚠️ Could not resolve named destinations: {e}")
+
+    names, pages, points = [], [], []
+    for name, dest in resolved.items():
+        page = dest.get('page', -1) if isinstance(dest, dict) else -1
+        if not isinstance(page, int) or page < 0:
+            continue  # Destination outside this document
+        names.append(str(name))
+        pages.append(page)
+        points.append(_point(dest.get('to')))
+
+    known = set(names)
+    for name, page, point in named_links:
+        if name and name not in known and page >= 0:
+            known.add(name)
+            names.append(name)
+            pages.append(page)
+            points.append(point)
+
+    return (StringColumn.from_strings(names),
+            np.array(pages, dtype=np.int32),
+            np.array(points, dtype=np.float64).reshape(-1, 2))
+
+
+def extract_link_index(file_path: str, content_hash: str) -> LinkIndex:
+    """Walk every page of a document with a private handle and pack its links"""
+    doc = fitz.open(file_path)
+    try:
+        offsets = [0]
+        rects, kinds, present = [], [], []
+        numbers = {'page': [], 'to': [], 'zoom': [], 'xref': []}
+        strings = {key: [] for key in _STRING_KEYS}
+        for page in doc:
+            for link in page.get_links():
+                rect = link.get('from')
+                rects.append((rect.x0, rect.y0, rect.x1, rect.y1) if rect is not None else (0, 0, 0, 0))
+                kinds.append(link.get('kind', fitz.LINK_NONE))
+                present.append(sum(bit for key, bit in _KEY_BITS.items() if link.get(key) is not None))
+
+                numbers['page'].append(link.get('page', -1))
+                numbers['to'].append(_point(link.get('to')))
+                numbers['zoom'].append(link.get('zoom', np.nan))
+                numbers['xref'].append(link.get('xref', 0))
+                for key in _STRING_KEYS:
+                    strings[key].append(link.get(key) or '')
+            offsets.append(len(kinds))
+
+        # Named links whose destination PyMuPDF resolved (page and point filled in)
+        named_links = [
+            (strings['nameddest'][i], numbers['page'][i], numbers['to'][i])
+            for i, kind in enumerate(kinds)
+            if kind == fitz.LINK_NAMED and present[i] & _KEY_BITS['page']]
+        dest_names, dest_pages, dest_points = extract_named_destinations(doc, named_links)
+    finally:
+        doc.close()
+
+    return LinkIndex(
+        content_hash,
+        np.array(offsets, dtype=np.int64),
+        np.array(rects, dtype=np.float64).reshape(-1, 4),
+        np.array(kinds, dtype=np.int8),
+        np.array(present, dtype=np.uint16),
+        np.array(numbers['page'], dtype=np.int32),
+        np.array(numbers['to'], dtype=np.float64).reshape(-1, 2),
+        np.array(numbers['zoom'], dtype=np.float64),
+        np.array(numbers['xref'], dtype=np.int32),
+        *(StringColumn.from_strings(strings[key]) for key in _STRING_KEYS),
+        dest_names, dest_pages, dest_points)
+
+
+def load_or_build_link_index(file_path: str) -> LinkIndex:
+    """Persisted index if it matches the file's content, else a freshly extracted (and saved) one"""
+    content_hash = file_content_hash(file_path)
+    path = index_path_for(file_path)
+
+    index = LinkIndex.load(path, content_hash)
+    if index is not None:
+        return index
+
+    index = extract_link_index(file_path, content_hash)
+    try:
+        index.save(path)
+    except OSError as e:
+        print(f"⚠️ Could not save link index next to {file_path}: {e}")
+    return index
+
+
+# ========================================
+# GUI SIDE
+# ========================================
+
+class LinkIndexer(QObject):
+    """Builds or loads a document's link index off the GUI thread"""
+
+    # Signals (always delivered on the GUI thread)
+    indexReady = pyqtSignal(str, object)  # file_path, LinkIndex
+    indexFailed = pyqtSignal(str, str)  # file_path, error message
+
+    # Internal: worker completion hop back to the GUI thread
+    _workerFinished = pyqtSignal(str, int, object, float)  # file_path, generation, Future, start time
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.index: Optional[LinkIndex] = None
+        self.file_path = ""
+        self.generation = 0
+        self.build_time = 0.0
+
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._workerFinished.connect(self._on_worker_finished)
+
+    def start(self, file_path: str):
+        """Index a document (results for an earlier document are dropped)"""
+        self.generation += 1
+        self.index = None
+        self.file_path = file_path or ""
+        if not FITZ_AVAILABLE or not self.file_path or not os.path.isfile(self.file_path):
+            return
+
+        generation = self.generation
+        start_time = time.perf_counter()
+        future = self._executor.submit(load_or_build_link_index, self.file_path)
+        future.add_done_callback(
+            lambda f, path=self.file_path: self._workerFinished.emit(path, generation, f, start_time))
+        print(f"🧵 Link indexing started for {self.file_path}")
+
+    def is_ready(self) -> bool:
+        return self.index is not None
+
+    @pyqtSlot(str, int, object, float)
+    def _on_worker_finished(self, file_path: str, generation: int, future, start_time: float):
+        if generation != self.generation:
+            return  # Document changed while indexing
+
+        error = future.exception()
+        if error is not None:
+            print(f"❌ Link indexing failed for {file_path}: {error}")
+            self.indexFailed.emit(file_path, str(error))
+            return
+
+        self.index = future.result()
+        self.build_time = time.perf_counter() - start_time
+        print(f"🔗 Link index ready: {len(self.index)} links on {self.index.page_count} pages, "
+              f"{len(self.index.dest_names)} named destinations "
+              f"in {self.build_time * 1000:.1f}ms")
+        self.indexReady.emit(file_path, self.index)
+
+    def shutdown(self):
+        self.generation += 1
+        self._executor.shutdown(wait=False)
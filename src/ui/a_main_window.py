@@ -682,6 +682,20 @@ class PDFMainWindow(QMainWindow):
         self.scroll_timer.stop()
         self.scroll_timer.start(50)  # 50ms delay
 
+        # Prefetch ahead of the scroll while it is still moving
+        if self.canvas_widget and self.canvas_widget.document:
+            self.canvas_widget.track_scroll(self._get_viewport_rect())
+
+    def _get_viewport_rect(self) -> QRectF:
+        """Visible canvas area in canvas coordinates"""
+        viewport = self.scroll_area.viewport()
+        return QRectF(
+            self.scroll_area.horizontalScrollBar().value(),
+            self.scroll_area.verticalScrollBar().value(),
+            viewport.width(),
+            viewport.height()
+        )
+
     @pyqtSlot()
     def _on_scroll_timer(self):
         """Handle scroll timer - update canvas viewport"""
@@ -690,16 +704,7 @@ class PDFMainWindow(QMainWindow):
 
         try:
             # Get viewport rectangle
-            scrollbar_v = self.scroll_area.verticalScrollBar()
-            scrollbar_h = self.scroll_area.horizontalScrollBar()
-
-            viewport = self.scroll_area.viewport()
-            viewport_rect = QRectF(
-                scrollbar_h.value(),
-                scrollbar_v.value(),
-                viewport.width(),
-                viewport.height()
-            )
+            viewport_rect = self._get_viewport_rect()
 
             # Get visible pages from canvas
             visible_pages = self.canvas_widget.get_visible_pages_in_viewport(viewport_rect)
@@ -0,0 +1,195 @@
+"""
+Page Cache - Byte-budgeted LRU cache for rendered page pixmaps
+File: src/ui/a_page_cache.py
+
+Entries are keyed by (page, zoom bucket, render DPI) so renders at different
+zoom levels coexist; a lower-resolution entry can stand in as a placeholder
+while the sharp version renders.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+from PyQt6.QtGui import QPixmap
+
+PageCacheKey = Tuple[int, int, int]  # page_index, zoom_bucket, render_dpi
+
+ZOOM_BUCKETS_PER_UNIT = 20  # 5% zoom steps share a bucket
+
+
+def zoom_bucket(zoom_level: float) -> int:
+    """Quantize a zoom level so tiny zoom differences hit the same entry"""
+    return int(round(zoom_level * ZOOM_BUCKETS_PER_UNIT))
+
+
+def pixmap_bytes(pixmap: QPixmap) -> int:
+    """Approximate memory held by a pixmap"""
+    return pixmap.width() * pixmap.height() * max(1, pixmap.depth() // 8)
+
+
+class PageCache:
+    """True-LRU page pixmap cache with a memory budget and viewport pinning"""
+
+    def __init__(self, budget_mb: float = 256):
+        self.budget_bytes = int(budget_mb * 1024 * 1024)
+
+        self._entries: "OrderedDict[PageCacheKey, QPixmap]" = OrderedDict()
+        self._sizes: Dict[PageCacheKey, int] = {}
+        self.current_bytes = 0
+
+        # Pages near the viewport (at the active DPI) are never evicted
+        self.pinned_pages = set()
+        self.pinned_dpi = None
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.placeholder_hits = 0
+
+    # ========================================
+    # LOOKUP
+    # ========================================
+
+    @staticmethod
+    def make_key(page_index: int, zoom_level: float, render_dpi: int) -> PageCacheKey:
+        return page_index, zoom_bucket(zoom_level), render_dpi
+
+    def get(self, page_index: int, zoom_level: float, render_dpi: int) -> Optional[QPixmap]:
+        """Exact-resolution lookup; marks the entry most recently used"""
+        key = self.make_key(page_index, zoom_level, render_dpi)
+        pixmap = self._entries.get(key)
+        if pixmap is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return pixmap
+
+    def contains(self, page_index: int, zoom_level: float, render_dpi: int) -> bool:
+        """Exact-resolution membership test (does not touch LRU order or stats)"""
+        return self.make_key(page_index, zoom_level, render_dpi) in self._entries
+
+    def has_page(self, page_index: int) -> bool:
+        """True if any resolution of the page is cached"""
+        return any(key[0] == page_index for key in self._entries)
+
+    def get_placeholder(self, page_index: int, render_dpi: int) -> Optional[QPixmap]:
+        """
+        Best other-resolution render of a page to scale up/down while the sharp one renders
+
+        Prefers the sharpest entry at or below render_dpi, otherwise the closest above it.
+        """
+        best_key = None
+        for key in self._entries:
+            if key[0] != page_index or key[2] == render_dpi:
+                continue
+            if best_key is None:
+                best_key = key
+                continue
+
+            best_dpi, dpi = best_key[2], key[2]
+            if dpi <= render_dpi:
+                if best_dpi > render_dpi or dpi > best_dpi:
+                    best_key = key
+            elif best_dpi > render_dpi and dpi < best_dpi:
+                best_key = key
+
+        if best_key is None:
+            return None
+
+        self._entries.move_to_end(best_key)
+        self.placeholder_hits += 1
+        return self._entries[best_key]
+
+    # ========================================
+    # INSERTION / EVICTION
+    # ========================================
+
+    def put(self, page_index: int, zoom_level: float, render_dpi: int, pixmap: QPixmap):
+        """Store a render and evict least-recently-used entries over budget"""
+        if pixmap is None or pixmap.isNull():
+            return
+
+        key = self.make_key(page_index, zoom_level, render_dpi)
+        if key in self._entries:
+            self.current_bytes -= self._sizes[key]
+
+        size = pixmap_bytes(pixmap)
+        self._entries[key] = pixmap
+        self._entries.move_to_end(key)
+        self._sizes[key] = size
+        self.current_bytes += size
+
+        self.evict_to_budget()
+
+    def set_pinned_pages(self, page_indices: Iterable[int], render_dpi: int = None):
+        """Pin pages near the viewport (only their entries at render_dpi are protected)"""
+        self.pinned_pages = set(page_indices)
+        self.pinned_dpi = render_dpi
+
+    def _is_pinned(self, key: PageCacheKey) -> bool:
+        return key[0] in self.pinned_pages and (self.pinned_dpi is None or key[2] == self.pinned_dpi)
+
+    def evict_to_budget(self) -> int:
+        """Evict LRU entries until under budget; pinned entries are skipped"""
+        if self.current_bytes <= self.budget_bytes:
+            return 0
+
+        evicted = 0
+        for key in list(self._entries.keys()):  # Oldest first
+            if self.current_bytes <= self.budget_bytes:
+                break
+            if self._is_pinned(key):
+                continue
+            self._remove(key)
+            evicted += 1
+
+        self.evictions += evicted
+        if evicted:
+            print(f"🧹 Page cache evicted {evicted} entries "
+                  f"({self.current_bytes / (1024 * 1024):.1f} MB / {self.budget_bytes / (1024 * 1024):.0f} MB)")
+        return evicted
+
+    def set_budget_mb(self, budget_mb: float):
+        """Change the memory budget"""
+        self.budget_bytes = int(budget_mb * 1024 * 1024)
+        self.evict_to_budget()
+
+    def invalidate_page(self, page_index: int):
+        """Drop every resolution of a page"""
+        for key in [k for k in self._entries if k[0] == page_index]:
+            self._remove(key)
+
+    def clear(self):
+        """Drop all entries (statistics are kept)"""
+        self._entries.clear()
+        self._sizes.clear()
+        self.current_bytes = 0
+
+    def _remove(self, key: PageCacheKey):
+        del self._entries[key]
+        self.current_bytes -= self._sizes.pop(key, 0)
+
+    # ========================================
+    # STATISTICS
+    # ========================================
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> dict:
+        """Cache statistics"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'memory_mb': self.current_bytes / (1024 * 1024),
+            'budget_mb': self.budget_bytes / (1024 * 1024),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits / lookups * 100) if lookups else 0.0,
+            'evictions': self.evictions,
+            'placeholder_hits': self.placeholder_hits,
+            'pinned_pages': sorted(self.pinned_pages)
+        }
@@ -3,6 +3,8 @@ from PyQt6.QtCore import QSizeF
 from PyQt6.QtGui import QPixmap
 import fitz  # PyMuPDF
 
+from utils.pixmap_utils import fitz_pixmap_to_qpixmap
+
 
 class PDFDocument:
     """Direct PDF document handling using PyMuPDF - all implementation here"""
@@ -45,11 +47,8 @@ class PDFDocument:
             matrix = fitz.Matrix(zoom, zoom)
             pix = page.get_pixmap(matrix=matrix, dpi=render_dpi)
 
-            # Convert to QPixmap
-            img_data = pix.tobytes("ppm")
-            qimg = QPixmap()
-            qimg.loadFromData(img_data)
-            return qimg
+            # Convert to QPixmap (wraps samples directly - no PPM encode/decode)
+            return fitz_pixmap_to_qpixmap(pix)
         except Exception as e:
             print(f"Error rendering page {page_index}: {e}")
             return QPixmap()
@@ -69,11 +68,8 @@ class PDFDocument:
 
             pix = page.get_pixmap(matrix=matrix, clip=clip, dpi=render_dpi)
 
-            # Convert to QPixmap
-            img_data = pix.tobytes("ppm")
-            qimg = QPixmap()
-            qimg.loadFromData(img_data)
-            return qimg
+            # Convert to QPixmap (wraps samples directly - no PPM encode/decode)
+            return fitz_pixmap_to_qpixmap(pix)
         except Exception as e:
             print(f"Error rendering page region {page_index}: {e}")
             return QPixmap()
@@ -14,6 +14,14 @@ from dataclasses import dataclass
 from enum import Enum
 from PyQt6.QtCore import QObject, pyqtSignal, QRectF, QPointF
 
+# Loaded both as ui.a_pdf_link_manager and as a flat module (src/ui on sys.path)
+try:
+    from .a_link_cache import LatencyHistogram, LinkCache
+    from .a_link_index import LinkIndexer
+except ImportError:
+    from a_link_cache import LatencyHistogram, LinkCache
+    from a_link_index import LinkIndexer
+
 
 class LinkType(Enum):
     """PDF link types"""
@@ -71,9 +79,12 @@ class PDFLinkManager(QObject):
         # Core state
         self.pdf_document = None  # Custom PDFDocument or fitz.Document
         self.document_path = ""
-        self.page_links_cache = {}  # Cache for extracted links
+        self.page_links_cache = LinkCache('page_links', max_entries=1000)  # page_index -> List[PDFLink]
         self.named_destinations = {}  # Cache for named destinations
 
+        # Whole-document link index, built (or loaded from disk) in the background
+        self.link_indexer = LinkIndexer(self)
+
         # Security settings
         self.allow_external_urls = True
         self.allow_file_launch = True
@@ -83,6 +94,10 @@ class PDFLinkManager(QObject):
         self.cache_links = True
         self.max_cache_size = 1000  # Maximum cached pages
 
+        # Performance tracking (fixed-size latency histograms)
+        self.extraction_latency = LatencyHistogram('extraction')
+        self.parsing_latency = LatencyHistogram('parsing')
+
         print("🔗 PDFLinkManager initialized")
 
     def set_pdf_document(self, pdf_document, document_path: str = ""):
@@ -95,6 +110,13 @@ class PDFLinkManager(QObject):
             self.page_links_cache.clear()
             self.named_destinations.clear()
 
+            # Index every page off the GUI thread; pages are extracted lazily until it is ready
+            index_path = ""
+            if pdf_document:
+                index_path = (document_path or getattr(pdf_document, 'file_path', '')
+                              or getattr(pdf_document, 'name', '') or "")
+            self.link_indexer.start(index_path)
+
             # Extract named destinations if available
             if pdf_document:
                 self._extract_named_destinations()
@@ -136,13 +158,18 @@ class PDFLinkManager(QObject):
             return []
 
         # Check cache first
-        if self.cache_links and page_index in self.page_links_cache:
-            return self.page_links_cache[page_index]
+        if self.cache_links:
+            cached_links = self.page_links_cache.get(page_index)
+            if cached_links is not None:
+                return cached_links
 
         try:
             extraction_start = time.perf_counter()
-            page = fitz_doc[page_index]
-            raw_links = page.get_links()
+            index = self.link_indexer.index
+            if index is not None and page_index < index.page_count:
+                raw_links = index.raw_links(page_index)  # No PyMuPDF call
+            else:
+                raw_links = fitz_doc[page_index].get_links()
             extraction_time = time.perf_counter() - extraction_start
 
             pdf_links = []
@@ -154,11 +181,12 @@ class PDFLinkManager(QObject):
 
             # Cache the results
             if self.cache_links:
-                self._manage_cache_size()
-                self.page_links_cache[page_index] = pdf_links
+                self.page_links_cache.put(page_index, pdf_links)
 
             parsing_time = time.perf_counter() - parsing_start
             total_time = time.perf_counter() - start_time
+            self.extraction_latency.record(extraction_time)
+            self.parsing_latency.record(parsing_time)
 
             print(f"🔗 Page {page_index + 1}: Extracted {len(pdf_links)} links")
 
@@ -335,7 +363,7 @@ class PDFLinkManager(QObject):
 
     def _parse_named_link(self, raw_link: dict, page_index: int, link_id: str, bounds: QRectF) -> PDFLink:
         """Parse named destination link"""
-        name = raw_link.get('name', '')
+        name = raw_link.get('nameddest') or raw_link.get('name', '')  # 'name' in older PyMuPDF versions
 
         # Try to resolve named destination
         resolved_target = self._resolve_named_destination(name)
@@ -412,6 +440,13 @@ class PDFLinkManager(QObject):
         if name in self.named_destinations:
             return self.named_destinations[name]
 
+        # Prebuilt destination table from the link index - O(1), no PyMuPDF call
+        index = self.link_indexer.index
+        if index is not None:
+            resolved = index.resolve_destination(name)
+            if resolved:
+                return resolved
+
         # Get the actual PyMuPDF document object
         fitz_doc = None
         if hasattr(self.pdf_document, 'doc'):
@@ -432,18 +467,19 @@ class PDFLinkManager(QObject):
                     # Cache the result
                     self.named_destinations[name] = resolved
                     return resolved
-            except:
-                pass
+            except Exception as e:
+                print(f"⚠️ Could not resolve named destination '{name}': {e}")
 
         return None
 
-    def _manage_cache_size(self):
-        """Manage link cache size to prevent memory issues"""
-        if len(self.page_links_cache) > self.max_cache_size:
-            # Remove oldest entries (simple FIFO)
-            keys_to_remove = list(self.page_links_cache.keys())[:-self.max_cache_size//2]
-            for key in keys_to_remove:
-                del self.page_links_cache[key]
+    @property
+    def max_cache_size(self) -> int:
+        """Maximum cached pages"""
+        return self.page_links_cache.max_entries
+
+    @max_cache_size.setter
+    def max_cache_size(self, max_pages: int):
+        self.page_links_cache.max_entries = max_pages
 
     def handle_link_click(self, pdf_link: PDFLink) -> bool:
         """Handle a link click and perform appropriate action"""
@@ -638,8 +674,27 @@ class PDFLinkManager(QObject):
         return {
             'cached_pages': len(self.page_links_cache),
             'total_cached_links': sum(len(links) for links in self.page_links_cache.values()),
-            'named_destinations': len(self.named_destinations),
-            'max_cache_size': self.max_cache_size
+            'named_destinations': len(self.named_destinations) + (
+                len(self.link_indexer.index.dest_names) if self.link_indexer.index is not None else 0),
+            'max_cache_size': self.max_cache_size,
+            'cache_hits': self.page_links_cache.hits,
+            'cache_misses': self.page_links_cache.misses,
+            'cache_hit_rate': self.page_links_cache.get_stats()['hit_rate'],
+            'cache_evictions': self.page_links_cache.evictions
+        }
+
+    def get_latency_stats(self) -> Dict[str, dict]:
+        """Latency histogram summaries by name"""
+        return {histogram.name: histogram.get_stats()
+                for histogram in (self.extraction_latency, self.parsing_latency)}
+
+    def get_performance_stats(self) -> Dict[str, Any]:
+        """Cache counters and extraction/parsing latency summaries"""
+        return {
+            'page_links_cache': self.page_links_cache.get_stats(),
+            'extraction': self.extraction_latency.get_stats(),
+            'parsing': self.parsing_latency.get_stats(),
+            'link_index_ready': self.link_indexer.is_ready()
         }
 
 
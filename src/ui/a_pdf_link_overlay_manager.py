@@ -3,137 +3,29 @@ PDF Link Overlay Manager - PyQt6 Implementation
 Manages visual overlays for PDF hyperlinks on the canvas widget
 """
 
-from PyQt6.QtWidgets import QWidget, QLabel, QToolTip
-from PyQt6.QtCore import Qt, QRect, QRectF, QPointF, QTimer, pyqtSignal, QObject
-from PyQt6.QtGui import QPainter, QPen, QBrush, QColor, QFont, QCursor, QPalette
+from PyQt6.QtCore import QRect, QPointF, QTimer, pyqtSignal, QObject
+from PyQt6.QtGui import QColor
 from typing import List, Dict, Optional, Tuple
 import time
 
 from a_pdf_link_manager import PDFLinkManager, PDFLink, LinkType
+from a_link_hotspot_layer import LinkHotspot, LinkHotspotLayer
 
-
-class LinkOverlay(QLabel):
-    """Individual overlay widget for a single hyperlink"""
-
-    # Signals
-    linkClicked = pyqtSignal(object)  # PDFLink
-    linkHovered = pyqtSignal(object)  # PDFLink
-    linkLeft = pyqtSignal(object)  # PDFLink
-
-    def __init__(self, pdf_link: PDFLink, parent=None):
-        super().__init__(parent)
-
-        self.pdf_link = pdf_link
-        self.is_hovered = False
-
-        # Setup appearance based on link type
-        self._setup_appearance()
-
-        # Enable mouse tracking
-        self.setMouseTracking(True)
-
-        # Set tooltip
-        self.setToolTip(self.pdf_link.description)
-
-    def _setup_appearance(self):
-        """Setup visual appearance based on link type"""
-        # Base styling
-        self.setStyleSheet(self._get_base_style())
-
-        # Set cursor
-        self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-
-        # Make transparent by default
-        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
-
-    def _get_base_style(self) -> str:
-        """Get CSS style based on link type"""
-        if self.pdf_link.link_type == LinkType.URI:
-            return """
-                QLabel {
-                    border: 2px dashed #0066cc;
-                    background-color: rgba(0, 102, 204, 20);
-                }
-                QLabel:hover {
-                    border: 2px solid #0066cc;
-                    background-color: rgba(0, 102, 204, 40);
-                }
-            """
-        elif self.pdf_link.link_type in [LinkType.GOTO, LinkType.NAMED]:
-            return """
-                QLabel {
-                    border: 2px dashed #009900;
-                    background-color: rgba(0, 153, 0, 20);
-                }
-                QLabel:hover {
-                    border: 2px solid #009900;
-                    background-color: rgba(0, 153, 0, 40);
-                }
-            """
-        elif self.pdf_link.link_type in [LinkType.GOTOR, LinkType.LAUNCH]:
-            return """
-                QLabel {
-                    border: 2px dashed #9900cc;
-                    background-color: rgba(153, 0, 204, 20);
-                }
-                QLabel:hover {
-                    border: 2px solid #9900cc;
-                    background-color: rgba(153, 0, 204, 40);
-                }
-            """
-        else:
-            return """
-                QLabel {
-                    border: 2px dashed #666666;
-                    background-color: rgba(102, 102, 102, 20);
-                }
-                QLabel:hover {
-                    border: 2px solid #666666;
-                    background-color: rgba(102, 102, 102, 40);
-                }
-            """
-
-    def mousePressEvent(self, event):
-        """Handle mouse click"""
-        if event.button() == Qt.MouseButton.LeftButton:
-            self.linkClicked.emit(self.pdf_link)
-        super().mousePressEvent(event)
-
-    def enterEvent(self, event):
-        """Handle mouse enter"""
-        self.is_hovered = True
-        self.linkHovered.emit(self.pdf_link)
-        super().enterEvent(event)
-
-    def leaveEvent(self, event):
-        """Handle mouse leave"""
-        self.is_hovered = False
-        self.linkLeft.emit(self.pdf_link)
-        super().leaveEvent(event)
-
-    def update_position(self, canvas_rect: QRectF, zoom_level: float, page_offset: QPointF):
-        """Update overlay position based on canvas coordinates"""
-        # Convert PDF coordinates to canvas coordinates
-        pdf_rect = self.pdf_link.bounds
-
-        # Scale by zoom level
-        scaled_x = pdf_rect.x() * zoom_level
-        scaled_y = pdf_rect.y() * zoom_level
-        scaled_width = pdf_rect.width() * zoom_level
-        scaled_height = pdf_rect.height() * zoom_level
-
-        # Apply page offset
-        canvas_x = scaled_x + page_offset.x()
-        canvas_y = scaled_y + page_offset.y()
-
-        # Set geometry
-        self.setGeometry(int(canvas_x), int(canvas_y), int(scaled_width), int(scaled_height))
+# Hotspot border color per link type (fill is the same color, translucent)
+LINK_TYPE_COLORS = {
+    LinkType.URI: QColor("#0066cc"),
+    LinkType.GOTO: QColor("#009900"),
+    LinkType.NAMED: QColor("#009900"),
+    LinkType.GOTOR: QColor("#9900cc"),
+    LinkType.LAUNCH: QColor("#9900cc"),
+    LinkType.UNKNOWN: QColor("#666666"),
+}
 
 
 class PDFLinkOverlayManager(QObject):
     """
     Manages all link overlays for the PDF canvas
-    Creates, positions, and updates overlay widgets
+    Positions link hotspots on a single LinkHotspotLayer (one painter, one hit-test index)
     """
 
     # Signals
@@ -152,10 +44,9 @@ class PDFLinkOverlayManager(QObject):
         self.current_zoom = 1.0
         self.visible_pages = []
 
-        # Overlay management
-        self.active_overlays = {}  # page_index -> List[LinkOverlay]
-        self.overlay_pool = []  # Reusable overlay widgets
-        self.max_pool_size = 50  # Maximum pooled overlays
+        # All link rects of the visible pages, painted and hit-tested by one layer
+        self.hotspot_layer: Optional[LinkHotspotLayer] = None
+        self._create_hotspot_layer()
 
         # Performance settings
         self.update_delay = 100  # ms delay for batch updates
@@ -177,10 +68,23 @@ class PDFLinkOverlayManager(QObject):
         if self.link_manager:
             self.link_manager.linkExtractionCompleted.connect(self._on_links_extracted)
 
+    def _create_hotspot_layer(self):
+        """Hotspot layer on the current canvas widget"""
+        if self.hotspot_layer is not None:
+            self.hotspot_layer.detach()
+            self.hotspot_layer = None
+
+        if self.canvas_widget is None:
+            return
+
+        self.hotspot_layer = LinkHotspotLayer(self.canvas_widget, LINK_TYPE_COLORS)
+        self.hotspot_layer.hotspotClicked.connect(self._on_overlay_clicked)
+        self.hotspot_layer.hotspotHovered.connect(self._on_overlay_hovered)
+
     def set_canvas_widget(self, canvas_widget):
         """Set or update the canvas widget"""
         self.canvas_widget = canvas_widget
-        self._clear_all_overlays()
+        self._create_hotspot_layer()
 
     def update_page_links(self, page_index: int, zoom_level: float, visible_pages: List[int] = None):
         """Update link overlays for current page and zoom level"""
@@ -214,8 +118,8 @@ class PDFLinkOverlayManager(QObject):
             print(f"❌ Error updating link overlays: {e}")
 
     def _create_page_overlays(self, page_index: int):
-        """Create overlay widgets for a specific page"""
-        if not self.link_manager:
+        """Place hotspots for a specific page on the hotspot layer"""
+        if not self.link_manager or self.hotspot_layer is None:
             return
 
         # Extract links for this page
@@ -229,49 +133,20 @@ class PDFLinkOverlayManager(QObject):
         if page_offset is None:
             return
 
-        # Create overlays for each link
-        page_overlays = []
+        # One hotspot per link, in canvas coordinates
+        zoom = self.current_zoom
+        hotspots = []
         for pdf_link in page_links:
-            overlay = self._get_or_create_overlay(pdf_link)
-            if overlay:
-                # Update position
-                canvas_rect = QRectF(self.canvas_widget.rect())
-                overlay.update_position(canvas_rect, self.current_zoom, page_offset)
+            bounds = pdf_link.bounds
+            rect = QRect(int(bounds.x() * zoom + page_offset.x()), int(bounds.y() * zoom + page_offset.y()),
+                         int(bounds.width() * zoom), int(bounds.height() * zoom))
+            hotspots.append(LinkHotspot(rect, page_index, pdf_link.link_type, pdf_link.id, pdf_link,
+                                        pdf_link.description))
 
-                # Connect signals
-                overlay.linkClicked.connect(self._on_overlay_clicked)
-                overlay.linkHovered.connect(self._on_overlay_hovered)
-
-                # Show overlay
-                overlay.show()
-                overlay.raise_()  # Bring to front
-
-                page_overlays.append(overlay)
-
-        # Store overlays for this page
-        self.active_overlays[page_index] = page_overlays
+        self.hotspot_layer.set_page_hotspots(page_index, hotspots)
 
         # Emit signal
-        self.overlaysUpdated.emit(page_index, len(page_overlays))
-
-    def _get_or_create_overlay(self, pdf_link: PDFLink) -> Optional[LinkOverlay]:
-        """Get overlay from pool or create new one"""
-        try:
-            # Try to reuse from pool
-            if self.overlay_pool:
-                overlay = self.overlay_pool.pop()
-                overlay.pdf_link = pdf_link
-                overlay._setup_appearance()
-                overlay.setToolTip(pdf_link.description)
-            else:
-                # Create new overlay
-                overlay = LinkOverlay(pdf_link, self.canvas_widget)
-
-            return overlay
-
-        except Exception as e:
-            print(f"❌ Error creating overlay: {e}")
-            return None
+        self.overlaysUpdated.emit(page_index, len(hotspots))
 
     def _get_page_offset(self, page_index: int) -> Optional[QPointF]:
         """Calculate page offset on canvas"""
@@ -290,19 +165,9 @@ class PDFLinkOverlayManager(QObject):
         return QPointF(0, 0)
 
     def _clear_all_overlays(self):
-        """Clear and hide all active overlays"""
-        for page_index, overlays in self.active_overlays.items():
-            for overlay in overlays:
-                overlay.hide()
-
-                # Return to pool if not full
-                if len(self.overlay_pool) < self.max_pool_size:
-                    self.overlay_pool.append(overlay)
-                else:
-                    # Delete excess overlays
-                    overlay.deleteLater()
-
-        self.active_overlays.clear()
+        """Remove every hotspot"""
+        if self.hotspot_layer is not None:
+            self.hotspot_layer.clear()
 
     def _on_links_extracted(self, page_index: int, links: List[PDFLink]):
         """Handle links extracted signal from link manager"""
@@ -335,46 +200,32 @@ class PDFLinkOverlayManager(QObject):
         """Set overlay opacity (0.0 to 1.0)"""
         self.overlay_opacity = max(0.0, min(1.0, opacity))
 
-        # Update existing overlays
-        for overlays in self.active_overlays.values():
-            for overlay in overlays:
-                overlay.setWindowOpacity(self.overlay_opacity)
+        if self.hotspot_layer is not None:
+            self.hotspot_layer.set_opacity(self.overlay_opacity)
 
     def get_links_at_position(self, canvas_pos: QPointF) -> List[PDFLink]:
-        """Get all links at a specific canvas position"""
-        found_links = []
-
-        for overlays in self.active_overlays.values():
-            for overlay in overlays:
-                if overlay.geometry().contains(canvas_pos.toPoint()):
-                    found_links.append(overlay.pdf_link)
-
-        return found_links
+        """Get all links at a specific canvas position (hit-test index lookup)"""
+        if self.hotspot_layer is None:
+            return []
+        return [hotspot.payload for hotspot in self.hotspot_layer.hotspots_at(canvas_pos.toPoint())]
 
     def highlight_link(self, pdf_link: PDFLink, highlight: bool = True):
         """Highlight or unhighlight a specific link"""
-        for overlays in self.active_overlays.values():
-            for overlay in overlays:
-                if overlay.pdf_link.id == pdf_link.id:
-                    if highlight:
-                        overlay.setStyleSheet(overlay._get_base_style() + """
-                            QLabel {
-                                border: 3px solid #ff6600 !important;
-                                background-color: rgba(255, 102, 0, 60) !important;
-                            }
-                        """)
-                    else:
-                        overlay._setup_appearance()
-                    break
+        if self.hotspot_layer is None:
+            return
+        if highlight:
+            self.hotspot_layer.set_highlighted(pdf_link.id)
+        elif self.hotspot_layer.highlighted_key == pdf_link.id:
+            self.hotspot_layer.set_highlighted(None)
 
     def get_overlay_stats(self) -> Dict[str, int]:
         """Get statistics about current overlays"""
-        total_overlays = sum(len(overlays) for overlays in self.active_overlays.values())
+        layer_stats = self.hotspot_layer.get_stats() if self.hotspot_layer is not None else {}
 
         return {
-            'active_pages': len(self.active_overlays),
-            'total_overlays': total_overlays,
-            'pooled_overlays': len(self.overlay_pool),
+            'active_pages': layer_stats.get('pages', 0),
+            'total_overlays': layer_stats.get('hotspots', 0),
+            'hit_tests': layer_stats.get('hit_tests', 0),
             'current_page': self.current_page,
             'visible_pages_count': len(self.visible_pages)
         }
@@ -385,17 +236,20 @@ class PDFLinkOverlayManager(QObject):
         print(f"   Current page: {self.current_page}")
         print(f"   Current zoom: {self.current_zoom:.2f}")
         print(f"   Visible pages: {self.visible_pages}")
-        print(f"   Active pages with overlays: {list(self.active_overlays.keys())}")
+        if self.hotspot_layer is None:
+            print("   No hotspot layer")
+            return
 
-        for page_index, overlays in self.active_overlays.items():
-            print(f"   📄 Page {page_index + 1}: {len(overlays)} overlays")
-            for i, overlay in enumerate(overlays):
-                link = overlay.pdf_link
-                geom = overlay.geometry()
+        print(f"   Active pages with overlays: {self.hotspot_layer.index.pages()}")
+        for page_index in sorted(self.hotspot_layer.index.pages()):
+            hotspots = self.hotspot_layer.index.page_hotspots(page_index)
+            print(f"   📄 Page {page_index + 1}: {len(hotspots)} overlays")
+            for i, hotspot in enumerate(hotspots):
+                link = hotspot.payload
+                geom = hotspot.rect
                 print(f"      {i + 1}. {link.description}")
                 print(f"         Type: {link.link_type.value}")
                 print(f"         Canvas pos: ({geom.x()}, {geom.y()}, {geom.width()}, {geom.height()})")
-                print(f"         Visible: {overlay.isVisible()}")
 
 
 class PDFLinkIntegration(QObject):
@@ -13,6 +13,14 @@ from typing import List, Dict, Any, Optional, Tuple
 from PyQt6.QtCore import QObject, pyqtSignal, QRectF, QPointF
 from enum import Enum
 
+# Loaded both as ui.a_raw_link_manager and as a flat module (src/ui on sys.path)
+try:
+    from .a_link_cache import LatencyHistogram, LinkCache
+    from .a_link_index import LinkIndexer
+except ImportError:
+    from a_link_cache import LatencyHistogram, LinkCache
+    from a_link_index import LinkIndexer
+
 
 class LinkType(Enum):
     """PDF link types"""
@@ -35,6 +43,7 @@ class RawLinkManager(QObject):
     externalUrlRequested = pyqtSignal(str)  # url
     externalFileRequested = pyqtSignal(str, int)  # file_path, page
     rawLinksExtracted = pyqtSignal(int, list)  # page_index, raw_links
+    linkIndexReady = pyqtSignal(int)  # total links in the document
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -44,13 +53,17 @@ class RawLinkManager(QObject):
         self.document_path = ""
 
         # Raw link cache - stores PyMuPDF data directly
-        self.raw_links_cache = {}  # page_index -> List[dict]
-        self.parsed_cache = {}  # (page_index, link_index) -> parsed_data
+        self.raw_links_cache = LinkCache('raw_links', max_entries=100)  # page_index -> List[dict]
+        self.parsed_cache = LinkCache('parsed_links', max_entries=2000)  # (page_index, link_index) -> parsed_data
+
+        # Whole-document link index, built (or loaded from disk) in the background
+        self.link_indexer = LinkIndexer(self)
+        self.link_indexer.indexReady.connect(self._on_link_index_ready)
 
-        # Performance tracking
+        # Performance tracking (fixed-size latency histograms)
         self.timing_stats = {
-            'raw_extraction_times': [],
-            'parse_on_click_times': [],
+            'raw_extraction': LatencyHistogram('raw_extraction'),
+            'parse_on_click': LatencyHistogram('parse_on_click'),
             'total_links_extracted': 0
         }
 
@@ -62,6 +75,15 @@ class RawLinkManager(QObject):
 
         print("🚀 RawLinkManager initialized (ultra-fast mode)")
 
+    @property
+    def max_cache_size(self) -> int:
+        """Max cached pages"""
+        return self.raw_links_cache.max_entries
+
+    @max_cache_size.setter
+    def max_cache_size(self, max_pages: int):
+        self.raw_links_cache.max_entries = max_pages
+
     def set_pdf_document(self, pdf_document, document_path: str = ""):
         """Set PDF document and clear caches"""
         try:
@@ -75,6 +97,13 @@ class RawLinkManager(QObject):
 
             print(f"🔗 Raw link manager set for: {document_path}")
 
+            # Index every page off the GUI thread; pages are extracted lazily until it is ready
+            index_path = ""
+            if pdf_document:
+                index_path = (document_path or getattr(pdf_document, 'file_path', '')
+                              or getattr(pdf_document, 'name', '') or "")
+            self.link_indexer.start(index_path)
+
             if pdf_document:
                 # Get page count
                 if hasattr(pdf_document, 'get_page_count'):
@@ -92,8 +121,8 @@ class RawLinkManager(QObject):
     def get_raw_page_links(self, page_index: int) -> List[dict]:
         """Get raw links for a page (cached or extracted) - FIXED for PDFDocument"""
         # Check cache first
-        if page_index in self.raw_links_cache:
-            cached_links = self.raw_links_cache[page_index]
+        cached_links = self.raw_links_cache.get(page_index)
+        if cached_links is not None:
             print(f"🔗 Page {page_index + 1}: {len(cached_links)} raw links (cached)")
             return cached_links
 
@@ -101,6 +130,14 @@ class RawLinkManager(QObject):
             print(f"❌ No PDF document loaded")
             return []
 
+        # Served from the document's link index - no PyMuPDF calls
+        index = self.link_indexer.index
+        if index is not None and 0 <= page_index < index.page_count:
+            raw_links = index.raw_links(page_index)
+            self.raw_links_cache.put(page_index, raw_links)
+            self.rawLinksExtracted.emit(page_index, raw_links)
+            return raw_links
+
         try:
             start_time = time.perf_counter()
 
@@ -128,12 +165,11 @@ class RawLinkManager(QObject):
             raw_links = page.get_links()
 
             # Cache raw data
-            self._manage_cache_size()
-            self.raw_links_cache[page_index] = raw_links
+            self.raw_links_cache.put(page_index, raw_links)
 
             # Update stats
             extraction_time = time.perf_counter() - start_time
-            self.timing_stats['raw_extraction_times'].append(extraction_time)
+            self.timing_stats['raw_extraction'].record(extraction_time)
             self.timing_stats['total_links_extracted'] += len(raw_links)
 
             print(f"🔗 Page {page_index + 1}: {len(raw_links)} raw links - {extraction_time * 1000:.2f}ms")
@@ -149,6 +185,13 @@ class RawLinkManager(QObject):
             traceback.print_exc()  # This will help debug the exact error
             return []
 
+    def _on_link_index_ready(self, file_path: str, index):
+        """Background index finished - later page requests are served from it"""
+        if file_path != self.link_indexer.file_path:
+            return
+        self.timing_stats['total_links_extracted'] = len(index)
+        self.linkIndexReady.emit(len(index))
+
     # 5. OPTIONAL: Add this method for better debug integration
     def get_link_stats(self) -> Dict[str, Any]:
         """Get comprehensive link statistics"""
@@ -158,21 +201,16 @@ class RawLinkManager(QObject):
         return {
             **stats,
             **cache_info,
-            'extraction_count': len(self.timing_stats['raw_extraction_times']),
-            'parse_count': len(self.timing_stats['parse_on_click_times']),
+            'extraction_count': self.timing_stats['raw_extraction'].count,
+            'parse_count': self.timing_stats['parse_on_click'].count,
             'cache_hit_ratio': self._calculate_cache_hit_ratio()
         }
 
     def _calculate_cache_hit_ratio(self) -> float:
-        """Calculate cache hit ratio"""
-        # This is a simple estimation
-        total_requests = len(self.timing_stats['raw_extraction_times'])
-        if total_requests == 0:
-            return 0.0
-
-        # Estimate cache hits (this is approximate)
-        cache_hits = max(0, total_requests - len(self.raw_links_cache))
-        return cache_hits / total_requests if total_requests > 0 else 0.0
+        """Raw link cache hit ratio"""
+        cache = self.raw_links_cache
+        total_requests = cache.hits + cache.misses
+        return cache.hits / total_requests if total_requests > 0 else 0.0
 
     def get_link_bounds(self, raw_link: dict) -> QRectF:
         """Extract bounds from raw link - ultra-fast"""
@@ -211,13 +249,13 @@ class RawLinkManager(QObject):
 
             # Check if already parsed
             cache_key = (page_index, link_index)
-            if cache_key in self.parsed_cache:
-                parsed_data = self.parsed_cache[cache_key]
+            parsed_data = self.parsed_cache.get(cache_key)
+            if parsed_data is not None:
                 print(f"   ✅ Using cached parsed data: {parsed_data}")
             else:
                 # Parse now for the first time
                 parsed_data = self._parse_raw_link_on_demand(raw_link)
-                self.parsed_cache[cache_key] = parsed_data
+                self.parsed_cache.put(cache_key, parsed_data)
                 print(f"   🔍 Newly parsed data: {parsed_data}")
 
             # Execute action based on link type
@@ -227,7 +265,7 @@ class RawLinkManager(QObject):
 
             # Update timing stats
             parse_time = time.perf_counter() - start_time
-            self.timing_stats['parse_on_click_times'].append(parse_time)
+            self.timing_stats['parse_on_click'].record(parse_time)
 
             print(f"🔗 Parsed and executed link in {parse_time * 1000:.2f}ms")
             return success
@@ -499,6 +537,14 @@ class RawLinkManager(QObject):
             print(f"   ✅ Found cached named destination: {cached}")
             return cached
 
+        # Prebuilt destination table from the link index - O(1), no PyMuPDF call
+        index = self.link_indexer.index
+        if index is not None:
+            resolved = index.resolve_destination(name)
+            if resolved:
+                print(f"   ✅ Found named destination in link index: {resolved}")
+                return resolved
+
         print(f"   🔍 Resolving named destination: '{name}'")
 
         # Get the actual PyMuPDF document
@@ -539,12 +585,6 @@ class RawLinkManager(QObject):
         print(f"   ❌ Could not resolve named destination: '{name}'")
         return None
 
-    def _resolve_named_destination(self, name: str, raw_link: dict) -> Optional[dict]:
-        """Try to resolve named destination"""
-        # This could be enhanced with more sophisticated resolution
-        # For now, just return None to indicate unresolved
-        return None
-
     def _open_external_url(self, url: str):
         """Open external URL in default browser"""
         try:
@@ -596,34 +636,39 @@ class RawLinkManager(QObject):
 
         return file_ext in safe_extensions
 
-    def _manage_cache_size(self):
-        """Manage cache size to prevent memory issues"""
-        if len(self.raw_links_cache) > self.max_cache_size:
-            # Remove oldest entries
-            keys_to_remove = list(self.raw_links_cache.keys())[:-self.max_cache_size // 2]
-            for key in keys_to_remove:
-                del self.raw_links_cache[key]
-
     def clear_cache(self):
         """Clear all caches"""
         self.raw_links_cache.clear()
         self.parsed_cache.clear()
         print("🧹 Raw link caches cleared")
 
+    def get_latency_stats(self) -> Dict[str, dict]:
+        """Latency histogram summaries by name"""
+        return {name: self.timing_stats[name].get_stats() for name in ('raw_extraction', 'parse_on_click')}
+
     def get_performance_stats(self) -> dict:
         """Get performance statistics"""
-        stats = self.timing_stats.copy()
+        extraction = self.timing_stats['raw_extraction']
+        parsing = self.timing_stats['parse_on_click']
+        stats = {
+            'total_links_extracted': self.timing_stats['total_links_extracted'],
+            'raw_extraction': extraction.get_stats(),
+            'parse_on_click': parsing.get_stats(),
+            'raw_links_cache': self.raw_links_cache.get_stats(),
+            'parsed_cache': self.parsed_cache.get_stats()
+        }
 
-        if stats['raw_extraction_times']:
-            stats['avg_extraction_time'] = sum(stats['raw_extraction_times']) / len(stats['raw_extraction_times'])
-            stats['total_extraction_time'] = sum(stats['raw_extraction_times'])
+        if extraction.count:
+            stats['avg_extraction_time'] = extraction.mean
+            stats['total_extraction_time'] = extraction.total
 
-        if stats['parse_on_click_times']:
-            stats['avg_parse_time'] = sum(stats['parse_on_click_times']) / len(stats['parse_on_click_times'])
-            stats['total_parse_time'] = sum(stats['parse_on_click_times'])
+        if parsing.count:
+            stats['avg_parse_time'] = parsing.mean
+            stats['total_parse_time'] = parsing.total
 
         stats['cached_pages'] = len(self.raw_links_cache)
         stats['parsed_links'] = len(self.parsed_cache)
+        stats['link_index_ready'] = self.link_indexer.is_ready()
 
         return stats
 
@@ -638,7 +683,9 @@ class RawLinkManager(QObject):
         print(f"Parsed links: {stats['parsed_links']}")
 
         if 'avg_extraction_time' in stats:
-            print(f"Avg extraction time: {stats['avg_extraction_time'] * 1000:.2f}ms")
+            print(f"Avg extraction time: {stats['avg_extraction_time'] * 1000:.2f}ms "
+                  f"(p90 {stats['raw_extraction']['p90'] * 1000:.2f}ms, "
+                  f"p99 {stats['raw_extraction']['p99'] * 1000:.2f}ms)")
             print(f"Total extraction time: {stats['total_extraction_time'] * 1000:.2f}ms")
 
         if 'avg_parse_time' in stats:
@@ -660,9 +707,15 @@ class RawLinkManager(QObject):
         return {
             'cached_pages': len(self.raw_links_cache),
             'total_cached_links': total_cached_links,
-            'named_destinations': 0,
+            'named_destinations': len(self.named_destinations) if hasattr(self, 'named_destinations') else 0,
+            'indexed_named_destinations': (len(self.link_indexer.index.dest_names)
+                                           if self.link_indexer.index is not None else 0),
             'max_cache_size': self.max_cache_size,
-            'parsed_cache_size': len(self.parsed_cache)
+            'parsed_cache_size': len(self.parsed_cache),
+            'cache_hits': self.raw_links_cache.hits,
+            'cache_misses': self.raw_links_cache.misses,
+            'cache_hit_rate': self.raw_links_cache.get_stats()['hit_rate'],
+            'cache_evictions': self.raw_links_cache.evictions
         }
 
     def extract_page_links(self, page_index: int) -> List[dict]:
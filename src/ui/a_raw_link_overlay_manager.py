@@ -3,124 +3,31 @@ Raw Overlay Manager - Ultra-Fast Rendering
 Creates overlays directly from raw PyMuPDF data for maximum performance
 """
 
-from PyQt6.QtWidgets import QWidget, QLabel
-from PyQt6.QtCore import Qt, QRect, QRectF, QPointF, QTimer, pyqtSignal, QObject
-from PyQt6.QtGui import QCursor
+from PyQt6.QtCore import QRect, QPointF, QTimer, pyqtSignal, QObject
+from PyQt6.QtGui import QColor
 from typing import List, Dict, Optional, Tuple
 import time
 
+# Loaded both as ui.a_raw_link_overlay_manager and as a flat module (src/ui on sys.path)
+try:
+    from .a_link_cache import LatencyHistogram
+    from .a_link_hotspot_layer import LinkHotspot, LinkHotspotLayer
+except ImportError:
+    from a_link_cache import LatencyHistogram
+    from a_link_hotspot_layer import LinkHotspot, LinkHotspotLayer
 
-class RawLinkOverlay(QLabel):
-    """Lightweight overlay widget for raw links"""
+# Hotspot colors per raw PyMuPDF link kind (only used when hotspots are drawn)
+RAW_LINK_KIND_COLORS = {
+    1: QColor("#009900"),  # GOTO
+    2: QColor("#0066cc"),  # URI
+}
 
-    # Signals
-    rawLinkClicked = pyqtSignal(dict, int, int)  # raw_link, page_index, link_index
-    rawLinkHovered = pyqtSignal(dict, int, int)  # raw_link, page_index, link_index
-
-    def __init__(self, raw_link: dict, page_index: int, link_index: int, parent=None):
-        super().__init__(parent)
-
-        self.raw_link = raw_link
-        self.page_index = page_index
-        self.link_index = link_index
-
-        # Setup appearance
-        self._setup_appearance()
-
-        # Enable mouse tracking
-        self.setMouseTracking(True)
-        self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-
-    def _setup_appearance(self):
-        """Setup visual appearance based on raw link type"""
-        try:
-            # Get basic link type from raw data
-            link_kind = self.raw_link.get('kind', 0)
-
-            # Choose style based on link type
-            if link_kind == 1:  # GOTO
-                style = """
-                    QLabel {
-                        border: 2px dashed #009900;
-                        background-color: rgba(0, 153, 0, 20);
-                    }
-                    QLabel:hover {
-                        border: 2px solid #009900;
-                        background-color: rgba(0, 153, 0, 40);
-                    }
-                """
-            elif link_kind == 2:  # URI
-                style = """
-                    QLabel {
-                        border: 2px dashed #0066cc;
-                        background-color: rgba(0, 102, 204, 20);
-                    }
-                    QLabel:hover {
-                        border: 2px solid #0066cc;
-                        background-color: rgba(0, 102, 204, 40);
-                    }
-                """
-            else:  # Other types
-                style = """
-                    QLabel {
-                        border: 2px dashed #9900cc;
-                        background-color: rgba(153, 0, 204, 20);
-                    }
-                    QLabel:hover {
-                        border: 2px solid #9900cc;
-                        background-color: rgba(153, 0, 204, 40);
-                    }
-                """
-
-            self.setStyleSheet(style)
-
-            # Make transparent background
-            self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
-
-        except Exception as e:
-            print(f"❌ Error setting overlay appearance: {e}")
-
-    def mousePressEvent(self, event):
-        """Handle mouse click"""
-        if event.button() == Qt.MouseButton.LeftButton:
-            self.rawLinkClicked.emit(self.raw_link, self.page_index, self.link_index)
-        super().mousePressEvent(event)
-
-    def enterEvent(self, event):
-        """Handle mouse enter"""
-        self.rawLinkHovered.emit(self.raw_link, self.page_index, self.link_index)
-        super().enterEvent(event)
-
-    def _setup_appearance(self):
-        """Setup visual appearance - cursor only, no hover effects"""
-        try:
-            # Just set the cursor, no visual styling
-            self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-
-            # Make the overlay invisible but still capture mouse events
-            self.setStyleSheet("QLabel { background-color: transparent; border: none; }")
-
-            # Enable mouse tracking
-            self.setMouseTracking(True)
-
-        except Exception as e:
-            print(f"❌ Error setting overlay appearance: {e}")
-
-    # Also simplify the mouse events:
-
-    def enterEvent(self, event):
-        """Handle mouse enter - signal only"""
-        self.rawLinkHovered.emit(self.raw_link, self.page_index, self.link_index)
-        # Don't call super() to avoid any default hover handling
-
-    def leaveEvent(self, event):
-        """Handle mouse leave - no action needed"""
-        pass
 
 class RawLinkOverlayManager(QObject):
     """
     Ultra-fast overlay manager that works directly with raw PyMuPDF data
-    No PDFLink objects created during rendering for maximum performance
+    No PDFLink objects created during rendering for maximum performance; links are
+    invisible hotspots on a single LinkHotspotLayer (pointer cursor, hover and click)
     """
 
     # Signals
@@ -139,10 +46,9 @@ class RawLinkOverlayManager(QObject):
         self.current_zoom = 1.0
         self.visible_pages = []
 
-        # Overlay management
-        self.active_overlays = {}  # page_index -> List[RawLinkOverlay]
-        self.overlay_pool = []  # Reusable overlay widgets
-        self.max_pool_size = 50  # Maximum pooled overlays
+        # All link rects of the visible pages, hit-tested by one layer
+        self.hotspot_layer: Optional[LinkHotspotLayer] = None
+        self._create_hotspot_layer()
 
         # Performance settings
         self.update_delay = 50  # ms delay for batch updates (reduced from 100)
@@ -153,8 +59,8 @@ class RawLinkOverlayManager(QObject):
         # Visual settings
         self.show_overlays = True
 
-        # Performance tracking
-        self.overlay_creation_times = []
+        # Performance tracking (fixed-size latency histogram)
+        self.overlay_creation_latency = LatencyHistogram('overlay_creation')
 
         # Connect raw link manager signals
         self._connect_raw_link_manager()
@@ -166,10 +72,23 @@ class RawLinkOverlayManager(QObject):
         if self.raw_link_manager:
             self.raw_link_manager.rawLinksExtracted.connect(self._on_raw_links_extracted)
 
+    def _create_hotspot_layer(self):
+        """Hotspot layer on the current canvas widget"""
+        if self.hotspot_layer is not None:
+            self.hotspot_layer.detach()
+            self.hotspot_layer = None
+
+        if self.canvas_widget is None:
+            return
+
+        self.hotspot_layer = LinkHotspotLayer(self.canvas_widget, RAW_LINK_KIND_COLORS, draw_hotspots=False)
+        self.hotspot_layer.hotspotClicked.connect(lambda hit: self._on_raw_overlay_clicked(*hit))
+        self.hotspot_layer.hotspotHovered.connect(lambda hit: self._on_raw_overlay_hovered(*hit))
+
     def set_canvas_widget(self, canvas_widget):
         """Set or update the canvas widget"""
         self.canvas_widget = canvas_widget
-        self._clear_all_overlays()
+        self._create_hotspot_layer()
 
     def update_page_links(self, page_index: int, zoom_level: float, visible_pages: List[int] = None):
         """Update link overlays for current page and zoom level"""
@@ -202,7 +121,7 @@ class RawLinkOverlayManager(QObject):
                 total_overlays += overlays_created
 
             elapsed = time.perf_counter() - start_time
-            self.overlay_creation_times.append(elapsed)
+            self.overlay_creation_latency.record(elapsed)
 
             print(f"🎨 Updated {total_overlays} overlays for pages {self.visible_pages} in {elapsed * 1000:.2f}ms")
 
@@ -210,7 +129,9 @@ class RawLinkOverlayManager(QObject):
             print(f"❌ Error updating raw link overlays: {e}")
 
     def _create_page_overlays_raw(self, page_index: int) -> int:
-        """Create overlay widgets directly from raw link data"""
+        """Place hotspots for a page directly from raw link data"""
+        if self.hotspot_layer is None:
+            return 0
 
         # Get raw links (ultra-fast, cached)
         raw_links = self.raw_link_manager.get_raw_page_links(page_index)
@@ -225,18 +146,15 @@ class RawLinkOverlayManager(QObject):
         if page_offset is None:
             return 0
 
-        # Create overlays for each raw link
-        page_overlays = []
-        overlays_created = 0
-
+        # One hotspot per raw link, in canvas coordinates
+        hotspots = []
         for link_index, raw_link in enumerate(raw_links):
-            overlay = self._create_raw_overlay(raw_link, page_index, link_index, page_offset)
-            if overlay:
-                page_overlays.append(overlay)
-                overlays_created += 1
+            hotspot = self._create_raw_hotspot(raw_link, page_index, link_index, page_offset)
+            if hotspot:
+                hotspots.append(hotspot)
+        overlays_created = len(hotspots)
 
-        # Store overlays for this page
-        self.active_overlays[page_index] = page_overlays
+        self.hotspot_layer.set_page_hotspots(page_index, hotspots)
 
         elapsed = time.perf_counter() - start_time
 
@@ -247,61 +165,27 @@ class RawLinkOverlayManager(QObject):
 
         return overlays_created
 
-    def _create_raw_overlay(self, raw_link: dict, page_index: int, link_index: int, page_offset: QPointF) -> Optional[
-        RawLinkOverlay]:
-        """Create overlay directly from raw link data - ultra-fast"""
+    def _create_raw_hotspot(self, raw_link: dict, page_index: int, link_index: int,
+                            page_offset: QPointF) -> Optional[LinkHotspot]:
+        """Hotspot directly from raw link data - ultra-fast"""
 
         try:
             # Extract bounds directly from raw data (no bounds checking for speed)
             link_rect = raw_link['from']  # Direct access
 
-            # Calculate overlay position
+            # Calculate hotspot position
             x = link_rect.x0 * self.current_zoom + page_offset.x()
             y = link_rect.y0 * self.current_zoom + page_offset.y()
             w = link_rect.width * self.current_zoom
             h = link_rect.height * self.current_zoom
 
-            # Get overlay from pool or create new
-            overlay = self._get_or_create_raw_overlay(raw_link, page_index, link_index)
-            if not overlay:
-                return None
-
-            # Set position and show
-            overlay.setGeometry(int(x), int(y), int(w), int(h))
-            overlay.show()
-            overlay.raise_()  # Bring to front
-
-            return overlay
+            return LinkHotspot(QRect(int(x), int(y), int(w), int(h)), page_index, raw_link.get('kind', 0),
+                               (page_index, link_index), (raw_link, page_index, link_index))
 
         except Exception as e:
             print(f"❌ Error creating raw overlay: {e}")
             return None
 
-    def _get_or_create_raw_overlay(self, raw_link: dict, page_index: int, link_index: int) -> Optional[RawLinkOverlay]:
-        """Get overlay from pool or create new one"""
-        try:
-            # Try to reuse from pool
-            if self.overlay_pool:
-                overlay = self.overlay_pool.pop()
-                # Update overlay data
-                overlay.raw_link = raw_link
-                overlay.page_index = page_index
-                overlay.link_index = link_index
-                overlay._setup_appearance()
-            else:
-                # Create new overlay
-                overlay = RawLinkOverlay(raw_link, page_index, link_index, self.canvas_widget)
-
-                # Connect signals
-                overlay.rawLinkClicked.connect(self._on_raw_overlay_clicked)
-                overlay.rawLinkHovered.connect(self._on_raw_overlay_hovered)
-
-            return overlay
-
-        except Exception as e:
-            print(f"❌ Error getting/creating raw overlay: {e}")
-            return None
-
     def _get_page_offset(self, page_index: int) -> Optional[QPointF]:
         """Calculate page offset on canvas"""
         if not self.canvas_widget or not hasattr(self.canvas_widget, 'layout_manager'):
@@ -319,19 +203,9 @@ class RawLinkOverlayManager(QObject):
         return QPointF(0, 0)
 
     def _clear_all_overlays(self):
-        """Clear and hide all active overlays"""
-        for page_index, overlays in self.active_overlays.items():
-            for overlay in overlays:
-                overlay.hide()
-
-                # Return to pool if not full
-                if len(self.overlay_pool) < self.max_pool_size:
-                    self.overlay_pool.append(overlay)
-                else:
-                    # Delete excess overlays
-                    overlay.deleteLater()
-
-        self.active_overlays.clear()
+        """Remove every hotspot"""
+        if self.hotspot_layer is not None:
+            self.hotspot_layer.clear()
 
     def _on_raw_links_extracted(self, page_index: int, raw_links: List[dict]):
         """Handle raw links extracted signal"""
@@ -361,32 +235,28 @@ class RawLinkOverlayManager(QObject):
             self._clear_all_overlays()
 
     def get_raw_links_at_position(self, canvas_pos: QPointF) -> List[Tuple[dict, int, int]]:
-        """Get all raw links at a specific canvas position"""
-        found_links = []
-
-        for overlays in self.active_overlays.values():
-            for overlay in overlays:
-                if overlay.geometry().contains(canvas_pos.toPoint()):
-                    found_links.append((overlay.raw_link, overlay.page_index, overlay.link_index))
-
-        return found_links
+        """Get all raw links at a specific canvas position (hit-test index lookup)"""
+        if self.hotspot_layer is None:
+            return []
+        return [hotspot.payload for hotspot in self.hotspot_layer.hotspots_at(canvas_pos.toPoint())]
 
     def get_overlay_stats(self) -> Dict[str, int]:
         """Get statistics about current overlays"""
-        total_overlays = sum(len(overlays) for overlays in self.active_overlays.values())
+        layer_stats = self.hotspot_layer.get_stats() if self.hotspot_layer is not None else {}
 
         stats = {
-            'active_pages': len(self.active_overlays),
-            'total_overlays': total_overlays,
-            'pooled_overlays': len(self.overlay_pool),
+            'active_pages': layer_stats.get('pages', 0),
+            'total_overlays': layer_stats.get('hotspots', 0),
+            'hit_tests': layer_stats.get('hit_tests', 0),
             'current_page': self.current_page,
             'visible_pages_count': len(self.visible_pages)
         }
 
         # Add performance stats
-        if self.overlay_creation_times:
-            stats['avg_creation_time_ms'] = sum(self.overlay_creation_times) * 1000 / len(self.overlay_creation_times)
-            stats['total_creation_time_ms'] = sum(self.overlay_creation_times) * 1000
+        if self.overlay_creation_latency.count:
+            stats['avg_creation_time_ms'] = self.overlay_creation_latency.mean * 1000
+            stats['total_creation_time_ms'] = self.overlay_creation_latency.total * 1000
+            stats['p90_creation_time_ms'] = self.overlay_creation_latency.percentile(90) * 1000
 
         return stats
 
@@ -398,11 +268,12 @@ class RawLinkOverlayManager(QObject):
         print("=" * 50)
         print(f"Active pages: {stats['active_pages']}")
         print(f"Total overlays: {stats['total_overlays']}")
-        print(f"Pooled overlays: {stats['pooled_overlays']}")
+        print(f"Hit tests: {stats['hit_tests']}")
 
         if 'avg_creation_time_ms' in stats:
             print(f"Avg creation time: {stats['avg_creation_time_ms']:.2f}ms")
             print(f"Total creation time: {stats['total_creation_time_ms']:.2f}ms")
+            print(f"P90 creation time: {stats['p90_creation_time_ms']:.2f}ms")
 
         if stats['total_overlays'] > 0 and 'total_creation_time_ms' in stats:
             time_per_overlay = stats['total_creation_time_ms'] / stats['total_overlays']
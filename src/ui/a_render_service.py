@@ -0,0 +1,252 @@
+"""
+Render Service - Background page rasterization for CanvasWidget
+File: src/ui/a_render_service.py
+
+Runs PyMuPDF rasterization in a worker pool. Every worker opens its own
+fitz.Document handle; finished pages come back to the GUI thread as QImages
+through signals. Results from an older zoom generation are dropped.
+"""
+
+import heapq
+import itertools
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QImage
+
+from utils.pixmap_utils import samples_to_qimage
+
+# Try to import PyMuPDF
+try:
+    import fitz
+    FITZ_AVAILABLE = True
+except ImportError:
+    FITZ_AVAILABLE = False
+    fitz = None
+
+
+# ========================================
+# WORKER SIDE (runs in pool threads/processes)
+# ========================================
+
+_worker_state = threading.local()
+
+
+def _get_worker_document(file_path: str):
+    """Open (once per worker) a private fitz.Document handle"""
+    docs = getattr(_worker_state, 'documents', None)
+    if docs is None:
+        docs = _worker_state.documents = {}
+
+    doc = docs.get(file_path)
+    if doc is None or doc.is_closed:
+        doc = fitz.open(file_path)
+        docs[file_path] = doc
+    return doc
+
+
+def render_page_worker(file_path: str, page_index: int, render_dpi: int) -> Tuple[int, int, int, int, bool, bytes]:
+    """Rasterize one page and return (width, height, stride, components, alpha, samples)"""
+    doc = _get_worker_document(file_path)
+    pix = doc[page_index].get_pixmap(dpi=render_dpi)
+    return pix.width, pix.height, pix.stride, pix.n, bool(pix.alpha), pix.samples
+
+
+# ========================================
+# GUI SIDE
+# ========================================
+
+class RenderRequest:
+    """A queued page render"""
+
+    __slots__ = ('page_index', 'render_dpi', 'generation', 'priority')
+
+    def __init__(self, page_index: int, render_dpi: int, generation: int, priority: int):
+        self.page_index = page_index
+        self.render_dpi = render_dpi
+        self.generation = generation
+        self.priority = priority
+
+
+class PageRenderService(QObject):
+    """Priority-queued background page renderer"""
+
+    # Signals (always delivered on the GUI thread)
+    # The image wraps the worker's sample buffer - convert or copy it inside the slot
+    pageRendered = pyqtSignal(int, int, int, QImage)  # page_index, render_dpi, generation, image
+    renderFailed = pyqtSignal(int, str)  # page_index, error message
+
+    # Internal: worker completion hop back to the GUI thread
+    _workerFinished = pyqtSignal(object, object)  # RenderRequest, Future
+
+    # Priorities (lower runs first)
+    PRIORITY_VISIBLE = 0
+    PRIORITY_PREFETCH = 1
+
+    def __init__(self, file_path: str, max_workers: int = 2, use_processes: bool = True, parent=None):
+        super().__init__(parent)
+
+        self.file_path = file_path
+        self.max_workers = max(1, max_workers)
+        self.use_processes = use_processes
+        self.generation = 0
+
+        self._queue = []  # heap of (priority, seq, RenderRequest)
+        self._queued: Dict[int, RenderRequest] = {}  # page_index -> request still waiting
+        self._in_flight: Dict[Tuple[int, int, int], object] = {}  # (page, dpi, generation) -> Future
+        self._sequence = itertools.count()
+
+        # Statistics
+        self.completed_count = 0
+        self.stale_count = 0
+
+        if use_processes:
+            # Spawn clean workers - forking the multithreaded Qt GUI process is unsafe
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                 mp_context=multiprocessing.get_context('spawn'))
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        self._workerFinished.connect(self._on_worker_finished)
+
+        print(f"🧵 Render service started: {self.max_workers} "
+              f"{'processes' if use_processes else 'threads'} for {file_path}")
+
+    # ========================================
+    # PUBLIC API
+    # ========================================
+
+    def next_generation(self) -> int:
+        """Start a new generation (e.g. after zoom) - queued and in-flight older work becomes stale"""
+        self.generation += 1
+        self._queue.clear()
+        self._queued.clear()
+        print(f"🧵 Render generation -> {self.generation}")
+        return self.generation
+
+    def request_page(self, page_index: int, render_dpi: int, priority: int = PRIORITY_VISIBLE):
+        """Queue a page render; a higher-priority request for a queued page promotes it"""
+        if (page_index, render_dpi, self.generation) in self._in_flight:
+            return
+
+        queued = self._queued.get(page_index)
+        if queued and queued.render_dpi == render_dpi and queued.priority <= priority:
+            return
+
+        request = RenderRequest(page_index, render_dpi, self.generation, priority)
+        self._queued[page_index] = request
+        heapq.heappush(self._queue, (priority, next(self._sequence), request))
+        self._dispatch()
+
+    def cancel_pending(self, keep_pages=None) -> int:
+        """Drop queued (not yet running) requests, optionally keeping some pages; returns the number dropped"""
+        keep_pages = set(keep_pages or ())
+        dropped = sum(1 for page in self._queued if page not in keep_pages)
+        self._queue = [entry for entry in self._queue if entry[2].page_index in keep_pages]
+        heapq.heapify(self._queue)
+        self._queued = {page: req for page, req in self._queued.items() if page in keep_pages}
+        return dropped
+
+    def cancel_pages(self, page_indices) -> int:
+        """Drop queued (not yet running) requests for the given pages; returns the number dropped"""
+        page_indices = set(page_indices)
+        return self.cancel_pending(keep_pages=set(self._queued) - page_indices)
+
+    def is_pending(self, page_index: int) -> bool:
+        """True if the page is queued or being rendered for the current generation"""
+        if page_index in self._queued:
+            return True
+        return any(key[0] == page_index and key[2] == self.generation for key in self._in_flight)
+
+    def shutdown(self):
+        """Stop the pool; pending results are discarded"""
+        self._queue.clear()
+        self._queued.clear()
+        for future in self._in_flight.values():
+            future.cancel()
+        self._in_flight.clear()
+        self.generation += 1  # Anything still in flight becomes stale
+        try:
+            self._executor.shutdown(wait=False)
+        except Exception as e:
+            print(f"⚠️ Render service shutdown error: {e}")
+        print("🧵 Render service stopped")
+
+    def get_stats(self) -> dict:
+        """Render service statistics"""
+        return {
+            'generation': self.generation,
+            'queued': len(self._queued),
+            'in_flight': len(self._in_flight),
+            'completed': self.completed_count,
+            'stale_dropped': self.stale_count,
+            'workers': self.max_workers,
+            'mode': 'processes' if self.use_processes else 'threads'
+        }
+
+    # ========================================
+    # DISPATCH
+    # ========================================
+
+    def _pop_next(self) -> Optional[RenderRequest]:
+        """Next live request from the heap (skipping superseded entries)"""
+        while self._queue:
+            _, _, request = heapq.heappop(self._queue)
+            if self._queued.get(request.page_index) is request:
+                del self._queued[request.page_index]
+                return request
+        return None
+
+    def _dispatch(self):
+        """Keep up to max_workers renders in flight"""
+        while len(self._in_flight) < self.max_workers:
+            request = self._pop_next()
+            if request is None:
+                return
+
+            key = (request.page_index, request.render_dpi, request.generation)
+            try:
+                future = self._executor.submit(render_page_worker, self.file_path,
+                                               request.page_index, request.render_dpi)
+            except RuntimeError as e:
+                # Executor already shut down
+                print(f"⚠️ Render service cannot submit page {request.page_index}: {e}")
+                return
+
+            self._in_flight[key] = future
+            # Done-callbacks run on a pool thread - hop back to the GUI thread via signal
+            future.add_done_callback(lambda f, r=request: self._workerFinished.emit(r, f))
+
+    @pyqtSlot(object, object)
+    def _on_worker_finished(self, request: RenderRequest, future):
+        """Deliver a finished render on the GUI thread (or drop it if stale)"""
+        self._in_flight.pop((request.page_index, request.render_dpi, request.generation), None)
+
+        try:
+            if future.cancelled():
+                return
+
+            if request.generation != self.generation:
+                self.stale_count += 1
+                print(f"🗑️ Dropped stale render of page {request.page_index} "
+                      f"(generation {request.generation} < {self.generation})")
+                return
+
+            error = future.exception()
+            if error is not None:
+                print(f"❌ Background render failed for page {request.page_index}: {error}")
+                self.renderFailed.emit(request.page_index, str(error))
+                return
+
+            width, height, stride, components, alpha, samples = future.result()
+            image = samples_to_qimage(samples, width, height, stride, components, alpha)
+            if image.isNull():
+                self.renderFailed.emit(request.page_index, f"unsupported pixmap layout n={components}")
+                return
+
+            self.completed_count += 1
+            self.pageRendered.emit(request.page_index, request.render_dpi, request.generation, image)
+        finally:
+            self._dispatch()
@@ -0,0 +1,174 @@
+"""
+Scroll Prefetcher - Velocity-aware page prefetching for CanvasWidget
+File: src/ui/a_scroll_prefetcher.py
+
+Uses SmartScrollOptimizer's scroll analysis (direction + velocity) to queue
+pages ahead of the scroll direction. Lookahead grows with scroll speed and
+queued prefetch work is cancelled when the user reverses direction.
+"""
+
+import math
+import time
+from typing import List, Set
+
+from PyQt6.QtCore import QRectF
+
+from ui.z_smart_scroll_optimizer import SmartScrollOptimizer
+
+
+class ScrollPrefetcher:
+    """Queues pages ahead of the scroll direction, scaled by scroll velocity"""
+
+    # Lookahead tuning
+    MIN_LOOKAHEAD = 1  # Pages ahead even for slow scrolling
+    MAX_LOOKAHEAD = 8  # Upper bound for fast flings
+    LOOKAHEAD_SECONDS = 0.5  # How far ahead in time to cover at the current velocity
+    SAMPLE_INTERVAL = 0.03  # Minimum seconds between scroll samples
+
+    def __init__(self, canvas_widget):
+        self.canvas_widget = canvas_widget
+
+        # Direction/velocity classification is shared with the repaint optimizer
+        self.motion = SmartScrollOptimizer(canvas_widget)
+
+        self.enabled = True
+        self.scroll_direction = 0  # -1 = up, 1 = down, 0 = none
+        self.lookahead = 0
+        self._last_sample_time = 0.0
+
+        # Pages currently prefetched ahead of the viewport and not yet shown
+        self.prefetched_pages: Set[int] = set()
+        self._last_visible: Set[int] = set()
+
+        # Statistics
+        self.arrivals = 0  # Pages that scrolled into view
+        self.arrival_hits = 0  # ... already rendered when they arrived
+        self.prefetch_requested = 0
+        self.prefetch_used = 0  # Prefetched pages that were later shown
+        self.reversals = 0
+        self.prefetch_cancelled = 0
+
+    # ========================================
+    # SCROLL SAMPLING
+    # ========================================
+
+    def on_scroll(self, viewport_rect: QRectF):
+        """Sample a scroll position (called on every scrollbar change, throttled here)"""
+        canvas = self.canvas_widget
+        if not self.enabled or not canvas.document or not canvas.layout_manager:
+            return
+
+        current_time = time.time()
+        if current_time - self._last_sample_time < self.SAMPLE_INTERVAL:
+            return
+        self._last_sample_time = current_time
+
+        scroll_info = self.motion.analyze_scroll(viewport_rect, current_time)
+        direction = self._get_vertical_direction(scroll_info)
+
+        if direction and self.scroll_direction and direction != self.scroll_direction:
+            self._on_direction_reversed(direction)
+        if direction:
+            self.scroll_direction = direction
+
+        # Show whatever is already rendered while the fling is still in progress
+        visible_pages = canvas.layout_manager.get_visible_pages(viewport_rect)
+        if visible_pages and visible_pages != canvas.visible_pages:
+            canvas.set_visible_pages_optimized(visible_pages, viewport_rect)
+
+        if direction and visible_pages:
+            self.lookahead = self._calculate_lookahead(scroll_info)
+            self._prefetch_ahead(visible_pages, direction, self.lookahead)
+
+        self.motion.track_scroll_state(visible_pages, viewport_rect, current_time)
+
+    def _get_vertical_direction(self, scroll_info: dict) -> int:
+        """-1 for up, 1 for down, 0 when there is no vertical movement"""
+        if scroll_info['direction'] not in ('vertical', 'vertical_dominant', 'diagonal'):
+            return 0
+        return 1 if scroll_info['dy'] > 0 else -1
+
+    def _calculate_lookahead(self, scroll_info: dict) -> int:
+        """Pages to prefetch: enough to cover LOOKAHEAD_SECONDS at the current velocity"""
+        time_delta = scroll_info['time_delta']
+        if time_delta <= 0:
+            return self.MIN_LOOKAHEAD
+
+        vertical_velocity = abs(scroll_info['dy']) / time_delta  # px/s
+        pages_per_second = vertical_velocity / self._get_average_page_height()
+        lookahead = math.ceil(pages_per_second * self.LOOKAHEAD_SECONDS)
+        return max(self.MIN_LOOKAHEAD, min(self.MAX_LOOKAHEAD, lookahead))
+
+    def _get_average_page_height(self) -> float:
+        """Average page pitch in canvas pixels"""
+        layout_manager = self.canvas_widget.layout_manager
+        page_count = max(1, layout_manager.get_page_count())
+        _, height = layout_manager.get_canvas_size()
+        return max(1.0, height / page_count)
+
+    # ========================================
+    # PREFETCH / CANCEL
+    # ========================================
+
+    def _prefetch_ahead(self, visible_pages: List[int], direction: int, lookahead: int):
+        """Queue the next pages in the scroll direction, nearest first"""
+        page_count = self.canvas_widget.document.get_page_count()
+        edge = max(visible_pages) if direction > 0 else min(visible_pages)
+
+        pages = [edge + direction * step for step in range(1, lookahead + 1)]
+        pages = [p for p in pages if 0 <= p < page_count]
+
+        queued = self.canvas_widget.prefetch_pages(pages)
+        self.prefetch_requested += len(queued)
+        self.prefetched_pages.update(queued)
+
+        if queued:
+            print(f"⏩ Prefetch {'down' if direction > 0 else 'up'} x{lookahead}: {queued}")
+
+    def _on_direction_reversed(self, new_direction: int):
+        """Drop queued prefetch work that is now behind the user"""
+        self.reversals += 1
+        self.prefetch_cancelled += self.canvas_widget.cancel_prefetch(self.prefetched_pages)
+        self.prefetched_pages.clear()
+        print(f"↩️ Scroll reversed ({'down' if new_direction > 0 else 'up'}) - prefetch cancelled")
+
+    # ========================================
+    # HIT-RATE ACCOUNTING
+    # ========================================
+
+    def record_visible_pages(self, visible_pages: List[int]):
+        """Count pages entering the viewport and whether they were already rendered"""
+        visible = set(visible_pages)
+        arrived = visible - self._last_visible
+        self._last_visible = visible
+
+        for page_idx in arrived:
+            self.arrivals += 1
+            if self.canvas_widget.is_page_cached(page_idx):
+                self.arrival_hits += 1
+            if page_idx in self.prefetched_pages:
+                self.prefetch_used += 1
+                self.prefetched_pages.discard(page_idx)
+
+    def reset(self):
+        """Forget scroll state (document or zoom changed)"""
+        self.motion.reset()
+        self.scroll_direction = 0
+        self.lookahead = 0
+        self.prefetched_pages.clear()
+        self._last_visible.clear()
+
+    def get_stats(self) -> dict:
+        """Prefetch statistics - hit_rate is the share of pages already rendered on arrival"""
+        return {
+            'arrivals': self.arrivals,
+            'arrival_hits': self.arrival_hits,
+            'hit_rate': (self.arrival_hits / self.arrivals * 100) if self.arrivals else 0.0,
+            'prefetch_requested': self.prefetch_requested,
+            'prefetch_used': self.prefetch_used,
+            'prefetch_accuracy': (self.prefetch_used / self.prefetch_requested * 100)
+            if self.prefetch_requested else 0.0,
+            'reversals': self.reversals,
+            'prefetch_cancelled': self.prefetch_cancelled,
+            'lookahead': self.lookahead
+        }
@@ -43,18 +43,25 @@ class TOCTreeWidget(QTreeWidget):
 
     def populate_from_entries(self, toc_entries: List[TOCEntry]):
         """Populate tree with lazy loading - only top level initially"""
+        self.begin_progressive_population()
+        self.append_entries(toc_entries)
+
+        print(f"📖 Tree populated with {self.topLevelItemCount()} top-level entries (lazy loading)")
+
+    def begin_progressive_population(self):
+        """Clear the tree before entries arrive in batches (see append_entries)"""
         self.clear()
 
         # Store full TOC data for lazy loading
-        self.full_toc_entries = toc_entries
+        self.full_toc_entries = []
 
-        # Only add top-level entries initially
-        for entry in toc_entries:
-            if entry.level == 0:  # Only top-level entries
-                item = self._create_tree_item_lazy(entry)
-                self.addTopLevelItem(item)
+    def append_entries(self, toc_entries: List[TOCEntry]):
+        """Add a batch of top-level entries (children load on expand)"""
+        self.full_toc_entries.extend(toc_entries)
 
-        print(f"📖 Tree populated with {len([e for e in toc_entries if e.level == 0])} top-level entries (lazy loading)")
+        # Only add top-level entries initially
+        items = [self._create_tree_item_lazy(entry) for entry in toc_entries if entry.level == 0]
+        self.addTopLevelItems(items)
 
     def _create_tree_item(self, toc_entry: TOCEntry) -> QTreeWidgetItem:
         """Create tree item from TOC entry"""
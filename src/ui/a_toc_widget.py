@@ -1,7 +1,7 @@
-from typing import Optional, List
+from typing import Optional, List, Iterator
 import time
 
-from PyQt6.QtCore import pyqtSignal, Qt
+from PyQt6.QtCore import pyqtSignal, Qt, QTimer
 from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTreeWidgetItem
 
@@ -23,6 +23,9 @@ class TOCWidget(QWidget):
     pageNavigationRequested = pyqtSignal(int, float, float)  # page, x, y
     entrySelected = pyqtSignal(str)  # entry title
 
+    # Per-tick time budget while streaming entries into the tree
+    STREAM_BATCH_MS = 15
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -30,6 +33,12 @@ class TOCWidget(QWidget):
         self.toc_navigator: Optional[TOCNavigator] = None
         self.current_page = 0
 
+        # Progressive loading state (top-level entries arrive in batches)
+        self._toc_stream: Optional[Iterator[TOCEntry]] = None
+        self._streamed_entries: List[TOCEntry] = []
+        self._stream_start_time = 0.0
+        self._stream_action = "took"
+
         self.init_ui()
 
     def init_ui(self):
@@ -67,37 +76,68 @@ class TOCWidget(QWidget):
         layout.addWidget(self.status_label)
 
     def load_toc(self, pdf_document) -> bool:
-        """Load TOC from PDF document"""
+        """Load TOC from PDF document (first batch now, the rest progressively)"""
         if not pdf_document:
             self.status_label.setText("No document loaded")
             return False
 
-        # Start timing
-        start_time = time.time()
-
-        # Extract TOC
         self.toc_extractor = TOCExtractor(pdf_document)
-        toc_entries = self.toc_extractor.extract_toc()
-
-        if not toc_entries:
-            elapsed_time = time.time() - start_time
-            self.status_label.setText(f"No table of contents found (took {elapsed_time:.3f}s)")
-            return False
+        return self._start_streaming("took")
+
+    def _start_streaming(self, action: str, use_cache: bool = True) -> bool:
+        """Populate the tree from the extractor's stream; True if any entries arrived in the first batch"""
+        self._stream_start_time = time.time()
+        self._stream_action = action
+        self._streamed_entries = []
+        self._toc_stream = self.toc_extractor.iter_toc(use_cache)
+        self.toc_navigator = None
+        self.toc_tree.begin_progressive_population()
+
+        self._pump_toc_stream()
+        return bool(self._streamed_entries)
+
+    def _pump_toc_stream(self):
+        """Move one time-boxed batch of top-level entries into the tree"""
+        stream = self._toc_stream
+        if stream is None:
+            return
+
+        deadline = time.perf_counter() + self.STREAM_BATCH_MS / 1000.0
+        batch = []
+        finished = False
+        while time.perf_counter() < deadline:
+            entry = next(stream, None)
+            if entry is None:
+                finished = True
+                break
+            batch.append(entry)
+
+        if batch:
+            self._streamed_entries.extend(batch)
+            self.toc_tree.append_entries(batch)
+
+        if not finished:
+            self.status_label.setText(f"Loading table of contents... {len(self._streamed_entries)} sections")
+            QTimer.singleShot(0, self._pump_toc_stream)
+            return
+
+        self._toc_stream = None
+        self._finish_streaming()
+
+    def _finish_streaming(self):
+        """All entries are in - build the navigator and show the summary"""
+        elapsed_time = time.time() - self._stream_start_time
+        if not self._streamed_entries:
+            self.status_label.setText(f"No table of contents found ({self._stream_action} {elapsed_time:.3f}s)")
+            return
 
         # Create navigator
-        self.toc_navigator = TOCNavigator(toc_entries)
-
-        # Populate UI
-        self.toc_tree.populate_from_entries(toc_entries)
-
-        # Calculate timing
-        elapsed_time = time.time() - start_time
+        self.toc_navigator = TOCNavigator(self._streamed_entries)
 
         # Update status with count and timing
         entry_count = len(self.toc_navigator.flat_entries)
-        self.status_label.setText(f"{entry_count} entries found (took {elapsed_time:.3f}s)")
-
-        return True
+        source = " from cache" if self.toc_extractor.last_source == "cache" else ""
+        self.status_label.setText(f"{entry_count} entries found{source} ({self._stream_action} {elapsed_time:.3f}s)")
 
     def _on_entry_navigation(self, toc_entry):
         """Handle navigation to TOC entry - DEBUG VERSION"""
@@ -118,21 +158,6 @@ class TOCWidget(QWidget):
         self.entrySelected.emit(toc_entry.title)
 
     def refresh_toc(self):
-        """Refresh table of contents"""
+        """Refresh table of contents (re-read from the PDF, bypassing the cache)"""
         if self.toc_extractor:
-            # Start timing for refresh
-            start_time = time.time()
-
-            # Re-extract from same document
-            toc_entries = self.toc_extractor.extract_toc()
-            if toc_entries:
-                self.toc_navigator = TOCNavigator(toc_entries)
-                self.toc_tree.populate_from_entries(toc_entries)
-
-                # Update status with timing
-                elapsed_time = time.time() - start_time
-                entry_count = len(self.toc_navigator.flat_entries)
-                self.status_label.setText(f"{entry_count} entries found (refreshed in {elapsed_time:.3f}s)")
-            else:
-                elapsed_time = time.time() - start_time
-                self.status_label.setText(f"No table of contents found (refresh took {elapsed_time:.3f}s)")
\ No newline at end of file
+            self._start_streaming("refreshed in", use_cache=False)
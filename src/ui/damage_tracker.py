@@ -0,0 +1,74 @@
+"""
+Damage Tracker
+Collects damaged canvas rectangles between repaints
+
+Field operations report the screen rects a field covered before and after a
+change; the canvas repaints only those rects instead of the whole overlay.
+Repainted pixels are counted per paint event so the savings can be checked.
+"""
+
+from typing import Dict, List
+
+from PyQt6.QtCore import QRect
+
+
+class DamageTracker:
+    """Pending damaged rects per page plus repaint statistics"""
+
+    def __init__(self):
+        self._pending: Dict[int, List[QRect]] = {}
+
+        # Statistics
+        self.frames = 0
+        self.last_frame_pixels = 0
+        self.max_frame_pixels = 0
+        self.total_pixels = 0
+        self.damage_reports = 0
+
+    # ========================================
+    # DAMAGE
+    # ========================================
+
+    def add(self, page_num: int, rect: QRect):
+        """Mark a canvas rect on a page as needing a repaint"""
+        if rect.isEmpty():
+            return
+        self._pending.setdefault(page_num, []).append(QRect(rect))
+        self.damage_reports += 1
+
+    def has_damage(self) -> bool:
+        return bool(self._pending)
+
+    def take(self) -> Dict[int, List[QRect]]:
+        """Pending rects per page (the tracker is emptied)"""
+        pending = self._pending
+        self._pending = {}
+        return pending
+
+    def clear(self):
+        self._pending.clear()
+
+    # ========================================
+    # REPAINT ACCOUNTING
+    # ========================================
+
+    def record_frame(self, rects) -> int:
+        """Count the pixels of one paint event's region"""
+        pixels = sum(rect.width() * rect.height() for rect in rects)
+        self.frames += 1
+        self.last_frame_pixels = pixels
+        self.max_frame_pixels = max(self.max_frame_pixels, pixels)
+        self.total_pixels += pixels
+        return pixels
+
+    def get_stats(self) -> dict:
+        """Repaint statistics - pixels per frame show how much each edit repainted"""
+        return {
+            'frames': self.frames,
+            'last_frame_pixels': self.last_frame_pixels,
+            'max_frame_pixels': self.max_frame_pixels,
+            'avg_frame_pixels': (self.total_pixels / self.frames) if self.frames else 0.0,
+            'total_pixels': self.total_pixels,
+            'damage_reports': self.damage_reports,
+            'pending_pages': sorted(self._pending)
+        }
@@ -0,0 +1,91 @@
+"""
+Drag Frame Scheduler
+Coalesces mouse moves during a drag to the display refresh rate
+
+Mice report moves far more often than the screen refreshes. Every move used to
+recompute all ghosts, snap, emit progress signals and repaint; now only the
+latest position is kept and processed once per display frame.
+"""
+
+import time
+from typing import Callable, Optional
+
+from PyQt6.QtCore import QObject, QPoint, QTimer
+from PyQt6.QtGui import QGuiApplication
+
+
+class DragFrameScheduler(QObject):
+    """Runs a frame callback with the latest submitted position, at most once per display frame"""
+
+    DEFAULT_REFRESH_RATE = 60.0
+
+    def __init__(self, on_frame: Callable[[QPoint], None], widget=None, parent=None):
+        """
+        Args:
+            on_frame: Called with the latest position once per frame
+            widget: Widget whose screen's refresh rate caps the frame rate
+        """
+        super().__init__(parent)
+        self._on_frame = on_frame
+        self._widget = widget
+        self._pending: Optional[QPoint] = None
+        self._last_frame_time = 0.0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._run_frame)
+
+        # Statistics
+        self.moves_submitted = 0
+        self.frames_run = 0
+
+    def frame_interval_ms(self) -> float:
+        """Milliseconds per frame of the widget's (or primary) screen"""
+        screen = None
+        if self._widget is not None and hasattr(self._widget, 'screen'):
+            screen = self._widget.screen()
+        if screen is None:
+            screen = QGuiApplication.primaryScreen()
+        refresh_rate = screen.refreshRate() if screen is not None else 0
+        return 1000.0 / (refresh_rate if refresh_rate and refresh_rate > 0 else self.DEFAULT_REFRESH_RATE)
+
+    def submit(self, pos: QPoint):
+        """Queue a position; earlier positions not yet processed are dropped"""
+        self._pending = QPoint(pos)
+        self.moves_submitted += 1
+        if self._timer.isActive():
+            return
+
+        elapsed_ms = (time.perf_counter() - self._last_frame_time) * 1000.0
+        self._timer.start(max(0, int(self.frame_interval_ms() - elapsed_ms)))
+
+    def flush(self):
+        """Process a pending position now"""
+        self._timer.stop()
+        self._run_frame()
+
+    def cancel(self):
+        """Drop a pending position (drag ended)"""
+        self._timer.stop()
+        self._pending = None
+
+    def has_pending(self) -> bool:
+        return self._pending is not None
+
+    def _run_frame(self):
+        pos = self._pending
+        if pos is None:
+            return
+        self._pending = None
+        self._last_frame_time = time.perf_counter()
+        self.frames_run += 1
+        self._on_frame(pos)
+
+    def get_stats(self) -> dict:
+        """Moves received vs frames processed"""
+        return {
+            'moves_submitted': self.moves_submitted,
+            'frames_run': self.frames_run,
+            'moves_coalesced': self.moves_submitted - self.frames_run,
+            'frame_interval_ms': self.frame_interval_ms()
+        }
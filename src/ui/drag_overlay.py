@@ -4,16 +4,23 @@ Provides smooth dragging without repainting the underlying PDF canvas
 """
 
 from PyQt6.QtWidgets import QWidget, QLabel
-from PyQt6.QtCore import Qt, QPoint, QRect, QTimer
+from PyQt6.QtCore import Qt, QLine, QPoint, QRect, QTimer
 from PyQt6.QtGui import QPainter, QPen, QBrush, QColor, QFont, QFontMetrics
 from typing import List, Optional, Dict, Tuple, Any
 
+import numpy as np
+
 
 class DragOverlay(QWidget):
     """
     Transparent overlay widget for handling drag operations without repainting the main canvas
     """
 
+    GHOST_LABEL_LIMIT = 50  # Ghost names are only drawn for drags of up to this many fields
+    GHOST_PEN_WIDTH = 4
+    CURSOR_SIZE = 15
+    GUIDE_COLOR = QColor(255, 0, 200, 220)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setup_overlay_properties()
@@ -63,6 +70,18 @@ class DragOverlay(QWidget):
         self.ghost_positions = {}  # field_id -> QPoint for ghost positions
         self.zoom_level = 1.0
 
+        # Ghost geometry as arrays (one column per dragged field), set up at drag start
+        self._ghost_ids = []
+        self._ghost_base = None  # 2 x n screen positions at zero drag offset
+        self._ghost_size = None  # 2 x n screen sizes
+        self._ghost_extent = None  # 2 x n painted size (ghost plus name label)
+        self._ghost_xy = None  # 2 x n current screen positions
+        self._ghost_bounds = QRect()  # Canvas rect covered by the ghosts and cursor indicator
+
+        # Alignment guides as screen lines (see set_guides)
+        self.guide_lines: List[QLine] = []
+        self._guide_bounds = QRect()
+
     def deprecated_start_drag(self, fields: List[Any], start_pos: QPoint, zoom_level: float = 1.0):
         """
         Start dragging operation with proper zoom level handling
@@ -118,8 +137,9 @@ class DragOverlay(QWidget):
             # At 100% zoom, coordinates should match
             self.current_drag_pos = current_pos
 
+        old_bounds = self._ghost_bounds
         self.update_ghost_positions()
-        self.update()
+        self.update(old_bounds.united(self._ghost_bounds))
 
     def get_drag_offset(self):
         """Get the current drag offset in screen coordinates"""
@@ -357,90 +377,39 @@ class DragOverlay(QWidget):
             return True  # Default to valid if validation fails
 
     def draw_drag_feedback(self, painter: QPainter):
-        """Draw visual feedback for dragged fields with debug output"""
-        print(
-            f"🎨 draw_drag_feedback called - dragging: {self.is_dragging}, fields: {len(self.drag_fields) if self.drag_fields else 0}")
-
-        if not self.is_dragging or not self.drag_fields:
-            print("🚫 Not drawing - not dragging or no fields")
+        """Draw ghosts for all dragged fields (one batched drawRects call) plus the cursor indicator"""
+        if not self.is_dragging or not self.drag_fields or self._ghost_xy is None:
             return
 
-        print(f"🎯 Drawing ghosts for {len(self.drag_fields)} fields")
-        print(f"   Ghost positions available: {len(self.ghost_positions)}")
-
-        # Very visible ghost styling for debugging
-        ghost_color = QColor(255, 0, 0, 150)  # Bright red for visibility
-        ghost_border = QColor(255, 0, 0, 255)  # Solid red border
+        xs, ys = self._ghost_xy.tolist()
+        widths, heights = self._ghost_size.tolist()
+        ghost_rects = [QRect(x, y, w, h) for x, y, w, h in zip(xs, ys, widths, heights)]
 
-        ghost_brush = QBrush(ghost_color)
-        ghost_pen = QPen(ghost_border, 4)  # Thick border
-        painter.setBrush(ghost_brush)
+        ghost_pen = QPen(QColor(255, 0, 0, 255), self.GHOST_PEN_WIDTH)  # Solid red border
+        painter.setBrush(QBrush(QColor(255, 0, 0, 150)))  # Bright red for visibility
         painter.setPen(ghost_pen)
-
-        ghosts_drawn = 0
-
-        # Draw ghost for each dragged field
-        for field in self.drag_fields:
-            field_id = getattr(field, 'id', None)
-            field_name = getattr(field, 'name', 'unnamed')
-
-            print(f"   Processing field: {field_name} (id: {field_id})")
-
-            if field_id and field_id in self.ghost_positions:
-                ghost_pos = self.ghost_positions[field_id]
-                print(f"   ✅ Found ghost position: {ghost_pos}")
-
-                # Check if position is reasonable
-                if ghost_pos.x() < -2000 or ghost_pos.y() < -2000 or ghost_pos.x() > 10000 or ghost_pos.y() > 10000:
-                    print(f"   ⚠️ Ghost position seems unreasonable: {ghost_pos}")
-                    continue
-
-                # Get field dimensions (scaled by zoom)
-                field_width = int(getattr(field, 'width', 100) * self.zoom_level)
-                field_height = int(getattr(field, 'height', 30) * self.zoom_level)
-
-                print(f"   Drawing rect at {ghost_pos} with size {field_width}x{field_height}")
-
-                # Draw ghost rectangle
-                ghost_rect = QRect(ghost_pos.x(), ghost_pos.y(), field_width, field_height)
-                painter.drawRect(ghost_rect)
-
-                # Draw field name
+        painter.drawRects(ghost_rects)
+
+        # Field names (skipped for large drags - hundreds of labels would be unreadable anyway)
+        if len(ghost_rects) <= self.GHOST_LABEL_LIMIT:
+            painter.setPen(QPen(QColor(255, 255, 255, 255)))  # White text
+            painter.setFont(self._ghost_label_font())
+            for field, rect in zip(self.drag_fields, ghost_rects):
+                field_name = getattr(field, 'name', '')
                 if field_name:
-                    painter.setPen(QPen(QColor(255, 255, 255, 255)))  # White text
-                    font = QFont("Arial", max(8, int(12 * self.zoom_level)))
-                    painter.setFont(font)
+                    painter.drawText(rect.x() + 5, rect.y() + 15, field_name)
 
-                    text_x = ghost_pos.x() + 5
-                    text_y = ghost_pos.y() + 15
-                    painter.drawText(text_x, text_y, field_name)
-
-                    # Restore pen
-                    painter.setPen(ghost_pen)
-
-                ghosts_drawn += 1
-                print(f"   👻 Successfully drew ghost for {field_name}")
-            else:
-                print(f"   ❌ No ghost position for {field_name} (id: {field_id})")
-                print(f"       Available ghost IDs: {list(self.ghost_positions.keys())}")
-
-        print(f"✅ Drew {ghosts_drawn}/{len(self.drag_fields)} ghosts")
+        self.draw_drag_guidelines(painter)
 
         # Draw cursor indicator
         cursor_x = self.current_drag_pos.x()
         cursor_y = self.current_drag_pos.y()
         painter.setPen(QPen(QColor(0, 255, 0, 255), 3))  # Green cursor
-        painter.drawLine(cursor_x - 15, cursor_y, cursor_x + 15, cursor_y)
-        painter.drawLine(cursor_x, cursor_y - 15, cursor_x, cursor_y + 15)
-        print(f"🎯 Drew cursor at {cursor_x}, {cursor_y}")
+        painter.drawLine(cursor_x - self.CURSOR_SIZE, cursor_y, cursor_x + self.CURSOR_SIZE, cursor_y)
+        painter.drawLine(cursor_x, cursor_y - self.CURSOR_SIZE, cursor_x, cursor_y + self.CURSOR_SIZE)
 
-        # Draw cursor indicator
-        cursor_x = self.current_drag_pos.x()
-        cursor_y = self.current_drag_pos.y()
-        painter.setPen(QPen(QColor(0, 255, 0, 255), 3))  # Green cursor
-        painter.drawLine(cursor_x - 15, cursor_y, cursor_x + 15, cursor_y)
-        painter.drawLine(cursor_x, cursor_y - 15, cursor_x, cursor_y + 15)
-        print(f"🎯 Drew cursor at {cursor_x}, {cursor_y}")
+    def _ghost_label_font(self) -> QFont:
+        return QFont("Arial", max(8, int(12 * self.zoom_level)))
 
     def deprecated_1_draw_drag_feedback(self, painter: QPainter):
         """
@@ -690,6 +659,9 @@ class DragOverlay(QWidget):
         if hasattr(self, '_cursor_to_field_y'):
             delattr(self, '_cursor_to_field_y')
 
+        # Screen geometry of every dragged field, computed once per drag
+        self._prepare_ghost_geometry()
+
         # Calculate initial ghost positions
         self.update_ghost_positions()
 
@@ -997,76 +969,76 @@ class DragOverlay(QWidget):
                 )
                 self.ghost_positions[field.id] = ghost_pos
 
-    def update_ghost_positions(self):
-        """
-        Calculate ghost positions with proper zoom-aware coordinate conversion
-        FIXED: Properly handles coordinate transformation at all zoom levels
-        """
-        if not self.is_dragging or not self.drag_fields:
-            return
-
-        print(f"🎯 Updating ghost positions for {len(self.drag_fields)} fields (zoom: {self.zoom_level:.2f}x)")
-
-        # Get canvas reference for coordinate conversion
+    def _prepare_ghost_geometry(self):
+        """Screen position (at zero drag offset) and size of every dragged field as arrays"""
         canvas = self.parent() if hasattr(self, 'parent') and self.parent() else None
-
-        # Clear previous positions
         self.ghost_positions.clear()
 
-        # FIXED: Calculate the drag offset in document coordinates
-        screen_drag_offset = self.current_drag_pos - self.drag_start_pos
-        doc_drag_offset_x = screen_drag_offset.x() / self.zoom_level
-        doc_drag_offset_y = screen_drag_offset.y() / self.zoom_level
-
-        print(f"   Screen drag offset: {screen_drag_offset}")
-        print(f"   Document drag offset: ({doc_drag_offset_x:.1f}, {doc_drag_offset_y:.1f})")
-
-        # Process each dragged field
+        ids = []
+        base_x, base_y, widths, heights = [], [], [], []
         for field in self.drag_fields:
             field_id = getattr(field, 'id', f'field_{id(field)}')
-            field_name = getattr(field, 'name', 'unnamed')
             page_number = getattr(field, 'page_number', 0)
 
-            print(f"   Processing field: {field_name} on page {page_number}")
-
-            try:
-                # FIXED: Calculate new field position in document coordinates FIRST
-                new_field_doc_x = field.x + doc_drag_offset_x
-                new_field_doc_y = field.y + doc_drag_offset_y
-
-                print(f"     Original doc: ({field.x}, {field.y})")
-                print(f"     New doc: ({new_field_doc_x:.1f}, {new_field_doc_y:.1f})")
-
-                # FIXED: Use canvas method to convert NEW document position to screen coordinates
-                if canvas and hasattr(canvas, 'document_to_screen_coordinates'):
-                    screen_coords = canvas.document_to_screen_coordinates(
-                        page_number, new_field_doc_x, new_field_doc_y
-                    )
-
-                    if screen_coords:
-                        ghost_screen_x, ghost_screen_y = screen_coords
-                        ghost_pos = QPoint(int(ghost_screen_x), int(ghost_screen_y))
-                        self.ghost_positions[field_id] = ghost_pos
-
-                        print(f"     ✅ Ghost screen: ({ghost_screen_x}, {ghost_screen_y})")
-                        continue
-                    else:
-                        print(f"     ⚠️ Canvas coordinate conversion failed, using fallback")
+            screen_coords = None
+            if canvas and hasattr(canvas, 'document_to_screen_coordinates'):
+                screen_coords = canvas.document_to_screen_coordinates(page_number, field.x, field.y)
+            if not screen_coords:
+                self._calculate_zoom_aware_ghost_fallback(field, field.x, field.y, canvas)
+                ghost_pos = self.ghost_positions[field_id]
+                screen_coords = (ghost_pos.x(), ghost_pos.y())
+
+            ids.append(field_id)
+            base_x.append(screen_coords[0])
+            base_y.append(screen_coords[1])
+            widths.append(int(getattr(field, 'width', 100) * self.zoom_level))
+            heights.append(int(getattr(field, 'height', 30) * self.zoom_level))
+
+        self._ghost_ids = ids
+        self._ghost_base = np.array([base_x, base_y], dtype=np.float64).reshape(2, len(ids))
+        self._ghost_size = np.array([widths, heights], dtype=np.int64).reshape(2, len(ids))
+
+        # Name labels (drawn at +5, +15) can reach past small ghosts
+        self._ghost_extent = self._ghost_size.copy()
+        if 0 < len(ids) <= self.GHOST_LABEL_LIMIT:
+            metrics = QFontMetrics(self._ghost_label_font())
+            label_widths = [metrics.horizontalAdvance(getattr(field, 'name', '') or '') + 5
+                            for field in self.drag_fields]
+            self._ghost_extent[0] = np.maximum(self._ghost_extent[0], label_widths)
+            self._ghost_extent[1] = np.maximum(self._ghost_extent[1], 15 + metrics.descent())
 
-                # FIXED: Enhanced fallback calculation with proper zoom handling
-                self._calculate_zoom_aware_ghost_fallback(field, new_field_doc_x, new_field_doc_y, canvas)
+    def update_ghost_positions(self):
+        """
+        Calculate ghost positions for all dragged fields in one vectorized step
 
-            except Exception as e:
-                print(f"     ❌ Error calculating ghost for {field_name}: {e}")
-                # Emergency fallback - position relative to cursor with zoom adjustment
-                fallback_offset_x = -50 / self.zoom_level
-                fallback_offset_y = -15 / self.zoom_level
-                self.ghost_positions[field_id] = QPoint(
-                    int(self.current_drag_pos.x() + fallback_offset_x),
-                    int(self.current_drag_pos.y() + fallback_offset_y)
-                )
+        Screen coordinates are linear in document coordinates, so every ghost is its
+        drag-start screen position plus the cursor's screen offset.
+        """
+        if not self.is_dragging or not self.drag_fields:
+            return
 
-        print(f"✅ Ghost positions calculated: {len(self.ghost_positions)} positions")
+        if self._ghost_base is None or self._ghost_base.shape[1] != len(self.drag_fields):
+            self._prepare_ghost_geometry()
+
+        offset = self.current_drag_pos - self.drag_start_pos
+        self._ghost_xy = (self._ghost_base + np.array([[offset.x()], [offset.y()]])).astype(np.int64)
+
+        xs, ys = self._ghost_xy
+        self.ghost_positions = {field_id: QPoint(x, y) for field_id, x, y
+                                in zip(self._ghost_ids, xs.tolist(), ys.tolist())}
+
+        # Canvas rect covered by ghosts (pen and labels included) and the cursor indicator
+        cursor = self.current_drag_pos
+        cursor_margin = self.CURSOR_SIZE + 2
+        bounds = QRect(cursor.x() - cursor_margin, cursor.y() - cursor_margin,
+                       2 * cursor_margin + 1, 2 * cursor_margin + 1)
+        if len(xs):
+            pad = self.GHOST_PEN_WIDTH
+            left_edge, top_edge = int(xs.min()) - pad, int(ys.min()) - pad
+            bounds = bounds.united(QRect(left_edge, top_edge,
+                                         int((xs + self._ghost_extent[0]).max()) + pad - left_edge + 1,
+                                         int((ys + self._ghost_extent[1]).max()) + pad - top_edge + 1))
+        self._ghost_bounds = bounds
 
     def _calculate_zoom_aware_ghost_fallback(self, field, new_doc_x, new_doc_y, canvas):
         """
@@ -1273,13 +1245,43 @@ class DragOverlay(QWidget):
 
         painter.drawText(text_x, text_y, field.name)
 
+    def set_guides(self, segments: List[Tuple[int, float, float, float, float]]):
+        """
+        Show alignment guides
+
+        Args:
+            segments: (page, x0, y0, x1, y1) guide lines in document coordinates
+        """
+        canvas = self.parent() if self.parent() else None
+        lines = []
+        for page_num, x0, y0, x1, y1 in segments:
+            if canvas is None or not hasattr(canvas, 'document_to_screen_coordinates'):
+                break
+            start = canvas.document_to_screen_coordinates(page_num, x0, y0)
+            end = canvas.document_to_screen_coordinates(page_num, x1, y1)
+            if start and end:
+                lines.append(QLine(int(start[0]), int(start[1]), int(end[0]), int(end[1])))
+
+        if not lines and not self.guide_lines:
+            return
+
+        bounds = QRect()
+        for line in lines:
+            bounds = bounds.united(QRect(line.p1(), line.p2()).normalized())
+
+        self.update(self._guide_bounds)
+        self.guide_lines = lines
+        self._guide_bounds = bounds.adjusted(-2, -2, 2, 2) if lines else QRect()
+        self.update(self._guide_bounds)
+
     def draw_drag_guidelines(self, painter: QPainter):
-        """Draw snapping guidelines or grid alignment hints"""
-        # This can be extended to show:
-        # - Grid snapping lines
-        # - Alignment guides with other fields
-        # - Drop zones
-        pass
+        """Draw alignment guides to the edges/centers of nearby fields"""
+        if not self.guide_lines:
+            return
+        pen = QPen(self.GUIDE_COLOR, 1, Qt.PenStyle.DashLine)
+        pen.setCosmetic(True)
+        painter.setPen(pen)
+        painter.drawLines(self.guide_lines)
 
     def resizeEvent(self, event):
         """Handle parent resize to maintain overlay coverage"""
@@ -11,6 +11,7 @@ from PyQt6.QtGui import QCursor
 # Import dependencies - these MUST work for enhanced drag handler to function
 from models.field_model import FormField, FieldManager
 from ui.drag_overlay import DragOverlay
+from ui.drag_frame_scheduler import DragFrameScheduler
 from utils.geometry_utils import (
     ResizeHandles, ResizeCalculator, BoundaryConstraints, GridUtils
 )
@@ -102,6 +103,9 @@ class EnhancedDragHandler(QObject):
         self.drag_overlay = DragOverlay(canvas)
         self.drag_overlay.hide()  # Initially hidden
 
+        # Mouse moves during a drag are processed once per display frame
+        self.frame_scheduler = DragFrameScheduler(self._process_drag_frame, canvas, self)
+
         self.resize_mode = False
         self.resize_handle = None
         self.resize_start_pos = QPoint()
@@ -112,6 +116,11 @@ class EnhancedDragHandler(QObject):
         self.grid_manager = None
         self.snap_enabled = False
 
+        # Alignment guides to other fields' edges/centers (edge index built per drag)
+        self.alignment_guides_enabled = True
+        self.guide_snap_distance = 6  # Screen pixels
+        self.edge_index = None
+
     def set_zoom_level(self, zoom_level: float):
         """Update zoom level for drag calculations"""
         self.zoom_level = zoom_level
@@ -247,7 +256,7 @@ class EnhancedDragHandler(QObject):
                 self.drag_start_pos = pos
                 print(f"🧲 Snapped click position: ({snapped_x:.1f}, {snapped_y:.1f})")
 
-            self.canvas.draw_overlay()
+            self._redraw_selection()
             print(f"🎯 Enhanced drag handler: {len(self.get_selected_fields())} fields selected")
 
         else:
@@ -259,7 +268,7 @@ class EnhancedDragHandler(QObject):
                 print(f"   - {field.name} at ({field.x}, {field.y})")
             self.field_manager.clear_selection()
             self.selectionChanged.emit(self.get_selected_fields())
-            self.canvas.draw_overlay()
+            self._redraw_selection()
 
         return clicked_field
 
@@ -284,28 +293,72 @@ class EnhancedDragHandler(QObject):
             if drag_distance > 1:  # Start drag after 5 pixel threshold
                 self.start_drag()
 
-        # Update drag if in progress
+        # Update drag if in progress (coalesced to the display refresh rate)
         if self.is_dragging:
-            # Apply snap to drag position
-            if self._should_snap():
-                zoom = getattr(self, 'zoom_level', 1.0)
-                # 🎯 FIX: Use grid_manager's snap method with distance threshold
-                snapped_x, snapped_y = self.grid_manager.snap_point_to_grid(
-                    pos.x(), pos.y(), zoom, max_snap_distance=25.0
-                )
-                pos = QPoint(int(snapped_x), int(snapped_y))
+            self.frame_scheduler.submit(pos)
 
-            self.drag_overlay.update_drag(pos)
+        return self.is_dragging
 
-            for field in self.get_selected_fields():
-                # Calculate current live position based on drag offset
-                drag_offset = pos - self.drag_start_pos
-                live_x = int(field.x + drag_offset.x())
-                live_y = int(field.y + drag_offset.y())
+    def _process_drag_frame(self, pos: QPoint):
+        """One drag frame for the latest mouse position: snap, move ghosts, report progress"""
+        if not self.is_dragging:
+            return
+
+        # Apply snap to drag position
+        if self._should_snap():
+            zoom = getattr(self, 'zoom_level', 1.0)
+            # 🎯 FIX: Use grid_manager's snap method with distance threshold
+            snapped_x, snapped_y = self.grid_manager.snap_point_to_grid(
+                pos.x(), pos.y(), zoom, max_snap_distance=25.0
+            )
+            pos = QPoint(int(snapped_x), int(snapped_y))
 
-                self.dragProgress.emit(field.id, live_x, live_y, int(field.width), int(field.height))
+        pos, guides = self._align_to_guides(pos)
+        self.drag_overlay.set_guides(guides)
+        self.drag_overlay.update_drag(pos)
 
-        return self.is_dragging
+        # Live position of every dragged field - the properties panel can show any of them
+        drag_offset = pos - self.drag_start_pos
+        for field in self.get_selected_fields():
+            live_x = int(field.x + drag_offset.x())
+            live_y = int(field.y + drag_offset.y())
+            self.dragProgress.emit(field.id, live_x, live_y, int(field.width), int(field.height))
+
+    def _align_to_guides(self, pos: QPoint):
+        """
+        Pull a drag position onto the nearest edge/center of other fields
+
+        Returns:
+            (position, guide segments as (page, x0, y0, x1, y1) in document coordinates)
+        """
+        field = self.get_selected_field()
+        if not self.alignment_guides_enabled or self.edge_index is None or field is None:
+            return pos, []
+
+        page_num = getattr(field, 'page_number', 0)
+        offset = pos - self.drag_start_pos
+        x0, y0 = field.x + offset.x(), field.y + offset.y()
+        bounds = (x0, y0, x0 + field.width, y0 + field.height)
+        tolerance = self.guide_snap_distance / max(self.zoom_level, 0.01)
+
+        x_match, y_match = self.edge_index.match(page_num, bounds, tolerance)
+        dx = int(round(x_match.delta)) if x_match else 0
+        dy = int(round(y_match.delta)) if y_match else 0
+        x0, y0 = x0 + dx, y0 + dy
+        x1, y1 = x0 + field.width, y0 + field.height
+
+        # Guides span the dragged field and the field it lines up with
+        guides = []
+        if x_match:
+            target = x_match.field
+            guides.append((page_num, x_match.position, min(y0, target.y),
+                           x_match.position, max(y1, target.y + target.height)))
+        if y_match:
+            target = y_match.field
+            guides.append((page_num, min(x0, target.x), y_match.position,
+                           max(x1, target.x + target.width), y_match.position))
+
+        return pos + QPoint(dx, dy), guides
 
     def working_handle_mouse_move(self, pos: QPoint) -> bool:
         """
@@ -400,24 +453,14 @@ class EnhancedDragHandler(QObject):
         if not self._should_snap() or not fields:
             return
 
-        # Find the primary field (first selected)
+        # Snap the primary field's (first selected) new position
         primary_field = fields[0]
+        snapped_x, snapped_y = self.snap_point_to_grid(primary_field.x + offset_x, primary_field.y + offset_y, zoom_level)
 
-        # Calculate new position for primary field
-        new_primary_x = primary_field.x + offset_x
-        new_primary_y = primary_field.y + offset_y
-
-        # Snap the primary field's new position
-        snapped_x, snapped_y = self.snap_point_to_grid(new_primary_x, new_primary_y, zoom_level)
-
-        # Calculate the actual offset after snapping
+        # Apply the snapped offset to all fields in one geometry transaction
         actual_offset_x = snapped_x - primary_field.x
         actual_offset_y = snapped_y - primary_field.y
-
-        # Apply the snapped offset to all fields
-        for field in fields:
-            field.x += actual_offset_x
-            field.y += actual_offset_y
+        self.field_manager.move_fields(fields, actual_offset_x, actual_offset_y)
 
         print(f"🧲 Snapped {len(fields)} fields with offset ({actual_offset_x:.1f}, {actual_offset_y:.1f})")
 
@@ -429,6 +472,11 @@ class EnhancedDragHandler(QObject):
         print(f"🚀 Starting drag operation with {len(self.get_selected_fields())} fields")
 
         self.is_dragging = True
+
+        # Snapshot of the other fields' edges for alignment guides
+        if self.alignment_guides_enabled and hasattr(self.field_manager, 'build_edge_index'):
+            self.edge_index = self.field_manager.build_edge_index(self.get_selected_fields())
+
         self.drag_overlay.start_drag(
             self.get_selected_fields(),
             self.drag_start_pos,
@@ -471,6 +519,9 @@ class EnhancedDragHandler(QObject):
         if not self.is_dragging:
             return False
 
+        # The release position supersedes any move still waiting for its frame
+        self.frame_scheduler.cancel()
+
         # End drag operation
         was_dragging = self.drag_overlay.end_drag()
 
@@ -482,8 +533,11 @@ class EnhancedDragHandler(QObject):
                 pos = QPoint(int(snapped_x), int(snapped_y))
                 print(f"🧲 Final snap position: ({snapped_x:.1f}, {snapped_y:.1f})")
 
+            # An alignment guide match wins over grid snapping of the individual fields
+            pos, guides = self._align_to_guides(pos)
+
             # Apply drag changes to actual fields
-            self.apply_drag_changes(pos)
+            self.apply_drag_changes(pos, snap=not guides)
 
             for field in self.get_selected_fields():
                 self.fieldMoved.emit(field.id, field.x, field.y)
@@ -498,6 +552,7 @@ class EnhancedDragHandler(QObject):
 
 
         self.is_dragging = False
+        self.edge_index = None
         return was_dragging
 
     def select_field(self, field):
@@ -511,6 +566,13 @@ class EnhancedDragHandler(QObject):
         except Exception as e:
             print(f"⚠️ Error in select_field: {e}")
 
+    def _redraw_selection(self):
+        """Repaint after a selection change (only the selection layer when the canvas has one)"""
+        if hasattr(self.canvas, 'draw_selection_overlay'):
+            self.canvas.draw_selection_overlay()
+        else:
+            self.canvas.draw_overlay()
+
     def get_selected_field(self):
         """Get the first selected field (delegates to field_manager)"""
         try:
@@ -743,128 +805,46 @@ class EnhancedDragHandler(QObject):
 
         print(f"✅ Updated {len(selected_fields)} field positions")
 
-    def apply_drag_changes(self, final_pos: QPoint):
+    def apply_drag_changes(self, final_pos: QPoint, snap: bool = True):
         """
-        Apply drag offset to actual field positions with snap support
-        FIXED: Added snap to grid functionality, kept zoom handling as-is
+        Apply drag offset to actual field positions with snap support (unless snap is False)
+
+        All selected fields are moved (and snapped) as one batch: the spatial
+        index is updated once per field and the canvas gets one change signal.
+        fieldMoved is emitted by handle_mouse_release.
         """
         selected_fields = self.get_selected_fields()
         if not selected_fields:
             return
 
-        print(f"🎯 Applying drag changes:")
-        print(f"   Drag start pos: {self.drag_start_pos}")
-        print(f"   Final pos: {final_pos}")
-        print(f"   Zoom level: {self.zoom_level}")
+        print(f"🎯 Applying drag changes: start {self.drag_start_pos} → final {final_pos} (zoom {self.zoom_level})")
 
         # ⭐ APPLY SNAP TO FINAL POSITION FIRST ⭐
         snapped_final_pos = final_pos
-        if self._should_snap():
+        should_snap = snap and self._should_snap()
+        if should_snap:
             zoom = getattr(self, 'zoom_level', 1.0)
             snapped_x, snapped_y = self.snap_point_to_grid(final_pos.x(), final_pos.y(), zoom)
             snapped_final_pos = QPoint(int(snapped_x), int(snapped_y))
             print(f"🧲 SNAP: Final pos {final_pos} → snapped to {snapped_final_pos}")
-        else:
-            print(f"🧲 SNAP: Not applied - _should_snap() = {self._should_snap()}")
 
         # Calculate screen offset using snapped final position
         screen_offset = snapped_final_pos - self.drag_start_pos
-        print(f"   Screen offset: {screen_offset}")
 
         # ⭐ KEEP ZOOM HANDLING AS-IS (commented out division) ⭐
         doc_offset_x = screen_offset.x()  # / self.zoom_level
         doc_offset_y = screen_offset.y()  # / self.zoom_level
         print(f"   Document offset: ({doc_offset_x:.1f}, {doc_offset_y:.1f})")
 
-        # Apply document offset to each field
-        for field in selected_fields:
-            original_x = field.x
-            original_y = field.y
-
-            # ⭐ ENHANCED SNAP LOGGING WITH MOVEMENT DETAILS ⭐
-            if self._should_snap():
-                # Calculate new position
-                new_x = original_x + doc_offset_x
-                new_y = original_y + doc_offset_y
-
-                # Snap the final field position
-                zoom = getattr(self, 'zoom_level', 1.0)
-
-                # Add this BEFORE the snap calculation in your method:
-                print(f"🔍 SNAP DEBUG FOR {field.id}:")
-                print(f"   Original field position: ({original_x:.1f}, {original_y:.1f})")
-                print(f"   Field size: {field.width}x{field.height}")
-                print(f"   Current field bounds:")
-                print(f"     Left: {original_x:.1f}, Right: {original_x + field.width:.1f}")
-                print(f"     Top: {original_y:.1f}, Bottom: {original_y + field.height:.1f}")
-                print(f"   Target position before snap: ({new_x:.1f}, {new_y:.1f})")
-                print(f"   Target bounds before snap:")
-                print(f"     Left: {new_x:.1f}, Right: {new_x + field.width:.1f}")
-                print(f"     Top: {new_y:.1f}, Bottom: {new_y + field.height:.1f}")
-
-                # Your existing snap call:
-                snapped_new_x, snapped_new_y = self.snap_point_to_grid(new_x, new_y, zoom)
-
-                # Add this AFTER the snap calculation:
-                print(f"   Snapped position: ({snapped_new_x:.1f}, {snapped_new_y:.1f})")
-                print(f"   Snapped bounds:")
-                print(f"     Left: {snapped_new_x:.1f}, Right: {snapped_new_x + field.width:.1f}")
-                print(f"     Top: {snapped_new_y:.1f}, Bottom: {snapped_new_y + field.height:.1f}")
-                print(f"   Available grid lines:")
-                print(f"     Vertical: {self.grid_manager.vertical_lines[:10]}")
-                print(f"     Horizontal: {self.grid_manager.horizontal_lines[:10]}")
-
-                # Calculate movement distances
-                total_movement_x = snapped_new_x - original_x
-                total_movement_y = snapped_new_y - original_y
-                total_distance = (total_movement_x ** 2 + total_movement_y ** 2) ** 0.5
-
-                # Calculate snap adjustment
-                snap_adjustment_x = snapped_new_x - new_x
-                snap_adjustment_y = snapped_new_y - new_y
-                snap_adjustment_distance = (snap_adjustment_x ** 2 + snap_adjustment_y ** 2) ** 0.5
-
-                print(f"🧲 FIELD '{field.id}' MOVEMENT SUMMARY:")
-                print(f"   📍 Original position: ({original_x:.1f}, {original_y:.1f})")
-                print(f"   📍 Target position:   ({new_x:.1f}, {new_y:.1f})")
-                print(f"   📍 Snapped position:  ({snapped_new_x:.1f}, {snapped_new_y:.1f})")
-                print(
-                    f"   📏 Total movement:    ({total_movement_x:+.1f}, {total_movement_y:+.1f}) = {total_distance:.1f}px")
-                print(
-                    f"   🧲 Snap adjustment:   ({snap_adjustment_x:+.1f}, {snap_adjustment_y:+.1f}) = {snap_adjustment_distance:.1f}px")
-
-                # Update field position
-                field.x = snapped_new_x
-                field.y = snapped_new_y
-
-            else:
-                # Normal positioning without snap
-                new_x = original_x + doc_offset_x
-                new_y = original_y + doc_offset_y
-
-                # Calculate movement distances
-                total_movement_x = new_x - original_x
-                total_movement_y = new_y - original_y
-                total_distance = (total_movement_x ** 2 + total_movement_y ** 2) ** 0.5
-
-                print(f"📍 FIELD '{field.id}' MOVEMENT (NO SNAP):")
-                print(f"   📍 Original position: ({original_x:.1f}, {original_y:.1f})")
-                print(f"   📍 Final position:    ({new_x:.1f}, {new_y:.1f})")
-                print(
-                    f"   📏 Total movement:    ({total_movement_x:+.1f}, {total_movement_y:+.1f}) = {total_distance:.1f}px")
-
-                # Update field position
-                field.x = new_x
-                field.y = new_y
-
-            # 🔥 ADD THIS DEBUG LINE:
-            print(f"🚨 DEBUG: About to emit fieldMoved signal for {field.id} at ({field.x:.1f}, {field.y:.1f})")
-
-            # Emit field moved signal
-            self.fieldMoved.emit(field.id, float(field.x), float(field.y))
-
+        if should_snap:
+            # Offset every field, then snap each target position to the grid
+            moved = self.field_manager.snap_fields(
+                selected_fields,
+                lambda xs, ys: self.grid_manager.snap_points_to_grid(xs + doc_offset_x, ys + doc_offset_y))
+        else:
+            moved = self.field_manager.move_fields(selected_fields, doc_offset_x, doc_offset_y)
 
-        print(f"✅ Updated {len(selected_fields)} field positions")
+        print(f"✅ Updated {moved}/{len(selected_fields)} field positions")
 
     def working_1_apply_drag_changes(self, final_pos: QPoint):
         """
@@ -1008,7 +988,9 @@ class EnhancedDragHandler(QObject):
             if hasattr(self, 'is_dragging') and self.is_dragging:
                 if hasattr(self, 'drag_overlay') and self.drag_overlay:
                     self.drag_overlay.cancel_drag()
+                self.frame_scheduler.cancel()
                 self.is_dragging = False
+                self.edge_index = None
                 print("✅ Cancelled drag operation")
 
         except Exception as e:
@@ -3,16 +3,34 @@ Enhanced Field Renderer with Appearance Support
 Updated field renderer that applies font, border, and background appearance properties
 """
 
-from typing import List, Optional, Dict, Any
-from PyQt6.QtGui import QPainter, QPen, QBrush, QColor, QFont
-from PyQt6.QtCore import Qt, QRect
+from math import ceil
+from typing import List, Optional, Dict, Any, Tuple
+from PyQt6.QtGui import QPainter, QPen, QBrush, QColor, QFont, QPicture, QPixmap
+from PyQt6.QtCore import Qt, QRect, QPoint
 
 from models.field_model import FormField, FieldType
+from ui.paint_object_cache import PaintObjectCache
 
 
 class EnhancedFieldRenderer:
     """Enhanced field renderer with appearance property support"""
 
+    BORDER_WIDTHS = {
+        'hairline': 0.5,
+        'thin': 1,
+        'medium': 2,
+        'thick': 3
+    }
+    PEN_STYLES = {
+        'solid': Qt.PenStyle.SolidLine,
+        'dashed': Qt.PenStyle.DashLine,
+        'dotted': Qt.PenStyle.DotLine
+    }
+
+    # Fields shorter than this on screen (pixels) are drawn as plain blocks - text,
+    # name labels and icons would be sub-pixel noise
+    DEFAULT_DETAIL_THRESHOLD = 12
+
     def __init__(self):
         # Default colors (fallback when no appearance properties)
         self.default_selection_color = QColor(0, 120, 215)
@@ -21,6 +39,25 @@ class EnhancedFieldRenderer:
         self.default_normal_bg_color = QColor(255, 255, 255, 150)
         self.default_text_color = QColor(0, 0, 0)
         self.default_font = QFont("Arial", 12)
+        self.label_bg_color = QColor(0, 0, 0, 127)  # Black with 50% opacity (127 out of 255)
+        self.label_text_color = QColor(255, 255, 255, 127)  # White with 50% opacity (127 out of 255)
+        self.handle_color = QColor(0, 120, 215)
+        self.handle_bg_color = QColor(255, 255, 255)
+
+        # Fonts, pens and brushes shared between identically styled fields
+        self.paint_cache = PaintObjectCache()
+
+        # Level of detail
+        self.detail_threshold = self.DEFAULT_DETAIL_THRESHOLD
+        self.block_fields_drawn = 0
+        self.block_batches_drawn = 0
+        self.detailed_fields_drawn = 0
+
+        # Pre-rendered field pixmaps: page -> id(field) -> entry (see _draw_cached_field)
+        self.pixmap_cache_enabled = True
+        self._pixmaps: Dict[int, Dict[int, Tuple]] = {}
+        self.pixmap_hits = 0
+        self.pixmap_misses = 0
 
     def render_fields(self, painter: QPainter, fields: List[FormField],
                       selected_field: Optional[FormField] = None, current_page: int = 0,
@@ -31,9 +68,184 @@ class EnhancedFieldRenderer:
         # Filter fields for current page
         page_fields = [field for field in fields if getattr(field, 'page_number', 0) == current_page]
 
+        # Level of detail: small unselected fields collapse into batched blocks
+        detailed_fields = []
+        blocks = {}
         for field in page_fields:
-            is_selected = field == selected_field
-            self.render_single_field(painter, field, is_selected, zoom_level, coord_transform_func)
+            if field is not selected_field and not self.is_detailed(field, zoom_level, coord_transform_func):
+                self._collect_block(blocks, field, zoom_level, coord_transform_func)
+            else:
+                detailed_fields.append(field)
+
+        if blocks:
+            self._draw_blocks(painter, blocks)
+        self.detailed_fields_drawn += len(detailed_fields)
+
+        if not self.pixmap_cache_enabled or not coord_transform_func:
+            for field in detailed_fields:
+                is_selected = field == selected_field
+                self.render_single_field(painter, field, is_selected, zoom_level, coord_transform_func)
+            return
+
+        page_cache = self._pixmaps.setdefault(current_page, {})
+        for field in detailed_fields:
+            self._draw_cached_field(painter, page_cache, field, field == selected_field,
+                                    zoom_level, coord_transform_func)
+
+    # ========================================
+    # LEVEL OF DETAIL
+    # ========================================
+
+    def is_detailed(self, field: FormField, zoom_level: float = 1.0, coord_transform_func=None) -> bool:
+        """True when the field is tall enough on screen for text, labels and icons"""
+        screen_height = field.height * zoom_level if coord_transform_func else field.height
+        return screen_height >= self.detail_threshold
+
+    def _collect_block(self, blocks: Dict[Tuple, Tuple], field: FormField, zoom_level: float,
+                       coord_transform_func):
+        """Add the field's screen rect to the batch for its fill/border style"""
+        if coord_transform_func:
+            screen_coords = coord_transform_func(getattr(field, 'page_number', 0), field.x, field.y)
+            if not screen_coords:
+                return
+            rect = QRect(int(screen_coords[0]), int(screen_coords[1]),
+                         int(field.width * zoom_level), int(field.height * zoom_level))
+        else:
+            rect = QRect(int(field.x), int(field.y), int(field.width), int(field.height))
+
+        appearance = field.properties.get('appearance', {})
+
+        fill = appearance.get('background_color')
+        if not isinstance(fill, QColor):
+            fill = self.default_normal_bg_color
+        border = appearance.get('border', {}).get('color')
+        if not isinstance(border, QColor):
+            border = self.default_normal_color
+
+        key = (fill.rgba(), border.rgba())
+        batch = blocks.get(key)
+        if batch is None:
+            batch = blocks[key] = (fill, border, [])
+        batch[2].append(rect)
+
+    def _draw_blocks(self, painter: QPainter, blocks: Dict[Tuple, Tuple]):
+        """One drawRects call per fill/border style"""
+        painter.save()
+        for fill, border, rects in blocks.values():
+            if border.alpha() == 0:
+                painter.setPen(Qt.PenStyle.NoPen)
+            else:
+                painter.setPen(self.paint_cache.pen(border))
+            if fill.alpha() == 0:
+                painter.setBrush(Qt.BrushStyle.NoBrush)
+            else:
+                painter.setBrush(self.paint_cache.brush(fill))
+            painter.drawRects(rects)
+            self.block_fields_drawn += len(rects)
+            self.block_batches_drawn += 1
+        painter.restore()
+
+    def get_lod_stats(self) -> dict:
+        """Level-of-detail statistics"""
+        return {
+            'detail_threshold': self.detail_threshold,
+            'block_fields': self.block_fields_drawn,
+            'block_batches': self.block_batches_drawn,
+            'detailed_fields': self.detailed_fields_drawn
+        }
+
+    # ========================================
+    # PIXMAP CACHE
+    # ========================================
+
+    def _draw_cached_field(self, painter: QPainter, page_cache: Dict[int, Tuple], field: FormField,
+                           is_selected: bool, zoom_level: float, coord_transform_func):
+        """Blit the field's pre-rendered pixmap, rendering it first if the field changed"""
+        screen_coords = coord_transform_func(getattr(field, 'page_number', 0), field.x, field.y)
+        if not screen_coords:
+            return
+        origin = QPoint(int(screen_coords[0]), int(screen_coords[1]))
+        device = painter.device()
+        pixel_ratio = device.devicePixelRatioF() if device is not None else 1.0
+
+        version = getattr(field, 'version', None)
+        entry = page_cache.get(id(field))
+        if (entry is not None and entry[0] is field and version is not None and
+                entry[1] == version and entry[2] == zoom_level and entry[3] == is_selected and
+                entry[4].devicePixelRatio() == pixel_ratio):
+            pixmap, bounds = entry[4], entry[5]
+            self.pixmap_hits += 1
+        else:
+            pixmap, bounds = self._rasterize_field(field, is_selected, zoom_level, pixel_ratio)
+            self.pixmap_misses += 1
+
+        page_cache[id(field)] = (field, version, zoom_level, is_selected, pixmap, bounds, origin)
+        painter.drawPixmap(origin + bounds.topLeft(), pixmap)
+
+    def _rasterize_field(self, field: FormField, is_selected: bool, zoom_level: float,
+                         pixel_ratio: float) -> Tuple[QPixmap, QRect]:
+        """Field drawing as a transparent pixmap and its field-local bounds (name label included)"""
+        # Record once in field-local coordinates to measure the drawing, then rasterize the recording
+        picture = QPicture()
+        recorder = QPainter(picture)
+        try:
+            recorder.setRenderHint(QPainter.RenderHint.Antialiasing)
+            self.render_single_field(recorder, field, is_selected, zoom_level, lambda page, x, y: (0, 0))
+        finally:
+            recorder.end()
+
+        bounds = picture.boundingRect().adjusted(-1, -1, 1, 1)  # Room for antialiased edges
+        pixmap = QPixmap(max(1, ceil(bounds.width() * pixel_ratio)), max(1, ceil(bounds.height() * pixel_ratio)))
+        pixmap.setDevicePixelRatio(pixel_ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        rasterizer = QPainter(pixmap)
+        try:
+            rasterizer.drawPicture(-bounds.left(), -bounds.top(), picture)
+        finally:
+            rasterizer.end()
+        return pixmap, bounds
+
+    def get_field_bounds(self, field: FormField) -> Optional[QRect]:
+        """Screen rect covered by the field's last drawing (name label included), None if not cached"""
+        page_cache = self._pixmaps.get(getattr(field, 'page_number', 0))
+        entry = page_cache.get(id(field)) if page_cache else None
+        if entry is None or entry[0] is not field:
+            return None
+        return entry[5].translated(entry[6])
+
+    def get_cached_fields_in_rect(self, page_num: int, rect: QRect) -> List[FormField]:
+        """Fields of a page whose last drawing touches a screen rect"""
+        return [entry[0] for entry in self._pixmaps.get(page_num, {}).values()
+                if entry[5].translated(entry[6]).intersects(rect)]
+
+    def invalidate_field(self, field_id: str):
+        """Drop the cached pixmap of a removed field"""
+        for page_cache in self._pixmaps.values():
+            for key in [key for key, entry in page_cache.items() if entry[0].id == field_id]:
+                del page_cache[key]
+
+    def clear_pixmap_cache(self, page_num: Optional[int] = None):
+        """Drop cached field pixmaps of one page (all pages if None)"""
+        if page_num is None:
+            self._pixmaps.clear()
+        else:
+            self._pixmaps.pop(page_num, None)
+
+    def get_cache_stats(self) -> dict:
+        """Pixmap cache and font/pen/brush cache statistics"""
+        lookups = self.pixmap_hits + self.pixmap_misses
+        return {
+            'paint_objects': self.paint_cache.get_stats(),
+            'enabled': self.pixmap_cache_enabled,
+            'pages': len(self._pixmaps),
+            'pixmaps': sum(len(page_cache) for page_cache in self._pixmaps.values()),
+            'hits': self.pixmap_hits,
+            'misses': self.pixmap_misses,
+            'hit_rate': (self.pixmap_hits / lookups * 100) if lookups else 0.0,
+            'pixmap_bytes': sum(entry[4].width() * entry[4].height() * entry[4].depth() // 8
+                                for page_cache in self._pixmaps.values() for entry in page_cache.values())
+        }
 
     def render_single_field(self, painter: QPainter, field: FormField, is_selected: bool = False,
                             zoom_level: float = 1.0, coord_transform_func=None):
@@ -111,30 +323,19 @@ class EnhancedFieldRenderer:
             border_color = self.default_selection_color if is_selected else self.default_normal_color
 
         # Border width
-        border_width_map = {
-            'hairline': 0.5,
-            'thin': 1,
-            'medium': 2,
-            'thick': 3
-        }
-        border_width = border_width_map.get(border_props.get('width', 'thin'), 1)
+        border_width = self.BORDER_WIDTHS.get(border_props.get('width', 'thin'), 1)
         if is_selected:
             border_width = max(border_width, 2)  # Selection always at least 2px
 
         # Border style
         border_style = border_props.get('style', 'solid')
-        pen_style_map = {
-            'solid': Qt.PenStyle.SolidLine,
-            'dashed': Qt.PenStyle.DashLine,
-            'dotted': Qt.PenStyle.DotLine
-        }
-        pen_style = pen_style_map.get(border_style, Qt.PenStyle.SolidLine)
+        pen_style = self.PEN_STYLES.get(border_style, Qt.PenStyle.SolidLine)
 
         # Convert coordinates to integers
         x, y, width, height = int(x), int(y), int(width), int(height)
 
         # Set pen and draw border
-        painter.setPen(QPen(border_color, border_width, pen_style))
+        painter.setPen(self.paint_cache.pen(border_color, border_width, pen_style))
 
         if border_style == 'underline':
             # Draw only bottom line for underline style
@@ -146,18 +347,18 @@ class EnhancedFieldRenderer:
 
             if border_style == 'beveled':
                 # Raised effect
-                painter.setPen(QPen(light_color, border_width))
+                painter.setPen(self.paint_cache.pen(light_color, border_width))
                 painter.drawLine(x, y, x + width - 1, y)  # Top
                 painter.drawLine(x, y, x, y + height - 1)  # Left
-                painter.setPen(QPen(dark_color, border_width))
+                painter.setPen(self.paint_cache.pen(dark_color, border_width))
                 painter.drawLine(x + width - 1, y, x + width - 1, y + height - 1)  # Right
                 painter.drawLine(x, y + height - 1, x + width - 1, y + height - 1)  # Bottom
             else:  # inset
                 # Depressed effect
-                painter.setPen(QPen(dark_color, border_width))
+                painter.setPen(self.paint_cache.pen(dark_color, border_width))
                 painter.drawLine(x, y, x + width - 1, y)  # Top
                 painter.drawLine(x, y, x, y + height - 1)  # Left
-                painter.setPen(QPen(light_color, border_width))
+                painter.setPen(self.paint_cache.pen(light_color, border_width))
                 painter.drawLine(x + width - 1, y, x + width - 1, y + height - 1)  # Right
                 painter.drawLine(x, y + height - 1, x + width - 1, y + height - 1)  # Bottom
         else:
@@ -179,9 +380,9 @@ class EnhancedFieldRenderer:
 
         # Set text color
         if isinstance(text_color, QColor):
-            painter.setPen(QPen(text_color))
+            painter.setPen(self.paint_cache.pen(text_color))
         else:
-            painter.setPen(QPen(self.default_text_color))
+            painter.setPen(self.paint_cache.pen(self.default_text_color))
 
         # Convert coordinates to integers
         x, y, width, height = int(x), int(y), int(width), int(height)
@@ -218,8 +419,7 @@ class EnhancedFieldRenderer:
 
         # Calculate font size based on zoom
         font_size = max(8, int(8 * zoom_level))
-        name_font = QFont("Arial", font_size)
-        painter.setFont(name_font)
+        painter.setFont(self.paint_cache.font("Arial", font_size))
 
         # Measure text dimensions
         font_metrics = painter.fontMetrics()
@@ -240,12 +440,10 @@ class EnhancedFieldRenderer:
 
         # Draw black background box with 50% opacity
         box_rect = QRect(box_x, box_y, box_width, box_height)
-        black_bg = QColor(0, 0, 0, 127)  # Black with 50% opacity (127 out of 255)
-        painter.fillRect(box_rect, black_bg)
+        painter.fillRect(box_rect, self.label_bg_color)
 
         # Draw white text with 50% opacity
-        white_text = QColor(255, 255, 255, 127)  # White with 50% opacity (127 out of 255)
-        painter.setPen(QPen(white_text))
+        painter.setPen(self.paint_cache.pen(self.label_text_color))
         text_x = box_x + padding_x
         text_y = box_y + padding_y + font_metrics.ascent()
         painter.drawText(text_x, text_y, field.name)
@@ -267,11 +465,7 @@ class EnhancedFieldRenderer:
             # Scale with zoom
             size = max(8, int(size * zoom_level))
 
-        font = QFont(family, size)
-        font.setBold(bold)
-        font.setItalic(italic)
-
-        return font
+        return self.paint_cache.font(family, size, bold, italic)
 
     def _get_text_alignment_flag(self, alignment: str) -> Qt.AlignmentFlag:
         """Convert text alignment string to Qt flag"""
@@ -548,14 +742,12 @@ class EnhancedFieldRenderer:
     def _render_resize_handles(self, painter: QPainter, x: float, y: float, width: float, height: float):
         """Render resize handles for selected field"""
         handle_size = 8
-        handle_color = QColor(0, 120, 215)
-        handle_bg_color = QColor(255, 255, 255)
 
         # Convert to integers
         x, y, width, height = int(x), int(y), int(width), int(height)
 
-        painter.setPen(QPen(handle_color, 1))
-        painter.setBrush(QBrush(handle_bg_color))
+        painter.setPen(self.paint_cache.pen(self.handle_color, 1))
+        painter.setBrush(self.paint_cache.brush(self.handle_bg_color))
 
         # Handle positions: corners and midpoints
         positions = [
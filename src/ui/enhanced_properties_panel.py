@@ -1381,12 +1381,7 @@ class EnhancedPropertiesPanel(QWidget):
         if not self.field_manager:
             return False  # Can't check if no field manager
 
-        existing_names = []
-        for field in self.field_manager.get_all_fields():
-            if exclude_control_id is None or field.id != exclude_control_id:
-                existing_names.append(field.name.lower())
-
-        return name.lower() in existing_names
+        return self.field_manager.is_name_duplicate(name, exclude_control_id)
 
     def _get_field_manager(self):
         """Get field manager from parent hierarchy"""
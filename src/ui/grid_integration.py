@@ -399,8 +399,8 @@ class GridIntegrator(QObject):
         original_toggle_grid = getattr(self.pdf_canvas, 'toggle_grid', None)
 
         # Enhanced grid drawing method (PROPERLY INDENTED INSIDE THE METHOD)
-        def enhanced_draw_grid(painter):
-            """Enhanced grid drawing using GridManager with page boundaries"""
+        def enhanced_draw_grid(painter, area=None):
+            """Enhanced grid drawing using GridManager with page boundaries (limited to area if given)"""
             if hasattr(self.pdf_canvas, 'page_pixmap') and self.pdf_canvas.page_pixmap:
                 width = self.pdf_canvas.page_pixmap.width()
                 height = self.pdf_canvas.page_pixmap.height()
@@ -408,7 +408,7 @@ class GridIntegrator(QObject):
 
                 # Pass canvas for page boundary support
                 self.grid_manager.draw_grid(painter, width, height, zoom_level,
-                                            canvas=self.pdf_canvas)
+                                            canvas=self.pdf_canvas, viewport_rect=area)
             else:
                 print("🚫 Enhanced draw_grid: No page_pixmap available")
 
@@ -7,10 +7,15 @@ Integrates with existing GridControlPopup and PDF Canvas architecture
 from PyQt6.QtWidgets import QColorDialog
 from PyQt6.QtCore import QObject, pyqtSignal, QTimer
 from PyQt6.QtGui import QColor, QPainter, QPen, QBrush
+from bisect import bisect_left
 from dataclasses import dataclass
 from typing import Optional, Tuple, Dict, Any
 import json
 
+import numpy as np
+
+from .grid_tiles import GridTileCache
+
 
 @dataclass
 class GridSettings:
@@ -108,10 +113,13 @@ class GridManager(QObject):
         self.update_timer.setSingleShot(True)
         self.update_timer.timeout.connect(self._emit_grid_changed)
 
-        self.vertical_lines = []  # X coordinates of vertical lines
-        self.horizontal_lines = []  # Y coordinates of horizontal lines
+        self.vertical_lines = []  # X coordinates of vertical lines (sorted)
+        self.horizontal_lines = []  # Y coordinates of horizontal lines (sorted)
         self.lines_valid = False  # Flag to track if arrays are current
 
+        # Precomputed line sets per (spacing, offset, zoom, page size)
+        self.tile_cache = GridTileCache()
+
     # =========================
     # CORE GRID FUNCTIONALITY
     # =========================
@@ -306,9 +314,9 @@ class GridManager(QObject):
             print("⚠️ Grid arrays empty - no lines available for snapping")
             return (x, y)
 
-        # Simple linear search (fast enough for typical grid sizes)
-        nearest_vertical = min(self.vertical_lines, key=lambda vx: abs(vx - x))
-        nearest_horizontal = min(self.horizontal_lines, key=lambda hy: abs(hy - y))
+        # Bisect the sorted line positions captured by the last draw
+        nearest_vertical = self._nearest_line(self.vertical_lines, x)
+        nearest_horizontal = self._nearest_line(self.horizontal_lines, y)
 
         distance = ((nearest_vertical - x) ** 2 + (nearest_horizontal - y) ** 2) ** 0.5
 
@@ -324,6 +332,43 @@ class GridManager(QObject):
             print(f"🚫 NO SNAP: distance {distance:.1f}px > threshold {max_snap_distance:.1f}px")
             return (x, y)
 
+    def snap_points_to_grid(self, xs, ys, max_snap_distance: float = 25.0):
+        """
+        Vectorized snap_point_to_grid for many points (e.g. all dragged fields)
+
+        Returns (xs, ys) arrays; points farther than max_snap_distance from the
+        nearest grid intersection are left where they are.
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        if (not self.settings.snap_enabled or not self.settings.visible or not self.lines_valid
+                or not self.vertical_lines or not self.horizontal_lines):
+            return xs, ys
+
+        nearest_x = self._nearest_lines(np.asarray(self.vertical_lines, dtype=np.float64), xs)
+        nearest_y = self._nearest_lines(np.asarray(self.horizontal_lines, dtype=np.float64), ys)
+        within = np.hypot(nearest_x - xs, nearest_y - ys) <= max_snap_distance
+        return np.where(within, nearest_x, xs), np.where(within, nearest_y, ys)
+
+    @staticmethod
+    def _nearest_lines(lines: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """Closest position in a sorted, non-empty array for each value (ties go to the lower line)"""
+        after = np.clip(np.searchsorted(lines, values, side='left'), 0, len(lines) - 1)
+        before = np.clip(after - 1, 0, len(lines) - 1)
+        use_before = (values - lines[before]) <= (lines[after] - values)
+        return np.where(use_before, lines[before], lines[after])
+
+    @staticmethod
+    def _nearest_line(lines: list, value: float) -> float:
+        """Closest position in a sorted, non-empty list"""
+        index = bisect_left(lines, value)
+        if index == 0:
+            return lines[0]
+        if index == len(lines):
+            return lines[-1]
+        before, after = lines[index - 1], lines[index]
+        return before if value - before <= after - value else after
+
     # =========================
     # ZOOM
     # =========================
@@ -508,8 +553,10 @@ class GridManager(QObject):
             if hasattr(canvas, 'grid_offset_y'):
                 canvas.grid_offset_y = settings.offset_y
 
-        # Force canvas to redraw
-        if hasattr(canvas, 'draw_overlay'):
+        # Force canvas to redraw (only the grid layer when the canvas has one)
+        if hasattr(canvas, 'redraw_grid'):
+            canvas.redraw_grid()
+        elif hasattr(canvas, 'draw_overlay'):
             canvas.draw_overlay()
         elif hasattr(canvas, 'update'):
             canvas.update()
@@ -602,13 +649,9 @@ class GridManager(QObject):
         pages_drawn = 0
         total_lines = 0
 
-        # Clear and rebuild line arrays
-        self.vertical_lines.clear()
-        self.horizontal_lines.clear()
-
-        # Use sets during collection to avoid duplicates efficiently
-        vertical_set = set()
-        horizontal_set = set()
+        # Line positions per page (screen coordinates), merged for snapping at the end
+        vertical_parts = []
+        horizontal_parts = []
 
         # Determine drawing bounds (viewport or full canvas)
         if viewport_rect:
@@ -616,30 +659,17 @@ class GridManager(QObject):
             draw_right = viewport_rect.right()
             draw_top = viewport_rect.top()
             draw_bottom = viewport_rect.bottom()
-            print(f"🎯 Drawing grid in viewport: {viewport_rect}")
         else:
             draw_left = 0
             draw_right = getattr(canvas, 'width', lambda: 2000)()
             draw_top = 0
             draw_bottom = getattr(canvas, 'height', lambda: 2000)()
-            print(f"🎯 Drawing grid for full canvas: {draw_right}x{draw_bottom}")
 
-        # Process each page
-        for page_num, page_top in enumerate(canvas.page_positions):
-            if page_num >= len(canvas.pdf_document):
-                continue
-
-            # Quick viewport culling - skip pages completely outside viewport
-            if viewport_rect and page_top > draw_bottom:
-                break  # All subsequent pages are below viewport
-
-            # Get page dimensions
-            page = canvas.pdf_document[page_num]
-            page_width = int(page.rect.width * zoom_level)
-            page_height = int(page.rect.height * zoom_level)
+        page_left = getattr(canvas, 'page_margin_left', 15)  # Standard margin
 
+        for page_num, page_top, page_width, page_height in self._iter_page_bounds(
+                canvas, zoom_level, draw_top, draw_bottom):
             # Page boundaries in screen coordinates
-            page_left = getattr(canvas, 'page_margin_left', 15)  # Standard margin
             page_right = page_left + page_width
             page_bottom = page_top + page_height
 
@@ -656,58 +686,49 @@ class GridManager(QObject):
             clip_top = max(page_top, draw_top)
             clip_bottom = min(page_bottom, draw_bottom)
 
-            # Calculate grid start positions for this page
-            # Grid starts from page top-left corner, then apply offset
-            if effective_offset_x % effective_spacing == 0:
-                grid_origin_x = page_left
-            else:
-                grid_origin_x = page_left + (effective_offset_x % effective_spacing)
-
-            if effective_offset_y % effective_spacing == 0:
-                grid_origin_y = page_top
-            else:
-                grid_origin_y = page_top + (effective_offset_y % effective_spacing)
-
-            # Draw and capture vertical lines for this page
-            first_x = grid_origin_x
-            if clip_left > grid_origin_x:
-                # Optimize: jump to first visible line
-                lines_to_skip = (clip_left - grid_origin_x) // effective_spacing
-                first_x = grid_origin_x + (lines_to_skip * effective_spacing)
-
-            x = first_x
-            while x <= clip_right:
-                if x >= clip_left:
-                    painter.drawLine(x, clip_top, x, clip_bottom)
-                    vertical_set.add(x)  # Capture line position in set
-                    total_lines += 1
-                x += effective_spacing
-
-            # Draw and capture horizontal lines for this page
-            first_y = grid_origin_y
-            if clip_top > grid_origin_y:
-                # Optimize: jump to first visible line
-                lines_to_skip = (clip_top - grid_origin_y) // effective_spacing
-                first_y = grid_origin_y + (lines_to_skip * effective_spacing)
-
-            y = first_y
-            while y <= clip_bottom:
-                if y >= clip_top:
-                    painter.drawLine(clip_left, y, clip_right, y)
-                    horizontal_set.add(y)  # Capture line position in set
-                    total_lines += 1
-                y += effective_spacing
-
-        # Convert sets to sorted lists once at the end
-        self.vertical_lines = sorted(vertical_set)
-        self.horizontal_lines = sorted(horizontal_set)
+            # Lines of this page size, bisected down to the visible part
+            tile = self.tile_cache.get(effective_spacing, effective_offset_x, effective_offset_y,
+                                       zoom_level, page_width, page_height)
+            x0, x1 = tile.x_range(clip_left - page_left, clip_right - page_left)
+            y0, y1 = tile.y_range(clip_top - page_top, clip_bottom - page_top)
+
+            painter.save()
+            painter.setClipRect(clip_left, clip_top, clip_right - clip_left + 1, clip_bottom - clip_top + 1)
+            painter.translate(page_left, page_top)
+            if x1 > x0:
+                painter.drawLines(tile.vertical[x0:x1])
+            if y1 > y0:
+                painter.drawLines(tile.horizontal[y0:y1])
+            painter.restore()
+
+            vertical_parts.append(tile.xs[x0:x1] + page_left)
+            horizontal_parts.append(tile.ys[y0:y1] + page_top)
+            total_lines += (x1 - x0) + (y1 - y0)
+
+        # Sorted, de-duplicated positions for snapping
+        self.vertical_lines = np.unique(np.concatenate(vertical_parts)).tolist() if vertical_parts else []
+        self.horizontal_lines = np.unique(np.concatenate(horizontal_parts)).tolist() if horizontal_parts else []
         self.lines_valid = True
 
         print(f"🎯 Drew {total_lines} grid lines across {pages_drawn} pages at {zoom_level:.1f}x zoom")
-        print(
-            f"📏 Captured {len(self.vertical_lines)} vertical lines: {self.vertical_lines[:5] if self.vertical_lines else 'none'}...")
-        print(
-            f"📏 Captured {len(self.horizontal_lines)} horizontal lines: {self.horizontal_lines[:5] if self.horizontal_lines else 'none'}...")
+
+    def _iter_page_bounds(self, canvas, zoom_level: float, draw_top: float, draw_bottom: float):
+        """(page, top, width, height) in screen pixels for pages that may touch [draw_top, draw_bottom]"""
+        layout_index = getattr(canvas, 'layout_index', None)
+        if layout_index is not None and len(layout_index) == len(canvas.page_positions) and layout_index.widths:
+            # Sizes come from the canvas' layout index - no per-page document access
+            for page_num in layout_index.pages_in_range(draw_top, draw_bottom):
+                yield (page_num, layout_index.tops[page_num],
+                       int(layout_index.widths[page_num]), int(layout_index.heights[page_num]))
+            return
+
+        for page_num, page_top in enumerate(canvas.page_positions):
+            if page_num >= len(canvas.pdf_document):
+                continue
+            if page_top > draw_bottom:
+                break  # All subsequent pages are below the drawing bounds
+            page = canvas.pdf_document[page_num]
+            yield page_num, page_top, int(page.rect.width * zoom_level), int(page.rect.height * zoom_level)
 
     def _modified_draw_page_bounded_grid(self, painter: QPainter, canvas, zoom_level: float,
                                 effective_spacing: int, effective_offset_x: int, effective_offset_y: int,
@@ -817,37 +838,15 @@ class GridManager(QObject):
                                effective_spacing: int, effective_offset_x: int, effective_offset_y: int):
         """Fallback method: draw grid across entire canvas"""
 
-        total_lines = 0
-
-        # Draw vertical lines
-        # modified start_x = effective_offset_x % effective_spacing
-
-        # Draw vertical lines
-        # Fix: Handle zero offset case
-        if effective_offset_x % effective_spacing == 0:
-            start_x = 0
-        else:
-            start_x = effective_offset_x % effective_spacing
-
-        for x in range(start_x, width, effective_spacing):
-            painter.drawLine(x, 0, x, height)
-            total_lines += 1
-
-        # Draw horizontal lines
-        # modified start_y = effective_offset_y % effective_spacing
-
-        # Draw horizontal lines
-        # Fix: Handle zero offset case
-        if effective_offset_y % effective_spacing == 0:
-            start_y = 0
-        else:
-            start_y = effective_offset_y % effective_spacing
-
-        for y in range(start_y, height, effective_spacing):
-            painter.drawLine(0, y, width, y)
-            total_lines += 1
+        # The whole canvas is one tile; lines exactly on the far edge are not drawn
+        tile = self.tile_cache.get(effective_spacing, effective_offset_x, effective_offset_y,
+                                   1.0, width, height)
+        x0, x1 = tile.x_range(0, width - 1)
+        y0, y1 = tile.y_range(0, height - 1)
+        painter.drawLines(tile.vertical[x0:x1])
+        painter.drawLines(tile.horizontal[y0:y1])
 
-        print(f"🎯 Drew {total_lines} grid lines (full canvas fallback)")
+        print(f"🎯 Drew {(x1 - x0) + (y1 - y0)} grid lines (full canvas fallback)")
 
     # Additional helper method for zoom-aware density control
     def _should_draw_grid_at_zoom(self, zoom_level: float) -> bool:
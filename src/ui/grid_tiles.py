@@ -0,0 +1,85 @@
+"""
+Grid Tiles
+Precomputed grid line sets for GridManager
+
+A page's grid only depends on spacing, offset, zoom and page size, so the line
+positions are generated once with NumPy and kept as a tile: sorted x/y arrays
+(used for culling and snapping by bisection) plus ready-made QLine lists for
+QPainter.drawLines. Tiles are in page-local coordinates and shared by every
+page of the same size.
+"""
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+from PyQt6.QtCore import QLine
+
+TileKey = Tuple[int, int, int, float, int, int]  # spacing, offset x, offset y, zoom, page width, page height
+
+
+class GridTile:
+    """Grid lines of one page size, page-local coordinates"""
+
+    __slots__ = ('width', 'height', 'xs', 'ys', 'vertical', 'horizontal')
+
+    def __init__(self, width: int, height: int, spacing: int, offset_x: int, offset_y: int):
+        self.width = width
+        self.height = height
+
+        # Lines start at the offset (modulo spacing) and run up to and including the page edge
+        self.xs = np.arange(offset_x % spacing, width + 1, spacing, dtype=np.int64)
+        self.ys = np.arange(offset_y % spacing, height + 1, spacing, dtype=np.int64)
+
+        vertical = np.column_stack((self.xs, np.zeros_like(self.xs), self.xs, np.full_like(self.xs, height)))
+        horizontal = np.column_stack((np.zeros_like(self.ys), self.ys, np.full_like(self.ys, width), self.ys))
+        self.vertical: List[QLine] = [QLine(*row) for row in vertical.tolist()]
+        self.horizontal: List[QLine] = [QLine(*row) for row in horizontal.tolist()]
+
+    def x_range(self, left: float, right: float) -> Tuple[int, int]:
+        """Slice of xs / vertical lines within [left, right] (page-local)"""
+        return (int(np.searchsorted(self.xs, left, side='left')),
+                int(np.searchsorted(self.xs, right, side='right')))
+
+    def y_range(self, top: float, bottom: float) -> Tuple[int, int]:
+        """Slice of ys / horizontal lines within [top, bottom] (page-local)"""
+        return (int(np.searchsorted(self.ys, top, side='left')),
+                int(np.searchsorted(self.ys, bottom, side='right')))
+
+    def line_count(self) -> int:
+        return len(self.vertical) + len(self.horizontal)
+
+
+class GridTileCache:
+    """Bounded tile cache keyed by (spacing, offset, zoom, page size)"""
+
+    def __init__(self, max_tiles: int = 32):
+        self.max_tiles = max_tiles
+        self._tiles: Dict[TileKey, GridTile] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, spacing: int, offset_x: int, offset_y: int, zoom: float,
+            width: int, height: int) -> GridTile:
+        key = (spacing, offset_x, offset_y, zoom, width, height)
+        tile = self._tiles.get(key)
+        if tile is not None:
+            self.hits += 1
+            return tile
+
+        self.misses += 1
+        if len(self._tiles) >= self.max_tiles:
+            self._tiles.clear()  # Settings changed enough to make old tiles useless
+        tile = self._tiles[key] = GridTile(width, height, spacing, offset_x, offset_y)
+        return tile
+
+    def clear(self):
+        self._tiles.clear()
+
+    def get_stats(self) -> dict:
+        """Tile cache statistics"""
+        return {
+            'tiles': len(self._tiles),
+            'lines': sum(tile.line_count() for tile in self._tiles.values()),
+            'hits': self.hits,
+            'misses': self.misses
+        }
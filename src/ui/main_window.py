@@ -299,33 +299,17 @@ class PDFViewerMainWindow(QMainWindow, ProjectManagementMixin, ToolbarManager):
             print(
                 f"🎯 Aligning {len(selected_fields)} fields using '{alignment_type}' with reference: {reference_field.id}")
 
-            # Import and use alignment utilities directly
-            from utils.geometry_utils import AlignmentUtils
-
             try:
-                # Perform alignment based on type
-                if alignment_type == "left":
-                    AlignmentUtils.align_left(selected_fields, reference_field)
-                elif alignment_type == "right":
-                    AlignmentUtils.align_right(selected_fields, reference_field)
-                elif alignment_type == "top":
-                    AlignmentUtils.align_top(selected_fields, reference_field)
-                elif alignment_type == "bottom":
-                    AlignmentUtils.align_bottom(selected_fields, reference_field)
-                elif alignment_type == "center_horizontal":
-                    AlignmentUtils.align_center_horizontal(selected_fields, reference_field)
-                elif alignment_type == "center_vertical":
-                    AlignmentUtils.align_center_vertical(selected_fields, reference_field)
-                elif alignment_type == "distribute_horizontal":
-                    AlignmentUtils.distribute_horizontal(selected_fields)
-                elif alignment_type == "distribute_vertical":
-                    AlignmentUtils.distribute_vertical(selected_fields)
+                # One geometry transaction: the canvas repaints the affected pages once
+                if alignment_type in ("distribute_horizontal", "distribute_vertical"):
+                    moved = field_manager.distribute_fields(selected_fields, alignment_type.split("_", 1)[1])
+                elif alignment_type in ("left", "right", "top", "bottom", "center_horizontal", "center_vertical"):
+                    moved = field_manager.align_fields(selected_fields, alignment_type, reference_field)
                 else:
                     print(f"⚠️ Unknown alignment type: {alignment_type}")
                     return
 
-                # Update canvas display
-                self._update_canvas_after_alignment()
+                print(f"📐 Moved {moved} fields")
 
                 # Mark document as modified
                 self.document_modified = True
@@ -339,45 +323,6 @@ class PDFViewerMainWindow(QMainWindow, ProjectManagementMixin, ToolbarManager):
             except Exception as e:
                 print(f"❌ Error during alignment: {e}")
 
-    def _update_canvas_after_alignment(self):
-        """Comprehensive canvas update after alignment operations"""
-        print("🎨 Updating canvas after alignment...")
-
-        try:
-            if hasattr(self, 'pdf_canvas'):
-                canvas = self.pdf_canvas
-
-                # Method 1: Standard update
-                if hasattr(canvas, 'update'):
-                    canvas.update()
-                    print("   ✅ Called canvas.update()")
-
-                # Method 2: Draw overlay (for field highlighting/selection)
-                if hasattr(canvas, 'draw_overlay'):
-                    canvas.draw_overlay()
-                    print("   ✅ Called canvas.draw_overlay()")
-
-                # Method 3: Repaint (force immediate redraw)
-                if hasattr(canvas, 'repaint'):
-                    canvas.repaint()
-                    print("   ✅ Called canvas.repaint()")
-
-                # Method 4: Update viewport if it's a scroll area
-                if hasattr(canvas, 'viewport'):
-                    canvas.viewport().update()
-                    print("   ✅ Called canvas.viewport().update()")
-
-                # Method 5: Refresh field rendering
-                if hasattr(canvas, 'field_renderer') and hasattr(canvas.field_renderer, 'refresh'):
-                    canvas.field_renderer.refresh()
-                    print("   ✅ Called field_renderer.refresh()")
-
-            else:
-                print("   ❌ No pdf_canvas found")
-
-        except Exception as e:
-            print(f"   ❌ Error updating canvas: {e}")
-
     def _setup_alignment_shortcuts(self):
         """Setup keyboard shortcuts for alignment"""
         from PyQt6.QtGui import QShortcut, QKeySequence
@@ -1166,14 +1111,11 @@ class PDFViewerMainWindow(QMainWindow, ProjectManagementMixin, ToolbarManager):
             self.statusBar().showMessage(f"Resized {field_id}", 2000)
 
     def _get_field_by_id(self, field_id: str):
-        """Helper method to get field by ID"""
-        try:
-            if hasattr(self, 'pdf_canvas') and self.pdf_canvas:
-                if hasattr(self.pdf_canvas, 'field_manager'):
-                    return self.pdf_canvas.field_manager.get_field_by_id(field_id)
-        except Exception as e:
-            print(f"⚠️ Error getting field {field_id}: {e}")
-        return None
+        """Helper method to get field by ID (hash lookup in the canvas FieldManager)"""
+        field_manager = getattr(getattr(self, 'pdf_canvas', None), 'field_manager', None)
+        if field_manager is None:
+            return None
+        return field_manager.get_field_by_id(field_id)
 
     @pyqtSlot(list)
     def on_multi_selection_changed(self, selected_fields):
@@ -1607,20 +1549,7 @@ class PDFViewerMainWindow(QMainWindow, ProjectManagementMixin, ToolbarManager):
 
         try:
             # Find the field and update it
-            field = None
-
-            if hasattr(self, 'pdf_canvas') and self.pdf_canvas:
-                if hasattr(self.pdf_canvas, 'get_field_by_id'):
-                    field = self.pdf_canvas.get_field_by_id(field_id)
-                elif hasattr(self.pdf_canvas, 'field_manager') and hasattr(self.pdf_canvas.field_manager,
-                                                                           'get_field_by_id'):
-                    field = self.pdf_canvas.field_manager.get_field_by_id(field_id)
-                elif hasattr(self.pdf_canvas, 'field_manager') and hasattr(self.pdf_canvas.field_manager, 'fields'):
-                    # Search in fields list
-                    for f in self.pdf_canvas.field_manager.fields:
-                        if getattr(f, 'id', getattr(f, 'name', None)) == field_id:
-                            field = f
-                            break
+            field = self._get_field_by_id(field_id)
 
             if field:
                 # Update the field property using different possible methods
@@ -2518,13 +2447,7 @@ class PDFViewerMainWindow(QMainWindow, ProjectManagementMixin, ToolbarManager):
 
         try:
             # Find field object
-            field = None
-            if hasattr(self, 'pdf_canvas') and self.pdf_canvas:
-                if hasattr(self.pdf_canvas, 'field_manager'):
-                    for f in self.pdf_canvas.field_manager.fields:
-                        if getattr(f, 'id', None) == field_id:
-                            field = f
-                            break
+            field = self._get_field_by_id(field_id)
 
             if field:
                 print(f"✅ Found field object: {field}")
@@ -2594,20 +2517,7 @@ class PDFViewerMainWindow(QMainWindow, ProjectManagementMixin, ToolbarManager):
 
         try:
             # Find the field and update it
-            field = None
-
-            if hasattr(self, 'pdf_canvas') and self.pdf_canvas:
-                if hasattr(self.pdf_canvas, 'get_field_by_id'):
-                    field = self.pdf_canvas.get_field_by_id(field_id)
-                elif hasattr(self.pdf_canvas, 'field_manager') and hasattr(self.pdf_canvas.field_manager,
-                                                                           'get_field_by_id'):
-                    field = self.pdf_canvas.field_manager.get_field_by_id(field_id)
-                elif hasattr(self.pdf_canvas, 'field_manager') and hasattr(self.pdf_canvas.field_manager, 'fields'):
-                    # Search in fields list
-                    for f in self.pdf_canvas.field_manager.fields:
-                        if getattr(f, 'id', getattr(f, 'name', None)) == field_id:
-                            field = f
-                            break
+            field = self._get_field_by_id(field_id)
 
             if field:
                 # Update the field property using different possible methods
@@ -2902,9 +2812,7 @@ class PDFViewerMainWindow(QMainWindow, ProjectManagementMixin, ToolbarManager):
                     selected_field = field_manager.get_selected_field()
                     if selected_field:
                         # Update field's appearance properties
-                        if 'appearance' not in selected_field.properties:
-                            selected_field.properties['appearance'] = {}
-                        selected_field.properties['appearance'].update(appearance_props)
+                        selected_field.update_appearance(appearance_props)
 
                         # Trigger field re-rendering
                         self.update_field_display()
@@ -2940,7 +2848,7 @@ class PDFViewerMainWindow(QMainWindow, ProjectManagementMixin, ToolbarManager):
                             selected_field.height = value['height']
                         elif property_name == "appearance":
                             # Update appearance properties
-                            selected_field.properties['appearance'] = value
+                            selected_field.set_appearance(value)
                         elif property_name in ['name', 'required']:
                             # Update basic field properties
                             setattr(selected_field, property_name, value)
@@ -0,0 +1,265 @@
+"""
+Overlay Layers
+Independently cached overlay layers composited over PDFCanvas' page tiles
+
+The overlay (grid, form fields, selection handles) used to be one pixmap that
+was rebuilt as a whole on every selection change, property edit and scroll
+stop. It is split into:
+
+    grid layer       - cached for the overlay area, rebuilt on grid/zoom changes
+    field layers     - one per page band, rebuilt only for pages whose fields changed
+    selection layer  - small pixmap around the selected fields and their handles
+
+Each layer is invalidated on its own, so a selection change only re-renders the
+(small) selection layer and a scroll only renders page bands that were not
+covered before.
+"""
+
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from PyQt6.QtCore import QRect, Qt
+from PyQt6.QtGui import QPainter, QPixmap
+
+Layer = Tuple[QPixmap, QRect]  # pixmap, canvas rect it covers
+
+
+class OverlayLayers:
+    """Grid, per-page field and selection layers with independent invalidation"""
+
+    PAGE_BAND_PADDING = 6  # Pixels around a page band for field borders drawn past the page edge
+
+    def __init__(self,
+                 draw_grid: Callable[[QPainter, QRect], None],
+                 draw_page_fields: Callable[[QPainter, int, Optional[QRect]], None],
+                 draw_selection: Callable[[QPainter], None],
+                 selection_bounds: Callable[[], QRect],
+                 page_dropped: Optional[Callable[[int], None]] = None):
+        """
+        Args:
+            draw_grid: Paints the grid for an area (painter is in canvas coordinates)
+            draw_page_fields: Paints the (unselected) fields of one page, optionally only
+                those touching a clip rect
+            draw_selection: Paints selection highlights and handles
+            selection_bounds: Canvas rect covering everything draw_selection paints
+            page_dropped: Called with a page whose field layer left the overlay area
+                (lets the field renderer release that page's cached pixmaps)
+        """
+        self._draw_grid = draw_grid
+        self._draw_page_fields = draw_page_fields
+        self._draw_selection = draw_selection
+        self._selection_bounds = selection_bounds
+        self._page_dropped = page_dropped
+
+        self.area = QRect()  # Overlay area (viewport + margin) of the last update
+        self.grid: Optional[Layer] = None
+        self.field_layers: Dict[int, Layer] = {}
+        self.selection: Optional[Layer] = None
+
+        self._grid_valid = False
+        self._dirty_pages = set()
+        self._selection_valid = False
+
+        # Statistics
+        self.grid_renders = 0
+        self.field_layer_renders = 0
+        self.field_region_renders = 0
+        self.selection_renders = 0
+        self.pixels_rendered = 0
+
+    # ========================================
+    # INVALIDATION
+    # ========================================
+
+    def invalidate_all(self):
+        """Grid, fields and selection all need redrawing"""
+        self._grid_valid = False
+        self._dirty_pages.add(None)  # None = every page
+        self._selection_valid = False
+
+    def invalidate_grid(self):
+        self._grid_valid = False
+
+    def invalidate_fields(self, pages: Iterable[int] = None):
+        """Field layers of the given pages (all pages if None) need redrawing"""
+        if pages is None:
+            self._dirty_pages.add(None)
+        else:
+            self._dirty_pages.update(pages)
+
+    def invalidate_selection(self):
+        self._selection_valid = False
+
+    def clear(self):
+        """Drop every layer (new document or zoom)"""
+        self.grid = None
+        self.field_layers.clear()
+        self.selection = None
+        self.area = QRect()
+        self.invalidate_all()
+
+    # ========================================
+    # UPDATE
+    # ========================================
+
+    def update(self, area: QRect, page_bands: Dict[int, Tuple[int, int]], show_grid: bool) -> QRect:
+        """
+        Re-render invalid layers for an overlay area
+
+        Args:
+            area: Canvas area to cover (viewport plus margin)
+            page_bands: page -> (top, bottom) in canvas pixels for pages in the area
+            show_grid: Whether the grid layer is shown
+
+        Returns:
+            Canvas region whose appearance changed (for QWidget.update)
+        """
+        self.area = QRect(area)
+        changed = QRect()
+        if area.isEmpty():
+            return changed
+
+        # Grid layer
+        if not show_grid:
+            if self.grid is not None:
+                changed = changed.united(self.grid[1])
+            self.grid = None
+        elif not self._grid_valid or self.grid is None or not self.grid[1].contains(area):
+            self.grid = self._render_layer(area, lambda painter: self._draw_grid(painter, area))
+            self.grid_renders += 1
+            self._grid_valid = True
+            changed = changed.united(area)
+
+        # Field layers - one per page band, pages outside the area are dropped
+        all_dirty = None in self._dirty_pages
+        for page_num in [p for p in self.field_layers if p not in page_bands]:
+            del self.field_layers[page_num]
+            if self._page_dropped is not None:
+                self._page_dropped(page_num)
+
+        for page_num, (top, bottom) in page_bands.items():
+            band = QRect(area.left(), top - self.PAGE_BAND_PADDING, area.width(),
+                         bottom - top + 2 * self.PAGE_BAND_PADDING).intersected(area)
+            if band.isEmpty():
+                continue
+
+            layer = self.field_layers.get(page_num)
+            if layer is not None and not all_dirty and page_num not in self._dirty_pages \
+                    and layer[1].contains(band):
+                continue
+
+            self.field_layers[page_num] = self._render_layer(
+                band, lambda painter, page=page_num: self._draw_page_fields(painter, page, None))
+            self.field_layer_renders += 1
+            changed = changed.united(band)
+
+        self._dirty_pages.clear()
+
+        # Selection layer - only the area around the selected fields
+        bounds = self._selection_bounds().intersected(area)
+        if (not self._selection_valid or
+                (self.selection is None and not bounds.isEmpty()) or
+                (self.selection is not None and not self.selection[1].contains(bounds))):
+            if self.selection is not None:
+                changed = changed.united(self.selection[1])
+            self.selection = None if bounds.isEmpty() else self._render_layer(bounds, self._draw_selection)
+            if self.selection is not None:
+                self.selection_renders += 1
+                changed = changed.united(bounds)
+            self._selection_valid = True
+
+        return changed
+
+    def repaint_field_region(self, page_num: int, rect: QRect) -> QRect:
+        """
+        Re-render part of a cached page field layer in place (dirty-rect update)
+
+        Returns the canvas rect that changed; empty if the page has no cached layer
+        (it is rendered in full when it scrolls into the overlay area).
+        """
+        layer = self.field_layers.get(page_num)
+        if layer is None:
+            return QRect()
+
+        pixmap, layer_rect = layer
+        target = rect.intersected(layer_rect)
+        if target.isEmpty():
+            return QRect()
+
+        painter = QPainter(pixmap)
+        try:
+            painter.translate(-layer_rect.x(), -layer_rect.y())
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Clear)
+            painter.fillRect(target, Qt.GlobalColor.transparent)
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
+            painter.setClipRect(target)
+            self._draw_page_fields(painter, page_num, target)
+        finally:
+            painter.end()
+
+        self.field_region_renders += 1
+        self.pixels_rendered += target.width() * target.height()
+        return target
+
+    def _render_layer(self, rect: QRect, draw: Callable[[QPainter], None]) -> Layer:
+        """Transparent pixmap for rect, painted in canvas coordinates"""
+        pixmap = QPixmap(rect.size())
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        try:
+            painter.translate(-rect.x(), -rect.y())
+            painter.setClipRect(rect)
+            draw(painter)
+        finally:
+            painter.end()
+
+        self.pixels_rendered += rect.width() * rect.height()
+        return pixmap, QRect(rect)
+
+    # ========================================
+    # COMPOSITING
+    # ========================================
+
+    def covers(self, rect: QRect) -> bool:
+        """True when the last update's area contains rect"""
+        return not self.area.isEmpty() and self.area.contains(rect)
+
+    def is_empty(self) -> bool:
+        return self.area.isEmpty()
+
+    def paint(self, painter: QPainter, exposed: QRect):
+        """Composite grid, field layers and selection over the exposed area"""
+        layers = []
+        if self.grid is not None:
+            layers.append(self.grid)
+        layers.extend(self.field_layers[page] for page in sorted(self.field_layers))
+        if self.selection is not None:
+            layers.append(self.selection)
+
+        for pixmap, rect in layers:
+            target = rect.intersected(exposed)
+            if target.isEmpty():
+                continue
+            painter.drawPixmap(target, pixmap, target.translated(-rect.x(), -rect.y()))
+
+    def get_memory_usage(self) -> int:
+        """Approximate bytes held by all layers"""
+        layers = list(self.field_layers.values())
+        if self.grid is not None:
+            layers.append(self.grid)
+        if self.selection is not None:
+            layers.append(self.selection)
+        return sum(pixmap.width() * pixmap.height() * 4 for pixmap, _ in layers)
+
+    def get_stats(self) -> dict:
+        """Layer statistics"""
+        return {
+            'area': (self.area.width(), self.area.height()),
+            'field_layers': len(self.field_layers),
+            'grid_renders': self.grid_renders,
+            'field_layer_renders': self.field_layer_renders,
+            'field_region_renders': self.field_region_renders,
+            'selection_renders': self.selection_renders,
+            'pixels_rendered': self.pixels_rendered,
+            'memory_bytes': self.get_memory_usage()
+        }
@@ -0,0 +1,431 @@
+"""
+Page Tile Layer
+Virtual document surface for PDFCanvas that rasterizes fixed-size tiles on demand
+
+Only tiles that intersect the scroll viewport (plus a configurable margin) are
+rasterized and kept, so memory scales with the viewport instead of the document.
+"""
+
+import math
+from bisect import bisect_left, bisect_right
+from typing import Callable, Dict, List, Optional, Tuple
+
+from PyQt6.QtCore import QRect, QSize
+from PyQt6.QtGui import QColor, QImage, QPainter, QPixmap
+
+from utils.pixmap_utils import fitz_pixmap_to_qimage
+
+# Try to import PyMuPDF
+try:
+    import fitz
+    FITZ_AVAILABLE = True
+except ImportError:
+    FITZ_AVAILABLE = False
+    fitz = None
+
+
+class PagePlacement:
+    """Where a single PDF page sits on the virtual canvas"""
+
+    __slots__ = ('page_num', 'page_rect', 'frame_rect')
+
+    def __init__(self, page_num: int, page_rect: QRect, frame_rect: QRect = None):
+        self.page_num = page_num
+        self.page_rect = page_rect  # Rasterized page content in canvas pixels
+        self.frame_rect = frame_rect or page_rect  # Content plus borders/shadows/cards
+
+    def __repr__(self):
+        return f"PagePlacement(page={self.page_num}, rect={self.page_rect})"
+
+
+class PageTileLayer:
+    """
+    Tiled, viewport-virtualized page surface
+
+    Exposes width()/height()/size()/isNull() so it can stand in for the old
+    whole-document pixmap wherever only the surface dimensions are needed.
+    """
+
+    DEFAULT_TILE_SIZE = 512  # Tile edge in device pixels
+    DEFAULT_MARGIN = 256  # Extra pixels around the viewport to keep rasterized
+    PREVIEW_SCALE = 0.25  # Quick preview renders use this fraction of the target zoom
+
+    def __init__(self, tile_size: int = DEFAULT_TILE_SIZE, margin: int = DEFAULT_MARGIN):
+        self.tile_size = max(64, int(tile_size))
+        self.margin = max(0, int(margin))
+
+        self.document = None
+        self.zoom_level = 1.0
+        self.placements: List[PagePlacement] = []
+        self.background = QColor(240, 240, 240)
+        self.decorate_page: Optional[Callable[[QPainter, PagePlacement], None]] = None
+
+        self._width = 0
+        self._height = 0
+        self._frame_tops: List[int] = []
+        self._frame_bottoms: List[int] = []
+
+        # (column, row) -> QPixmap
+        self.tiles: Dict[Tuple[int, int], QPixmap] = {}
+        self.viewport_rect = QRect()
+
+        # Progressive mode: previews (scaled old-zoom tiles or low-res renders)
+        # stand in until refine_step() replaces them with sharp tiles
+        self.progressive = False
+        self.preview_tiles: Dict[Tuple[int, int], QPixmap] = {}
+        self._previous_tiles: Dict[Tuple[int, int], QPixmap] = {}
+        self._previous_placements: Dict[int, PagePlacement] = {}
+        self._previous_tile_size = self.tile_size
+
+        # Statistics
+        self.tiles_rendered = 0
+        self.tiles_evicted = 0
+        self.previews_rendered = 0
+
+    # ========================================
+    # SURFACE CONFIGURATION
+    # ========================================
+
+    def configure(self, document, zoom_level: float, width: int, height: int,
+                  placements: List[PagePlacement], background: QColor = None,
+                  decorate_page: Callable[[QPainter, PagePlacement], None] = None,
+                  progressive: bool = False):
+        """
+        Describe the virtual surface; drops every cached tile
+
+        With progressive=True (zoom changes) the current sharp tiles are kept as
+        preview material: missing tiles are painted from them, scaled, until
+        refine_step() has re-rasterized the viewport at the new zoom.
+        """
+        if progressive and document is self.document:
+            # Keep the oldest sharp material when zooming again mid-refine
+            if self.tiles and not self.progressive:
+                self._previous_tiles = dict(self.tiles)
+                self._previous_placements = {p.page_num: p for p in self.placements}
+                self._previous_tile_size = self.tile_size
+            self.progressive = True
+        else:
+            self.end_progressive()
+
+        self.document = document
+        self.zoom_level = zoom_level
+        self._width = int(width)
+        self._height = int(height)
+        self.placements = list(placements)
+        if background is not None:
+            self.background = QColor(background)
+        self.decorate_page = decorate_page
+
+        # Pages are stacked vertically, so frame edges are sorted and bisectable
+        self._frame_tops = [p.frame_rect.top() for p in self.placements]
+        self._frame_bottoms = [p.frame_rect.bottom() for p in self.placements]
+
+        self.invalidate()
+        print(f"🧱 Tile layer configured: {self._width}x{self._height}, "
+              f"{len(self.placements)} pages, tile={self.tile_size}px, margin={self.margin}px")
+
+    def set_margin(self, margin: int):
+        """Change how far beyond the viewport tiles are kept"""
+        self.margin = max(0, int(margin))
+        self.prune()
+
+    def invalidate(self):
+        """Drop all rasterized tiles"""
+        self.tiles.clear()
+        self.preview_tiles.clear()
+
+    def end_progressive(self):
+        """Leave progressive mode and release the preview material"""
+        self.progressive = False
+        self.preview_tiles.clear()
+        self._previous_tiles = {}
+        self._previous_placements = {}
+
+    def clear(self):
+        """Forget the document and all tiles"""
+        self.document = None
+        self.placements = []
+        self._frame_tops = []
+        self._frame_bottoms = []
+        self._width = 0
+        self._height = 0
+        self.end_progressive()
+        self.invalidate()
+
+    # ========================================
+    # PIXMAP-COMPATIBLE SURFACE API
+    # ========================================
+
+    def width(self) -> int:
+        return self._width
+
+    def height(self) -> int:
+        return self._height
+
+    def size(self) -> QSize:
+        return QSize(self._width, self._height)
+
+    def rect(self) -> QRect:
+        return QRect(0, 0, self._width, self._height)
+
+    def isNull(self) -> bool:
+        return self._width <= 0 or self._height <= 0
+
+    # ========================================
+    # TILE GEOMETRY
+    # ========================================
+
+    def tile_rect(self, column: int, row: int) -> QRect:
+        """Canvas rectangle covered by a tile (clipped to the surface)"""
+        x = column * self.tile_size
+        y = row * self.tile_size
+        return QRect(x, y,
+                     min(self.tile_size, self._width - x),
+                     min(self.tile_size, self._height - y))
+
+    def tiles_for_rect(self, rect: QRect) -> List[Tuple[int, int]]:
+        """Tile keys that intersect a canvas rectangle"""
+        area = rect.intersected(self.rect())
+        if area.isEmpty():
+            return []
+
+        first_col = area.left() // self.tile_size
+        last_col = area.right() // self.tile_size
+        first_row = area.top() // self.tile_size
+        last_row = area.bottom() // self.tile_size
+
+        return [(col, row)
+                for row in range(first_row, last_row + 1)
+                for col in range(first_col, last_col + 1)]
+
+    def keep_rect(self, viewport_rect: QRect = None) -> QRect:
+        """Viewport grown by the margin - the only area whose tiles are kept"""
+        viewport_rect = viewport_rect if viewport_rect is not None else self.viewport_rect
+        if viewport_rect.isEmpty():
+            return QRect()
+        return viewport_rect.adjusted(-self.margin, -self.margin,
+                                      self.margin, self.margin).intersected(self.rect())
+
+    def placements_in_rect(self, rect: QRect) -> List[PagePlacement]:
+        """Pages whose frame intersects a canvas rectangle"""
+        start = bisect_left(self._frame_bottoms, rect.top())
+        end = bisect_right(self._frame_tops, rect.bottom())
+        return [p for p in self.placements[start:end] if p.frame_rect.intersects(rect)]
+
+    # ========================================
+    # VIEWPORT TRACKING
+    # ========================================
+
+    def update_viewport(self, viewport_rect: QRect):
+        """Record the visible canvas area and evict tiles that left the margin"""
+        self.viewport_rect = QRect(viewport_rect)
+        self.prune()
+
+    def prune(self):
+        """Evict tiles outside viewport + margin"""
+        keep = self.keep_rect()
+        if keep.isEmpty():
+            return
+
+        stale = [key for key in self.tiles if not self.tile_rect(*key).intersects(keep)]
+        for key in stale:
+            del self.tiles[key]
+
+        for key in [key for key in self.preview_tiles if not self.tile_rect(*key).intersects(keep)]:
+            del self.preview_tiles[key]
+
+        if stale:
+            self.tiles_evicted += len(stale)
+            print(f"🧹 Tile layer evicted {len(stale)} tiles ({len(self.tiles)} kept)")
+
+    def prefetch(self, viewport_rect: QRect = None) -> int:
+        """Rasterize any missing tiles inside viewport + margin"""
+        if viewport_rect is not None:
+            self.update_viewport(viewport_rect)
+
+        rendered = 0
+        for key in self.tiles_for_rect(self.keep_rect()):
+            if key not in self.tiles:
+                self.tiles[key] = self._render_tile(*key)
+                rendered += 1
+        return rendered
+
+    # ========================================
+    # PAINTING
+    # ========================================
+
+    def paint(self, painter: QPainter, rect: QRect):
+        """Paint every tile touching rect, rasterizing missing ones on demand (previews in progressive mode)"""
+        for key in self.tiles_for_rect(rect):
+            tile = self.tiles.get(key)
+            if tile is None and self.progressive:
+                tile = self.preview_tiles.get(key)
+                if tile is None:
+                    tile = self._render_preview_tile(*key)
+                    self.preview_tiles[key] = tile
+            if tile is None:
+                tile = self._render_tile(*key)
+                self.tiles[key] = tile
+            painter.drawPixmap(self.tile_rect(*key).topLeft(), tile)
+
+    def refine_step(self) -> Optional[QRect]:
+        """
+        Replace one preview tile in the viewport with a sharp tile
+
+        Returns the refined canvas rect, or None once the viewport is sharp
+        (which also ends progressive mode).
+        """
+        if not self.progressive:
+            return None
+
+        area = self.viewport_rect if not self.viewport_rect.isEmpty() else self.rect()
+        for key in self.tiles_for_rect(area):
+            if key not in self.tiles:
+                self.tiles[key] = self._render_tile(*key)
+                self.preview_tiles.pop(key, None)
+                return self.tile_rect(*key)
+
+        self.end_progressive()
+        return None
+
+    def _render_tile(self, column: int, row: int) -> QPixmap:
+        """Rasterize one tile: background, page decorations and clipped page content"""
+        rect = self.tile_rect(column, row)
+        tile = QPixmap(rect.size())
+        tile.fill(self.background)
+
+        painter = QPainter(tile)
+        try:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.translate(-rect.x(), -rect.y())
+
+            for placement in self.placements_in_rect(rect):
+                if self.decorate_page:
+                    self.decorate_page(painter, placement)
+
+                visible = placement.page_rect.intersected(rect)
+                if visible.isEmpty():
+                    continue
+
+                page_image = self._render_page_region(placement, visible)
+                if page_image is not None and not page_image.isNull():
+                    # Draw into the exact target rect so neighbouring tiles never seam
+                    painter.drawImage(visible, page_image)
+        except Exception as e:
+            print(f"❌ Error rendering tile ({column}, {row}): {e}")
+        finally:
+            painter.end()
+
+        self.tiles_rendered += 1
+        return tile
+
+    def _render_preview_tile(self, column: int, row: int) -> QPixmap:
+        """Quick stand-in tile: old-zoom tiles scaled into place, else a low-DPI render"""
+        rect = self.tile_rect(column, row)
+        tile = QPixmap(rect.size())
+        tile.fill(self.background)
+
+        painter = QPainter(tile)
+        try:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+            painter.translate(-rect.x(), -rect.y())
+
+            for placement in self.placements_in_rect(rect):
+                if self.decorate_page:
+                    self.decorate_page(painter, placement)
+
+                visible = placement.page_rect.intersected(rect)
+                if visible.isEmpty() or self._paint_from_previous(painter, placement, visible):
+                    continue
+
+                page_image = self._render_page_region(placement, visible, self.PREVIEW_SCALE)
+                if page_image is not None and not page_image.isNull():
+                    painter.drawImage(visible, page_image)
+        except Exception as e:
+            print(f"❌ Error rendering preview tile ({column}, {row}): {e}")
+        finally:
+            painter.end()
+
+        self.previews_rendered += 1
+        return tile
+
+    def _paint_from_previous(self, painter: QPainter, placement: PagePlacement, visible: QRect) -> bool:
+        """Scale old-zoom tiles of the same page into visible; False if they do not cover it"""
+        previous = self._previous_placements.get(placement.page_num)
+        if previous is None or placement.page_rect.isEmpty():
+            return False
+
+        new_rect = placement.page_rect
+        old_rect = previous.page_rect
+        scale_x = old_rect.width() / new_rect.width()
+        scale_y = old_rect.height() / new_rect.height()
+
+        # Area of the old surface that maps onto the visible part of the new page
+        old_left = old_rect.x() + (visible.x() - new_rect.x()) * scale_x
+        old_top = old_rect.y() + (visible.y() - new_rect.y()) * scale_y
+        old_right = old_left + visible.width() * scale_x
+        old_bottom = old_top + visible.height() * scale_y
+
+        tile_size = self._previous_tile_size
+        keys = [(col, row)
+                for row in range(int(old_top) // tile_size, (math.ceil(old_bottom) - 1) // tile_size + 1)
+                for col in range(int(old_left) // tile_size, (math.ceil(old_right) - 1) // tile_size + 1)]
+        if not keys or any(key not in self._previous_tiles for key in keys):
+            return False
+
+        painter.save()
+        painter.setClipRect(visible)
+        painter.translate(new_rect.x(), new_rect.y())
+        painter.scale(1 / scale_x, 1 / scale_y)
+        painter.translate(-old_rect.x(), -old_rect.y())
+        for col, row in keys:
+            painter.drawPixmap(col * tile_size, row * tile_size, self._previous_tiles[(col, row)])
+        painter.restore()
+        return True
+
+    def _render_page_region(self, placement: PagePlacement, visible: QRect,
+                            render_scale: float = 1.0) -> Optional[QImage]:
+        """Rasterize the part of a page that falls inside a tile (render_scale < 1 for quick previews)"""
+        if not FITZ_AVAILABLE or self.document is None:
+            return None
+
+        zoom = self.zoom_level
+        page_rect = placement.page_rect
+
+        # Tile intersection back to PDF points on this page
+        clip = fitz.Rect(
+            (visible.x() - page_rect.x()) / zoom,
+            (visible.y() - page_rect.y()) / zoom,
+            (visible.x() + visible.width() - page_rect.x()) / zoom,
+            (visible.y() + visible.height() - page_rect.y()) / zoom
+        )
+
+        page = self.document[placement.page_num]
+        pix = page.get_pixmap(matrix=fitz.Matrix(zoom * render_scale, zoom * render_scale), clip=clip)
+
+        # QImage shares the fitz sample buffer; drawImage blits it straight into the tile
+        return fitz_pixmap_to_qimage(pix)
+
+    # ========================================
+    # STATISTICS
+    # ========================================
+
+    def get_memory_usage(self) -> int:
+        """Approximate bytes held by rasterized tiles"""
+        return sum(tile.width() * tile.height() * max(1, tile.depth() // 8)
+                   for tile in self.tiles.values())
+
+    def get_stats(self) -> dict:
+        """Tile layer statistics"""
+        return {
+            'surface_size': (self._width, self._height),
+            'tile_size': self.tile_size,
+            'margin': self.margin,
+            'tiles_cached': len(self.tiles),
+            'tiles_rendered': self.tiles_rendered,
+            'tiles_evicted': self.tiles_evicted,
+            'previews_rendered': self.previews_rendered,
+            'progressive': self.progressive,
+            'memory_bytes': self.get_memory_usage()
+        }
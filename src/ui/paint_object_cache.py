@@ -0,0 +1,91 @@
+"""
+Paint Object Cache
+Bounded memoization of QFont / QPen / QBrush objects used by the field renderer
+
+Forms with thousands of identically styled fields used to build the same font,
+pen and brush for every field on every overlay pass. Objects are keyed by the
+values they are built from (family, pixel size, bold, italic for fonts - the
+pixel size already folds in the zoom level; rgba, width, style for pens) and
+kept in small LRU tables.
+"""
+
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QBrush, QColor, QFont, QPen
+
+
+class _LRUTable:
+    """One bounded key -> object table with hit/miss counters"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, object]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, build: Callable[[], object]):
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        value = build()
+        self._entries[key] = value
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        self._entries.clear()
+
+    def get_stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits / lookups * 100) if lookups else 0.0
+        }
+
+
+class PaintObjectCache:
+    """Shared fonts, pens and brushes - treat returned objects as read-only"""
+
+    def __init__(self, max_fonts: int = 64, max_pens: int = 128, max_brushes: int = 64):
+        self._fonts = _LRUTable(max_fonts)
+        self._pens = _LRUTable(max_pens)
+        self._brushes = _LRUTable(max_brushes)
+
+    def font(self, family: str, size: int, bold: bool = False, italic: bool = False) -> QFont:
+        """Font for a family at a pixel-scaled point size"""
+        def build():
+            font = QFont(family, size)
+            font.setBold(bold)
+            font.setItalic(italic)
+            return font
+        return self._fonts.get((family, size, bool(bold), bool(italic)), build)
+
+    def pen(self, color: QColor, width: float = 1, style: Qt.PenStyle = Qt.PenStyle.SolidLine) -> QPen:
+        """Pen for a color/width/style"""
+        return self._pens.get((color.rgba(), width, style), lambda: QPen(QColor(color), width, style))
+
+    def brush(self, color: QColor) -> QBrush:
+        """Solid brush for a color"""
+        return self._brushes.get(color.rgba(), lambda: QBrush(QColor(color)))
+
+    def clear(self):
+        self._fonts.clear()
+        self._pens.clear()
+        self._brushes.clear()
+
+    def get_stats(self) -> dict:
+        """Hit rates (percent) per object kind"""
+        return {
+            'fonts': self._fonts.get_stats(),
+            'pens': self._pens.get_stats(),
+            'brushes': self._brushes.get_stats()
+        }
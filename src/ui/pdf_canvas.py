@@ -3,14 +3,16 @@ PDF Canvas Widget
 Complete working version for displaying PDFs with scrolling and field support
 """
 
-from typing import List
-
 from PyQt6.QtCore import QPoint
-from PyQt6.QtCore import pyqtSignal, Qt, QRect
-from PyQt6.QtGui import QPixmap, QPainter, QPen, QCursor, QPalette, QColor, QBrush
+from PyQt6.QtCore import pyqtSignal, Qt, QRect, QTimer
+from PyQt6.QtGui import QPainter, QPen, QCursor, QPalette, QColor, QBrush
 from PyQt6.QtWidgets import QLabel
 
 from .enhanced_drag_handler import EnhancedDragHandler
+from .page_tile_layer import PageTileLayer, PagePlacement
+from .overlay_layers import OverlayLayers
+from .damage_tracker import DamageTracker
+from utils.layout_index import PageLayoutIndex
 
 # Try to import PyMuPDF
 try:
@@ -127,6 +129,8 @@ class PDFCanvas(QLabel):
     positionClicked = pyqtSignal(int, int)  # x, y
     selectionChanged = pyqtSignal(object)  # field or None
 
+    PAGE_MARGIN_X = 10  # Canvas x of every page's left edge (document x 0)
+
     def __init__(self):
         super().__init__()
 
@@ -134,7 +138,33 @@ class PDFCanvas(QLabel):
         self.pdf_document = None
         self.current_page = 0
         self.zoom_level = 1.0
-        self.page_pixmap = None
+        self.page_pixmap = None  # Virtual page surface (PageTileLayer) once a document is laid out
+        self.layout_index = PageLayoutIndex()  # Bisectable page tops/bottoms of the current layout
+        self._page_point_sizes = None  # (document, [(w, h), ...]) - page rects read once per document
+
+        # Tiled rendering - only tiles near the viewport are rasterized
+        self.tile_layer = PageTileLayer(tile_size=512, margin=256)
+        # Grid, per-page fields and selection handles for the area around the viewport
+        self.overlay_layers = OverlayLayers(self._draw_grid, self._draw_page_field_layer,
+                                            self._draw_selection_layer, self._get_selection_bounds,
+                                            self._release_page_field_pixmaps)
+        self._overlay_rect = QRect()
+
+        # Dirty-rect repaints for field edits (FieldManager.field_damaged -> update(QRect))
+        self.damage_tracker = DamageTracker()
+        self._damage_timer = QTimer()
+        self._damage_timer.setSingleShot(True)
+        self._damage_timer.timeout.connect(self.flush_damage)
+        self._tile_prefetch_timer = QTimer()
+        self._tile_prefetch_timer.setSingleShot(True)
+        self._tile_prefetch_timer.timeout.connect(self._prefetch_tiles)
+
+        # Progressive zoom - show scaled previews instantly, sharpen tile by tile
+        self.progressive_zoom = True
+        self._zoom_in_progress = False
+        self._refine_timer = QTimer()
+        self._refine_timer.setSingleShot(True)
+        self._refine_timer.timeout.connect(self._refine_tiles)
 
         # Grid properties
         self.grid_size = 20  # Default grid size in pixels
@@ -168,6 +198,11 @@ class PDFCanvas(QLabel):
 
     def _init_handlers(self):
         """Initialize field and interaction handlers"""
+        self._init_field_handlers()
+        self._connect_field_damage()
+
+    def _init_field_handlers(self):
+        """Create the field manager, selection/drag handlers and renderer"""
         if FIELD_COMPONENTS_AVAILABLE:
             try:
                 self.field_manager = FieldManager()
@@ -232,9 +267,8 @@ class PDFCanvas(QLabel):
     def _on_selection_changed(self, field):
         """Handle selection changes from selection handler"""
         try:
-            # Update display when selection changes
-            if hasattr(self, 'draw_overlay'):
-                self.draw_overlay()
+            # Selection only affects the selection/handle layer
+            self.draw_selection_overlay()
 
             # Emit field clicked signal if field is selected
             if field and hasattr(self, 'fieldClicked'):
@@ -247,9 +281,8 @@ class PDFCanvas(QLabel):
     def _on_selection_changed(self, field):
         """Handle selection changes from selection handler"""
         try:
-            # Update display when selection changes
-            if hasattr(self, 'draw_overlay'):
-                self.draw_overlay()
+            # Selection only affects the selection/handle layer
+            self.draw_selection_overlay()
 
             # Emit field clicked signal if field is selected
             if field and hasattr(self, 'fieldClicked'):
@@ -335,17 +368,15 @@ class PDFCanvas(QLabel):
 
     # Enhanced render_page method with page moats
     def render_page(self):
-        """Render all PDF pages as continuous vertical view with simple spacing and borders"""
+        """Lay out all PDF pages as continuous vertical view with simple spacing and borders"""
         if not self.pdf_document:
             return
         # Import PyQt6 classes locally to avoid import issues
-        from PyQt6.QtGui import QColor, QPainter, QPen
+        from PyQt6.QtGui import QColor, QPen
         from PyQt6.QtCore import QRect
 
-        #self.setStyleSheet("border:solid 1px red;");
-
         try:
-            print(f"🎨 Rendering all {self.pdf_document.page_count} pages with simple moats")
+            print(f"🎨 Laying out all {self.pdf_document.page_count} pages with simple moats")
 
             # Simple spacing settings
             top_margin = 15  # Gap from top
@@ -353,29 +384,13 @@ class PDFCanvas(QLabel):
             vertical_spacing = 15  # Gap between pages
             horizontal_margin = 15  # Left/right gaps when fit-to-width
 
-            # Calculate page dimensions
-            page_heights = []
-            max_width = 0
-
-            # First pass: get dimensions of all pages
-            for page_num in range(self.pdf_document.page_count):
-                page = self.pdf_document[page_num]
-                mat = fitz.Matrix(self.zoom_level, self.zoom_level)
-
-                rect = page.rect
-                page_width = int(rect.width * self.zoom_level)
-                page_height = int(rect.height * self.zoom_level)
-
-                page_heights.append(page_height)
-                max_width = max(max_width, page_width)
+            # Page dimensions only - no rasterization happens here
+            page_sizes = self._get_zoomed_page_sizes()
+            max_width = max((w for w, h in page_sizes), default=0)
 
             # Calculate total canvas dimensions
             canvas_width = max_width + (2 * horizontal_margin)
-            total_height = top_margin + sum(page_heights) + (len(page_heights) - 1) * vertical_spacing + top_margin + bottom_margin
-
-            # Create canvas with white background (no overall boundary)
-            self.page_pixmap = QPixmap(canvas_width, total_height)
-            #self.page_pixmap.fill(QColor(255, 255, 255))
+            total_height = top_margin + sum(h for w, h in page_sizes) + (len(page_sizes) - 1) * vertical_spacing + top_margin + bottom_margin
 
             scroll_area = self.parent()
             if scroll_area and hasattr(scroll_area, 'viewport'):
@@ -383,71 +398,30 @@ class PDFCanvas(QLabel):
             else:
                 bg_color = QColor(240, 240, 240)  # Light gray fallback
 
-            self.page_pixmap.fill(bg_color)
-
-            # ✅ ADD THIS BLOCK HERE:
-            # Update drag overlay size after PDF canvas resize
-            if hasattr(self, 'enhanced_drag_handler') and hasattr(self.enhanced_drag_handler, 'drag_overlay'):
-                self.enhanced_drag_handler.drag_overlay.update_overlay_size()
-                print("📏 Updated drag overlay size after PDF render")
-
-            painter = QPainter(self.page_pixmap)
-            # painter.setPen(QPen(QColor(255, 255, 255), 1))  # Light silver border
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-            # Render all pages
+            # Position all pages
             current_y = top_margin
             self.page_positions = []
+            placements = []
 
-            for page_num in range(self.pdf_document.page_count):
-                page = self.pdf_document[page_num]
-                mat = fitz.Matrix(self.zoom_level, self.zoom_level)
-
-                # Render page to pixmap
-                pix = page.get_pixmap(matrix=mat)
-                img_data = pix.tobytes("ppm")
-
-                page_pixmap = QPixmap()
-                page_pixmap.loadFromData(img_data)
-
-                # Calculate page position (centered horizontally with margins)
-                page_x = horizontal_margin
-                page_y = current_y
-
-                # Draw light silver border around page
-                border_rect = QRect(page_x - 1, page_y - 1,
-                                    page_pixmap.width() + 2, page_pixmap.height() + 2)
-                painter.setPen(QPen(QColor(200, 200, 200), 1))  # Light silver border
-                painter.drawRect(border_rect)
-
-                # Draw the page content
-                painter.drawPixmap(page_x, page_y, page_pixmap)
+            for page_num, (page_width, page_height) in enumerate(page_sizes):
+                page_rect = QRect(horizontal_margin, current_y, page_width, page_height)
+                # Frame includes the 1px border drawn around the page
+                placements.append(PagePlacement(page_num, page_rect, page_rect.adjusted(-1, -1, 2, 2)))
 
                 # Store page position for navigation
-                self.page_positions.append(page_y)
+                self.page_positions.append(current_y)
 
                 # Move to next page position
-                current_y += page_pixmap.height() + vertical_spacing
-
-                print(f"  ✅ Rendered page {page_num + 1} at y={page_y}")
-
-            painter.end()
+                current_y += page_height + vertical_spacing
 
-            # Set widget size to match the full document
-            self.setMinimumSize(self.page_pixmap.size())
-            self.resize(self.page_pixmap.size())
-
-            # Update the displayed pixmap
-            self.setPixmap(self.page_pixmap)
-
-            # Draw overlay (grid, fields, etc.)
-            self.draw_overlay()
+            def decorate(painter, placement):
+                # Draw light silver border around page
+                painter.setPen(QPen(QColor(200, 200, 200), 1))
+                painter.drawRect(placement.page_rect.adjusted(-1, -1, 1, 1))
 
-            print(f"✅ Simple continuous view rendered: {canvas_width}x{total_height} pixels")
+            self._install_tile_surface(canvas_width, total_height, placements, bg_color, decorate)
 
-            # ADD THESE LINES:
-            # Setup scroll tracking after successful rendering
-            #self.setup_scroll_tracking()
+            print(f"✅ Simple continuous view laid out: {canvas_width}x{total_height} pixels (tiled)")
 
             # Initialize current_page and visible pages tracking
             if not hasattr(self, 'current_page'):
@@ -455,8 +429,6 @@ class PDFCanvas(QLabel):
             if not hasattr(self, '_last_visible_pages'):
                 self._last_visible_pages = [0]
 
-            print("✅ PDF rendering complete with scroll tracking")
-
         except Exception as e:
             print(f"❌ Error rendering simple continuous view: {e}")
             import traceback
@@ -503,7 +475,7 @@ class PDFCanvas(QLabel):
 
 
     def render_page_cards(self):
-        """Render pages as Material Design-style cards"""
+        """Lay out pages as Material Design-style cards"""
         if not self.pdf_document:
             return
 
@@ -515,80 +487,50 @@ class PDFCanvas(QLabel):
             shadow_blur = 10  # Shadow blur radius
 
             # Calculate dimensions
-            page_heights = []
-            max_width = 0
-
-            for page_num in range(self.pdf_document.page_count):
-                page = self.pdf_document[page_num]
-                mat = fitz.Matrix(self.zoom_level, self.zoom_level)
-                rect = page.rect
-
-                page_width = int(rect.width * self.zoom_level)
-                page_height = int(rect.height * self.zoom_level)
-
-                page_heights.append(page_height)
-                max_width = max(max_width, page_width)
+            page_sizes = self._get_zoomed_page_sizes()
+            max_width = max((w for w, h in page_sizes), default=0)
 
             # Total canvas dimensions
             canvas_width = max_width + (2 * (card_margin + card_padding))
-            total_height = sum(h + 2 * (card_margin + card_padding) for h in page_heights)
-
-            # Create canvas
-            self.page_pixmap = QPixmap(canvas_width, total_height)
-            self.page_pixmap.fill(QColor(250, 250, 250))  # Very light background
-
-            painter = QPainter(self.page_pixmap)
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            total_height = sum(h + 2 * (card_margin + card_padding) for w, h in page_sizes)
 
             current_y = 0
             self.page_positions = []
+            placements = []
 
-            for page_num in range(self.pdf_document.page_count):
-                # Render page content
-                page = self.pdf_document[page_num]
-                mat = fitz.Matrix(self.zoom_level, self.zoom_level)
-                pix = page.get_pixmap(matrix=mat)
-                img_data = pix.tobytes("ppm")
-
-                page_pixmap = QPixmap()
-                page_pixmap.loadFromData(img_data)
-
+            for page_num, (page_width, page_height) in enumerate(page_sizes):
                 # Card dimensions
                 card_x = card_margin
                 card_y = current_y + card_margin
-                card_w = page_pixmap.width() + (2 * card_padding)
-                card_h = page_pixmap.height() + (2 * card_padding)
+                card_w = page_width + (2 * card_padding)
+                card_h = page_height + (2 * card_padding)
+
+                # Page content sits inside the card; frame includes the shadow
+                content_rect = QRect(card_x + card_padding, card_y + card_padding, page_width, page_height)
+                frame_rect = QRect(card_x, card_y, card_w + 4, card_h + 4)
+                placements.append(PagePlacement(page_num, content_rect, frame_rect))
+
+                # Store position
+                self.page_positions.append(content_rect.y())
+
+                # Move to next card
+                current_y += card_h + card_margin
+
+            def decorate(painter, placement):
+                card_rect = placement.page_rect.adjusted(-card_padding, -card_padding, card_padding, card_padding)
 
                 # Draw card shadow
-                shadow_rect = QRect(card_x + 3, card_y + 3, card_w, card_h)
-                painter.fillRect(shadow_rect, QColor(0, 0, 0, 30))
+                painter.fillRect(card_rect.translated(3, 3), QColor(0, 0, 0, 30))
 
                 # Draw card background
-                card_rect = QRect(card_x, card_y, card_w, card_h)
                 painter.fillRect(card_rect, QColor(255, 255, 255))
 
                 # Draw card border
                 painter.setPen(QPen(QColor(220, 220, 220), 1))
                 painter.drawRect(card_rect)
 
-                # Draw page content
-                content_x = card_x + card_padding
-                content_y = card_y + card_padding
-                painter.drawPixmap(content_x, content_y, page_pixmap)
-
-                # Store position
-                self.page_positions.append(content_y)
-
-                # Move to next card
-                current_y += card_h + card_margin
-
-            painter.end()
-
-            # Update display
-            self.setMinimumSize(self.page_pixmap.size())
-            self.resize(self.page_pixmap.size())
-            self.setPixmap(self.page_pixmap)
-            self.draw_overlay()
+            self._install_tile_surface(canvas_width, total_height, placements,
+                                       QColor(250, 250, 250), decorate)  # Very light background
 
         except Exception as e:
             print(f"❌ Error rendering card-style pages: {e}")
@@ -610,256 +552,396 @@ class PDFCanvas(QLabel):
             self.render_page_cards()  # Card-style rendering
 
     def render_page_original(self):
-        """Render all PDF pages as continuous vertical view"""
+        """Lay out all PDF pages as continuous vertical view"""
         if not self.pdf_document:
             return
 
         try:
-            print(f"🎨 Rendering all {self.pdf_document.page_count} pages for continuous view")
+            print(f"🎨 Laying out all {self.pdf_document.page_count} pages for continuous view")
 
             # Calculate total height needed for all pages
-            page_heights = []
-            max_width = 0
+            page_sizes = self._get_zoomed_page_sizes()
+            max_width = max((w for w, h in page_sizes), default=0)
 
-            # First pass: get dimensions of all pages
-            for page_num in range(self.pdf_document.page_count):
-                page = self.pdf_document[page_num]
-                mat = fitz.Matrix(self.zoom_level, self.zoom_level)
+            # Calculate total height with spacing between pages
+            page_spacing = 10  # pixels between pages
+            total_height = sum(h for w, h in page_sizes) + (len(page_sizes) - 1) * page_spacing
 
-                # Get page dimensions
-                rect = page.rect
-                page_width = int(rect.width * self.zoom_level)
-                page_height = int(rect.height * self.zoom_level)
+            current_y = 0
+            self.page_positions = []  # Store where each page starts
+            placements = []
 
-                page_heights.append(page_height)
-                max_width = max(max_width, page_width)
+            for page_num, (page_width, page_height) in enumerate(page_sizes):
+                # Center the page horizontally if it's narrower than max_width
+                x_offset = (max_width - page_width) // 2
+                placements.append(PagePlacement(page_num, QRect(x_offset, current_y, page_width, page_height)))
 
-            # Calculate total height with spacing between pages
-            page_spacing = 10  # pixels between pages
-            total_height = sum(page_heights) + (len(page_heights) - 1) * page_spacing
+                # Store page position for navigation
+                self.page_positions.append(current_y)
 
-            # Create one large pixmap to hold all pages
-            self.page_pixmap = QPixmap(max_width, total_height)
-            self.page_pixmap.fill(Qt.GlobalColor.white)
+                # Move to next page position
+                current_y += page_height + page_spacing
 
-            painter = QPainter(self.page_pixmap)
+            self._install_tile_surface(max_width, total_height, placements, QColor(Qt.GlobalColor.white))
 
-            # Second pass: render all pages onto the large pixmap
-            current_y = 0
-            self.page_positions = []  # Store where each page starts
+            print(f"✅ Continuous view laid out: {max_width}x{total_height} pixels (tiled)")
 
-            for page_num in range(self.pdf_document.page_count):
-                page = self.pdf_document[page_num]
-                mat = fitz.Matrix(self.zoom_level, self.zoom_level)
+        except Exception as e:
+            print(f"❌ Error rendering continuous view: {e}")
+            import traceback
+            traceback.print_exc()
 
-                # Render page to pixmap
-                pix = page.get_pixmap(matrix=mat)
-                img_data = pix.tobytes("ppm")
+    # ========================================
+    # TILED SURFACE
+    # ========================================
 
-                # Convert to QPixmap
-                page_pixmap = QPixmap()
-                page_pixmap.loadFromData(img_data)
+    def _get_zoomed_page_sizes(self):
+        """(width, height) of every page at the current zoom - page rects are read once per document"""
+        if self._page_point_sizes is None or self._page_point_sizes[0] is not self.pdf_document:
+            point_sizes = []
+            for page_num in range(self.pdf_document.page_count):
+                rect = self.pdf_document[page_num].rect
+                point_sizes.append((rect.width, rect.height))
+            self._page_point_sizes = (self.pdf_document, point_sizes)
+
+        return [(int(width * self.zoom_level), int(height * self.zoom_level))
+                for width, height in self._page_point_sizes[1]]
+
+    def _install_tile_surface(self, canvas_width, total_height, placements, background, decorate=None):
+        """Point the tile layer at a new page layout and resize the canvas to match"""
+        # Index the layout once; page lookups bisect it instead of scanning pages
+        self.layout_index = PageLayoutIndex.from_positions(
+            self.page_positions,
+            [p.page_rect.height() for p in placements],
+            [p.page_rect.width() for p in placements]
+        )
 
-                # Center the page horizontally if it's narrower than max_width
-                x_offset = (max_width - page_pixmap.width()) // 2
+        self.tile_layer.configure(self.pdf_document, self.zoom_level, canvas_width, total_height,
+                                  placements, background, decorate,
+                                  progressive=self._zoom_in_progress and self.progressive_zoom)
 
-                # Draw this page onto the large pixmap
-                painter.drawPixmap(x_offset, current_y, page_pixmap)
+        # The tile layer stands in for the old whole-document pixmap (same width/height/size API)
+        self.page_pixmap = self.tile_layer
+        self.overlay_layers.clear()
+        if hasattr(self.field_renderer, 'clear_pixmap_cache'):
+            self.field_renderer.clear_pixmap_cache()
 
-                # Store page position for navigation
-                self.page_positions.append(current_y)
+        # Drop any "no document" text; painting is done in paintEvent from tiles
+        self.clear()
 
-                # Move to next page position
-                current_y += page_pixmap.height() + page_spacing
+        # Set widget size to match the full document
+        self.setMinimumSize(self.tile_layer.size())
+        self.resize(self.tile_layer.size())
 
-                print(f"  ✅ Rendered page {page_num + 1}")
+        # Update drag overlay size after PDF canvas resize
+        if hasattr(self, 'enhanced_drag_handler') and hasattr(self.enhanced_drag_handler, 'drag_overlay'):
+            self.enhanced_drag_handler.drag_overlay.update_overlay_size()
 
-            painter.end()
+        self._connect_viewport_tracking()
+        self.tile_layer.update_viewport(self._get_viewport_rect())
+        self.update()
 
-            # Set widget size to match the full document
-            self.setMinimumSize(self.page_pixmap.size())
-            self.resize(self.page_pixmap.size())
+        # Draw overlay (grid, fields, etc.)
+        self.draw_overlay()
 
-            # Update the displayed pixmap
-            self.setPixmap(self.page_pixmap)
+        if self.tile_layer.progressive:
+            # Let paint show previews first; wheel bursts restart the delay
+            self._refine_timer.start(40)
 
-            # Draw overlay (grid, fields, etc.)
-            self.draw_overlay()
+    def set_tile_margin(self, margin: int):
+        """Set how many pixels beyond the viewport stay rasterized"""
+        self.tile_layer.set_margin(margin)
+        self.update()
 
-            print(f"✅ Continuous view rendered: {max_width}x{total_height} pixels")
+    def _get_viewport_rect(self) -> QRect:
+        """Visible part of the canvas in canvas coordinates"""
+        return self.visibleRegion().boundingRect()
 
-        except Exception as e:
-            print(f"❌ Error rendering continuous view: {e}")
-            import traceback
-            traceback.print_exc()
+    def _connect_viewport_tracking(self):
+        """Hook the enclosing scroll area's scrollbars to the tile layer (once)"""
+        if getattr(self, '_viewport_tracking_connected', False):
+            return
 
-    def set_page(self, page_number: int):
-        """Set current page and render it"""
-        if not self.pdf_document:
+        scroll_area = self.parent()
+        while scroll_area and not hasattr(scroll_area, 'verticalScrollBar'):
+            scroll_area = scroll_area.parent()
+        if not scroll_area:
             return
 
-        if 0 <= page_number < self.pdf_document.page_count:
-            self.current_page = page_number
-            self.render_page()
+        scroll_area.verticalScrollBar().valueChanged.connect(self._on_viewport_scrolled)
+        scroll_area.horizontalScrollBar().valueChanged.connect(self._on_viewport_scrolled)
+        self._viewport_tracking_connected = True
 
-    def set_zoom(self, zoom_level: float):
-        """Set zoom level and re-render"""
-        if zoom_level < 0.1 or zoom_level > 5.0:
+    def _on_viewport_scrolled(self, _value=None):
+        """Evict tiles that scrolled out of viewport + margin and prefetch the margin"""
+        if self.page_pixmap is None:
             return
+        self.tile_layer.update_viewport(self._get_viewport_rect())
+        self._tile_prefetch_timer.start(100)
 
-        self.zoom_level = zoom_level
+    def _prefetch_tiles(self):
+        """Rasterize margin tiles once scrolling pauses"""
+        if self.page_pixmap is None or self.tile_layer.progressive:
+            return
+        rendered = self.tile_layer.prefetch(self._get_viewport_rect())
+        if rendered:
+            print(f"🧱 Prefetched {rendered} tiles around viewport")
 
-        # Update PageManager zoom level
-        if hasattr(self, 'field_manager'):
-            self.field_manager.page_manager.set_zoom_level(zoom_level)
+        # Overlay only spans viewport + margin; render the layers we scrolled into
+        if not self._overlay_covers_viewport():
+            self._refresh_overlay_layers()
 
-        # ✅ ADD THIS LINE - Update enhanced drag handler zoom level
-        if hasattr(self, 'enhanced_drag_handler'):
-            self.enhanced_drag_handler.set_zoom_level(zoom_level)
+    def _refine_tiles(self):
+        """Second phase of a zoom: replace preview tiles with sharp ones, one per event-loop pass"""
+        if self.page_pixmap is None:
+            return
 
-        # Re-render with new zoom level
-        self.render_page()
-        # self.update_drag_handler_for_document()
+        self.tile_layer.update_viewport(self._get_viewport_rect())
+        refined_rect = self.tile_layer.refine_step()
+        if refined_rect is not None:
+            self.update(refined_rect)
+            self._refine_timer.start(0)  # Yield to input events between tiles
+        else:
+            print("🔍 Progressive zoom: viewport sharp")
+            self._tile_prefetch_timer.start(100)
+
+    def _get_overlay_rect(self) -> QRect:
+        """Canvas area covered by the overlay: viewport plus the tile margin"""
+        viewport = self._get_viewport_rect()
+        if viewport.isEmpty():
+            return QRect()
+        return self.tile_layer.keep_rect(viewport)
+
+    def _overlay_covers_viewport(self) -> bool:
+        """True when the overlay layers still cover the visible canvas area"""
+        return self.overlay_layers.covers(self._get_viewport_rect())
+
+    def _refresh_overlay_layers(self):
+        """Re-render invalid overlay layers for viewport + margin and repaint what changed"""
+        if self.page_pixmap is None:
+            return
 
-    def _filter_fields_in_zoomed_viewport(self, fields: List[FormField], viewport_rect: QRect,
-                                          page_num: int, zoom_level: float) -> List[FormField]:
-        """Filter fields considering zoom level and viewport"""
-        visible_fields = []
+        area = self._get_overlay_rect()
+        self._overlay_rect = area
 
-        for field in fields:
-            # Convert field document coordinates to zoomed screen coordinates
-            screen_coords = self.document_to_screen_coordinates(page_num, field.x, field.y)
+        page_bands = {}
+        if not area.isEmpty():
+            for page_num in self.layout_index.pages_in_range(area.top(), area.bottom()):
+                page_bands[page_num] = (self.layout_index.tops[page_num], self.layout_index.bottoms[page_num])
 
-            if screen_coords:
-                screen_x, screen_y = screen_coords
+        changed = self.overlay_layers.update(area, page_bands, self.show_grid)
+        if not changed.isEmpty():
+            self.update(changed)
 
-                # Calculate field dimensions at current zoom
-                field_width = int(field.width * zoom_level)
-                field_height = int(field.height * zoom_level)
+    def _release_page_field_pixmaps(self, page_num: int):
+        """Drop the renderer's cached field pixmaps of a page that left the overlay area"""
+        if hasattr(self.field_renderer, 'clear_pixmap_cache'):
+            self.field_renderer.clear_pixmap_cache(page_num)
 
-                # Create field rectangle in screen coordinates
-                field_rect = QRect(screen_x, screen_y, field_width, field_height)
+    def _get_page_fields(self, page_num: int) -> list:
+        """Fields on one page (spatial index lookup when the manager has one)"""
+        if hasattr(self.field_manager, 'get_fields_on_page'):
+            return self.field_manager.get_fields_on_page(page_num)
+        return [f for f in self.field_manager.fields if getattr(f, 'page_number', 0) == page_num]
 
-                # Add tolerance for fields partially visible
-                tolerance = max(5, int(10 * zoom_level))  # Scale tolerance with zoom
-                expanded_viewport = viewport_rect.adjusted(-tolerance, -tolerance, tolerance, tolerance)
+    def _draw_page_field_layer(self, painter, page_num: int, clip: QRect = None):
+        """Field layer of one page - every field drawn unselected (selection has its own layer)"""
+        if not self.field_renderer or not hasattr(self.field_renderer, 'render_fields'):
+            return
 
-                # Check intersection with expanded viewport
-                if expanded_viewport.intersects(field_rect):
-                    visible_fields.append(field)
-                    print(f"     Field {field.id}: visible at zoom {zoom_level:.1f}x")
+        fields = None
+        spatial_index = getattr(self.field_manager, 'spatial_index', None)
+        if clip is not None and spatial_index is not None and page_num < len(getattr(self, 'page_positions', [])):
+            # Dirty-rect repaint: only fields touching the clip rect (grown for borders drawn outside fields)
+            page_top = self.page_positions[page_num]
+            area = clip.adjusted(-self.DAMAGE_PADDING, -self.DAMAGE_PADDING, self.DAMAGE_PADDING, self.DAMAGE_PADDING)
+            fields = spatial_index.query_rect(page_num, (
+                (area.left() - self.PAGE_MARGIN_X) / self.zoom_level, (area.top() - page_top) / self.zoom_level,
+                (area.right() + 1 - self.PAGE_MARGIN_X) / self.zoom_level,
+                (area.bottom() + 1 - page_top) / self.zoom_level
+            ))
+            if hasattr(self.field_renderer, 'get_cached_fields_in_rect'):
+                # Name labels are drawn outside the field rect - add fields whose drawing reaches the clip
+                queried = {id(f) for f in fields}
+                fields = list(fields) + [f for f in self.field_renderer.get_cached_fields_in_rect(page_num, area)
+                                         if id(f) not in queried]
+        if fields is None:
+            fields = self._get_page_fields(page_num)
+
+        self.field_renderer.render_fields(
+            painter,
+            fields,
+            None,
+            page_num,
+            zoom_level=self.zoom_level,
+            coord_transform_func=self.document_to_screen_coordinates
+        )
 
-        return visible_fields
+    def _draw_selection_layer(self, painter):
+        """Selection layer - primary selected field highlight plus handles of all selected fields"""
+        primary_selected_field = self.selection_handler.get_selected_field() if hasattr(self,
+                                                                                        'selection_handler') else None
+        if (primary_selected_field and self.field_renderer and
+                hasattr(self.field_renderer, 'render_single_field')):
+            self.field_renderer.render_single_field(
+                painter, primary_selected_field, True, self.zoom_level, self.document_to_screen_coordinates
+            )
 
-    def _draw_grid_in_viewport_zoomed(self, painter: QPainter, viewport_rect: QRect, zoom_level: float):
-        """Draw grid scaled appropriately for zoom level, limited to page boundaries"""
-        if not self.show_grid:
-            return
+        self._draw_selection_handles(painter)
 
-        # Scale grid size with zoom level
-        scaled_grid_size = int(self.grid_size * zoom_level)
+    def _get_selected_fields_for_overlay(self) -> list:
+        """Fields drawn on the selection layer (multi-selection plus the primary selection)"""
+        selected_fields = []
+        if hasattr(self, 'enhanced_drag_handler') and hasattr(self.enhanced_drag_handler, 'get_selected_fields'):
+            selected_fields = list(self.enhanced_drag_handler.get_selected_fields())
 
-        # At very high zoom, might want larger grid spacing
-        if zoom_level > 3.0:
-            scaled_grid_size = int(scaled_grid_size * 2)  # Double spacing at high zoom
+        primary = self.selection_handler.get_selected_field() if hasattr(self, 'selection_handler') else None
+        if primary and primary not in selected_fields:
+            selected_fields.append(primary)
+        return selected_fields
 
-        # At very low zoom, might want to skip grid entirely
-        if zoom_level < 0.3:
-            return  # Grid would be too dense to be useful
+    DAMAGE_PADDING = 4  # Pixels around a damaged field rect (borders and antialiasing)
 
-        # Get grid color and opacity from GridManager if available
-        grid_color = None
-        grid_opacity = None
-        scaled_offset_x = 0
-        scaled_offset_y = 0
+    def _get_selection_bounds(self) -> QRect:
+        """Canvas rect covering selection highlights and handles"""
+        handle_margin = 12  # Handles (8px) centred on edges, 2px selection outline offset, pen width
+        bounds = QRect()
+        for field in self._get_selected_fields_for_overlay():
+            screen_coords = self.document_to_screen_coordinates(getattr(field, 'page_number', 0), field.x, field.y)
+            if not screen_coords:
+                continue
+            field_rect = QRect(int(screen_coords[0]), int(screen_coords[1]),
+                               int(field.width * self.zoom_level) + 1, int(field.height * self.zoom_level) + 1)
+            bounds = bounds.united(field_rect.adjusted(-handle_margin, -handle_margin, handle_margin, handle_margin))
+        return bounds
+
+    # ========================================
+    # DIRTY-RECT REPAINTS
+    # ========================================
+
+    def _connect_field_damage(self):
+        """Repaint only damaged regions when the field manager reports field changes"""
+        if hasattr(self.field_manager, 'field_damaged'):
+            self.field_manager.field_damaged.connect(self._on_field_damaged)
+        if hasattr(self.field_manager, 'fields_geometry_changed'):
+            self.field_manager.fields_geometry_changed.connect(self._on_fields_geometry_changed)
+
+        # Cached pixmaps of removed fields are dropped with them
+        if hasattr(self.field_renderer, 'invalidate_field'):
+            self.field_manager.field_removed.connect(self.field_renderer.invalidate_field)
+            self.field_manager.fields_cleared.connect(self.field_renderer.clear_pixmap_cache)
+
+    def _on_field_damaged(self, field, old_bounds, new_bounds):
+        """Record the old and new screen rects of a changed field (repainted on the next pass)"""
+        # The last cached drawing still sits at the old position and includes the name
+        # label drawn above the field; it moves with the field's top-left corner
+        drawn = self.field_renderer.get_field_bounds(field) \
+            if hasattr(self.field_renderer, 'get_field_bounds') else None
+        old_origin = None
+
+        for page_num, x0, y0, x1, y1 in (old_bounds, new_bounds):
+            screen_coords = self.document_to_screen_coordinates(page_num, x0, y0)
+            if not screen_coords:
+                continue
+            rect = QRect(int(screen_coords[0]), int(screen_coords[1]),
+                         int((x1 - x0) * self.zoom_level) + 1, int((y1 - y0) * self.zoom_level) + 1)
+            if old_origin is None:
+                old_origin = rect.topLeft()
+            if drawn is not None:
+                rect = rect.united(drawn.translated(rect.topLeft() - old_origin))
+            self.damage_tracker.add(page_num, rect.adjusted(-self.DAMAGE_PADDING, -self.DAMAGE_PADDING,
+                                                            self.DAMAGE_PADDING, self.DAMAGE_PADDING))
+
+        # Coalesce every change made in this event-loop pass into one repaint
+        if not self._damage_timer.isActive():
+            self._damage_timer.start(0)
+
+    def _on_fields_geometry_changed(self, fields: list, pages: list):
+        """A geometry transaction moved/resized fields - re-render the affected page layers once"""
+        self.overlay_layers.invalidate_fields(pages)
+        self.overlay_layers.invalidate_selection()
+        self._refresh_overlay_layers()
+
+    def flush_damage(self):
+        """Re-render damaged field regions and repaint only those rects"""
+        self._damage_timer.stop()
+        damaged = self.damage_tracker.take()
+        if not damaged or self.page_pixmap is None:
+            return
 
-        # Try to get enhanced settings from GridManager
-        if hasattr(self, 'parent') and self.parent():
-            main_window = self.parent()
-            while main_window and not hasattr(main_window, 'grid_manager'):
-                main_window = main_window.parent()
+        repainted = []
+        for page_num, rects in damaged.items():
+            for rect in rects:
+                changed = self.overlay_layers.repaint_field_region(page_num, rect)
+                if not changed.isEmpty():
+                    repainted.append(changed)
+
+        # Selected fields may have moved with the damage - the selection layer is small
+        self.overlay_layers.invalidate_selection()
+        self._refresh_overlay_layers()
+
+        for rect in repainted:
+            self.update(rect)
+
+    def update_field_display(self, field):
+        """A field's properties changed - repaint only its rect"""
+        if hasattr(self.field_manager, 'notify_field_changed'):
+            self.field_manager.notify_field_changed(field)
+            self.flush_damage()
+        else:
+            self.draw_overlay()
 
-            if main_window and hasattr(main_window, 'grid_manager'):
-                grid_manager = main_window.grid_manager
-                grid_color = grid_manager.settings.color
-                grid_opacity = grid_manager.settings.opacity
-
-                # Apply offsets with zoom scaling if sync_with_zoom is enabled
-                if grid_manager.settings.sync_with_zoom:
-                    scaled_offset_x = int(grid_manager.settings.offset_x * zoom_level)
-                    scaled_offset_y = int(grid_manager.settings.offset_y * zoom_level)
-                else:
-                    scaled_offset_x = grid_manager.settings.offset_x
-                    scaled_offset_y = grid_manager.settings.offset_y
+    def get_repaint_stats(self) -> dict:
+        """Repainted pixels per frame plus overlay layer statistics"""
+        stats = self.damage_tracker.get_stats()
+        stats['overlay'] = self.overlay_layers.get_stats()
+        return stats
 
-        # Fallback to default color/opacity if GridManager not available
-        if grid_color is None:
-            from PyQt6.QtGui import QColor
-            grid_color = QColor(getattr(self, 'grid_color', QColor(128, 128, 128)))
-            if hasattr(grid_color, 'setAlphaF'):
-                grid_color.setAlphaF(getattr(self, 'grid_opacity', 0.7))
+    def draw_selection_overlay(self):
+        """Selection changed - re-render only the selection/handle layer"""
+        if self.page_pixmap is None:
+            return
+        self.overlay_layers.invalidate_selection()
+        self._refresh_overlay_layers()
 
-        pen = QPen(grid_color, 1)
-        painter.setPen(pen)
+    def redraw_grid(self):
+        """Grid settings changed - re-render only the grid layer"""
+        if self.page_pixmap is None:
+            return
+        self.overlay_layers.invalidate_grid()
+        self._refresh_overlay_layers()
 
-        # Only draw grid within page boundaries
-        if not hasattr(self, 'page_positions') or not self.page_positions:
-            # Fallback to original behavior if no page position info
-            self._draw_grid_fallback(painter, viewport_rect, scaled_grid_size, scaled_offset_x, scaled_offset_y)
+    def set_page(self, page_number: int):
+        """Set current page and render it"""
+        if not self.pdf_document:
             return
 
-        pages_drawn = 0
+        if 0 <= page_number < self.pdf_document.page_count:
+            self.current_page = page_number
+            self.render_page()
+
+    def set_zoom(self, zoom_level: float):
+        """Set zoom level and re-render"""
+        if zoom_level < 0.1 or zoom_level > 5.0:
+            return
 
-        # Draw grid for each page that intersects with viewport
-        for page_num, page_top in enumerate(self.page_positions):
-            if page_num >= len(self.pdf_document):
-                continue
+        self.zoom_level = zoom_level
 
-            # Get page dimensions
-            page = self.pdf_document[page_num]
-            page_width = int(page.rect.width * zoom_level)
-            page_height = int(page.rect.height * zoom_level)
-
-            # Page boundaries in screen coordinates
-            page_left = 10  # Standard horizontal margin from canvas
-            page_right = page_left + page_width
-            page_bottom = page_top + page_height
-
-            # Check if this page intersects with viewport
-            if (page_bottom < viewport_rect.top() or
-                    page_top > viewport_rect.bottom() or
-                    page_right < viewport_rect.left() or
-                    page_left > viewport_rect.right()):
-                continue  # Page not visible in viewport
-
-            pages_drawn += 1
-
-            # Calculate intersection of page and viewport
-            draw_left = max(page_left, viewport_rect.left())
-            draw_right = min(page_right, viewport_rect.right())
-            draw_top = max(page_top, viewport_rect.top())
-            draw_bottom = min(page_bottom, viewport_rect.bottom())
-
-            # Calculate grid start positions for this page
-            # Grid starts from page top-left corner, then apply offset
-            grid_start_x = page_left + (scaled_offset_x % scaled_grid_size)
-            grid_start_y = page_top + (scaled_offset_y % scaled_grid_size)
-
-            # Draw vertical lines for this page (within viewport intersection)
-            x = grid_start_x
-            while x < draw_right:
-                if x >= draw_left:
-                    painter.drawLine(x, draw_top, x, draw_bottom)
-                x += scaled_grid_size
-
-            # Draw horizontal lines for this page (within viewport intersection)
-            y = grid_start_y
-            while y < draw_bottom:
-                if y >= draw_top:
-                    painter.drawLine(draw_left, y, draw_right, y)
-                y += scaled_grid_size
-
-        print(f"🎯 Drew page-bounded grid for {pages_drawn} visible pages at {zoom_level:.1f}x zoom")
+        # Update PageManager zoom level
+        if hasattr(self, 'field_manager'):
+            self.field_manager.page_manager.set_zoom_level(zoom_level)
+
+        # ✅ ADD THIS LINE - Update enhanced drag handler zoom level
+        if hasattr(self, 'enhanced_drag_handler'):
+            self.enhanced_drag_handler.set_zoom_level(zoom_level)
+
+        # Re-layout with new zoom level; tiles sharpen progressively after a scaled preview
+        self._zoom_in_progress = True
+        try:
+            self.render_page()
+        finally:
+            self._zoom_in_progress = False
+        # self.update_drag_handler_for_document()
 
     def working_draw_grid_in_viewport_zoomed(self, painter: QPainter, viewport_rect: QRect, zoom_level: float):
         """Draw grid scaled appropriately for zoom level"""
@@ -892,63 +974,6 @@ class PDFCanvas(QLabel):
             if viewport_rect.top() <= y <= viewport_rect.bottom():
                 painter.drawLine(viewport_rect.left(), y, viewport_rect.right(), y)
 
-    def _render_field_at_zoom(self, painter: QPainter, field: FormField,
-                              selected_field: FormField, zoom_level: float):
-        """Render field with zoom-appropriate detail level"""
-
-        # Get screen coordinates
-        page_num = getattr(field, 'page_number', 0)
-        screen_coords = self.document_to_screen_coordinates(page_num, field.x, field.y)
-
-        if not screen_coords:
-            return
-
-        screen_x, screen_y = screen_coords
-        field_width = int(field.width * zoom_level)
-        field_height = int(field.height * zoom_level)
-
-        # Adjust rendering detail based on zoom level
-        if zoom_level < 0.5:
-            # Low zoom: simple rectangles only
-            self._render_field_simple(painter, screen_x, screen_y, field_width, field_height, field)
-        elif zoom_level < 2.0:
-            # Medium zoom: normal detail
-            self._render_field_normal(painter, screen_x, screen_y, field_width, field_height, field)
-        else:
-            # High zoom: full detail including borders, text, etc.
-            self._render_field_detailed(painter, screen_x, screen_y, field_width, field_height, field)
-
-        # Draw selection handles if selected (scale with zoom)
-        if field == selected_field:
-            self._draw_selection_handles_zoomed(painter, screen_x, screen_y,
-                                                field_width, field_height, zoom_level)
-
-    def _draw_selection_handles_zoomed(self, painter: QPainter, x: int, y: int,
-                                       width: int, height: int, zoom_level: float):
-        """Draw selection handles scaled appropriately for zoom"""
-
-        # Scale handle size with zoom, but keep readable
-        base_handle_size = 8
-        handle_size = max(6, min(16, int(base_handle_size * zoom_level)))
-
-        # Draw selection rectangle
-        painter.setPen(QPen(QColor(255, 0, 0), max(1, int(2 * zoom_level))))
-        painter.setBrush(QBrush())
-        painter.drawRect(x - 2, y - 2, width + 4, height + 4)
-
-        # Draw corner handles
-        painter.setBrush(QBrush(QColor(255, 0, 0)))
-
-        positions = [
-            (x - handle_size // 2, y - handle_size // 2),  # Top-left
-            (x + width - handle_size // 2, y - handle_size // 2),  # Top-right
-            (x - handle_size // 2, y + height - handle_size // 2),  # Bottom-left
-            (x + width - handle_size // 2, y + height - handle_size // 2)  # Bottom-right
-        ]
-
-        for pos_x, pos_y in positions:
-            painter.drawRect(pos_x, pos_y, handle_size, handle_size)
-
     def update_current_page_from_scroll(self):
         """Update current page and render controls with zoom awareness"""
         try:
@@ -1000,22 +1025,20 @@ class PDFCanvas(QLabel):
         # Update scroll position to maintain focus point
         self._maintain_zoom_focus_point(old_zoom, new_zoom_level)
 
-    def get_rendering_strategy_for_zoom(self, zoom_level: float) -> str:
-        """Determine rendering strategy based on zoom level"""
-        if zoom_level < 0.3:
-            return "ultra_low_detail"  # Just colored rectangles
-        elif zoom_level < 0.7:
-            return "low_detail"  # Simple borders, no text
-        elif zoom_level < 1.5:
-            return "normal_detail"  # Standard rendering
-        elif zoom_level < 3.0:
-            return "high_detail"  # Enhanced borders, full text
-        else:
-            return "ultra_high_detail"  # All decorations, crisp text
+    def set_field_detail_threshold(self, pixels: int):
+        """Screen height (pixels) below which fields are drawn as plain blocks"""
+        if not hasattr(self.field_renderer, 'detail_threshold'):
+            return
+        self.field_renderer.detail_threshold = max(0, int(pixels))
+        self.overlay_layers.invalidate_fields()
+        self._refresh_overlay_layers()
 
     def draw_controls_and_overlay(self, start_page: int, end_page: int, viewport_rect: QRect):
         """
-        Draw controls with zoom-aware viewport handling
+        Bring the overlay up to date after a scroll stop
+
+        Only overlay layers that do not yet cover the new viewport (plus margin) are
+        rendered; page field layers that are still valid are reused.
 
         Args:
             start_page: First visible page (0-based)
@@ -1030,48 +1053,13 @@ class PDFCanvas(QLabel):
             print(f"🎨 Drawing controls for pages {start_page}-{end_page} at zoom {zoom_level:.1f}x")
             print(f"   Viewport: {viewport_rect} (canvas coords)")
 
-            # Create overlay copy
-            overlay_pixmap = self.page_pixmap.copy()
-            painter = QPainter(overlay_pixmap)
-
-            # Scale grid size with zoom
-            if self.show_grid:
-                self._draw_grid_in_viewport_zoomed(painter, viewport_rect, zoom_level)
-
-            # Draw fields with zoom-aware filtering
-            if self.field_renderer and hasattr(self, 'field_manager'):
-                selected_field = self.selection_handler.get_selected_field() if hasattr(self,
-                                                                                        'selection_handler') else None
-
-                total_fields_rendered = 0
-                for page_num in range(start_page, end_page + 1):
-                    # Get fields on this page
-                    page_fields = [f for f in self.field_manager.fields
-                                   if getattr(f, 'page_number', 0) == page_num]
-
-                    # Filter fields visible in zoomed viewport
-                    visible_fields = self._filter_fields_in_zoomed_viewport(
-                        page_fields, viewport_rect, page_num, zoom_level
-                    )
-
-                    print(f"   Page {page_num}: {len(visible_fields)}/{len(page_fields)} fields in zoomed viewport")
-
-                    # Render visible fields at current zoom
-                    for field in visible_fields:
-                        self._render_field_at_zoom(painter, field, selected_field, zoom_level)
-                        total_fields_rendered += 1
-
-                print(f"✅ Rendered {total_fields_rendered} fields at {zoom_level:.1f}x zoom")
-
-            painter.end()
-            self.setPixmap(overlay_pixmap)
+            self._refresh_overlay_layers()
 
         except Exception as e:
             print(f"❌ Error in draw_controls_and_overlay: {e}")
 
     def draw_overlay(self):
-
-        """Draw overlay with fields and grid for all visible pages"""
+        """Invalidate and re-render every overlay layer (grid, page fields, selection)"""
         if hasattr(self, 'enhanced_drag_handler') and self.enhanced_drag_handler.is_dragging:
             return  # Skip expensive redraw during drag - overlay handles it!
 
@@ -1085,52 +1073,8 @@ class PDFCanvas(QLabel):
         try:
             self._rendering_in_progress = True
 
-            # Create a copy of the pixmap to draw on
-            overlay_pixmap = self.page_pixmap.copy()
-            painter = QPainter(overlay_pixmap)
-
-            # Draw grid if enabled
-            if self.show_grid:
-                self._draw_grid(painter)
-
-            # Draw fields if available - HANDLE MULTIPLE VISIBLE PAGES
-            if self.field_renderer and hasattr(self.field_renderer, 'render_fields'):
-                # Get primary selected field
-                primary_selected_field = self.selection_handler.get_selected_field() if hasattr(self,
-                                                                                                'selection_handler') else None
-
-                # Get ALL selected fields from drag handler for counting
-                multi_selected_fields = []
-                if hasattr(self, 'enhanced_drag_handler') and hasattr(self.enhanced_drag_handler, 'get_selected_fields'):
-                    multi_selected_fields = self.enhanced_drag_handler.get_selected_fields()
-
-                # Get ALL visible pages
-                visible_pages = self.get_visible_page_numbers()
-                print(f"🎨 Drawing fields for visible pages: {visible_pages}")
-
-                # DEBUG: Check what fields exist per page
-                total_fields = len(self.field_manager.fields) if self.field_manager else 0
-                print(f"🎨 Total fields in manager: {total_fields}")
-                print(f"🎨 Multi-selected fields: {len(multi_selected_fields)}")
-
-                # Render fields for each visible page (WITHOUT multi_selected_fields parameter)
-                for page_num in visible_pages:
-                    self.field_renderer.render_fields(
-                        painter,
-                        self.field_manager.fields,
-                        primary_selected_field,
-                        page_num,
-                        zoom_level=self.zoom_level,
-                        coord_transform_func=self.document_to_screen_coordinates
-                    )
-
-            # ✅ Draw selection handles for all selected fields AFTER field rendering
-            self._draw_selection_handles(painter)
-
-            painter.end()
-
-            # Update the displayed pixmap
-            self.setPixmap(overlay_pixmap)
+            self.overlay_layers.invalidate_all()
+            self._refresh_overlay_layers()
 
         except Exception as e:
             print(f"Error drawing overlay: {e}")
@@ -1319,8 +1263,8 @@ class PDFCanvas(QLabel):
             self.scroll_timer.stop()
             print("✅ Scroll tracking timer stopped")
 
-    def _draw_grid(self, painter):
-        """Draw enhanced grid overlay with offset support"""
+    def _draw_grid(self, painter, area: QRect = None):
+        """Draw enhanced grid overlay with offset support (limited to area, default the overlay area)"""
         if not self.page_pixmap or not self.show_grid:
             return
 
@@ -1335,6 +1279,12 @@ class PDFCanvas(QLabel):
         width = self.page_pixmap.width()
         height = self.page_pixmap.height()
 
+        # Only the overlay area (viewport + margin) is ever drawn
+        if area is None:
+            area = getattr(self, '_overlay_rect', None)
+        if area is None or area.isEmpty():
+            area = QRect(0, 0, width, height)
+
         # Check if we should sync with zoom (look for GridManager setting)
         should_sync_with_zoom = True  # Default behavior
 
@@ -1363,15 +1313,20 @@ class PDFCanvas(QLabel):
         if scaled_grid_size < 2:
             return
 
-        # Draw vertical lines with offset
+        top, bottom = area.top(), min(height, area.bottom() + 1)
+        left, right = area.left(), min(width, area.right() + 1)
+
+        # Draw vertical lines with offset (first line at or after the area's left edge)
         start_x = (scaled_offset_x % scaled_grid_size)
-        for x in range(start_x, width, scaled_grid_size):
-            painter.drawLine(x, 0, x, height)
+        start_x += max(0, (left - start_x + scaled_grid_size - 1) // scaled_grid_size) * scaled_grid_size
+        for x in range(start_x, right, scaled_grid_size):
+            painter.drawLine(x, top, x, bottom)
 
         # Draw horizontal lines with offset
         start_y = (scaled_offset_y % scaled_grid_size)
-        for y in range(start_y, height, scaled_grid_size):
-            painter.drawLine(0, y, width, y)
+        start_y += max(0, (top - start_y + scaled_grid_size - 1) // scaled_grid_size) * scaled_grid_size
+        for y in range(start_y, bottom, scaled_grid_size):
+            painter.drawLine(left, y, right, y)
 
     def increase_grid_size(self):
         """Increase grid size"""
@@ -1379,7 +1334,7 @@ class PDFCanvas(QLabel):
         self.grid_size = min(self.grid_size + 5, 100)  # Max 100px
         if self.grid_size != old_size:
             self._update_drag_handler_grid()
-            self.draw_overlay()
+            self.redraw_grid()
             return True
         return False
 
@@ -1389,39 +1344,39 @@ class PDFCanvas(QLabel):
         self.grid_size = max(self.grid_size - 5, 5)  # Min 5px
         if self.grid_size != old_size:
             self._update_drag_handler_grid()
-            self.draw_overlay()
+            self.redraw_grid()
             return True
         return False
 
     def move_grid_up(self):
         """Move grid up by 1 pixel"""
         self.grid_offset_y = (self.grid_offset_y - 1) % self.grid_size
-        self.draw_overlay()
+        self.redraw_grid()
         return True
 
     def move_grid_down(self):
         """Move grid down by 1 pixel"""
         self.grid_offset_y = (self.grid_offset_y + 1) % self.grid_size
-        self.draw_overlay()
+        self.redraw_grid()
         return True
 
     def move_grid_left(self):
         """Move grid left by 1 pixel"""
         self.grid_offset_x = (self.grid_offset_x - 1) % self.grid_size
-        self.draw_overlay()
+        self.redraw_grid()
         return True
 
     def move_grid_right(self):
         """Move grid right by 1 pixel"""
         self.grid_offset_x = (self.grid_offset_x + 1) % self.grid_size
-        self.draw_overlay()
+        self.redraw_grid()
         return True
 
     def reset_grid_offset(self):
         """Reset grid offset to origin"""
         self.grid_offset_x = 0
         self.grid_offset_y = 0
-        self.draw_overlay()
+        self.redraw_grid()
         return True
 
     def set_grid_size(self, size):
@@ -1430,7 +1385,7 @@ class PDFCanvas(QLabel):
         if size != self.grid_size:
             self.grid_size = size
             self._update_drag_handler_grid()
-            self.draw_overlay()
+            self.redraw_grid()
             return True
         return False
 
@@ -1473,7 +1428,7 @@ class PDFCanvas(QLabel):
         self.show_grid = not self.show_grid
         if hasattr(self.enhanced_drag_handler, 'set_grid_settings'):
             self.enhanced_drag_handler.set_grid_settings(self.grid_size, self.show_grid)
-        self.draw_overlay()
+        self.redraw_grid()
 
     def get_fields_as_objects(self):
         """Get all fields as objects"""
@@ -1669,19 +1624,19 @@ class PDFCanvas(QLabel):
 
         if key == Qt.Key.Key_Left:
             self.enhanced_drag_handler.handle_keyboard_move(-move_distance, 0)
-            self.draw_overlay()
+            self.flush_damage()
             event.accept()
         elif key == Qt.Key.Key_Right:
             self.enhanced_drag_handler.handle_keyboard_move(move_distance, 0)
-            self.draw_overlay()
+            self.flush_damage()
             event.accept()
         elif key == Qt.Key.Key_Up:
             self.enhanced_drag_handler.handle_keyboard_move(0, -move_distance)
-            self.draw_overlay()
+            self.flush_damage()
             event.accept()
         elif key == Qt.Key.Key_Down:
             self.enhanced_drag_handler.handle_keyboard_move(0, move_distance)
-            self.draw_overlay()
+            self.flush_damage()
             event.accept()
         # Duplicate shortcut (Ctrl+D) - ADD THIS TO keyPressEvent
         elif key == Qt.Key.Key_D and modifiers & Qt.KeyboardModifier.ControlModifier:
@@ -1716,14 +1671,14 @@ class PDFCanvas(QLabel):
         elif key == Qt.Key.Key_A and modifiers & Qt.KeyboardModifier.ControlModifier:
             for field in self.field_manager.fields:
                 self.enhanced_drag_handler.select_field(field, add_to_selection=True)
-            self.draw_overlay()
+            self.draw_selection_overlay()
             event.accept()
 
         # Escape to clear selection
         elif key == Qt.Key.Key_Escape:
             self.enhanced_drag_handler.clear_selection()
             self.selection_handler.clear_selection()
-            self.draw_overlay()
+            self.draw_selection_overlay()
             event.accept()
 
         else:
@@ -1785,29 +1740,39 @@ class PDFCanvas(QLabel):
     # Mouse event handlers
 
     def paintEvent(self, event):
-        """Paint event to render PDF and fields"""
-        super().paintEvent(event)
+        """Paint visible page tiles and the field/grid overlay"""
+        if not self.pdf_document or self.page_pixmap is None:
+            # No document - let QLabel draw the placeholder text
+            super().paintEvent(event)
+            return
 
+        painter = QPainter(self)
         try:
-            # Get a painter for this widget
-            from PyQt6.QtGui import QPainter, QPen, QBrush, QColor
-            painter = QPainter(self)
+            exposed = event.rect()
+            self._record_repaint(event)
+            self.tile_layer.update_viewport(self._get_viewport_rect())
 
-            # Draw all fields
-            #if hasattr(self, 'field_manager') and self.field_manager:
-            #    for field in self.field_manager.fields:
-            #        self._draw_field(painter, field)
+            # Only tiles touching the exposed area are painted (and rasterized if missing)
+            self.tile_layer.paint(painter, exposed)
 
-            # Draw selection handles for selected field
-            #if (hasattr(self, 'selection_handler') and
-            #    self.selection_handler and
-            #    hasattr(self.selection_handler, 'selected_field') and
-            #    self.selection_handler.selected_field):
-
-            #    self._draw_selection_handles(painter, self.selection_handler.selected_field)
+            if not self.overlay_layers.is_empty():
+                self.overlay_layers.paint(painter, exposed)
+            elif not getattr(self, '_rendering_in_progress', False):
+                # First paint after layout (widget was not visible yet) - build overlay next
+                QTimer.singleShot(0, self.draw_overlay)
 
         except Exception as e:
             print(f"⚠️ Error in paintEvent: {e}")
+        finally:
+            painter.end()
+
+    def _record_repaint(self, event):
+        """Count the pixels this paint event repaints"""
+        try:
+            rects = list(event.region())
+        except TypeError:
+            rects = [event.rect()]
+        self.damage_tracker.record_frame(rects)
 
     def _draw_field(self, painter, field):
         """Draw a single field"""
@@ -2050,25 +2015,20 @@ class PDFCanvas(QLabel):
             return None
 
         # Find which page was clicked
-        for page_num, page_top in enumerate(self.page_positions):
-            # Get page height (accounting for zoom)
-            page = self.pdf_document[page_num]
-            page_height = int(page.rect.height * self.zoom_level)
-            page_bottom = page_top + page_height
-
-            if page_top <= screen_y <= page_bottom:
-                # Click is within this page
-                # Convert to page-relative coordinates
-                page_relative_x = screen_x - 10  # Remove horizontal margin
-                page_relative_y = screen_y - page_top
+        page_num = self.layout_index.page_at(screen_y)
+        if page_num is None:
+            return None  # Click was in gap/margin area
 
-                # Convert to document coordinates (remove zoom)
-                doc_x = page_relative_x / self.zoom_level
-                doc_y = page_relative_y / self.zoom_level
+        # Click is within this page
+        # Convert to page-relative coordinates
+        page_relative_x = screen_x - self.PAGE_MARGIN_X
+        page_relative_y = screen_y - self.layout_index.tops[page_num]
 
-                return (page_num, doc_x, doc_y)
+        # Convert to document coordinates (remove zoom)
+        doc_x = page_relative_x / self.zoom_level
+        doc_y = page_relative_y / self.zoom_level
 
-        return None  # Click was in gap/margin area
+        return (page_num, doc_x, doc_y)
 
     def document_to_screen_coordinates(self, page_num, doc_x, doc_y):
         """Convert document coordinates back to screen coordinates"""
@@ -2083,7 +2043,7 @@ class PDFCanvas(QLabel):
         page_relative_y = doc_y * self.zoom_level
 
         # Add page layout offsets
-        screen_x = page_relative_x + 10  # Add horizontal margin
+        screen_x = page_relative_x + self.PAGE_MARGIN_X
         screen_y = page_relative_y + page_top
 
         return (int(screen_x), int(screen_y))
@@ -2528,7 +2488,7 @@ class PDFCanvas(QLabel):
 
                 if was_dragging:
                     print("✅ Drag operation completed")
-                    self.draw_overlay()
+                    self.flush_damage()  # Moved fields reported their old/new rects
 
                     # Notify main window of changes
                     main_window = self._get_main_window()
@@ -2656,14 +2616,9 @@ class PDFCanvas(QLabel):
             return 0
 
         try:
-            for page_num, page_top in enumerate(self.page_positions):
-                # Get page height (accounting for zoom)
-                page = self.pdf_document[page_num]
-                page_height = int(page.rect.height * self.zoom_level)
-                page_bottom = page_top + page_height
-
-                if page_top <= y_position <= page_bottom:
-                    return page_num
+            page_num = self.layout_index.page_at(y_position)
+            if page_num is not None:
+                return page_num
 
             # If not found, return last page
             return len(self.page_positions) - 1 if self.page_positions else 0
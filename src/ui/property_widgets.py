@@ -769,12 +769,7 @@ class XPropertiesPanel(QWidget):
         if not self.field_manager:
             self.field_manager = self._get_field_manager()
 
-        existing_names = []
-        for field in self.field_manager.get_all_fields():
-            if exclude_control_id is None or field.id != exclude_control_id:
-                existing_names.append(field.name.lower())
-
-        return name.lower() in existing_names
+        return self.field_manager.is_name_duplicate(name, exclude_control_id)
 
     def show_error_message_box(self, error_message):
         """Show error message box only"""
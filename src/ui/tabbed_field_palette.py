@@ -473,9 +473,9 @@ class PropertiesTab(QWidget):
             if hasattr(self, 'current_field') and self.current_field:
                 # Update the field's appearance properties
                 if 'appearance' not in self.current_field.properties:
-                    self.current_field.properties['appearance'] = {}
+                    self.current_field.set_appearance({})
                 else:
-                    self.current_field.properties['appearance'].update(appearance_props)
+                    self.current_field.update_appearance(appearance_props)
 
                 print(f"✅ Updated appearance for field {self.current_field.id}")
 
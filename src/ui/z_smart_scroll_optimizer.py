@@ -62,6 +62,20 @@ class SmartScrollOptimizer:
         # Update tracking state
         self._update_tracking_state(new_visible_pages, new_viewport_rect, current_time)
 
+    def analyze_scroll(self, new_viewport_rect: QRectF, current_time: float) -> dict:
+        """Direction, velocity and deltas of a scroll relative to the last tracked viewport"""
+        return self._analyze_scroll_movement(new_viewport_rect, current_time)
+
+    def track_scroll_state(self, new_visible_pages: List[int], new_viewport_rect: QRectF, current_time: float):
+        """Remember a viewport as the reference for the next analyze_scroll"""
+        self._update_tracking_state(new_visible_pages, new_viewport_rect, current_time)
+
+    def reset(self):
+        """Forget the tracked viewport (the next scroll is treated as initial)"""
+        self.last_visible_pages = []
+        self.last_viewport_rect = QRectF()
+        self.last_scroll_time = 0.0
+
     def _analyze_scroll_movement(self, new_viewport_rect: QRectF, current_time: float) -> dict:
         """Analyze scroll direction, speed, and type"""
 
@@ -9,6 +9,7 @@ from .geometry_utils import (
     ResizeCalculator, AlignmentUtils, DistributionUtils
 )
 from .icon_utils import create_app_icon, create_field_icon, create_toolbar_icons
+from .pixmap_utils import fitz_pixmap_to_qimage, fitz_pixmap_to_qpixmap, samples_to_qimage
 
 __all__ = [
     'GridUtils',
@@ -19,5 +20,8 @@ __all__ = [
     'DistributionUtils',
     'create_app_icon',
     'create_field_icon',
-    'create_toolbar_icons'
+    'create_toolbar_icons',
+    'fitz_pixmap_to_qimage',
+    'fitz_pixmap_to_qpixmap',
+    'samples_to_qimage'
 ]
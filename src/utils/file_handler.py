@@ -0,0 +1,55 @@
+"""
+File Handler
+Helpers for files on disk shared by the on-disk caches
+
+Content hashes are remembered per file until its size or mtime changes, so the
+TOC cache and the link index hash a document once between them. Import this
+module as utils.file_handler everywhere - a second module root would keep a
+second set of hashes.
+"""
+
+import hashlib
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+_hash_lock = threading.Lock()
+_known_hashes: Dict[str, Tuple[Tuple[int, int], str]] = {}  # path -> (signature, SHA-256)
+
+
+def file_signature(file_path: str) -> Tuple[int, int]:
+    """(size, mtime in ns) - changes whenever the file is rewritten or touched"""
+    stat = os.stat(file_path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def known_content_hash(file_path: str) -> Optional[str]:
+    """SHA-256 already computed for the file as it is now, None if getting it needs a full read"""
+    try:
+        signature = file_signature(file_path)
+    except OSError:
+        return None
+    with _hash_lock:
+        entry = _known_hashes.get(os.path.abspath(file_path))
+    if entry is None or entry[0] != signature:
+        return None
+    return entry[1]
+
+
+def file_content_hash(file_path: str) -> str:
+    """SHA-256 of a file's content (reads the file unless it is already known)"""
+    known = known_content_hash(file_path)
+    if known is not None:
+        return known
+
+    signature = file_signature(file_path)
+    sha256_hash = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for byte_block in iter(lambda: f.read(1 << 20), b""):
+            sha256_hash.update(byte_block)
+    digest = sha256_hash.hexdigest()
+
+    if file_signature(file_path) == signature:  # Not rewritten while reading
+        with _hash_lock:
+            _known_hashes[os.path.abspath(file_path)] = (signature, digest)
+    return digest
@@ -0,0 +1,163 @@
+"""
+Page Layout Index
+Prefix-sum index over vertically stacked pages
+
+Page sizes (in points) are read once per document. Zoom changes only rebuild
+the prefix sums of page tops, and position queries are answered by bisection
+instead of scanning every page.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import List, Optional, Sequence, Tuple
+
+
+class PageLayoutIndex:
+    """Page tops/bottoms for a vertical page stack with O(log n) lookups"""
+
+    def __init__(self, page_sizes: Sequence[Tuple[float, float]] = (), zoom: float = 1.0,
+                 top_margin: float = 15, spacing: float = 15, integer_heights: bool = True):
+        """
+        Args:
+            page_sizes: (width, height) of each page in points
+            zoom: Points to pixels scale
+            top_margin: Pixels above the first page
+            spacing: Pixels between pages
+            integer_heights: Truncate zoomed heights to int (matches int(h * zoom) layouts)
+        """
+        self.page_sizes: List[Tuple[float, float]] = list(page_sizes)
+        self.zoom = zoom
+        self.top_margin = top_margin
+        self.spacing = spacing
+        self.integer_heights = integer_heights
+
+        self.tops: List[float] = []
+        self.bottoms: List[float] = []
+        self.heights: List[float] = []
+        self.widths: List[float] = []
+        self.rebuild_count = 0
+
+        self.rebuild()
+
+    @classmethod
+    def from_positions(cls, tops: Sequence[float], heights: Sequence[float],
+                       widths: Sequence[float] = ()) -> "PageLayoutIndex":
+        """Index an already laid-out stack (e.g. page_positions from a render pass)"""
+        index = cls()
+        index.tops = list(tops)
+        index.heights = list(heights)
+        index.widths = list(widths)
+        index.bottoms = [top + height for top, height in zip(index.tops, index.heights)]
+        index.rebuild_count = 1
+        return index
+
+    # ========================================
+    # BUILDING
+    # ========================================
+
+    def set_page_sizes(self, page_sizes: Sequence[Tuple[float, float]]):
+        """New document (or page sizes changed) - full rebuild"""
+        self.page_sizes = list(page_sizes)
+        self.rebuild()
+
+    def set_zoom(self, zoom: float):
+        """Zoom change - page sizes are reused, only prefix sums are recomputed"""
+        if zoom == self.zoom and self.tops:
+            return
+        self.zoom = zoom
+        self.rebuild()
+
+    def set_spacing(self, top_margin: float = None, spacing: float = None):
+        """Change margins/spacing and recompute positions"""
+        if top_margin is not None:
+            self.top_margin = top_margin
+        if spacing is not None:
+            self.spacing = spacing
+        self.rebuild()
+
+    def rebuild(self):
+        """Prefix sums of page tops at the current zoom"""
+        heights = []
+        widths = []
+        for width, height in self.page_sizes:
+            zoomed_width = width * self.zoom
+            zoomed_height = height * self.zoom
+            widths.append(int(zoomed_width) if self.integer_heights else zoomed_width)
+            heights.append(int(zoomed_height) if self.integer_heights else zoomed_height)
+
+        tops = []
+        current_y = self.top_margin
+        for height in heights:
+            tops.append(current_y)
+            current_y += height + self.spacing
+
+        self.heights = heights
+        self.widths = widths
+        self.tops = tops
+        self.bottoms = [top + height for top, height in zip(tops, heights)]
+        self.rebuild_count += 1
+
+    # ========================================
+    # QUERIES
+    # ========================================
+
+    def __len__(self) -> int:
+        return len(self.tops)
+
+    def get_page_top(self, page_num: int) -> Optional[float]:
+        """Top of a page, or None if out of range"""
+        if 0 <= page_num < len(self.tops):
+            return self.tops[page_num]
+        return None
+
+    def get_page_height(self, page_num: int) -> Optional[float]:
+        """Zoomed height of a page, or None if out of range"""
+        if 0 <= page_num < len(self.heights):
+            return self.heights[page_num]
+        return None
+
+    def get_page_width(self, page_num: int) -> Optional[float]:
+        """Zoomed width of a page, or None if out of range"""
+        if 0 <= page_num < len(self.widths):
+            return self.widths[page_num]
+        return None
+
+    def get_total_height(self) -> float:
+        """Bottom of the last page (without bottom margin)"""
+        return self.bottoms[-1] if self.bottoms else self.top_margin
+
+    def page_at(self, y: float) -> Optional[int]:
+        """Page whose [top, bottom] contains y (first one on a shared edge), else None"""
+        i = bisect_right(self.tops, y) - 1
+        if i < 0:
+            return None
+        if i > 0 and y <= self.bottoms[i - 1]:
+            return i - 1
+        return i if y <= self.bottoms[i] else None
+
+    def nearest_page(self, y: float) -> int:
+        """Page containing y, or the page with the closest top/bottom edge when y is in a gap"""
+        if not self.tops:
+            return 0
+
+        page = self.page_at(y)
+        if page is not None:
+            return page
+
+        i = bisect_right(self.tops, y) - 1
+        candidates = [p for p in (i, i + 1) if 0 <= p < len(self.tops)]
+        return min(candidates, key=lambda p: (min(abs(y - self.tops[p]), abs(y - self.bottoms[p])), p))
+
+    def pages_in_range(self, top: float, bottom: float, inclusive: bool = True) -> range:
+        """
+        Pages overlapping the vertical band [top, bottom]
+
+        inclusive=False only counts strict overlap (touching edges do not intersect),
+        matching QRectF.intersects.
+        """
+        if inclusive:
+            start = bisect_left(self.bottoms, top)
+            end = bisect_right(self.tops, bottom)
+        else:
+            start = bisect_right(self.bottoms, top)
+            end = bisect_left(self.tops, bottom)
+        return range(start, max(start, end))
@@ -0,0 +1,83 @@
+"""
+Pixmap Utilities
+Zero-copy conversion from PyMuPDF pixmaps to Qt images
+
+fitz.Pixmap.samples is already raw, row-packed pixel data, so it can be wrapped
+as a QImage directly instead of encoding a PPM and parsing it straight back.
+"""
+
+from PyQt6.QtGui import QImage, QPixmap
+
+# Try to import PyMuPDF
+try:
+    import fitz
+    FITZ_AVAILABLE = True
+except ImportError:
+    FITZ_AVAILABLE = False
+    fitz = None
+
+
+# Samples per pixel -> QImage format (MuPDF alpha is premultiplied)
+_FORMATS = {
+    (1, False): QImage.Format.Format_Grayscale8,
+    (3, False): QImage.Format.Format_RGB888,
+    (4, True): QImage.Format.Format_RGBA8888_Premultiplied,
+}
+
+
+def qimage_format_for(components: int, alpha: bool):
+    """QImage format for a pixmap layout, or None if it needs colorspace conversion"""
+    return _FORMATS.get((components, bool(alpha)))
+
+
+def samples_to_qimage(samples, width: int, height: int, stride: int, components: int,
+                      alpha: bool, keep_alive=None) -> QImage:
+    """
+    Wrap raw pixel samples as a QImage without copying
+
+    Args:
+        samples: bytes/memoryview with height * stride bytes
+        width, height: Image size in pixels
+        stride: Bytes per row
+        components: Samples per pixel (1, 3 or 4)
+        alpha: Whether the last component is alpha
+        keep_alive: Object owning the buffer; kept referenced by the image
+
+    Returns:
+        QImage sharing the sample buffer, or a null QImage for unsupported layouts
+    """
+    image_format = qimage_format_for(components, alpha)
+    if image_format is None:
+        return QImage()
+
+    image = QImage(samples, width, height, stride, image_format)
+
+    # QImage does not own foreign buffers - pin the owner for the image's lifetime
+    image._buffer_owner = keep_alive if keep_alive is not None else samples
+    return image
+
+
+def fitz_pixmap_to_qimage(pix) -> QImage:
+    """
+    Convert a fitz.Pixmap to a QImage sharing the pixmap's sample buffer
+
+    Gray, RGB and RGBA pixmaps are wrapped as-is (correct stride, premultiplied
+    alpha). Other layouts (CMYK, gray+alpha) are converted to RGB(A) first.
+    """
+    if qimage_format_for(pix.n, pix.alpha) is None:
+        pix = fitz.Pixmap(fitz.csRGB, pix)  # One conversion, then wrap
+
+    # samples_mv is a view into MuPDF memory (PyMuPDF >= 1.22); samples is a bytes copy
+    samples = getattr(pix, 'samples_mv', None)
+    if samples is None:
+        samples = pix.samples
+
+    return samples_to_qimage(samples, pix.width, pix.height, pix.stride, pix.n, pix.alpha, keep_alive=pix)
+
+
+def fitz_pixmap_to_qpixmap(pix) -> QPixmap:
+    """Convert a fitz.Pixmap to a QPixmap (single upload copy, no PPM round-trip)"""
+    image = fitz_pixmap_to_qimage(pix)
+    if image.isNull():
+        return QPixmap()
+    return QPixmap.fromImage(image)
@@ -0,0 +1,26 @@
+"""
+Shared test configuration
+
+Puts the repository root and src/ on sys.path (the app imports modules both as
+models.X / utils.X and as src.X) and runs Qt without a display.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+for path in (ROOT / "src", ROOT):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """One QApplication for every test that needs QPixmap/QWidget"""
+    from PyQt6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
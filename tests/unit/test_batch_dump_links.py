@@ -0,0 +1,132 @@
+"""
+Tests for the headless batch link/TOC dump
+"""
+
+import json
+import multiprocessing
+import os
+
+import fitz
+import pytest
+
+import a_batch_dump_links
+from a_batch_dump_links import completed_files, dump_file, find_pdfs, run_batch
+
+
+def make_pdf(path, links=0, toc=True):
+    doc = fitz.open()
+    for _ in range(2):
+        doc.new_page()
+    for i in range(links):
+        doc[0].insert_link({'kind': fitz.LINK_GOTO, 'from': fitz.Rect(10, 10 + i * 30, 50, 30 + i * 30), 'page': 1})
+    if toc:
+        doc.set_toc([[1, "Start", 1], [2, "End", 2]])
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+def read_records(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    folder = tmp_path / "corpus"
+    (folder / "nested").mkdir(parents=True)
+    return {
+        'a': make_pdf(folder / "a.pdf", links=2),
+        'b': make_pdf(folder / "b.pdf", links=3),
+        'nested': make_pdf(folder / "nested" / "c.PDF", links=1),
+        'folder': str(folder)
+    }
+
+
+def test_find_pdfs_in_directories_and_globs(corpus, tmp_path):
+    (tmp_path / "corpus" / "notes.txt").write_text("not a pdf")
+
+    assert find_pdfs([corpus['folder']]) == sorted([corpus['a'], corpus['b']])
+    assert find_pdfs([corpus['folder']], recursive=True) == sorted([corpus['a'], corpus['b'], corpus['nested']])
+    assert find_pdfs([os.path.join(corpus['folder'], "b*.pdf"), corpus['b']]) == [corpus['b']]
+    assert find_pdfs([str(tmp_path / "missing.pdf")]) == []
+
+
+def test_dump_file_writes_file_record_last(corpus):
+    block, ok = dump_file(corpus['b'])
+    records = [json.loads(line) for line in block.splitlines()]
+
+    assert ok
+    assert [r['type'] for r in records] == ['link'] * 3 + ['toc'] * 2 + ['file']
+    assert all(r['file'] == corpus['b'] for r in records)
+    assert records[0]['kind'] == 'goto' and records[0]['target_page'] == 1
+    assert records[3]['page'] == 0 and records[3]['valid']
+    assert records[-1]['links'] == 3 and records[-1]['toc_entries'] == 2 and records[-1]['pages'] == 2
+
+
+def test_dump_file_reports_errors_in_file_record(tmp_path):
+    broken = tmp_path / "broken.pdf"
+    broken.write_bytes(b"not a pdf at all")
+
+    block, ok = dump_file(str(broken), sections=('links',))
+    record = json.loads(block)
+
+    assert not ok
+    assert record['type'] == 'file' and record['status'] == 'error' and record['error']
+
+
+def test_run_batch_dumps_every_file(corpus, tmp_path):
+    output = str(tmp_path / "dump.jsonl")
+    stats = run_batch([corpus['a'], corpus['b']], output, workers=2, sections=('links', 'toc'))
+
+    records = read_records(output)
+    assert stats['files'] == 2 and stats['errors'] == 0
+    assert sorted(r['file'] for r in records if r['type'] == 'file') == sorted([corpus['a'], corpus['b']])
+    assert sum(r['type'] == 'link' for r in records) == 5
+
+
+def test_resume_drops_partly_written_block(corpus, tmp_path):
+    output = str(tmp_path / "dump.jsonl")
+    block_a, _ = dump_file(corpus['a'])
+    block_b, _ = dump_file(corpus['b'])
+    partial_b = ''.join(block_b.splitlines(keepends=True)[:-1])  # Links and TOC of b, no "file" record
+    with open(output, 'w', encoding='utf-8') as f:
+        f.write(block_a + partial_b + '{"type": "li')
+
+    assert completed_files(output) == {corpus['a']}
+    with open(output, encoding='utf-8') as f:
+        assert f.read() == block_a
+
+    stats = run_batch([corpus['a'], corpus['b']], output, workers=1, sections=a_batch_dump_links.SECTIONS,
+                      resume=True)
+
+    records = read_records(output)
+    assert stats['skipped'] == 1 and stats['files'] == 1
+    assert sum(r['type'] == 'link' and r['file'] == corpus['b'] for r in records) == 3
+    assert sum(r['type'] == 'file' for r in records) == 2
+
+
+def test_completed_files_without_output(tmp_path):
+    assert completed_files(str(tmp_path / "missing.jsonl")) == set()
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != 'fork',
+                    reason="the crashing fitz.open patch only reaches forked workers")
+def test_crashed_worker_only_fails_its_file(corpus, tmp_path, monkeypatch):
+    real_open = fitz.open
+
+    def crashing_open(path, *args, **kwargs):
+        if os.path.basename(str(path)) == "crash.pdf":
+            os._exit(1)  # Like a MuPDF segfault - kills the worker process
+        return real_open(path, *args, **kwargs)
+
+    crash = make_pdf(tmp_path / "corpus" / "crash.pdf")
+    monkeypatch.setattr(fitz, 'open', crashing_open)
+
+    output = str(tmp_path / "dump.jsonl")
+    stats = run_batch([crash, corpus['a'], corpus['b']], output, workers=1, sections=('links',))
+
+    summaries = {r['file']: r for r in read_records(output) if r['type'] == 'file'}
+    assert stats['files'] == 3 and stats['errors'] == 1
+    assert summaries[crash]['status'] == 'error' and 'BrokenProcessPool' in summaries[crash]['error']
+    assert summaries[corpus['a']]['status'] == 'ok' and summaries[corpus['b']]['status'] == 'ok'
@@ -0,0 +1,61 @@
+"""
+Tests for damaged-rect tracking between repaints
+"""
+
+from PyQt6.QtCore import QRect
+
+from models.field_model import FieldManager, FieldType, FormField
+from ui.damage_tracker import DamageTracker
+
+
+def test_take_returns_pending_rects_per_page_and_empties():
+    tracker = DamageTracker()
+    tracker.add(0, QRect(0, 0, 10, 10))
+    tracker.add(0, QRect(20, 20, 5, 5))
+    tracker.add(2, QRect(0, 0, 1, 1))
+
+    pending = tracker.take()
+
+    assert sorted(pending) == [0, 2]
+    assert pending[0] == [QRect(0, 0, 10, 10), QRect(20, 20, 5, 5)]
+    assert not tracker.has_damage()
+    assert tracker.damage_reports == 3
+
+
+def test_empty_rects_are_ignored():
+    tracker = DamageTracker()
+    tracker.add(0, QRect())
+    assert not tracker.has_damage()
+    assert tracker.damage_reports == 0
+
+
+def test_added_rect_is_copied():
+    tracker = DamageTracker()
+    rect = QRect(0, 0, 10, 10)
+    tracker.add(0, rect)
+    rect.setWidth(100)
+    assert tracker.take()[0] == [QRect(0, 0, 10, 10)]
+
+
+def test_record_frame_statistics():
+    tracker = DamageTracker()
+    tracker.record_frame([QRect(0, 0, 10, 10), QRect(0, 0, 5, 2)])
+    tracker.record_frame([QRect(0, 0, 4, 4)])
+
+    stats = tracker.get_stats()
+    assert stats['frames'] == 2
+    assert stats['last_frame_pixels'] == 16
+    assert stats['max_frame_pixels'] == 110
+    assert stats['avg_frame_pixels'] == 63.0
+
+
+def test_field_move_reports_old_and_new_bounds():
+    manager = FieldManager()
+    field = FormField(id='f', type=FieldType.TEXT, name='f', x=10, y=10, width=50, height=20, page_number=1)
+    manager.add_field(field)
+    damaged = []
+    manager.field_damaged.connect(lambda f, old, new: damaged.append((f, old, new)))
+
+    field.move_to(100, 200)
+
+    assert damaged == [(field, (1, 10, 10, 60, 30), (1, 100, 200, 150, 220))]
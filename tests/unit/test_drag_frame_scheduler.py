@@ -0,0 +1,110 @@
+"""
+Tests for coalescing drag moves to the display refresh rate and the per-frame
+progress reports
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from PyQt6.QtCore import QPoint
+from PyQt6.QtTest import QTest
+from PyQt6.QtWidgets import QWidget
+
+from ui.drag_frame_scheduler import DragFrameScheduler
+from ui.enhanced_drag_handler import EnhancedDragHandler
+
+
+class FakeScreen:
+    def __init__(self, refresh_rate):
+        self.refresh_rate = refresh_rate
+
+    def refreshRate(self):
+        return self.refresh_rate
+
+
+class FakeWidget:
+    def __init__(self, refresh_rate):
+        self._screen = FakeScreen(refresh_rate)
+
+    def screen(self):
+        return self._screen
+
+
+@pytest.fixture
+def frames(qapp):
+    return []
+
+
+def test_moves_are_coalesced_to_the_latest_position(frames):
+    scheduler = DragFrameScheduler(frames.append, FakeWidget(60))
+    for x in range(10):
+        scheduler.submit(QPoint(x, 2 * x))
+    assert frames == [] and scheduler.has_pending()
+
+    QTest.qWait(100)
+
+    assert frames == [QPoint(9, 18)]
+    assert not scheduler.has_pending()
+    assert scheduler.get_stats()['moves_coalesced'] == 9
+
+
+def test_submitted_position_is_copied(frames):
+    scheduler = DragFrameScheduler(frames.append, FakeWidget(60))
+    pos = QPoint(1, 1)
+    scheduler.submit(pos)
+    pos.setX(50)
+    scheduler.flush()
+    assert frames == [QPoint(1, 1)]
+
+
+def test_flush_runs_the_pending_frame_once(frames):
+    scheduler = DragFrameScheduler(frames.append, FakeWidget(60))
+    scheduler.submit(QPoint(1, 1))
+    scheduler.submit(QPoint(5, 5))
+    scheduler.flush()
+    assert frames == [QPoint(5, 5)]
+
+    scheduler.flush()  # Nothing pending
+    QTest.qWait(50)  # The timer was stopped
+    assert frames == [QPoint(5, 5)]
+    assert scheduler.frames_run == 1
+
+
+def test_cancel_drops_the_pending_position(frames):
+    scheduler = DragFrameScheduler(frames.append, FakeWidget(60))
+    scheduler.submit(QPoint(3, 3))
+    scheduler.cancel()
+    assert not scheduler.has_pending()
+
+    QTest.qWait(50)
+    scheduler.flush()
+    assert frames == []
+
+
+@pytest.mark.parametrize('refresh_rate', [0, -1, None])
+def test_unknown_refresh_rate_falls_back_to_60hz(qapp, refresh_rate):
+    scheduler = DragFrameScheduler(lambda pos: None, FakeWidget(refresh_rate))
+    assert scheduler.frame_interval_ms() == pytest.approx(1000.0 / 60)
+
+
+def test_frame_interval_follows_the_screen(qapp):
+    scheduler = DragFrameScheduler(lambda pos: None, FakeWidget(120))
+    assert scheduler.frame_interval_ms() == pytest.approx(1000.0 / 120)
+
+
+def test_drag_frame_reports_every_selected_field(qapp):
+    fields = [SimpleNamespace(id=f'f{i}', page_number=0, x=10 + 50 * i, y=20, width=40, height=15)
+              for i in range(3)]
+    manager = SimpleNamespace(get_selected_fields=lambda: fields, get_selected_field=lambda: fields[0])
+    canvas = QWidget()
+    canvas.document_to_screen_coordinates = lambda page, x, y: (x, y)
+    handler = EnhancedDragHandler(canvas, manager)
+    handler.alignment_guides_enabled = False
+    progress = []
+    handler.dragProgress.connect(lambda *args: progress.append(args))
+
+    handler.is_dragging = True
+    handler.drag_start_pos = QPoint(0, 0)
+    handler._process_drag_frame(QPoint(5, 7))
+
+    assert progress == [('f0', 15, 27, 40, 15), ('f1', 65, 27, 40, 15), ('f2', 115, 27, 40, 15)]
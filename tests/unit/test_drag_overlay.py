@@ -0,0 +1,75 @@
+"""
+Tests for the drag overlay's vectorized ghost positions
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from PyQt6.QtCore import QPoint
+from PyQt6.QtWidgets import QWidget
+
+from ui.drag_overlay import DragOverlay
+
+PAGE_HEIGHT = 792
+PAGE_SPACING = 20
+MARGIN = 10
+
+
+class FakeCanvas(QWidget):
+    """Canvas with PDFCanvas's linear document -> screen mapping"""
+
+    def __init__(self, zoom_level):
+        super().__init__()
+        self.zoom_level = zoom_level
+        self.resize(2000, 6000)
+
+    def document_to_screen_coordinates(self, page_num, x, y):
+        page_top = MARGIN + page_num * (PAGE_HEIGHT * self.zoom_level + PAGE_SPACING)
+        return MARGIN + x * self.zoom_level, page_top + y * self.zoom_level
+
+
+def make_fields(count):
+    return [SimpleNamespace(id=f'f{i}', name=f'f{i}', page_number=i % 3, x=30 + 17 * i, y=40 + 11 * i,
+                            width=100, height=20) for i in range(count)]
+
+
+def expected_ghost(canvas, field, offset, zoom_level):
+    x, y = canvas.document_to_screen_coordinates(field.page_number, field.x + offset.x() / zoom_level,
+                                                 field.y + offset.y() / zoom_level)
+    return QPoint(int(x), int(y))
+
+
+@pytest.mark.parametrize('zoom_level', [1.0, 1.5, 2.0])
+@pytest.mark.parametrize('count', [1, 7, 200])
+def test_ghosts_match_per_field_screen_coordinates(qapp, zoom_level, count):
+    canvas = FakeCanvas(zoom_level)
+    overlay = DragOverlay(canvas)
+    fields = make_fields(count)
+    start = QPoint(300, 400)
+    overlay.start_drag(fields, start, zoom_level)
+
+    for offset in (QPoint(0, 0), QPoint(30, -60), QPoint(-90, 120)):
+        overlay.current_drag_pos = start + offset
+        overlay.update_ghost_positions()
+
+        assert len(overlay.ghost_positions) == count
+        for field in fields:
+            assert overlay.ghost_positions[field.id] == expected_ghost(canvas, field, offset, zoom_level)
+
+    overlay.end_drag()
+
+
+def test_update_drag_moves_ghosts_by_the_cursor_offset(qapp):
+    canvas = FakeCanvas(1.0)
+    overlay = DragOverlay(canvas)
+    fields = make_fields(5)
+    overlay.start_drag(fields, QPoint(100, 100), 1.0)
+
+    overlay.update_drag(QPoint(125, 90))
+
+    for field in fields:
+        assert overlay.ghost_positions[field.id] == expected_ghost(canvas, field, QPoint(25, -10), 1.0)
+    for field_id, pos in overlay.ghost_positions.items():
+        assert overlay._ghost_bounds.contains(pos)
+
+    overlay.end_drag()
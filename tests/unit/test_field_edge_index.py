@@ -0,0 +1,92 @@
+"""
+Tests for the sorted field edge index behind alignment guides
+"""
+
+import random
+from types import SimpleNamespace
+
+from models.field_edge_index import FieldEdgeIndex, edge_positions
+from models.field_model import FieldManager, FieldType, FormField
+
+
+def make_field(x, y, width=50, height=20):
+    return SimpleNamespace(x=x, y=y, width=width, height=height)
+
+
+def make_index(pages, exclude=()):
+    requested = []
+
+    def fields_on_page(page_num):
+        requested.append(page_num)
+        return pages.get(page_num, [])
+
+    return FieldEdgeIndex(fields_on_page, exclude), requested
+
+
+def test_edge_positions():
+    assert edge_positions((10, 20, 30, 60), 'x') == (10, 20.0, 30)
+    assert edge_positions((10, 20, 30, 60), 'y') == (20, 40.0, 60)
+
+
+def test_nearest_edge_within_tolerance():
+    target = make_field(100, 100, 40, 40)  # x edges 100, 120, 140
+    index, _ = make_index({0: [target]})
+
+    assert index.nearest_edge(0, 'x', 118, tolerance=5) == (120.0, 'center_x', target)
+    assert index.nearest_edge(0, 'x', 150, tolerance=5) is None
+    assert index.nearest_edge(1, 'x', 100, tolerance=5) is None
+
+
+def test_match_picks_closest_edge_per_axis():
+    target = make_field(100, 200, 60, 30)
+    index, _ = make_index({0: [target]})
+
+    # Dragged bounds: right edge 2px left of target's left, top 1px below target's top
+    x_match, y_match = index.match(0, (48, 201, 98, 221), tolerance=5)
+
+    assert (x_match.edge, x_match.target, x_match.delta) == ('right', 'left', 2)
+    assert (y_match.edge, y_match.target, y_match.delta) == ('top', 'top', -1)
+    assert x_match.field is target
+    assert index.get_stats()['matches'] == 1
+
+
+def test_excluded_fields_and_lazy_pages():
+    dragged = make_field(0, 0)
+    other = make_field(300, 300)
+    index, requested = make_index({0: [dragged, other], 1: [make_field(0, 0)]}, exclude=[dragged])
+
+    assert index.match(0, (0, 0, 50, 20), tolerance=5) == (None, None)
+    assert requested == [0]
+    index.match(0, (0, 0, 50, 20), tolerance=5)
+    assert requested == [0]  # Page edges are built once
+    assert index.get_stats()['edges'] == 6
+
+
+def test_matches_linear_scan():
+    rng = random.Random(11)
+    fields = [make_field(rng.randint(0, 500), rng.randint(0, 700), rng.randint(10, 120), rng.randint(10, 60))
+              for _ in range(100)]
+    index, _ = make_index({0: fields})
+
+    for _ in range(300):
+        value = rng.uniform(-20, 650)
+        hit = index.nearest_edge(0, 'x', value, tolerance=4)
+        edges = [e for f in fields for e in edge_positions((f.x, f.y, f.x + f.width, f.y + f.height), 'x')]
+        best = min(abs(e - value) for e in edges)
+        if best > 4:
+            assert hit is None
+        else:
+            assert abs(hit[0] - value) == best
+
+
+def test_field_manager_builds_index_without_dragged_fields():
+    manager = FieldManager()
+    dragged = FormField(id='d', type=FieldType.TEXT, name='d', x=0, y=0, width=50, height=20)
+    other = FormField(id='o', type=FieldType.TEXT, name='o', x=200, y=0, width=50, height=20)
+    manager.add_field(dragged)
+    manager.add_field(other)
+
+    index = manager.build_edge_index(exclude=[dragged])
+    x_match, _ = index.match(0, (148, 100, 198, 120), tolerance=5)
+
+    assert x_match.field is other and x_match.delta == 2
@@ -0,0 +1,86 @@
+"""
+Tests for level-of-detail field rendering (small fields drawn as batched blocks)
+"""
+
+import pytest
+from PyQt6.QtGui import QColor, QImage, QPainter
+
+from models.field_model import FormField
+from ui.enhanced_field_renderer import EnhancedFieldRenderer
+
+SMALL_ZOOM = 0.4  # 25pt text fields are 10px tall - below the 12px threshold
+LARGE_ZOOM = 1.0
+
+
+def to_screen(page, x, y):
+    return x * SMALL_ZOOM, y * SMALL_ZOOM
+
+
+def make_field(i, fill=None):
+    field = FormField.create('text', 20, 40 + i * 30, field_id=f'text_{i}')
+    if fill is not None:
+        field.set_appearance({'background_color': fill})
+    return field
+
+
+def render(renderer, fields, selected=None, zoom=SMALL_ZOOM):
+    image = QImage(400, 400, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(QColor(255, 255, 255))
+    painter = QPainter(image)
+    renderer.render_fields(painter, fields, selected, 0, zoom, to_screen)
+    painter.end()
+    return image
+
+
+@pytest.fixture
+def renderer(qapp):
+    return EnhancedFieldRenderer()
+
+
+def test_small_fields_are_drawn_in_one_batch_per_style(renderer):
+    red, green = QColor(255, 0, 0), QColor(0, 255, 0)
+    fields = [make_field(0, red), make_field(1, red), make_field(2, green), make_field(3)]
+
+    render(renderer, fields)
+
+    stats = renderer.get_lod_stats()
+    assert stats['block_fields'] == 4
+    assert stats['block_batches'] == 3  # red, green and the default style
+    assert stats['detailed_fields'] == 0
+    assert renderer.get_cache_stats()['pixmaps'] == 0
+
+
+def test_blocks_are_filled_with_the_field_color(renderer):
+    field = make_field(0, QColor(255, 0, 0))
+    image = render(renderer, [field])
+
+    x, y = to_screen(0, field.x + field.width / 2, field.y + field.height / 2)
+    assert image.pixelColor(int(x), int(y)) == QColor(255, 0, 0)
+
+
+def test_selected_field_stays_detailed(renderer):
+    fields = [make_field(i) for i in range(3)]
+    render(renderer, fields, selected=fields[1])
+
+    stats = renderer.get_lod_stats()
+    assert stats['block_fields'] == 2
+    assert stats['detailed_fields'] == 1
+    assert renderer.get_field_bounds(fields[1]) is not None
+    assert renderer.get_field_bounds(fields[0]) is None
+
+
+def test_threshold_decides_detail(renderer):
+    field = make_field(0)
+    assert not renderer.is_detailed(field, SMALL_ZOOM, to_screen)
+    assert renderer.is_detailed(field, LARGE_ZOOM, to_screen)
+
+    renderer.detail_threshold = 5
+    assert renderer.is_detailed(field, SMALL_ZOOM, to_screen)
+
+
+def test_fields_at_full_zoom_are_detailed(renderer):
+    render(renderer, [make_field(i) for i in range(3)], zoom=LARGE_ZOOM)
+
+    stats = renderer.get_lod_stats()
+    assert stats['block_batches'] == 0
+    assert stats['detailed_fields'] == 3
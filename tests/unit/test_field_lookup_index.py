@@ -0,0 +1,74 @@
+"""
+Tests for the id/name field lookup index
+"""
+
+from models.field_lookup_index import FieldLookupIndex
+from models.field_model import FieldType, FormField
+
+
+def make_field(field_id, name=None):
+    return FormField(id=field_id, type=FieldType.TEXT, name=name or field_id,
+                     x=0, y=0, width=50, height=20)
+
+
+def test_get_and_get_many():
+    index = FieldLookupIndex()
+    a, b, c = make_field('a'), make_field('b'), make_field('c')
+    index.rebuild([a, b, c])
+
+    assert index.get('b') is b
+    assert index.get('missing') is None
+    assert index.get_many(['c', 'missing', 'a']) == [c, a]
+    assert index.contains_id('a')
+    assert len(index) == 3
+
+
+def test_names_are_case_insensitive():
+    index = FieldLookupIndex()
+    field = make_field('f1', 'FirstName')
+    index.insert(field)
+
+    assert index.has_name('firstname')
+    assert index.has_name('FIRSTNAME')
+    assert not index.has_name('firstname', exclude_field_id='f1')
+    assert not index.has_name('LastName')
+
+
+def test_duplicate_ids_first_indexed_wins():
+    index = FieldLookupIndex()
+    first, second = make_field('dup', 'one'), make_field('dup', 'two')
+    index.rebuild([first, second])
+
+    assert index.get('dup') is first
+    index.remove(first)
+    assert index.get('dup') is second
+
+
+def test_id_and_name_writes_rekey_the_field():
+    index = FieldLookupIndex()
+    field = make_field('old_id', 'Old Name')
+    index.insert(field)
+
+    field.id = 'new_id'
+    field.name = 'New Name'
+
+    assert index.get('old_id') is None
+    assert index.get('new_id') is field
+    assert not index.has_name('old name')
+    assert index.has_name('new name')
+    assert index.get_stats() == {'ids': 1, 'names': 1, 'fields': 1}
+
+
+def test_remove_and_clear_detach_fields():
+    index = FieldLookupIndex()
+    a, b = make_field('a'), make_field('b')
+    index.rebuild([a, b])
+
+    index.remove(a)
+    assert a._lookup_index is None
+    a.name = 'renamed'  # No longer indexed - must not raise
+    assert not index.has_name('renamed')
+
+    index.clear()
+    assert len(index) == 0
+    assert b._lookup_index is None
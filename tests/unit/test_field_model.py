@@ -0,0 +1,109 @@
+"""
+Tests for the slotted FormField data model
+"""
+
+import copy
+import json
+
+import pytest
+from PyQt6.QtGui import QColor
+
+from models.field_interning import SharedAppearance, thaw
+from models.field_model import FieldType, FormField
+
+
+def make_field(**overrides):
+    data = dict(id='name_1', type=FieldType.TEXT, name='FirstName', x=10, y=20, width=150, height=25,
+                page_number=3, required=True, read_only=True, tooltip='Given name', locked=True,
+                visibility='Hidden', orientation='90', value='Ada',
+                properties={'appearance': {'font_size': 12}, 'max_length': 40},
+                format_category='Number', format_settings='{"decimals": 2}', input_type='number',
+                map_to='first_name')
+    data.update(overrides)
+    return FormField(**data)
+
+
+def test_to_dict_from_dict_round_trip():
+    field = make_field()
+    data = json.loads(json.dumps(field.to_dict()))  # Must survive JSON serialization
+    restored = FormField.from_dict(data)
+
+    assert restored.to_dict() == field.to_dict()
+    for name in FormField.__slots__:
+        assert getattr(restored, name) == getattr(field, name), name
+
+
+def test_from_dict_defaults():
+    restored = FormField.from_dict({'id': 'cb', 'type': 'checkbox', 'name': 'cb',
+                                    'x': 1, 'y': 2, 'width': 20, 'height': 20})
+    assert restored.type is FieldType.CHECKBOX
+    assert restored.page_number == 0
+    assert restored.visibility == 'Visible'
+    assert restored.properties == {}
+
+
+def test_fields_are_slotted():
+    field = make_field()
+    assert not hasattr(field, '__dict__')
+    with pytest.raises(AttributeError):
+        field.page_num = 1
+
+
+def test_copy_keeps_geometry_and_appearance():
+    field = make_field()
+    clone = copy.deepcopy(field)
+
+    assert (clone.x, clone.y, clone.width, clone.height, clone.page_number) == (10, 20, 150, 25, 3)
+    assert clone.properties['appearance'] == {'font_size': 12}
+    assert clone.properties['max_length'] == 40
+    assert clone.properties is not field.properties
+
+
+def ui_appearance():
+    """Appearance as the property widgets build it"""
+    return {'font': {'family': 'Arial', 'size': 10, 'color': QColor(0, 0, 0)},
+            'border': {'color': QColor(100, 100, 100), 'width': 'thin', 'style': 'solid'},
+            'background': {'color': QColor(255, 255, 0), 'opacity': 100}}
+
+
+def test_qcolor_appearances_are_shared():
+    first = make_field(id='a', properties={'appearance': ui_appearance()})
+    second = make_field(id='b', properties={'appearance': ui_appearance()})
+    other = make_field(id='c', properties={'appearance': dict(ui_appearance(), text_color=QColor(255, 0, 0))})
+
+    assert isinstance(first.properties['appearance'], SharedAppearance)
+    assert first.properties['appearance'] is second.properties['appearance']
+    assert other.properties['appearance'] is not first.properties['appearance']
+    assert first.properties['appearance']['border']['color'] == QColor(100, 100, 100)
+
+
+def test_shared_qcolors_are_copies():
+    appearance = ui_appearance()
+    field = make_field(properties={'appearance': appearance})
+    appearance['border']['color'].setRed(0)  # The caller's color, not the pooled one
+    assert field.properties['appearance']['border']['color'] == QColor(100, 100, 100)
+
+    thawed = thaw(field.properties['appearance'])
+    thawed['border']['color'].setRed(0)
+    assert field.properties['appearance']['border']['color'] == QColor(100, 100, 100)
+
+
+def test_thaw_keeps_list_and_tuple_types():
+    appearance = {'dash': [4, 2], 'margins': (1, 2, 3, 4), 'stops': [(0, 'a'), (1, 'b')]}
+    field = make_field(properties={'appearance': appearance})
+    assert thaw(field.properties['appearance']) == appearance
+    assert field.properties['appearance'].copy() == appearance
+
+
+def test_free_text_is_not_interned():
+    tooltip = ''.join(['Given', ' name'])
+    field = make_field(tooltip=tooltip)
+    assert field.tooltip is tooltip
+
+
+def test_writes_bump_version():
+    field = make_field()
+    version = field.version
+    field.x = 50
+    field.touch()
+    assert field.version == version + 2
@@ -0,0 +1,93 @@
+"""
+Tests for the field renderer's pre-rendered pixmap cache
+"""
+
+import pytest
+from PyQt6.QtGui import QColor, QImage, QPainter
+
+from models.field_model import FormField
+from ui.enhanced_field_renderer import EnhancedFieldRenderer
+
+
+def to_screen(page, x, y):
+    return x + 10, y + 30
+
+
+def make_fields():
+    fields = []
+    for i in range(4):
+        field = FormField.create('text', 20 + i * 200, 40, field_id=f'text_{i}')
+        field.set_appearance({'font': {'family': 'Arial', 'size': 10, 'bold': False, 'italic': False},
+                              'border': {'style': 'solid', 'width': 'thin'}})
+        fields.append(field)
+    return fields
+
+
+def render(renderer, fields, selected=None):
+    image = QImage(860, 160, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(QColor(255, 255, 255))
+    painter = QPainter(image)
+    renderer.render_fields(painter, fields, selected, 0, 1.0, to_screen)
+    painter.end()
+    return image
+
+
+def max_channel_difference(a, b):
+    worst = 0
+    for y in range(a.height()):
+        for x in range(a.width()):
+            pa, pb = a.pixelColor(x, y), b.pixelColor(x, y)
+            worst = max(worst, abs(pa.red() - pb.red()), abs(pa.green() - pb.green()),
+                        abs(pa.blue() - pb.blue()))
+    return worst
+
+
+@pytest.fixture
+def fields(qapp):
+    return make_fields()
+
+
+def test_blitted_pixmaps_match_direct_rendering(fields):
+    direct = EnhancedFieldRenderer()
+    direct.pixmap_cache_enabled = False
+    cached = EnhancedFieldRenderer()
+
+    expected = render(direct, fields, fields[1])
+    render(cached, fields, fields[1])  # Fills the cache
+    actual = render(cached, fields, fields[1])
+
+    stats = cached.get_cache_stats()
+    assert stats['hits'] == len(fields)
+    assert stats['hit_rate'] == 50.0  # Percent, like LinkCache and PageCache
+    assert stats['paint_objects']['pens']['hit_rate'] > 50.0
+    assert max_channel_difference(expected, actual) <= 2  # Antialiasing rounding only
+
+
+def test_changed_or_reselected_fields_are_rerendered(fields):
+    renderer = EnhancedFieldRenderer()
+    render(renderer, fields)
+    assert renderer.get_cache_stats()['misses'] == len(fields)
+
+    fields[0].set_appearance({'background_color': QColor(255, 0, 0)})  # Bumps the field's version
+    render(renderer, fields, fields[2])
+
+    stats = renderer.get_cache_stats()
+    assert stats['misses'] == len(fields) + 2
+    assert stats['hits'] == len(fields) - 2
+    assert stats['pixmaps'] == len(fields) and stats['pixmap_bytes'] > 0
+
+
+def test_bounds_follow_the_field_and_invalidation(fields):
+    renderer = EnhancedFieldRenderer()
+    render(renderer, fields)
+
+    bounds = renderer.get_field_bounds(fields[0])
+    x, y = to_screen(0, fields[0].x, fields[0].y)
+    assert bounds.contains(x + 5, y + 5)
+    assert renderer.get_cached_fields_in_rect(0, bounds) == [fields[0]]
+
+    renderer.invalidate_field(fields[0].id)
+    assert renderer.get_field_bounds(fields[0]) is None
+
+    renderer.clear_pixmap_cache()
+    assert renderer.get_cache_stats()['pixmaps'] == 0
@@ -0,0 +1,120 @@
+"""
+Tests for the per-page uniform grid field index
+"""
+
+import random
+
+from models.field_model import FieldType, FormField
+from models.field_spatial_index import FieldSpatialIndex, field_bounds
+
+
+def make_field(field_id, x, y, width=50, height=20, page=0):
+    return FormField(id=field_id, type=FieldType.TEXT, name=field_id,
+                     x=x, y=y, width=width, height=height, page_number=page)
+
+
+def linear_point(fields, page, x, y, tolerance=0):
+    for field in fields:
+        x0, y0, x1, y1 = field_bounds(field)
+        if (field.page_number == page and x0 - tolerance <= x <= x1 + tolerance and
+                y0 - tolerance <= y <= y1 + tolerance):
+            return field
+    return None
+
+
+def test_query_point_returns_first_inserted_overlap():
+    index = FieldSpatialIndex()
+    below = make_field('below', 10, 10, 100, 100)
+    above = make_field('above', 50, 50, 100, 100)
+    index.rebuild([below, above])
+
+    assert index.query_point(0, 60, 60) is below
+    assert index.query_point(0, 140, 140) is above
+    assert index.query_point(0, 300, 300) is None
+    assert index.query_point(1, 60, 60) is None
+
+
+def test_query_point_tolerance():
+    index = FieldSpatialIndex()
+    field = make_field('f', 100, 100)
+    index.insert(field)
+
+    assert index.query_point(0, 97, 100) is None
+    assert index.query_point(0, 97, 100, tolerance=5) is field
+
+
+def test_matches_linear_scan_on_random_layout():
+    rng = random.Random(7)
+    fields = [make_field(f"f{i}", rng.randint(0, 500), rng.randint(0, 700),
+                         rng.randint(10, 200), rng.randint(10, 80), page=rng.randint(0, 2))
+              for i in range(200)]
+    index = FieldSpatialIndex(cell_size=32)
+    index.rebuild(fields)
+
+    for _ in range(500):
+        page, x, y = rng.randint(0, 2), rng.randint(0, 700), rng.randint(0, 800)
+        assert index.query_point(page, x, y, tolerance=3) is linear_point(fields, page, x, y, tolerance=3)
+
+
+def test_query_rect_is_strict_and_ordered():
+    index = FieldSpatialIndex()
+    a = make_field('a', 0, 0, 100, 100)
+    b = make_field('b', 100, 0, 100, 100)  # Touches a's right edge
+    c = make_field('c', 50, 50, 100, 100)
+    index.rebuild([a, b, c])
+
+    assert index.query_rect(0, (0, 0, 100, 100)) == [a, c]
+    assert index.query_rect(0, (90, 10, 110, 20)) == [a, b]
+    assert index.fields_on_page(0) == [a, b, c]
+
+
+def test_geometry_writes_rebucket_and_notify_listener():
+    index = FieldSpatialIndex()
+    field = make_field('f', 0, 0)
+    index.insert(field)
+    changes = []
+    index.listener = lambda *change: changes.append(change)
+
+    field.x = 400
+    field.page_number = 2
+
+    assert index.query_point(0, 10, 10) is None
+    assert index.query_point(2, 410, 10) is field
+    assert index.fields_on_page(2) == [field]
+    assert changes[0] == (field, 0, (0, 0, 50, 20), 0, (400, 0, 450, 20))
+    assert changes[1][1] == 0 and changes[1][3] == 2
+
+
+def test_deferred_updates_rebucket_each_field_once():
+    index = FieldSpatialIndex()
+    field = make_field('f', 0, 0)
+    index.insert(field)
+    notified = []
+    index.listener = lambda *change: notified.append(change)
+
+    index.defer_updates()
+    field.move_to(100, 100)
+    field.move_to(200, 200)
+    changes = index.apply_deferred()
+
+    assert notified == []
+    assert len(changes) == 1
+    assert changes[0][2] == (0, 0, 50, 20) and changes[0][4] == (200, 200, 250, 220)
+    assert index.query_point(0, 210, 210) is field
+    assert not index.is_deferring()
+
+
+def test_remove_and_clear_detach_fields():
+    index = FieldSpatialIndex()
+    a, b = make_field('a', 0, 0), make_field('b', 100, 100)
+    index.rebuild([a, b])
+
+    index.remove(a)
+    assert len(index) == 1
+    assert a._spatial_index is None
+    a.x = 10  # No longer indexed - must not raise
+
+    index.clear()
+    assert len(index) == 0
+    assert b._spatial_index is None
+    assert index.get_stats()['cells'] == 0
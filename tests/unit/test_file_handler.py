@@ -0,0 +1,33 @@
+"""
+Tests for the shared, remembered file content hash
+"""
+
+import hashlib
+import os
+
+from utils.file_handler import file_content_hash, known_content_hash
+
+
+def test_hash_is_remembered_until_the_file_changes(tmp_path):
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(b"%PDF-1.7 first")
+    assert known_content_hash(str(path)) is None
+
+    digest = file_content_hash(str(path))
+    assert digest == hashlib.sha256(b"%PDF-1.7 first").hexdigest()
+    assert known_content_hash(str(path)) == digest
+
+    path.write_bytes(b"%PDF-1.7 second version")
+    assert known_content_hash(str(path)) is None
+    assert file_content_hash(str(path)) == hashlib.sha256(b"%PDF-1.7 second version").hexdigest()
+
+
+def test_touching_a_file_forgets_its_hash(tmp_path):
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(b"%PDF-1.7")
+    file_content_hash(str(path))
+
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert known_content_hash(str(path)) is None
+    assert known_content_hash(str(tmp_path / "missing.pdf")) is None
@@ -0,0 +1,115 @@
+"""
+Tests for FieldManager batch geometry transactions (move/align/distribute/snap)
+"""
+
+import numpy as np
+import pytest
+
+from models.field_model import FieldManager, FieldType, FormField
+
+
+def make_field(field_id, x, y, width=50, height=20, page=0):
+    return FormField(id=field_id, type=FieldType.TEXT, name=field_id,
+                     x=x, y=y, width=width, height=height, page_number=page)
+
+
+@pytest.fixture
+def manager():
+    manager = FieldManager()
+    manager.batches = []
+    manager.damaged = []
+    manager.fields_geometry_changed.connect(lambda fields, pages: manager.batches.append((fields, pages)))
+    manager.field_damaged.connect(lambda field, old, new: manager.damaged.append(field))
+    return manager
+
+
+def add_fields(manager, *fields):
+    for field in fields:
+        assert manager.add_field(field)
+    return list(fields)
+
+
+def test_transaction_emits_one_batch_instead_of_per_field_damage(manager):
+    a, b = add_fields(manager, make_field('a', 0, 0), make_field('b', 100, 0, page=1))
+
+    with manager.geometry_transaction():
+        a.move_to(10, 10)
+        a.move_to(20, 20)
+        b.move_to(110, 10)
+
+    assert manager.damaged == []
+    assert len(manager.batches) == 1
+    fields, pages = manager.batches[0]
+    assert sorted(f.id for f in fields) == ['a', 'b']
+    assert pages == [0, 1]
+    assert manager.get_field_at_position(25, 25) is a
+
+
+def test_nested_transactions_commit_once(manager):
+    a, = add_fields(manager, make_field('a', 0, 0))
+
+    with manager.geometry_transaction():
+        with manager.geometry_transaction():
+            a.move_to(5, 5)
+        assert manager.batches == []
+        a.move_to(6, 6)
+
+    assert len(manager.batches) == 1
+
+
+def test_transaction_without_changes_emits_nothing(manager):
+    add_fields(manager, make_field('a', 0, 0))
+    with manager.geometry_transaction():
+        pass
+    assert manager.batches == []
+
+
+def test_move_fields(manager):
+    fields = add_fields(manager, make_field('a', 0, 0), make_field('b', 30, 40))
+    assert manager.move_fields(fields, 5, -5) == 2
+    assert [(f.x, f.y) for f in fields] == [(5, -5), (35, 35)]
+    assert all(isinstance(f.x, int) for f in fields)
+    assert len(manager.batches) == 1
+
+
+def test_align_fields(manager):
+    reference = make_field('ref', 100, 50, width=80, height=40)
+    other = make_field('other', 10, 10, width=20, height=10)
+    add_fields(manager, reference, other)
+
+    manager.align_fields([reference, other], 'right')
+    assert other.x + other.width == reference.x + reference.width
+
+    manager.align_fields([reference, other], 'center_vertical')
+    assert other.y == 50 + 40 // 2 - 10 // 2
+
+    assert manager.align_fields([reference, other], 'diagonal') == 0
+
+
+def test_distribute_equalizes_gaps_and_keeps_ends(manager):
+    fields = add_fields(manager, make_field('a', 0, 0, width=10), make_field('c', 190, 0, width=10),
+                        make_field('b', 20, 0, width=30))
+
+    manager.distribute_fields(fields, 'horizontal')
+
+    a, c, b = fields
+    assert (a.x, c.x) == (0, 190)
+    assert b.x - (a.x + a.width) == c.x - (b.x + b.width)
+
+
+def test_distribute_with_fixed_spacing(manager):
+    fields = add_fields(manager, make_field('a', 0, 0, height=10), make_field('b', 0, 100, height=20),
+                        make_field('c', 0, 15, height=5))
+    manager.distribute_fields(fields, 'vertical', spacing=4)
+    a, b, c = fields
+    assert (a.y, c.y, b.y) == (0, 14, 23)
+
+
+def test_snap_fields_uses_vectorized_function(manager):
+    fields = add_fields(manager, make_field('a', 12, 18), make_field('b', 41, 59))
+
+    def snap(xs, ys):
+        return np.round(xs / 10) * 10, np.round(ys / 10) * 10
+
+    assert manager.snap_fields(fields, snap) == 2
+    assert [(f.x, f.y) for f in fields] == [(10, 20), (40, 60)]
@@ -0,0 +1,84 @@
+"""
+Tests for precomputed grid tiles and grid snapping
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from ui.grid_manager import GridManager
+from ui.grid_tiles import GridTile, GridTileCache
+
+
+def test_tile_lines_start_at_offset_and_include_edge():
+    tile = GridTile(100, 60, spacing=20, offset_x=25, offset_y=-5)
+
+    assert tile.xs.tolist() == [5, 25, 45, 65, 85]
+    assert tile.ys.tolist() == [15, 35, 55]
+    assert GridTile(100, 60, 20, 0, 0).xs.tolist() == [0, 20, 40, 60, 80, 100]
+
+    assert tile.vertical[0].x1() == 5 and tile.vertical[0].y2() == 60
+    assert tile.horizontal[-1].y1() == 55 and tile.horizontal[-1].x2() == 100
+    assert tile.line_count() == 8
+
+
+def test_tile_ranges_cull_to_the_visible_band():
+    tile = GridTile(200, 200, 10, 0, 0)
+    start, end = tile.x_range(35, 70)
+    assert tile.xs[start:end].tolist() == [40, 50, 60, 70]
+
+    start, end = tile.y_range(300, 400)
+    assert start == end
+
+
+def test_tile_cache_shares_tiles_and_resets_when_full():
+    cache = GridTileCache(max_tiles=2)
+    first = cache.get(20, 0, 0, 1.0, 600, 800)
+    assert cache.get(20, 0, 0, 1.0, 600, 800) is first
+    cache.get(20, 0, 0, 1.5, 900, 1200)
+    cache.get(10, 0, 0, 1.0, 600, 800)  # Third key clears the cache
+
+    stats = cache.get_stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 3
+    assert stats['tiles'] == 1
+
+
+@pytest.fixture
+def grid(qapp):
+    manager = GridManager()
+    manager.settings.visible = True
+    manager.settings.snap_enabled = True
+    manager.vertical_lines = list(range(0, 601, 20))
+    manager.horizontal_lines = list(range(10, 801, 20))
+    manager.lines_valid = True
+    return manager
+
+
+def test_snap_point_to_nearest_intersection(grid):
+    assert grid.snap_point_to_grid(27, 14) == (20, 10)
+    assert grid.snap_point_to_grid(30, 20) == (20, 10)  # Ties go to the lower line
+    assert grid.snap_point_to_grid(-40, 900) == (-40, 900)  # Too far from the grid edge
+    assert grid.snap_point_to_grid(-5, 5) == (0, 10)
+
+
+def test_snap_is_a_no_op_when_disabled_or_stale(grid):
+    grid.settings.snap_enabled = False
+    assert grid.snap_point_to_grid(27, 14) == (27, 14)
+
+    grid.settings.snap_enabled = True
+    grid.invalidate_line_arrays()
+    assert grid.snap_point_to_grid(27, 14) == (27, 14)
+
+
+def test_vectorized_snap_matches_scalar_snap(grid):
+    rng = random.Random(3)
+    xs = [rng.uniform(-50, 650) for _ in range(300)]
+    ys = [rng.uniform(-50, 850) for _ in range(300)]
+
+    snapped_x, snapped_y = grid.snap_points_to_grid(xs, ys, max_snap_distance=12)
+
+    expected = [grid.snap_point_to_grid(x, y, max_snap_distance=12) for x, y in zip(xs, ys)]
+    assert np.allclose(snapped_x, [point[0] for point in expected])
+    assert np.allclose(snapped_y, [point[1] for point in expected])
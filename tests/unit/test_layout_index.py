@@ -0,0 +1,74 @@
+"""
+Tests for the prefix-sum page layout index
+"""
+
+from utils.layout_index import PageLayoutIndex
+
+SIZES = [(600, 800), (600, 400), (800, 1000)]
+
+
+def linear_page_at(index, y):
+    for page, (top, bottom) in enumerate(zip(index.tops, index.bottoms)):
+        if top <= y <= bottom:
+            return page
+    return None
+
+
+def test_tops_are_prefix_sums():
+    index = PageLayoutIndex(SIZES, zoom=1.0, top_margin=10, spacing=5)
+    assert index.tops == [10, 815, 1220]
+    assert index.bottoms == [810, 1215, 2220]
+    assert index.get_total_height() == 2220
+    assert len(index) == 3
+
+
+def test_zoom_reuses_page_sizes():
+    index = PageLayoutIndex(SIZES, zoom=1.0, top_margin=0, spacing=0)
+    rebuilds = index.rebuild_count
+    index.set_zoom(0.5)
+
+    assert index.heights == [400, 200, 500]
+    assert index.widths == [300, 300, 400]
+    assert index.rebuild_count == rebuilds + 1
+
+    index.set_zoom(0.5)  # Unchanged zoom does not rebuild
+    assert index.rebuild_count == rebuilds + 1
+
+
+def test_integer_heights_truncate():
+    index = PageLayoutIndex([(100, 333)], zoom=1.5, top_margin=0)
+    assert index.get_page_height(0) == 499
+
+    exact = PageLayoutIndex([(100, 333)], zoom=1.5, top_margin=0, integer_heights=False)
+    assert exact.get_page_height(0) == 499.5
+
+
+def test_page_at_matches_linear_scan():
+    index = PageLayoutIndex(SIZES, zoom=1.0, top_margin=15, spacing=15)
+    for y in range(-20, int(index.get_total_height()) + 40, 7):
+        assert index.page_at(y) == linear_page_at(index, y), y
+
+
+def test_page_at_gap_and_shared_edge():
+    index = PageLayoutIndex(SIZES, zoom=1.0, top_margin=15, spacing=15)
+    assert index.page_at(820) is None  # Between page 0 and 1
+    assert index.nearest_page(820) == 0
+    assert index.nearest_page(828) == 1
+
+    touching = PageLayoutIndex.from_positions([0, 100], [100, 100])
+    assert touching.page_at(100) == 0
+
+
+def test_pages_in_range_inclusive_and_strict():
+    index = PageLayoutIndex.from_positions([0, 100, 200], [100, 100, 100])
+    assert list(index.pages_in_range(50, 150)) == [0, 1]
+    assert list(index.pages_in_range(100, 150)) == [0, 1]
+    assert list(index.pages_in_range(100, 150, inclusive=False)) == [1]
+    assert list(index.pages_in_range(400, 500)) == []
+
+
+def test_out_of_range_queries():
+    index = PageLayoutIndex(SIZES)
+    assert index.get_page_top(3) is None
+    assert index.get_page_height(-1) is None
+    assert PageLayoutIndex().nearest_page(100) == 0
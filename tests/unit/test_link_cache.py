@@ -0,0 +1,103 @@
+"""
+Tests for the link managers' LRU cache and latency histogram
+"""
+
+import random
+
+import pytest
+
+from ui.a_link_cache import LatencyHistogram, LinkCache
+
+
+def test_lru_eviction_order():
+    cache = LinkCache('links', max_entries=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1  # 'b' is now least recently used
+    cache.put('c', 3)
+
+    assert list(cache) == ['a', 'c']
+    assert cache.evictions == 1
+
+
+def test_hit_miss_counters_and_membership():
+    cache = LinkCache('links')
+    cache.put('a', [])
+    assert cache.get('a') == []
+    assert cache.get('missing', 'default') == 'default'
+    assert 'a' in cache and 'missing' not in cache  # Membership is not counted
+
+    stats = cache.get_stats()
+    assert (stats['hits'], stats['misses'], stats['hit_rate']) == (1, 1, 50.0)
+
+
+def test_byte_budget_keeps_newest_entry():
+    cache = LinkCache('links', max_entries=0, max_bytes=10, sizeof=len)
+    cache.put('a', 'xxxx')
+    cache.put('b', 'xxxx')
+    cache.put('c', 'xxxx')
+    assert list(cache) == ['b', 'c']
+    assert cache.current_bytes == 8
+
+    cache.put('huge', 'x' * 50)  # Over budget on its own, but never evicted on insert
+    assert list(cache) == ['huge']
+    assert cache.current_bytes == 50
+
+
+def test_replacing_and_removing_entries_tracks_bytes():
+    cache = LinkCache('links', max_bytes=100, sizeof=len)
+    cache.put('a', 'xxxx')
+    cache.put('a', 'xx')
+    assert cache.current_bytes == 2
+
+    assert cache.pop('a') == 'xx'
+    assert cache.pop('a', 'gone') == 'gone'
+    assert cache.current_bytes == 0
+
+
+def test_shrinking_max_entries_evicts():
+    cache = LinkCache('links', max_entries=5)
+    for i in range(5):
+        cache.put(i, i)
+    cache.max_entries = 2
+    assert list(cache) == [3, 4]
+
+
+def test_histogram_buckets_cover_every_value_once():
+    previous_high = 0
+    for index in range(LatencyHistogram.bucket_index(1 << 20) + 1):
+        low, high = LatencyHistogram.bucket_bounds(index)
+        assert low == previous_high
+        assert LatencyHistogram.bucket_index(low) == index
+        assert LatencyHistogram.bucket_index(high - 1) == index
+        previous_high = high
+
+
+def test_histogram_percentiles_within_bucket_error():
+    rng = random.Random(5)
+    samples = [rng.uniform(0.0001, 0.05) for _ in range(5000)]
+    histogram = LatencyHistogram('parse')
+    for seconds in samples:
+        histogram.record(seconds)
+
+    ordered = sorted(samples)
+    for percent in (50, 90, 99):
+        exact = ordered[int(round(percent / 100 * len(ordered))) - 1]
+        assert histogram.percentile(percent) == pytest.approx(exact, rel=0.125)
+
+    stats = histogram.get_stats()
+    assert stats['count'] == 5000
+    assert stats['min'] == min(samples) and stats['max'] == max(samples)
+    assert stats['mean'] == pytest.approx(sum(samples) / len(samples))
+
+
+def test_histogram_memory_is_fixed_and_reset_clears():
+    histogram = LatencyHistogram('extract')
+    buckets = len(histogram.counts)
+    for i in range(10000):
+        histogram.record(i / 1000)
+    assert len(histogram.counts) == buckets
+
+    histogram.reset()
+    assert len(histogram) == 0
+    assert histogram.percentile(50) == 0.0
@@ -0,0 +1,87 @@
+"""
+Tests for the grid hit-test index behind the link hotspot layer
+"""
+
+import random
+
+from PyQt6.QtCore import QPoint, QRect
+
+from ui.a_link_hotspot_layer import LinkHitIndex, LinkHotspot
+
+
+def hotspot(x, y, width, height, page_index=0, key=None):
+    return LinkHotspot(QRect(x, y, width, height), page_index, 'goto', key, payload=key)
+
+
+def keys(hotspots):
+    return [h.key for h in hotspots]
+
+
+def test_point_and_rect_queries():
+    index = LinkHitIndex(cell_size=64)
+    index.set_page(0, [hotspot(10, 10, 20, 20, key='a'), hotspot(100, 10, 20, 20, key='b')])
+
+    assert keys(index.at(QPoint(15, 15))) == ['a']
+    assert index.at(QPoint(50, 50)) == []
+    assert keys(index.in_rect(QRect(0, 0, 200, 40))) == ['a', 'b']
+    assert keys(index.in_rect(QRect(90, 0, 20, 20))) == ['b']
+    assert index.in_rect(QRect(40, 40, 10, 10)) == []
+
+
+def test_rect_spanning_several_cells_is_found_in_each_once():
+    index = LinkHitIndex(cell_size=64)
+    wide = hotspot(50, 50, 200, 100, key='wide')  # Cells (0..3, 0..2)
+    index.set_page(0, [wide])
+
+    for point in (QPoint(50, 50), QPoint(130, 70), QPoint(249, 149), QPoint(200, 128)):
+        assert index.at(point) == [wide]
+    assert index.in_rect(QRect(0, 0, 400, 400)) == [wide]  # Not once per cell
+
+
+def test_points_on_cell_boundaries():
+    index = LinkHitIndex(cell_size=64)
+    first_cell = hotspot(0, 0, 64, 64, key='first')  # Right/bottom edge 63 - last pixel of cell (0, 0)
+    straddling = hotspot(60, 60, 10, 10, key='straddling')  # Cells (0, 0) to (1, 1)
+    index.set_page(0, [first_cell, straddling])
+
+    assert keys(index.at(QPoint(63, 63))) == ['first', 'straddling']
+    assert keys(index.at(QPoint(64, 64))) == ['straddling']
+    assert keys(index.at(QPoint(64, 0))) == []
+    assert keys(index.at(QPoint(0, 0))) == ['first']
+    assert keys(index.in_rect(QRect(64, 64, 1, 1))) == ['straddling']
+
+
+def test_set_and_remove_page_rebuild_the_index():
+    index = LinkHitIndex(cell_size=64)
+    index.set_page(0, [hotspot(0, 0, 10, 10, key='old')])
+    assert keys(index.at(QPoint(5, 5))) == ['old']
+
+    index.set_page(0, [hotspot(0, 0, 10, 10, key='new')])  # Replaces the page's hotspots
+    index.set_page(1, [hotspot(0, 500, 10, 10, page_index=1, key='p1')])
+    assert keys(index.at(QPoint(5, 5))) == ['new']
+    assert keys(index.at(QPoint(5, 505))) == ['p1']
+    assert len(index) == 2 and index.pages() == [0, 1]
+
+    index.remove_page(0)
+    assert index.at(QPoint(5, 5)) == []
+    assert keys(index.at(QPoint(5, 505))) == ['p1']
+
+    index.clear()
+    assert index.at(QPoint(5, 505)) == [] and len(index) == 0
+
+
+def test_matches_linear_scan():
+    rng = random.Random(3)
+    hotspots = [hotspot(rng.randint(0, 900), rng.randint(0, 900), rng.randint(1, 200), rng.randint(1, 60),
+                        page_index=i % 3, key=i) for i in range(300)]
+    index = LinkHitIndex(cell_size=48)
+    for page_index in range(3):
+        index.set_page(page_index, [h for h in hotspots if h.page_index == page_index])
+
+    ordered = list(index.all_hotspots())
+    for _ in range(300):
+        point = QPoint(rng.randint(-10, 1100), rng.randint(-10, 1000))
+        assert index.at(point) == [h for h in ordered if h.rect.contains(point)]
+
+        rect = QRect(rng.randint(-10, 1000), rng.randint(-10, 1000), rng.randint(1, 150), rng.randint(1, 150))
+        assert sorted(keys(index.in_rect(rect))) == sorted(h.key for h in hotspots if h.rect.intersects(rect))
@@ -0,0 +1,157 @@
+"""
+Tests for the persisted whole-document link index
+"""
+
+import fitz
+import pytest
+
+from ui.a_link_index import (LinkIndex, StringColumn, extract_link_index, extract_named_destinations,
+                             file_content_hash, index_path_for, load_or_build_link_index)
+
+
+@pytest.fixture
+def links_pdf(tmp_path):
+    """Three pages; page 0 has one link of every kind, page 2 is the 'chapter2' destination"""
+    doc = fitz.open()
+    for _ in range(3):
+        doc.new_page()
+
+    page = doc[0]
+    page.insert_link({'kind': fitz.LINK_GOTO, 'from': fitz.Rect(10, 10, 50, 30),
+                      'page': 1, 'to': fitz.Point(72, 100)})
+    page.insert_link({'kind': fitz.LINK_URI, 'from': fitz.Rect(10, 40, 50, 60), 'uri': 'https://example.com'})
+    page.insert_link({'kind': fitz.LINK_LAUNCH, 'from': fitz.Rect(10, 70, 50, 90), 'file': 'notes.txt'})
+    page.insert_link({'kind': fitz.LINK_GOTOR, 'from': fitz.Rect(10, 100, 50, 120),
+                      'file': 'other.pdf', 'page': 3, 'to': fitz.Point(0, 0)})
+    page.insert_link({'kind': fitz.LINK_NAMED, 'from': fitz.Rect(10, 130, 50, 150), 'nameddest': 'chapter2'})
+    page.insert_link({'kind': fitz.LINK_NAMED, 'from': fitz.Rect(10, 160, 50, 180), 'name': 'NextPage'})
+    doc[1].insert_link({'kind': fitz.LINK_GOTO, 'from': fitz.Rect(100.25, 200.5, 150.75, 220.125), 'page': 0})
+
+    names = doc.get_new_xref()
+    doc.update_object(names, f"<< /Names [(chapter2) [{doc[2].xref} 0 R /XYZ 72 500 0]] >>")
+    doc.xref_set_key(doc.pdf_catalog(), "Names", f"<< /Dests {names} 0 R >>")
+
+    path = str(tmp_path / "links.pdf")
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def live_links(path):
+    with fitz.open(path) as doc:
+        return [page.get_links() for page in doc]
+
+
+def test_raw_links_equal_get_links(links_pdf):
+    index = extract_link_index(links_pdf, file_content_hash(links_pdf))
+    expected = live_links(links_pdf)
+
+    assert index.page_count == len(expected)
+    assert len(index) == sum(len(links) for links in expected)
+    for page_index, links in enumerate(expected):
+        assert index.raw_links(page_index) == links
+
+
+def test_named_and_remote_links_keep_their_targets(links_pdf):
+    index = extract_link_index(links_pdf, file_content_hash(links_pdf))
+    by_kind = {}
+    for link in index.raw_links(0):
+        by_kind.setdefault(link['kind'], []).append(link)
+
+    named = by_kind[fitz.LINK_NAMED]
+    assert [link['nameddest'] for link in named] == ['chapter2', 'NextPage']
+    assert named[0]['page'] == 2
+    assert all('file' not in link for link in named)
+
+    gotor = [link for link in by_kind[fitz.LINK_GOTOR] if link['file'] == 'other.pdf']
+    assert gotor and gotor[0]['page'] == 3
+    assert all('nameddest' not in link for link in by_kind[fitz.LINK_GOTOR])
+
+    assert by_kind[fitz.LINK_URI][0]['uri'] == 'https://example.com'
+
+
+def test_saved_index_round_trips(links_pdf, tmp_path):
+    content_hash = file_content_hash(links_pdf)
+    index = extract_link_index(links_pdf, content_hash)
+    path = str(tmp_path / "links.linkindex.npz")
+    index.save(path)
+
+    loaded = LinkIndex.load(path, content_hash)
+
+    assert loaded is not None
+    for page_index, links in enumerate(live_links(links_pdf)):
+        assert loaded.raw_links(page_index) == links
+    assert loaded.destinations == index.destinations
+    assert LinkIndex.load(path, "different content") is None
+    assert LinkIndex.load(str(tmp_path / "missing.npz"), content_hash) is None
+
+
+def test_load_or_build_persists_next_to_the_pdf(links_pdf):
+    built = load_or_build_link_index(links_pdf)
+    loaded = load_or_build_link_index(links_pdf)
+
+    assert loaded is not built
+    assert loaded.raw_links(0) == built.raw_links(0)
+    assert LinkIndex.load(index_path_for(links_pdf), file_content_hash(links_pdf)) is not None
+
+
+def test_out_of_range_pages(links_pdf):
+    index = extract_link_index(links_pdf, file_content_hash(links_pdf))
+    assert index.raw_links(-1) == []
+    assert index.raw_links(3) == []
+    assert index.page_link_count(2) == 0
+
+
+def test_resolves_real_named_destination(links_pdf):
+    index = extract_link_index(links_pdf, file_content_hash(links_pdf))
+
+    assert index.resolve_destination('chapter2') == {'page': 2, 'x': 72.0, 'y': 500.0}
+    assert index.resolve_destination('NextPage') is None  # Named action, not a destination
+    assert index.resolve_destination('missing') is None
+
+    named_link = next(link for link in index.raw_links(0) if link.get('nameddest') == 'chapter2')
+    assert named_link['kind'] == fitz.LINK_NAMED
+    assert index.resolve_destination(named_link['nameddest'])['page'] == named_link['page']
+
+
+def test_destination_table_adds_names_only_named_links_resolve(links_pdf):
+    with fitz.open(links_pdf) as doc:
+        names, pages, points = extract_named_destinations(doc, [
+            ('chapter2', 0, (1.0, 1.0)),  # The name tree wins over a link-resolved duplicate
+            ('appendix', 1, (36.0, 700.0)),
+            ('elsewhere', -1, (0.0, 0.0))])  # Not in this document
+
+    assert names.tolist() == ['chapter2', 'appendix']
+    assert pages.tolist() == [2, 1]
+    assert points.tolist() == [[72.0, 500.0], [36.0, 700.0]]
+
+
+def test_string_column_slices_and_indexes():
+    column = StringColumn.from_strings(['', 'héllo', 'https://example.com', '章節'])
+
+    assert len(column) == 4
+    assert column.tolist() == ['', 'héllo', 'https://example.com', '章節']
+    assert column[1:3] == ['héllo', 'https://example.com']
+    assert column[3:3] == []
+    assert column[-1] == '章節'
+    assert StringColumn.from_strings([]).tolist() == []
+
+
+def test_long_uri_does_not_pad_other_links(tmp_path):
+    doc = fitz.open()
+    page = doc.new_page()
+    long_uri = 'https://example.com/' + 'x' * 500
+    page.insert_link({'kind': fitz.LINK_URI, 'from': fitz.Rect(10, 10, 50, 30), 'uri': long_uri})
+    for i in range(200):
+        page.insert_link({'kind': fitz.LINK_URI, 'from': fitz.Rect(10, 40, 50, 60), 'uri': f'https://e.com/{i}'})
+    path = str(tmp_path / "uris.pdf")
+    doc.save(path)
+    doc.close()
+
+    index = extract_link_index(path, file_content_hash(path))
+    assert index.uris.data.nbytes < len(long_uri) + 200 * 20
+    assert index.raw_links(0)[0]['uri'] == long_uri
+
+    index.save(str(tmp_path / "uris.npz"))
+    loaded = LinkIndex.load(str(tmp_path / "uris.npz"), index.content_hash)
+    assert loaded.raw_links(0) == index.raw_links(0)
@@ -0,0 +1,161 @@
+"""
+Tests for the overlay's independently invalidated grid, field and selection layers
+"""
+
+import pytest
+from PyQt6.QtCore import QRect, Qt
+from PyQt6.QtGui import QColor
+
+from ui.overlay_layers import OverlayLayers
+
+AREA = QRect(0, 0, 200, 300)
+BANDS = {0: (0, 100), 1: (150, 250)}
+
+
+class StubCanvas:
+    """Draw callbacks that record what they were asked to paint"""
+
+    def __init__(self):
+        self.calls = []
+        self.field_colors = {0: QColor(Qt.GlobalColor.red), 1: QColor(Qt.GlobalColor.red)}
+        self.selection_rect = QRect(10, 10, 20, 20)
+
+    def draw_grid(self, painter, area):
+        self.calls.append(('grid', QRect(area)))
+
+    def draw_page_fields(self, painter, page, clip):
+        self.calls.append(('fields', page, clip))
+        top, bottom = BANDS[page]
+        painter.fillRect(QRect(0, top, AREA.width(), bottom - top), self.field_colors[page])
+
+    def draw_selection(self, painter):
+        self.calls.append(('selection',))
+
+    def selection_bounds(self):
+        return QRect(self.selection_rect)
+
+    def take_calls(self):
+        calls, self.calls = self.calls, []
+        return calls
+
+
+@pytest.fixture
+def canvas(qapp):
+    return StubCanvas()
+
+
+@pytest.fixture
+def layers(canvas):
+    layers = OverlayLayers(canvas.draw_grid, canvas.draw_page_fields,
+                           canvas.draw_selection, canvas.selection_bounds)
+    layers.update(AREA, BANDS, show_grid=True)
+    canvas.take_calls()
+    return layers
+
+
+def pixel(layers, page, x, y):
+    pixmap, rect = layers.field_layers[page]
+    return pixmap.toImage().pixelColor(x - rect.x(), y - rect.y())
+
+
+def test_first_update_renders_every_layer(canvas):
+    layers = OverlayLayers(canvas.draw_grid, canvas.draw_page_fields,
+                           canvas.draw_selection, canvas.selection_bounds)
+    changed = layers.update(AREA, BANDS, show_grid=True)
+
+    assert changed == AREA
+    assert sorted(canvas.take_calls(), key=str) == sorted(
+        [('grid', AREA), ('fields', 0, None), ('fields', 1, None), ('selection',)], key=str)
+    assert layers.selection[1] == canvas.selection_rect
+
+
+def test_update_without_invalidation_renders_nothing(layers, canvas):
+    assert layers.update(AREA, BANDS, show_grid=True).isEmpty()
+    assert canvas.take_calls() == []
+
+
+def test_selection_change_only_renders_selection_layer(layers, canvas):
+    old_bounds = QRect(canvas.selection_rect)
+    canvas.selection_rect = QRect(50, 160, 30, 30)
+    layers.invalidate_selection()
+
+    changed = layers.update(AREA, BANDS, show_grid=True)
+
+    assert canvas.take_calls() == [('selection',)]
+    assert changed == old_bounds.united(canvas.selection_rect)
+    assert layers.selection[1] == canvas.selection_rect
+    assert layers.get_stats()['field_layer_renders'] == 2
+
+
+def test_selection_growing_past_its_layer_rerenders_it(layers, canvas):
+    canvas.selection_rect = QRect(10, 10, 60, 60)  # No invalidation - bounds grew during a drag
+    layers.update(AREA, BANDS, show_grid=True)
+    assert canvas.take_calls() == [('selection',)]
+
+
+def test_invalidate_fields_only_renders_that_page(layers, canvas):
+    layers.invalidate_fields([1])
+    changed = layers.update(AREA, BANDS, show_grid=True)
+
+    assert canvas.take_calls() == [('fields', 1, None)]
+    assert changed == layers.field_layers[1][1]
+
+
+def test_invalidate_all_fields_renders_every_page(layers, canvas):
+    layers.invalidate_fields()
+    layers.update(AREA, BANDS, show_grid=True)
+    assert canvas.take_calls() == [('fields', 0, None), ('fields', 1, None)]
+
+
+def test_band_outside_cached_layer_is_rendered(layers, canvas):
+    taller = {**BANDS, 1: (150, 290)}
+    layers.update(AREA, taller, show_grid=True)
+    assert canvas.take_calls() == [('fields', 1, None)]
+
+
+def test_pages_leaving_the_area_are_dropped(layers, canvas):
+    layers.update(AREA, {1: BANDS[1]}, show_grid=True)
+    assert list(layers.field_layers) == [1]
+    assert canvas.take_calls() == []
+
+
+def test_hiding_grid_drops_grid_layer(layers, canvas):
+    changed = layers.update(AREA, BANDS, show_grid=False)
+    assert layers.grid is None
+    assert changed == AREA
+    assert canvas.take_calls() == []
+
+
+def test_repaint_field_region_redraws_only_target(layers, canvas):
+    canvas.field_colors[0] = QColor(Qt.GlobalColor.blue)
+    target = QRect(20, 20, 30, 30)
+
+    assert layers.repaint_field_region(0, target) == target
+    assert canvas.take_calls() == [('fields', 0, target)]
+    assert pixel(layers, 0, 30, 30) == QColor(Qt.GlobalColor.blue)
+    assert pixel(layers, 0, 80, 80) == QColor(Qt.GlobalColor.red)
+    assert layers.get_stats()['field_region_renders'] == 1
+
+
+def test_repaint_field_region_clears_before_drawing(layers, canvas):
+    canvas.field_colors[0] = QColor(Qt.GlobalColor.transparent)
+    layers.repaint_field_region(0, QRect(20, 20, 30, 30))
+
+    assert pixel(layers, 0, 30, 30).alpha() == 0
+    assert pixel(layers, 0, 80, 80) == QColor(Qt.GlobalColor.red)
+
+
+def test_repaint_field_region_without_cached_layer(layers, canvas):
+    assert layers.repaint_field_region(5, QRect(0, 0, 10, 10)).isEmpty()
+    assert layers.repaint_field_region(0, QRect(0, 500, 10, 10)).isEmpty()
+    assert canvas.take_calls() == []
+
+
+def test_dropped_pages_are_reported(canvas):
+    dropped = []
+    layers = OverlayLayers(canvas.draw_grid, canvas.draw_page_fields, canvas.draw_selection,
+                           canvas.selection_bounds, dropped.append)
+    layers.update(AREA, BANDS, show_grid=True)
+    layers.update(AREA, {1: BANDS[1]}, show_grid=True)
+    layers.update(AREA, {1: BANDS[1]}, show_grid=True)
+    assert dropped == [0]
@@ -0,0 +1,111 @@
+"""
+Tests for the byte-budgeted page pixmap cache
+"""
+
+import pytest
+from PyQt6.QtGui import QPixmap
+
+from ui.a_page_cache import PageCache, pixmap_bytes, zoom_bucket
+
+
+@pytest.fixture
+def pixmap(qapp):
+    def make(width=100, height=100):
+        pm = QPixmap(width, height)
+        pm.fill()
+        return pm
+    return make
+
+
+def test_zoom_bucket_groups_close_zoom_levels():
+    assert zoom_bucket(1.0) == zoom_bucket(1.01)
+    assert zoom_bucket(1.0) != zoom_bucket(1.1)
+
+
+def test_get_counts_hits_and_misses(pixmap):
+    cache = PageCache(budget_mb=16)
+    cache.put(0, 1.0, 96, pixmap())
+
+    assert cache.get(0, 1.0, 96) is not None
+    assert cache.get(0, 1.0, 150) is None
+    assert cache.get(1, 1.0, 96) is None
+
+    stats = cache.get_stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 2
+
+
+def test_evicts_least_recently_used_over_budget(pixmap):
+    size = pixmap_bytes(pixmap())
+    cache = PageCache(budget_mb=(size * 2) / (1024 * 1024))
+    cache.put(0, 1.0, 96, pixmap())
+    cache.put(1, 1.0, 96, pixmap())
+    cache.get(0, 1.0, 96)  # Page 1 is now least recently used
+    cache.put(2, 1.0, 96, pixmap())
+
+    assert cache.contains(0, 1.0, 96)
+    assert not cache.contains(1, 1.0, 96)
+    assert cache.contains(2, 1.0, 96)
+    assert cache.current_bytes <= cache.budget_bytes
+    assert cache.evictions == 1
+
+
+def test_pinned_pages_survive_eviction(pixmap):
+    size = pixmap_bytes(pixmap())
+    cache = PageCache(budget_mb=(size * 2) / (1024 * 1024))
+    cache.put(0, 1.0, 96, pixmap())
+    cache.set_pinned_pages([0], render_dpi=96)
+    cache.put(1, 1.0, 96, pixmap())
+    cache.put(2, 1.0, 96, pixmap())
+
+    assert cache.contains(0, 1.0, 96)
+    assert not cache.contains(1, 1.0, 96)
+
+
+def test_pinning_only_protects_the_active_dpi(pixmap):
+    size = pixmap_bytes(pixmap())
+    cache = PageCache(budget_mb=(size * 2) / (1024 * 1024))
+    cache.put(0, 1.0, 72, pixmap())
+    cache.set_pinned_pages([0], render_dpi=96)
+    cache.put(1, 1.0, 96, pixmap())
+    cache.put(2, 1.0, 96, pixmap())
+
+    assert not cache.contains(0, 1.0, 72)
+
+
+def test_placeholder_prefers_sharpest_render_below_target(pixmap):
+    cache = PageCache(budget_mb=16)
+    low, mid, high = pixmap(10, 10), pixmap(20, 20), pixmap(40, 40)
+    cache.put(0, 0.5, 48, low)
+    cache.put(0, 1.0, 72, mid)
+    cache.put(0, 2.0, 192, high)
+
+    assert cache.get_placeholder(0, 96).size() == mid.size()
+    assert cache.get_placeholder(0, 36).size() == low.size()
+    assert cache.get_placeholder(1, 96) is None
+    assert cache.placeholder_hits == 2
+
+
+def test_placeholder_skips_the_exact_dpi(pixmap):
+    cache = PageCache(budget_mb=16)
+    cache.put(0, 1.0, 96, pixmap())
+    assert cache.get_placeholder(0, 96) is None
+
+
+def test_invalidate_page_drops_every_resolution(pixmap):
+    cache = PageCache(budget_mb=16)
+    cache.put(0, 1.0, 96, pixmap())
+    cache.put(0, 2.0, 192, pixmap())
+    cache.put(1, 1.0, 96, pixmap())
+
+    cache.invalidate_page(0)
+
+    assert not cache.has_page(0)
+    assert cache.has_page(1)
+    assert cache.current_bytes == pixmap_bytes(pixmap())
+
+
+def test_null_pixmap_is_not_stored(qapp):
+    cache = PageCache(budget_mb=16)
+    cache.put(0, 1.0, 96, QPixmap())
+    assert len(cache) == 0
@@ -0,0 +1,87 @@
+"""
+Tests for wrapping fitz.Pixmap samples as QImages - output must match the old
+pix.tobytes("ppm") + decode path
+"""
+
+import fitz
+import pytest
+from PyQt6.QtGui import QImage
+
+from utils.pixmap_utils import fitz_pixmap_to_qimage, fitz_pixmap_to_qpixmap, samples_to_qimage
+
+ARGB32 = QImage.Format.Format_ARGB32
+
+
+@pytest.fixture
+def page(qapp):
+    """Odd-sized page (RGB rows are not 4-byte aligned) with solid, translucent and text content"""
+    doc = fitz.open()
+    page = doc.new_page(width=101, height=57)
+    page.draw_rect(fitz.Rect(10, 10, 60, 40), color=(1, 0, 0), fill=(0, 0.5, 1), fill_opacity=0.4)
+    page.insert_text((5, 50), "Hi", fontsize=12)
+    yield page
+    doc.close()
+
+
+def decode_ppm(pix) -> QImage:
+    """The old conversion: encode as PPM, decode it straight back"""
+    return QImage.fromData(pix.tobytes("ppm"))
+
+
+def image_bytes(image: QImage) -> bytes:
+    bits = image.constBits()
+    bits.setsize(image.sizeInBytes())
+    return bytes(bits)
+
+
+@pytest.mark.parametrize('colorspace', ['RGB', 'GRAY'])
+def test_matches_ppm_path(page, colorspace):
+    pix = page.get_pixmap(colorspace=getattr(fitz, f"cs{colorspace}"))
+    image = fitz_pixmap_to_qimage(pix)
+
+    assert (image.width(), image.height()) == (pix.width, pix.height)
+    assert image.convertToFormat(ARGB32) == decode_ppm(pix).convertToFormat(ARGB32)
+
+
+def test_cmyk_is_converted_to_rgb_first(page):
+    pix = page.get_pixmap(colorspace=fitz.csCMYK)
+    image = fitz_pixmap_to_qimage(pix)
+    assert image.convertToFormat(ARGB32) == decode_ppm(fitz.Pixmap(fitz.csRGB, pix)).convertToFormat(ARGB32)
+
+
+def test_alpha_pixmaps_keep_premultiplied_samples(page):
+    pix = page.get_pixmap(alpha=True)
+    image = fitz_pixmap_to_qimage(pix)
+
+    # PPM has no alpha channel; the wrapped pixels are MuPDF's premultiplied samples unchanged
+    assert image.format() == QImage.Format.Format_RGBA8888_Premultiplied
+    assert image.bytesPerLine() == pix.stride
+    assert image_bytes(image) == pix.samples
+
+    # PNG stores straight alpha, so its decode differs by unpremultiply rounding only
+    reference = QImage.fromData(pix.tobytes("png")).convertToFormat(ARGB32)
+    converted = image.convertToFormat(ARGB32)
+    for y in range(pix.height):
+        for x in range(pix.width):
+            a, b = converted.pixel(x, y), reference.pixel(x, y)
+            assert all(abs((a >> shift & 255) - (b >> shift & 255)) <= 1 for shift in (0, 8, 16, 24))
+
+
+def test_padded_stride(page):
+    pix = page.get_pixmap()
+    row = pix.width * pix.n
+    stride = row + 5  # Padding bytes after every row must be skipped
+    samples = b"".join(pix.samples[y * row:(y + 1) * row] + b"\xab" * 5 for y in range(pix.height))
+
+    image = samples_to_qimage(samples, pix.width, pix.height, stride, pix.n, pix.alpha)
+
+    assert image.bytesPerLine() == stride
+    assert image.convertToFormat(ARGB32) == decode_ppm(pix).convertToFormat(ARGB32)
+
+
+def test_unsupported_layout_and_qpixmap(page):
+    assert samples_to_qimage(b"\0" * 8, 1, 1, 8, 2, True).isNull()  # Gray + alpha needs conversion
+
+    pix = page.get_pixmap()
+    pixmap = fitz_pixmap_to_qpixmap(pix)
+    assert pixmap.toImage().convertToFormat(ARGB32) == decode_ppm(pix).convertToFormat(ARGB32)
@@ -0,0 +1,124 @@
+"""
+Tests for the background render service's queueing, cancellation and
+generation handling
+"""
+
+import threading
+import time
+
+import fitz
+import pytest
+from PyQt6.QtTest import QTest
+
+from ui import a_render_service
+from ui.a_render_service import PageRenderService
+
+PAGE_COUNT = 5
+DPI = 36
+
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    doc = fitz.open()
+    for i in range(PAGE_COUNT):
+        doc.new_page(width=200, height=100).insert_text((10, 50), f"Page {i + 1}")
+    path = str(tmp_path / "pages.pdf")
+    doc.save(path)
+    doc.close()
+    return path
+
+
+@pytest.fixture
+def gate(monkeypatch):
+    """Workers block until the gate is set, so requests stay queued/in flight"""
+    release = threading.Event()
+    render = a_render_service.render_page_worker
+
+    def gated_worker(*args):
+        release.wait(5)
+        return render(*args)
+
+    monkeypatch.setattr(a_render_service, 'render_page_worker', gated_worker)
+    yield release
+    release.set()
+
+
+@pytest.fixture
+def service(qapp, pdf_path):
+    service = PageRenderService(pdf_path, max_workers=1, use_processes=False)
+    rendered = []
+    service.pageRendered.connect(
+        lambda page, dpi, generation, image: rendered.append((page, generation, image.width())))
+    service.rendered = rendered
+    yield service
+    service.shutdown()
+
+
+def wait_idle(service, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while (service.get_stats()['in_flight'] or service.get_stats()['queued']) and time.monotonic() < deadline:
+        QTest.qWait(10)
+    assert not service.get_stats()['in_flight'], "renders did not finish"
+
+
+def test_renders_queued_pages_in_priority_order(service, gate):
+    service.request_page(0, DPI)  # Starts immediately
+    service.request_page(3, DPI, PageRenderService.PRIORITY_PREFETCH)
+    service.request_page(1, DPI)
+    gate.set()
+    wait_idle(service)
+
+    assert [page for page, _, _ in service.rendered] == [0, 1, 3]
+    assert all(width == 100 for _, _, width in service.rendered)  # 200pt at 36 DPI
+    assert service.get_stats()['completed'] == 3
+
+
+def test_cancel_pending_keeps_requested_pages(service, gate):
+    for page in range(4):
+        service.request_page(page, DPI)
+
+    assert service.cancel_pending(keep_pages=[2]) == 2  # Pages 1 and 3; page 0 is already running
+    assert not service.is_pending(1) and service.is_pending(2) and service.is_pending(0)
+
+    gate.set()
+    wait_idle(service)
+    assert [page for page, _, _ in service.rendered] == [0, 2]
+
+
+def test_cancel_pages_drops_only_those_pages(service, gate):
+    for page in range(4):
+        service.request_page(page, DPI)
+
+    assert service.cancel_pages([1, 3, 4]) == 2  # Page 4 was never queued
+
+    gate.set()
+    wait_idle(service)
+    assert [page for page, _, _ in service.rendered] == [0, 2]
+
+
+def test_stale_generation_results_are_dropped(service, gate):
+    service.request_page(0, DPI)  # In flight for generation 0
+    service.request_page(1, DPI)  # Queued for generation 0
+
+    generation = service.next_generation()
+    assert service.get_stats()['queued'] == 0
+    service.request_page(0, DPI)
+
+    gate.set()
+    wait_idle(service)
+
+    assert service.rendered == [(0, generation, 100)]
+    assert service.get_stats()['stale_dropped'] == 1
+
+
+def test_process_workers_are_spawned(qapp, pdf_path):
+    service = PageRenderService(pdf_path, max_workers=1, use_processes=True)
+    rendered = []
+    service.pageRendered.connect(lambda page, dpi, generation, image: rendered.append((page, image.width())))
+    try:
+        assert service._executor._mp_context.get_start_method() == 'spawn'
+        service.request_page(2, DPI)
+        wait_idle(service, timeout=30.0)
+        assert rendered == [(2, 100)]
+    finally:
+        service.shutdown()
@@ -0,0 +1,138 @@
+"""
+Tests for velocity-aware scroll prefetching - measures the prefetch hit rate
+on a simulated fling over a document whose renders complete instantly
+"""
+
+import pytest
+from PyQt6.QtCore import QRectF
+
+from ui import a_scroll_prefetcher
+from ui.a_scroll_prefetcher import ScrollPrefetcher
+
+PAGE_HEIGHT = 1000
+PAGE_COUNT = 50
+VIEWPORT_HEIGHT = 800
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+class FakeDocument:
+    def get_page_count(self):
+        return PAGE_COUNT
+
+
+class FakeLayout:
+    def get_page_count(self):
+        return PAGE_COUNT
+
+    def get_canvas_size(self):
+        return 600, PAGE_HEIGHT * PAGE_COUNT
+
+    def get_visible_pages(self, rect: QRectF):
+        first = int(rect.y()) // PAGE_HEIGHT
+        last = int(rect.y() + rect.height() - 1) // PAGE_HEIGHT
+        return [p for p in range(first, last + 1) if 0 <= p < PAGE_COUNT]
+
+
+class FakeCanvas:
+    """The parts of CanvasWidget the prefetcher uses; queued renders finish immediately"""
+
+    def __init__(self):
+        self.document = FakeDocument()
+        self.layout_manager = FakeLayout()
+        self.visible_pages = []
+        self.rendered = set()
+        self.cancelled = []
+        self.scroll_prefetcher = None
+
+    def is_page_cached(self, page_index):
+        return page_index in self.rendered
+
+    def prefetch_pages(self, page_indices):
+        queued = [p for p in page_indices if p not in self.rendered]
+        self.rendered.update(queued)
+        return queued
+
+    def cancel_prefetch(self, page_indices):
+        self.cancelled.append(set(page_indices))
+        return len(page_indices)
+
+    def set_visible_pages_optimized(self, page_indices, viewport_rect):
+        self.scroll_prefetcher.record_visible_pages(page_indices)
+        self.visible_pages = page_indices
+        self.rendered.update(page_indices)  # Anything missing is rendered on demand
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(a_scroll_prefetcher, 'time', fake)
+    return fake
+
+
+def make_prefetcher(enabled=True):
+    canvas = FakeCanvas()
+    prefetcher = ScrollPrefetcher(canvas)
+    prefetcher.enabled = enabled
+    canvas.scroll_prefetcher = prefetcher
+    return canvas, prefetcher
+
+
+def fling(canvas, prefetcher, clock, positions, step_seconds=0.05):
+    for y in positions:
+        clock.now += step_seconds
+        rect = QRectF(0, y, 600, VIEWPORT_HEIGHT)
+        if prefetcher.enabled:
+            prefetcher.on_scroll(rect)
+        else:
+            canvas.set_visible_pages_optimized(canvas.layout_manager.get_visible_pages(rect), rect)
+
+
+def test_prefetch_hit_rate_on_downward_fling(clock):
+    canvas, prefetcher = make_prefetcher()
+    fling(canvas, prefetcher, clock, range(0, 20 * PAGE_HEIGHT, 250))
+
+    stats = prefetcher.get_stats()
+    assert stats['arrivals'] >= 20
+    assert stats['hit_rate'] >= 85.0
+    assert stats['prefetch_accuracy'] >= 85.0
+
+
+def test_hit_rate_without_prefetch_is_zero(clock):
+    canvas, prefetcher = make_prefetcher(enabled=False)
+    fling(canvas, prefetcher, clock, range(0, 20 * PAGE_HEIGHT, 250))
+
+    stats = prefetcher.get_stats()
+    assert stats['arrivals'] >= 20
+    assert stats['hit_rate'] == 0.0
+
+
+def test_lookahead_grows_with_velocity(clock):
+    canvas, prefetcher = make_prefetcher()
+    fling(canvas, prefetcher, clock, [0, 100])
+    slow = prefetcher.lookahead
+
+    canvas, prefetcher = make_prefetcher()
+    fling(canvas, prefetcher, clock, [0, 2000])
+    fast = prefetcher.lookahead
+
+    assert ScrollPrefetcher.MIN_LOOKAHEAD <= slow < fast <= ScrollPrefetcher.MAX_LOOKAHEAD
+
+
+def test_reversal_cancels_outstanding_prefetch(clock):
+    canvas, prefetcher = make_prefetcher()
+    fling(canvas, prefetcher, clock, [0, 500, 1000])
+    outstanding = set(prefetcher.prefetched_pages)
+    assert outstanding
+
+    fling(canvas, prefetcher, clock, [500])
+
+    assert prefetcher.reversals == 1
+    assert canvas.cancelled == [outstanding]
+    assert prefetcher.scroll_direction == -1
@@ -0,0 +1,134 @@
+"""
+Tests for streaming TOC extraction and its on-disk cache
+"""
+
+import json
+import os
+
+import fitz
+import pytest
+
+from src.core.a_toc_extractor import TOC_CACHE_VERSION, TOCCache, TOCExtractor, toc_cache_path
+from utils.file_handler import file_content_hash, known_content_hash
+from src.ui.a_pdf_document import PDFDocument
+
+TOC = [
+    [1, "Introduction", 1],
+    [2, "Scope", 1],
+    [1, "Chapter 1", 2],
+    [2, "Section 1.1", 2],
+    [3, "Detail", 3],
+    [1, "Appendix", 3],
+]
+
+
+@pytest.fixture
+def toc_pdf(tmp_path):
+    doc = fitz.open()
+    for _ in range(3):
+        doc.new_page()
+    doc.set_toc(TOC)
+    path = str(tmp_path / "toc.pdf")
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def flatten(entries):
+    for entry in entries:
+        yield entry.level, entry.title, entry.page
+        yield from flatten(entry.children)
+
+
+def test_cache_round_trip(toc_pdf):
+    rows = [[0, "Introduction", 0, 0.0, 0.0], [1, "Scope", 0, 72.0, 700.0]]
+    TOCCache.save(toc_pdf, rows)
+    assert TOCCache.load(toc_pdf) == rows
+
+
+def test_missing_and_stale_caches(toc_pdf):
+    assert TOCCache.load(toc_pdf) is None
+
+    TOCCache.save(toc_pdf, [[0, "Introduction", 0, 0, 0]])
+    with open(toc_pdf, "ab") as f:
+        f.write(b"\n% appended")
+    assert TOCCache.load(toc_pdf) is None
+
+
+def touch(path):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+
+def cached_hash(path):
+    with open(toc_cache_path(path), encoding="utf-8") as f:
+        return json.load(f)['sha256']
+
+
+def test_save_hashes_in_the_background(toc_pdf):
+    TOCCache.save(toc_pdf, [[0, "Introduction", 0, 0, 0]])
+    TOCCache.wait_for_hashing()
+
+    assert cached_hash(toc_pdf) == file_content_hash(toc_pdf)
+
+
+def test_save_uses_an_already_known_hash(toc_pdf):
+    content_hash = file_content_hash(toc_pdf)  # e.g. by the link indexer
+    TOCCache.save(toc_pdf, [])
+    assert cached_hash(toc_pdf) == content_hash
+
+
+def test_touched_file_is_not_hashed_on_load(toc_pdf):
+    TOCCache.save(toc_pdf, [[0, "Introduction", 0, 0, 0]])
+    TOCCache.wait_for_hashing()
+    touch(toc_pdf)
+
+    assert TOCCache.load(toc_pdf) is None
+    assert known_content_hash(toc_pdf) is None
+
+
+def test_touched_file_with_same_content_stays_valid(toc_pdf):
+    rows = [[0, "Introduction", 0, 0, 0]]
+    TOCCache.save(toc_pdf, rows)
+    TOCCache.wait_for_hashing()
+    touch(toc_pdf)
+    file_content_hash(toc_pdf)  # The link indexer hashed the touched file
+
+    assert TOCCache.load(toc_pdf) == rows
+    with open(toc_cache_path(toc_pdf), encoding="utf-8") as f:
+        assert json.load(f)['signature'][1] == os.stat(toc_pdf).st_mtime_ns  # Signature refreshed
+
+
+def test_unreadable_or_old_version_caches_are_ignored(toc_pdf):
+    with open(toc_cache_path(toc_pdf), "w", encoding="utf-8") as f:
+        f.write("{not json")
+    assert TOCCache.load(toc_pdf) is None
+
+    TOCCache.save(toc_pdf, [])
+    with open(toc_cache_path(toc_pdf), encoding="utf-8") as f:
+        data = json.load(f)
+    data['version'] = TOC_CACHE_VERSION + 1
+    with open(toc_cache_path(toc_pdf), "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    assert TOCCache.load(toc_pdf) is None
+
+
+def test_extractor_streams_top_level_entries_then_serves_cache(toc_pdf):
+    document = PDFDocument(toc_pdf)
+    try:
+        extractor = TOCExtractor(document)
+        first = list(extractor.iter_toc())
+        assert extractor.last_source == "pdf"
+        assert [entry.title for entry in first] == ["Introduction", "Chapter 1", "Appendix"]
+        assert list(flatten(first)) == [(level - 1, title, page - 1) for level, title, page in TOC]
+        assert os.path.exists(toc_cache_path(toc_pdf))
+
+        second = extractor.extract_toc()
+        assert extractor.last_source == "cache"
+        assert list(flatten(second)) == list(flatten(first))
+        assert extractor.get_performance_stats()['entries'] == len(TOC)
+
+        list(extractor.iter_toc(use_cache=False))
+        assert extractor.last_source == "pdf"
+    finally:
+        document.close()